@@ -1,87 +1,146 @@
 """Application factory for the Flask backend."""
 
+import importlib
 import logging
 import os
 
+import click
 from flask import Flask
 from flask_cors import CORS
-from flask_migrate import Migrate
 
 from app.cli.sync import sync_accounts
-from app.config import DB_IDENTITY, DB_SCHEMA, IS_DEV, IS_TEST, logger, plaid_client
+from app.config import logger
 from app.database.schema import ensure_schema
 from app.extensions import db
-
-
-def create_app():
-    """Configure and return the Flask application instance."""
-    from app.config import ARBIT_EXPORTER_URL, ENABLE_ARBIT_DASHBOARD
-
+from app.utils.compression import init_compression
+from app.utils.json_provider import FastJSONProvider
+from app.utils.metrics import init_metrics
+from app.utils.profiler import init_request_profiler
+from app.utils.read_replica import init_read_replica
+from app.utils.sql_instrumentation import init_sql_instrumentation, instrument_cli_commands
+from app.utils.tracing import init_tracing
+
+# (module, blueprint attribute, url_prefix), registered in this order. Modules
+# are imported by ``register_blueprints`` so callers that skip routes never pay
+# for them.
+BLUEPRINTS = (
+    ("app.routes.frontend", "frontend", "/"),
+    ("app.routes.metrics", "metrics", None),
+    ("app.routes.export", "export", "/api/export"),
+    ("app.routes.dashboard", "dashboard", "/api/dashboard"),
+    ("app.routes.docs", "docs", "/api/docs"),
+    ("app.routes.categories", "categories", "/api/categories"),
+    ("app.routes.codex_exec", "codex_exec", "/api/codex"),
+    ("app.routes.transactions", "transactions", "/api/transactions"),
+    ("app.routes.rules", "rules", "/api/rules"),
+    ("app.routes.accounts", "accounts", "/api/accounts"),
+    ("app.routes.manual_io", "manual_up", "/api/import"),
+    ("app.routes.charts", "charts", "/api/charts"),
+    ("app.routes.forecast", "forecast", "/api/forecast"),
+    ("app.routes.recurring", "recurring", "/api/recurring"),
+    ("app.routes.rsa_monitor", "rsa_monitor", "/api/rsa-monitor"),
+    ("app.routes.goals", "goals", "/api/goals"),
+    ("app.routes.plaid_transactions", "plaid_transactions", "/api/plaid/transactions"),
+    ("app.routes.plaid_webhook", "plaid_webhooks", "/api/webhooks"),
+    ("app.routes.plaid_webhook_admin", "plaid_webhook_admin", "/api/plaid/webhook"),
+    ("app.routes.plaid_investments", "plaid_investments", "/api/plaid/investments"),
+    ("app.routes.investments", "investments", "/api/investments"),
+    ("app.routes.planning", "planning", "/api/planning"),
+    ("app.routes.institutions", "institutions", "/api/institutions"),
+    ("app.routes.summary", "summary", "/api/summary"),
+    ("app.routes.suggest", "suggest", "/api/suggest"),
+    ("app.routes.analytics", "analytics", "/api/analytics"),
+    ("app.routes.debug", "debug", "/api/debug"),
+    ("app.routes.profiles", "profiles", "/api/profiles"),
+)
+
+
+def register_blueprints(app):
+    """Import every route module in :data:`BLUEPRINTS` and register its blueprint."""
+
+    for module_name, attribute, url_prefix in BLUEPRINTS:
+        blueprint = getattr(importlib.import_module(module_name), attribute)
+        if url_prefix is None:
+            app.register_blueprint(blueprint)
+        else:
+            app.register_blueprint(blueprint, url_prefix=url_prefix)
+
+
+class LazyMigrateGroup(click.Group):
+    """``flask db`` placeholder that imports Flask-Migrate on first use.
+
+    Flask-Migrate pulls in Alembic (~0.4 s), which web workers, cron jobs and
+    scripts never need. When ``flask db ...`` runs, the real extension is
+    attached to the app and the real command group takes over parsing.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("db", help="Perform database migrations.")
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        from flask import current_app
+        from flask_migrate import Migrate
+        from flask_migrate.cli import db as db_cli_group
+
+        Migrate(current_app._get_current_object(), db)
+        return db_cli_group.make_context(info_name, args, parent=parent, **extra)
+
+
+def init_migrate(app):
+    """Register ``flask db`` without importing Flask-Migrate up front."""
+
+    app.cli.add_command(LazyMigrateGroup())
+
+
+def create_app(register_routes: bool = True):
+    """Configure and return the Flask application instance.
+
+    Cron jobs and scripts that only need an application context pass
+    ``register_routes=False`` to skip importing the route modules.
+    """
+    from app.config import (
+        ARBIT_EXPORTER_URL,
+        DB_IDENTITY,
+        DB_SCHEMA,
+        ENABLE_ARBIT_DASHBOARD,
+        IS_DEV,
+        IS_TEST,
+        configure_logging,
+        plaid_client,
+    )
+
+    configure_logging()
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     CORS(app)
     app.config.from_object("app.config")
     app.config["ENABLE_ARBIT_DASHBOARD"] = ENABLE_ARBIT_DASHBOARD
     app.config["ARBIT_EXPORTER_URL"] = ARBIT_EXPORTER_URL
     db.init_app(app)
+    init_read_replica(app, db)
     if IS_DEV or IS_TEST:
         with app.app_context():
             ensure_schema(db.engine, DB_SCHEMA)
 
-    Migrate(app, db)
-    # Always register routes (for all environments)
-    from app.routes.accounts import accounts
-    from app.routes.categories import categories
-    from app.routes.charts import charts
-    from app.routes.codex_exec import codex_exec
-    from app.routes.dashboard import dashboard
-    from app.routes.docs import docs
-    from app.routes.export import export
-    from app.routes.forecast import forecast
-    from app.routes.frontend import frontend
-    from app.routes.goals import goals
-    from app.routes.institutions import institutions
-    from app.routes.investments import investments
-    from app.routes.manual_io import manual_up
-    from app.routes.plaid_investments import plaid_investments
-    from app.routes.plaid_transactions import plaid_transactions
-    from app.routes.plaid_webhook import plaid_webhooks
-    from app.routes.plaid_webhook_admin import plaid_webhook_admin
-    from app.routes.planning import planning
-    from app.routes.recurring import recurring
-    from app.routes.rsa_monitor import rsa_monitor
-    from app.routes.rules import rules as rules_bp
-    from app.routes.summary import summary
-    from app.routes.transactions import transactions
-
-    app.register_blueprint(frontend, url_prefix="/")
-    app.register_blueprint(export, url_prefix="/api/export")
-    app.register_blueprint(dashboard, url_prefix="/api/dashboard")
-    app.register_blueprint(docs, url_prefix="/api/docs")
-    app.register_blueprint(categories, url_prefix="/api/categories")
-    app.register_blueprint(codex_exec, url_prefix="/api/codex")
-    app.register_blueprint(transactions, url_prefix="/api/transactions")
-    app.register_blueprint(rules_bp, url_prefix="/api/rules")
-    app.register_blueprint(accounts, url_prefix="/api/accounts")
-    app.register_blueprint(manual_up, url_prefix="/api/import")
-    app.register_blueprint(charts, url_prefix="/api/charts")
-    app.register_blueprint(forecast, url_prefix="/api/forecast")
-    app.register_blueprint(recurring, url_prefix="/api/recurring")
-    app.register_blueprint(rsa_monitor, url_prefix="/api/rsa-monitor")
-    app.register_blueprint(goals, url_prefix="/api/goals")
-    app.register_blueprint(plaid_transactions, url_prefix="/api/plaid/transactions")
-    app.register_blueprint(plaid_webhooks, url_prefix="/api/webhooks")
-    app.register_blueprint(plaid_webhook_admin, url_prefix="/api/plaid/webhook")
-    app.register_blueprint(plaid_investments, url_prefix="/api/plaid/investments")
-    app.register_blueprint(investments, url_prefix="/api/investments")
-    app.register_blueprint(planning, url_prefix="/api/planning")
-    app.register_blueprint(institutions, url_prefix="/api/institutions")
-    app.register_blueprint(summary, url_prefix="/api/summary")
+    init_migrate(app)
+    init_compression(app)
+    app.config.setdefault("SQL_DEBUG_ENDPOINT", IS_DEV)
+    init_sql_instrumentation(app)
+    init_metrics(app)
+    init_tracing(app)
+    init_request_profiler(app)
+    if register_routes:
+        register_blueprints(app)
 
     app.cli.add_command(sync_accounts)
     # Dev CLI: seed demo data into a fresh database
     from app.cli.seed_dev import seed_dev
 
     app.cli.add_command(seed_dev)
+    # Load-test CLI: seed a scalable synthetic dataset
+    from app.cli.seed_synthetic import seed_synthetic
+
+    app.cli.add_command(seed_synthetic)
     # Dev CLI: reconcile local Items with Plaid live status
     from app.cli.reconcile_plaid_items import reconcile_plaid_items
 
@@ -106,6 +165,21 @@ def create_app():
     app.cli.add_command(backfill_plaid_history)
     app.cli.add_command(debug_plaid_history)
 
+    # Utility CLI: re-apply merchant normalization to stored transactions
+    from app.cli.renormalize_merchants import renormalize_merchants
+
+    app.cli.add_command(renormalize_merchants)
+
+    # Utility CLI: backfill transaction full-text search documents
+    from app.cli.reindex_transaction_search import reindex_transaction_search
+
+    app.cli.add_command(reindex_transaction_search)
+
+    # Utility CLI: refresh columnar analytics snapshots
+    from app.cli.write_analytics_snapshots import write_analytics_snapshots_command
+
+    app.cli.add_command(write_analytics_snapshots_command)
+
     # Dev CLI: run Plaid transactions/sync
     try:
         from app.cli.sync_plaid_transactions import sync_plaid_tx
@@ -114,6 +188,8 @@ def create_app():
     except Exception:
         pass
 
+    instrument_cli_commands(app)
+
     log_routes_enabled = app.debug or os.getenv("LOG_ROUTE_TABLE", "false").lower() in {
         "1",
         "true",
@@ -121,8 +197,8 @@ def create_app():
         "on",
     }
 
-    if plaid_client:
-        logger.info("Plaid client initialized.")
+    if plaid_client.configured:
+        logger.info("Plaid credentials configured; the client is created on first use.")
         if log_routes_enabled and logger.isEnabledFor(logging.DEBUG):
             with app.app_context():
                 # 🎯 only GET routes (skip static, HEAD, OPTIONS)
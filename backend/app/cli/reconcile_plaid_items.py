@@ -21,7 +21,6 @@ from __future__ import annotations
 
 import click
 from flask.cli import with_appcontext
-from plaid.model.item_get_request import ItemGetRequest
 
 from app.config import plaid_client
 from app.models import PlaidAccount, PlaidItem
@@ -37,10 +36,12 @@ def reconcile_plaid_items(verbose: bool) -> None:
         verbose: Whether to emit per-item details during reconciliation.
     """
 
-    if plaid_client is None:
+    if not plaid_client:
         click.echo("Plaid client is not configured. Check backend/.env.")
         return
 
+    from plaid.model.item_get_request import ItemGetRequest
+
     # Build a map of item_id -> access_token (prefer PlaidItem token if present)
     item_tokens: dict[str, str] = {}
 
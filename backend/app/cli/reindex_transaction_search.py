@@ -0,0 +1,40 @@
+"""CLI: Rebuild transaction full-text search documents.
+
+Usage examples:
+
+- flask --app 'app:create_app' reindex-transaction-search
+- flask --app 'app:create_app' reindex-transaction-search --user-id <USER_ID>
+
+Run once after applying the search-documents migration to backfill existing
+transactions, and after bulk set-based edits (for example
+``renormalize-merchants``) that bypass the per-write refresh.
+"""
+
+from __future__ import annotations
+
+import click
+from flask.cli import with_appcontext
+
+from app.sql.search_logic import SEARCH_REBUILD_BATCH_SIZE, rebuild_search_documents
+
+
+@click.command("reindex-transaction-search")
+@click.option("--user-id", default=None, help="Only rebuild documents for this user")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=SEARCH_REBUILD_BATCH_SIZE,
+    show_default=True,
+    help="Transactions per commit",
+)
+@with_appcontext
+def reindex_transaction_search(user_id: str | None, batch_size: int) -> None:
+    """Backfill or reconcile search documents.
+
+    Args:
+        user_id: Optional user scope.
+        batch_size: Number of transactions refreshed per commit.
+    """
+
+    written = rebuild_search_documents(user_id=user_id, batch_size=batch_size)
+    click.echo(f"Refreshed {written} transaction search documents.")
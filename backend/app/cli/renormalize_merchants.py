@@ -0,0 +1,44 @@
+"""CLI: Re-apply merchant normalization to stored transactions.
+
+Usage examples:
+
+- flask --app 'app:create_app' renormalize-merchants --dry-run
+- flask --app 'app:create_app' renormalize-merchants --chunk-size 1000
+
+Run after changing the rules in ``app.utils.merchant_normalization`` so
+historical rows pick up the new display names and slugs. Rows edited by users
+(``user_modified``) are skipped.
+"""
+
+from __future__ import annotations
+
+import click
+from flask.cli import with_appcontext
+
+from app.sql.transactions_logic import RENORMALIZE_CHUNK_SIZE, renormalize_transaction_merchants
+
+
+@click.command("renormalize-merchants")
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=RENORMALIZE_CHUNK_SIZE,
+    show_default=True,
+    help="Transactions read and committed per batch",
+)
+@click.option("--dry-run", is_flag=True, help="Report changes without writing")
+@with_appcontext
+def renormalize_merchants(chunk_size: int, dry_run: bool) -> None:
+    """Re-normalize merchant names and slugs on stored transactions.
+
+    Args:
+        chunk_size: Number of transactions read and committed per batch.
+        dry_run: Whether to only count the merchant inputs that would change.
+    """
+
+    stats = renormalize_transaction_merchants(chunk_size=chunk_size, dry_run=dry_run)
+    prefix = "[dry-run] " if dry_run else ""
+    click.echo(
+        f"{prefix}Scanned {stats['groups']} merchant groups; "
+        f"{stats['changed_groups']} changed; {stats['rows_updated']} rows updated."
+    )
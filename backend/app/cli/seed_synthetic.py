@@ -0,0 +1,73 @@
+"""CLI: Seed a scalable synthetic dataset for load tests and benchmarks.
+
+Usage examples:
+
+- flask --app 'app:create_app' seed-synthetic
+- flask --app 'app:create_app' seed-synthetic --users 50 --transactions 2000000 --months 36
+- flask --app 'app:create_app' seed-synthetic --reset --seed 7
+
+Never run this against a production database; synthetic users are written
+alongside real ones and only ``--reset`` removes them.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import click
+from flask.cli import with_appcontext
+
+from app.services.synthetic_data import (
+    DEFAULT_BATCH_SIZE,
+    HISTORY_DAYS,
+    delete_synthetic_dataset,
+    generate_synthetic_dataset,
+    synthetic_data_present,
+)
+
+
+@click.command("seed-synthetic")
+@click.option("--users", type=click.IntRange(min=1), default=5, show_default=True, help="Synthetic users")
+@click.option("--accounts-per-user", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option("--months", type=click.IntRange(min=1), default=24, show_default=True, help="Months of history")
+@click.option(
+    "--transactions", type=click.IntRange(min=1), default=50_000, show_default=True, help="Approximate total rows"
+)
+@click.option("--seed", type=int, default=42, show_default=True, help="Random seed")
+@click.option("--end-date", default=None, help="Last transaction date (YYYY-MM-DD, default today)")
+@click.option("--history-days", type=click.IntRange(min=1), default=HISTORY_DAYS, show_default=True)
+@click.option("--batch-size", type=click.IntRange(min=1), default=DEFAULT_BATCH_SIZE, show_default=True)
+@click.option("--reset", is_flag=True, help="Delete existing synthetic users first")
+@with_appcontext
+def seed_synthetic(
+    users: int,
+    accounts_per_user: int,
+    months: int,
+    transactions: int,
+    seed: int,
+    end_date: str | None,
+    history_days: int,
+    batch_size: int,
+    reset: bool,
+) -> None:
+    """Generate synthetic users, accounts, tags, transactions and balance history."""
+
+    if synthetic_data_present():
+        if not reset:
+            click.echo("Synthetic data already present; pass --reset to regenerate.")
+            return
+        click.echo(f"Removed {delete_synthetic_dataset()} synthetic accounts.")
+
+    last_day = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else None
+    counts = generate_synthetic_dataset(
+        users=users,
+        accounts_per_user=accounts_per_user,
+        months=months,
+        transactions=transactions,
+        seed=seed,
+        end_date=last_day,
+        history_days=history_days,
+        batch_size=batch_size,
+        progress=lambda done, total: click.echo(f"  user {done}/{total}"),
+    )
+    click.echo(", ".join(f"{count} {name}" for name, count in counts.items()))
@@ -1,35 +1,59 @@
 """
 Expose configuration constants and logger setup across the app.
 
-This module emits a single INFO-level summary on import while deferring
-verbose configuration details to DEBUG logs. It intentionally avoids
+Importing this package has no side effects. Settings resolve on first access
+(PEP 562 ``__getattr__``): the first environment value read loads the ``.env``
+files, ``plaid_client`` is a proxy that builds the Plaid client on first use,
+and ``logger`` is the root logger, whose handlers are installed explicitly by
+:func:`configure_logging` (``create_app`` calls it). It intentionally avoids
 Flask-specific environment variables and relies solely on ENV.
 """
 
+import importlib
 import logging
 
-from .constants import DATABASE_NAME, DB_IDENTITY, FILES, SQLALCHEMY_DATABASE_URI, SQLALCHEMY_ENGINE_OPTIONS
-from .environment import (
-    ARBIT_EXPORTER_URL,
-    BACKEND_PUBLIC_URL,
-    CLIENT_NAME,
-    DB_SCHEMA,
-    ENABLE_ARBIT_DASHBOARD,
-    ENV,
-    IS_DEV,
-    IS_TEST,
-    OPENAI_API_KEY_PYNANCE,
-    PLAID_CLIENT_ID,
-    PLAID_CLIENT_NAME,
-    PLAID_ENV,
-    PLAID_REDIRECT_URI,
-    PLAID_SECRET,
-    PLAID_WEBHOOK_SECRET,
-    PRODUCTS,
-)
-from .log_setup import LOG_LEVEL, setup_logger
-from .paths import DIRECTORIES
-from .plaid_config import PLAID_BASE_URL, plaid_client
+# name -> submodule that defines it
+_SOURCES = {
+    **dict.fromkeys(
+        (
+            "ARBIT_EXPORTER_URL",
+            "BACKEND_PUBLIC_URL",
+            "CLIENT_NAME",
+            "DB_SCHEMA",
+            "ENABLE_ARBIT_DASHBOARD",
+            "ENV",
+            "IS_DEV",
+            "IS_TEST",
+            "OPENAI_API_KEY_PYNANCE",
+            "PLAID_CLIENT_ID",
+            "PLAID_CLIENT_NAME",
+            "PLAID_ENV",
+            "PLAID_REDIRECT_URI",
+            "PLAID_SECRET",
+            "PLAID_WEBHOOK_SECRET",
+            "PRODUCTS",
+        ),
+        "environment",
+    ),
+    **dict.fromkeys(
+        (
+            "DATABASE_NAME",
+            "DB_IDENTITY",
+            "FILES",
+            "INTERNAL_SCAN_WORKERS",
+            "REPLICA_MAX_LAG_SECONDS",
+            "SQLALCHEMY_BINDS",
+            "SQLALCHEMY_DATABASE_URI",
+            "SQLALCHEMY_ENGINE_OPTIONS",
+            "SQLALCHEMY_REPLICA_URI",
+        ),
+        "constants",
+    ),
+    "LOG_LEVEL": "log_setup",
+    "DIRECTORIES": "paths",
+    "PLAID_BASE_URL": "plaid_config",
+    "plaid_client": "plaid_config",
+}
 
 __all__ = [
     # environment
@@ -42,7 +66,11 @@ __all__ = [
     "DATABASE_NAME",
     "SQLALCHEMY_DATABASE_URI",
     "SQLALCHEMY_ENGINE_OPTIONS",
+    "SQLALCHEMY_REPLICA_URI",
+    "SQLALCHEMY_BINDS",
+    "REPLICA_MAX_LAG_SECONDS",
     "DB_IDENTITY",
+    "INTERNAL_SCAN_WORKERS",
     # app / feature flags
     "CLIENT_NAME",
     "ENABLE_ARBIT_DASHBOARD",
@@ -63,32 +91,72 @@ __all__ = [
     "DIRECTORIES",
     # logging
     "logger",
+    "configure_logging",
 ]
 
-# initialize logger once
-logger = setup_logger()
-
-# concise startup summary (INFO-safe)
-logger.info(
-    f"Configuration loaded "
-    f"(env={ENV}, "
-    f"schema={DB_SCHEMA}, "
-    f"plaid_env={PLAID_ENV}, "
-    f"dashboard_enabled={ENABLE_ARBIT_DASHBOARD}, "
-    f"log_level={LOG_LEVEL})"
-)
-
-# verbose diagnostics (DEBUG only)
-if logger.isEnabledFor(logging.DEBUG):
-    logger.debug(
-        "Configuration context: %s",
-        {
-            "database_name": DATABASE_NAME,
-            "db_identity": DB_IDENTITY,
-            "plaid_client_initialized": bool(plaid_client),
-            "plaid_base_url": PLAID_BASE_URL,
-            "arbit_exporter_url": ARBIT_EXPORTER_URL,
-            "directories": DIRECTORIES,
-            "products": PRODUCTS,
-        },
+# The root logger; handlers are added by ``configure_logging``.
+logger = logging.getLogger()
+
+_logging_configured = False
+
+
+def __getattr__(name):
+    module_name = _SOURCES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SOURCES))
+
+
+def configure_logging():
+    """Install the app and SQLAlchemy log handlers and log a configuration summary.
+
+    Safe to call more than once; later calls are no-ops.
+    """
+
+    global _logging_configured
+
+    if _logging_configured:
+        return logger
+    _logging_configured = True
+
+    from .log_setup import LOG_LEVEL, setup_logger, setup_sql_logger
+
+    setup_sql_logger()
+    setup_logger()
+
+    from .constants import DATABASE_NAME, DB_IDENTITY
+    from .environment import ARBIT_EXPORTER_URL, DB_SCHEMA, ENABLE_ARBIT_DASHBOARD, ENV, PLAID_ENV, PRODUCTS
+    from .paths import DIRECTORIES
+    from .plaid_config import PLAID_BASE_URL, plaid_client
+
+    # concise startup summary (INFO-safe)
+    logger.info(
+        f"Configuration loaded "
+        f"(env={ENV}, "
+        f"schema={DB_SCHEMA}, "
+        f"plaid_env={PLAID_ENV}, "
+        f"dashboard_enabled={ENABLE_ARBIT_DASHBOARD}, "
+        f"log_level={LOG_LEVEL})"
     )
+
+    # verbose diagnostics (DEBUG only)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Configuration context: %s",
+            {
+                "database_name": DATABASE_NAME,
+                "db_identity": DB_IDENTITY,
+                "plaid_credentials_set": plaid_client.configured,
+                "plaid_base_url": PLAID_BASE_URL,
+                "arbit_exporter_url": ARBIT_EXPORTER_URL,
+                "directories": DIRECTORIES,
+                "products": PRODUCTS,
+            },
+        )
+    return logger
@@ -27,19 +27,44 @@ FILES = {
 FRONTEND_DIST_DIR = os.path.join(os.path.dirname(__file__), "../../../frontend/dist")
 
 SQLALCHEMY_DATABASE_URI = os.getenv("SQLALCHEMY_DATABASE_URI")
-SQLALCHEMY_ENGINE_OPTIONS = {"connect_args": {"options": f"-c search_path={DB_SCHEMA}"}}
 if not SQLALCHEMY_DATABASE_URI:
     raise RuntimeError("SQLALCHEMY_DATABASE_URI must be defined when running against PostgreSQL.")
 
 try:
     _parsed_uri = make_url(SQLALCHEMY_DATABASE_URI)
     DATABASE_NAME = _parsed_uri.database
+    # ``search_path`` is a libpq option; SQLite URLs (benchmarks, smoke runs) take none.
+    SQLALCHEMY_ENGINE_OPTIONS = (
+        {"connect_args": {"options": f"-c search_path={DB_SCHEMA}"}}
+        if _parsed_uri.get_backend_name() == "postgresql"
+        else {}
+    )
     if IS_PROD and DB_SCHEMA != "public":
         raise RuntimeError(f"Production environment may only use DB_SCHEMA='public' " f"(got {DB_SCHEMA!r})")
 except ArgumentError as exc:  # pragma: no cover - misconfiguration guard
     raise RuntimeError("SQLALCHEMY_DATABASE_URI is not a valid SQLAlchemy URL.") from exc
 DB_IDENTITY = f"{DATABASE_NAME}:{DB_SCHEMA}"
 
+# Optional read replica; see ``app.utils.read_replica``. Registered as the
+# ``replica`` bind, which no model declares, so ``db.create_all`` and
+# migrations never touch it.
+SQLALCHEMY_REPLICA_URI = os.getenv("SQLALCHEMY_REPLICA_URI") or None
+SQLALCHEMY_BINDS = {}
+if SQLALCHEMY_REPLICA_URI:
+    try:
+        _replica_backend = make_url(SQLALCHEMY_REPLICA_URI).get_backend_name()
+    except ArgumentError as exc:  # pragma: no cover - misconfiguration guard
+        raise RuntimeError("SQLALCHEMY_REPLICA_URI is not a valid SQLAlchemy URL.") from exc
+    SQLALCHEMY_BINDS["replica"] = {
+        "url": SQLALCHEMY_REPLICA_URI,
+        **({"connect_args": {"options": f"-c search_path={DB_SCHEMA}"}} if _replica_backend == "postgresql" else {}),
+    }
+# Users written to by this process within this many seconds read from the primary.
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+
+# Worker processes POST /api/transactions/scan-internal may use to match users.
+INTERNAL_SCAN_WORKERS = int(os.getenv("INTERNAL_SCAN_WORKERS", "1"))
+
 TELEMETRY = {"enabled": True, "track_modifications": False}
 
 # Path to the R/S arbitrage dashboard data produced by the Discord bot.
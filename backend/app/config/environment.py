@@ -47,6 +47,12 @@ PRODUCTS = os.getenv("PRODUCTS", "transactions").split(",")
 PLAID_ENV = os.getenv("PLAID_ENV", "sandbox")
 PLAID_REDIRECT_URI = os.getenv("PLAID_REDIRECT_URI")
 
+# Shared Plaid HTTP pool: connections kept alive per process and per-request
+# timeouts in seconds (the SDK default is to wait forever).
+PLAID_POOL_MAXSIZE = int(os.getenv("PLAID_POOL_MAXSIZE", "10"))
+PLAID_CONNECT_TIMEOUT = float(os.getenv("PLAID_CONNECT_TIMEOUT", "5"))
+PLAID_READ_TIMEOUT = float(os.getenv("PLAID_READ_TIMEOUT", "60"))
+
 # Optional OpenAI API Key - pyNance Specific Key Default
 OPENAI_API_KEY_PYNANCE = os.getenv("OPENAI_API_KEY_PYNANCE")
 
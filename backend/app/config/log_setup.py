@@ -3,13 +3,27 @@
 The module respects the ``LOG_LEVEL`` environment variable (defaulting to
 ``INFO``) for the root logger and both console/file handlers. The console
 handler uses ANSI color codes, while the file handler rotates at 10MB with
-five backups.
+five backups. Importing the module installs nothing; handlers are added by
+:func:`setup_sql_logger` and :func:`setup_logger`, which
+``app.config.configure_logging`` calls.
+
+Application records never touch a file or stream on the calling thread: the
+root logger holds a single :class:`~logging.handlers.QueueHandler` and a
+:class:`~logging.handlers.QueueListener` thread writes to the real handlers.
+``LOG_FORMAT=json`` switches both outputs to one JSON object per line, and
+:class:`RateLimitFilter` caps how often a single call site may emit
+DEBUG/INFO records (``LOG_RATE_LIMIT`` per ``LOG_RATE_WINDOW`` seconds).
 """
 
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from .environment import ENV
@@ -26,16 +40,28 @@ sql_formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(filename)s:%(li
 #   SQLAlchemy Logging (Rotating, quiet by default)
 # ---------------------------------------------------------------------------
 sqlalchemy_logger = logging.getLogger("sqlalchemy.engine")
-sqlalchemy_logger.setLevel(logging.WARNING)
 
-sql_file_handler = RotatingFileHandler(SQL_LOG_FILE, maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT, encoding="utf-8")
-sql_file_handler.setFormatter(sql_formatter)
-sqlalchemy_logger.addHandler(sql_file_handler)
 
-if os.getenv("SQL_ECHO", "false").lower() == "true":
-    sql_console_handler = logging.StreamHandler(sys.stdout)
-    sql_console_handler.setFormatter(sql_formatter)
-    sqlalchemy_logger.addHandler(sql_console_handler)
+def setup_sql_logger():
+    """Send ``sqlalchemy.engine`` warnings to ``sqlalchemy.log`` (and stdout with ``SQL_ECHO``) once."""
+
+    sqlalchemy_logger.setLevel(logging.WARNING)
+    if any(Path(getattr(h, "baseFilename", "")) == SQL_LOG_FILE for h in sqlalchemy_logger.handlers):
+        return sqlalchemy_logger
+
+    SQL_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    sql_file_handler = RotatingFileHandler(
+        SQL_LOG_FILE, maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT, encoding="utf-8"
+    )
+    sql_file_handler.setFormatter(sql_formatter)
+    sqlalchemy_logger.addHandler(sql_file_handler)
+
+    if os.getenv("SQL_ECHO", "false").lower() == "true":
+        sql_console_handler = logging.StreamHandler(sys.stdout)
+        sql_console_handler.setFormatter(sql_formatter)
+        sqlalchemy_logger.addHandler(sql_console_handler)
+    return sqlalchemy_logger
+
 
 # ---------------------------------------------------------------------------
 #   App Logging
@@ -47,6 +73,17 @@ elif ENV == "production" and LOG_LEVEL.upper() == "DEBUG":
     LOG_LEVEL = "INFO"
 LOG_LEVEL = LOG_LEVEL.upper()
 
+# "text" (default) or "json"
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").strip().lower()
+# DEBUG/INFO records one call site may emit per window; 0 disables the limit
+LOG_RATE_LIMIT = int(os.getenv("LOG_RATE_LIMIT", "50"))
+LOG_RATE_WINDOW = float(os.getenv("LOG_RATE_WINDOW", "60"))
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+
+# LogRecord attributes that are not ``extra=`` fields
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "suppressed"}
+
 
 class ColorFormatter(logging.Formatter):
     COLORS = {
@@ -69,21 +106,150 @@ class ColorFormatter(logging.Formatter):
         return f"{color}{super().format(record)}{self.RESET}"
 
 
+class JsonFormatter(logging.Formatter):
+    """Render each record as a single-line JSON object.
+
+    ``extra=`` fields are included as top-level keys, tracebacks under ``exc``.
+    """
+
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "file": record.filename,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if getattr(record, "suppressed", 0):
+            payload["suppressed"] = record.suppressed
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Let each call site emit at most ``limit`` DEBUG/INFO records per ``window`` seconds.
+
+    A call site is the logger name plus source file and line. Records beyond
+    the limit are dropped and counted; the first record of the next window
+    reports how many were suppressed. WARNING and above always pass.
+    """
+
+    def __init__(self, limit: int = LOG_RATE_LIMIT, window: float = LOG_RATE_WINDOW):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._sites: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.limit <= 0:
+            return True
+        key = (record.name, record.pathname, record.lineno)
+        with self._lock:
+            state = self._sites.get(key)
+            if state is None or record.created - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                state = self._sites[key] = [record.created, 0, suppressed]
+            if state[1] >= self.limit:
+                state[2] += 1
+                return False
+            state[1] += 1
+            suppressed, state[2] = state[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+            record.msg = f"{record.getMessage()} [{suppressed} similar messages suppressed]"
+            record.args = None
+        return True
+
+
+class AppQueueHandler(QueueHandler):
+    """``QueueHandler`` that keeps the message and traceback separate for the JSON formatter."""
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener: QueueListener | None = None
+
+
+def _build_formatter(console: bool = False):
+    if LOG_FORMAT == "json":
+        return JsonFormatter()
+    if console:
+        return ColorFormatter(TEXT_FORMAT, use_color=sys.stdout.isatty())
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread (registered with ``atexit``)."""
+
+    global _listener
+
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
+
+def _restart_listener_after_fork():
+    """Give a forked child its own queue and listener; the parent's thread does not survive ``fork``."""
+
+    global _listener
+
+    if _listener is None:
+        return
+    queue_handler = next((h for h in logging.getLogger().handlers if isinstance(h, AppQueueHandler)), None)
+    if queue_handler is None:
+        return
+    queue_handler.queue = queue.SimpleQueue()
+    _listener = QueueListener(queue_handler.queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+atexit.register(stop_logging)
+
+
 def setup_logger():
     """
     Configure root logger with:
-      - single rotating file handler
-      - single colored console handler
-      - honoring LOG_LEVEL
+      - a single queue handler (rate limited) feeding a listener thread that owns
+        - one rotating file handler
+        - one colored console handler (unless the root already logs to stdout/stderr)
+      - honoring LOG_LEVEL and LOG_FORMAT
       - suppressing noisy libs (werkzeug, urllib3, botocore)
     """
+    global _listener
+
     log_level = getattr(logging, LOG_LEVEL, logging.INFO)
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Helper predicates
-    def is_app_file_handler(h):
-        return isinstance(h, RotatingFileHandler) and Path(getattr(h, "baseFilename", "")) == APP_LOG_FILE
+    queue_handler = next((h for h in root_logger.handlers if isinstance(h, AppQueueHandler)), None)
+    if queue_handler is not None and _listener is not None:
+        queue_handler.setLevel(log_level)
+        for handler in _listener.handlers:
+            handler.setLevel(log_level)
+        return root_logger
+    stop_logging()  # a listener whose queue handler was removed
 
     def is_console_handler(h):
         return isinstance(h, logging.StreamHandler) and getattr(h, "stream", None) in (
@@ -91,54 +257,39 @@ def setup_logger():
             sys.stderr,
         )
 
-    existing_file = any(is_app_file_handler(h) for h in root_logger.handlers)
     existing_console = any(is_console_handler(h) for h in root_logger.handlers)
 
-    # Create log directory if needed
-    if not existing_file or not existing_console:
-        APP_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    APP_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     # ----------------------------
-    # File Handler
+    # Output handlers (run on the listener thread)
     # ----------------------------
-    if not existing_file:
-        file_handler = RotatingFileHandler(
-            APP_LOG_FILE,
-            maxBytes=MAX_LOG_SIZE,
-            backupCount=BACKUP_COUNT,
-            encoding="utf-8",
-        )
-        file_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
-        )
-        file_handler.setLevel(log_level)
-        root_logger.addHandler(file_handler)
+    file_handler = RotatingFileHandler(
+        APP_LOG_FILE,
+        maxBytes=MAX_LOG_SIZE,
+        backupCount=BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(_build_formatter())
+    file_handler.setLevel(log_level)
+    handlers = [file_handler]
 
-    # ----------------------------
-    # Console Handler
-    # ----------------------------
     if not existing_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(
-            ColorFormatter(
-                "%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
-                use_color=sys.stdout.isatty(),
-            )
-        )
+        console_handler.setFormatter(_build_formatter(console=True))
         console_handler.setLevel(log_level)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # ----------------------------
-    # Normalize handler levels
+    # Queue handler (runs on the calling thread)
     # ----------------------------
-    for handler in root_logger.handlers:
-        if is_app_file_handler(handler):
-            handler.setLevel(log_level)
-            handler.setFormatter(
-                logging.Formatter("%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
-            )
-        elif is_console_handler(handler):
-            handler.setLevel(log_level)
+    queue_handler = AppQueueHandler(queue.SimpleQueue())
+    queue_handler.setLevel(log_level)
+    queue_handler.addFilter(RateLimitFilter())
+    root_logger.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # ----------------------------
     # Silence noisy libs once
@@ -149,9 +300,12 @@ def setup_logger():
 
     # Only log once after full setup
     root_logger.info(
-        "Logging initialized. LOG_LEVEL=%s (RotatingFileHandler, 10MB x%d)",
+        "Logging initialized. LOG_LEVEL=%s LOG_FORMAT=%s (queued RotatingFileHandler, 10MB x%d, rate limit %d/%ss)",
         LOG_LEVEL,
+        LOG_FORMAT,
         BACKUP_COUNT,
+        LOG_RATE_LIMIT,
+        LOG_RATE_WINDOW,
     )
 
     return root_logger
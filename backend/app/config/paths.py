@@ -1,9 +1,11 @@
 """Define and create backend directory structure.
 
 This module exposes common paths used by the backend. Each directory is created
-on import so other modules can read and write files safely.
+on import so other modules can read and write files safely. ``LOGS_DIR`` may be
+overridden through the environment variable of the same name.
 """
 
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -15,7 +17,7 @@ DIRECTORIES = {
     "IMPORT_DIR": BASE_DIR / "data" / "imports",
     "CERTS_DIR": BASE_DIR / "certs",
     "TEMP_DIR": BASE_DIR / "temp",
-    "LOGS_DIR": BASE_DIR / "logs",
+    "LOGS_DIR": Path(os.getenv("LOGS_DIR") or BASE_DIR / "logs"),
     "ARCHIVE_DIR": BASE_DIR / "archive",
     "CONFIG_DIR": BASE_DIR / "config",
     "THEMES_DIR": BASE_DIR / "themes",
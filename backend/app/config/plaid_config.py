@@ -1,33 +1,123 @@
-"""Initialize the Plaid API client if dependencies are available.
+"""Expose a lazily created, pooled Plaid API client.
 
-This module configures and exposes a :data:`plaid_client` instance used by the
-rest of the application. Tests and environments without Plaid credentials or
-packages should still be able to import this module, so the client defaults to
-``None`` when requirements are missing.
+:data:`plaid_client` is a :class:`LazyPlaidClient` proxy. Importing this module
+does not import the Plaid SDK; the real ``PlaidApi`` is built on first
+attribute access and then shared by every caller in the process, so its
+``urllib3`` connection pool keeps connections to Plaid alive across requests,
+sync workers and threads. Tests and environments without Plaid credentials or
+packages can still import this module: the proxy is falsy when the client
+cannot be built.
 """
 
 from __future__ import annotations
 
+import threading
+
+from .environment import (
+    PLAID_CLIENT_ID,
+    PLAID_CONNECT_TIMEOUT,
+    PLAID_ENV,
+    PLAID_POOL_MAXSIZE,
+    PLAID_READ_TIMEOUT,
+    PLAID_SECRET,
+)
+
 # pylint: disable=import-error,invalid-name,broad-exception-caught
 
-# Provide safe defaults to allow imports when Plaid dependencies are absent.
-PLAID_BASE_URL = "https://sandbox.plaid.com"
-plaid_client = None
+PLAID_BASE_URL = f"https://{PLAID_ENV}.plaid.com"
+
+
+def build_plaid_client(
+    host: str = PLAID_BASE_URL,
+    client_id: str | None = PLAID_CLIENT_ID,
+    secret: str | None = PLAID_SECRET,
+    pool_maxsize: int = PLAID_POOL_MAXSIZE,
+    timeout: tuple[float, float] = (PLAID_CONNECT_TIMEOUT, PLAID_READ_TIMEOUT),
+):
+    """Return a ``PlaidApi`` with a keep-alive connection pool and default timeouts.
+
+    Every request gets ``timeout`` as ``(connect, read)`` seconds unless the
+    caller passes its own ``_request_timeout``.
+    """
+
+    import socket
 
-try:  # pragma: no cover - exercised indirectly
+    from plaid import rest
     from plaid.api import plaid_api
     from plaid.api_client import ApiClient
     from plaid.configuration import Configuration
+    from urllib3.connection import HTTPConnection
 
-    from .environment import PLAID_CLIENT_ID, PLAID_ENV, PLAID_SECRET
+    class TimeoutRESTClient(rest.RESTClientObject):
+        """SDK REST client that applies ``timeout`` when a call sets none."""
 
-    PLAID_BASE_URL = f"https://{PLAID_ENV}.plaid.com"
-    configuration = Configuration(
-        host=PLAID_BASE_URL,
-        api_key={"clientId": PLAID_CLIENT_ID, "secret": PLAID_SECRET},
-    )
+        def request(self, method, url, *args, _request_timeout=None, **kwargs):
+            return super().request(method, url, *args, _request_timeout=_request_timeout or timeout, **kwargs)
+
+    configuration = Configuration(host=host, api_key={"clientId": client_id, "secret": secret})
+    configuration.connection_pool_maxsize = pool_maxsize
+    configuration.socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
     api_client = ApiClient(configuration)
-    plaid_client = plaid_api.PlaidApi(api_client)
-except Exception:  # noqa: BLE001
-    # If Plaid isn't configured, expose a ``None`` client to allow tests to run.
-    plaid_client = None
+    api_client.rest_client = TimeoutRESTClient(configuration)
+    return plaid_api.PlaidApi(api_client)
+
+
+class LazyPlaidClient:
+    """Proxy that builds the shared Plaid client on first use.
+
+    Attribute access (``plaid_client.accounts_get(...)``) is forwarded to the
+    real client. ``bool(proxy)`` is ``False`` when the SDK is missing or the
+    client cannot be built; :attr:`configured` checks credentials without
+    building anything.
+    """
+
+    def __init__(self, factory=build_plaid_client):
+        self._factory = factory
+        self._client = None
+        self._built = False
+        self._lock = threading.Lock()
+
+    @property
+    def configured(self) -> bool:
+        """Return ``True`` when Plaid credentials are set."""
+
+        return bool(PLAID_CLIENT_ID and PLAID_SECRET)
+
+    def get(self):
+        """Return the shared ``PlaidApi``, or ``None`` when it cannot be built."""
+
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    try:  # pragma: no cover - exercised indirectly
+                        self._client = self._factory()
+                    except Exception:  # noqa: BLE001
+                        self._client = None
+                    self._built = True
+        return self._client
+
+    def reset(self) -> None:
+        """Drop the shared client and its connection pool; the next use builds a new one."""
+
+        with self._lock:
+            client, self._client, self._built = self._client, None, False
+        if client is not None:
+            client.api_client.rest_client.pool_manager.clear()
+
+    def __bool__(self) -> bool:
+        return self.get() is not None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        client = self.get()
+        if client is None:
+            raise RuntimeError("Plaid client is unavailable; install plaid-python and check the Plaid settings.")
+        return getattr(client, name)
+
+    def __repr__(self) -> str:
+        state = "built" if self._client is not None else ("unavailable" if self._built else "not built")
+        return f"<LazyPlaidClient {PLAID_BASE_URL} ({state})>"
+
+
+plaid_client = LazyPlaidClient()
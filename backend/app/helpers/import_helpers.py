@@ -6,8 +6,6 @@ import traceback
 from datetime import datetime
 from pathlib import Path
 
-import pdfplumber
-
 from app.config import logger
 
 
@@ -68,6 +66,8 @@ def import_transactions_from_csv(filepath: str | Path):
 
 def import_transactions_from_pdf(filepath: str | Path):
     """Parse a Synchrony PDF statement into transaction dicts."""
+    import pdfplumber
+
     path = _resolve_import_path(filepath)
     logger.debug("[PDF IMPORT] Starting PDF import from: %s", path)
 
@@ -10,26 +10,12 @@ from datetime import date, datetime
 from typing import Union
 
 from flask import has_request_context, request
-from plaid.exceptions import ApiException
-from plaid.model.accounts_get_request import AccountsGetRequest
-from plaid.model.country_code import CountryCode
-from plaid.model.institutions_get_by_id_request import InstitutionsGetByIdRequest
-from plaid.model.investments_holdings_get_request import InvestmentsHoldingsGetRequest
-from plaid.model.investments_transactions_get_request import InvestmentsTransactionsGetRequest
-from plaid.model.investments_transactions_get_request_options import InvestmentsTransactionsGetRequestOptions
-from plaid.model.item_get_request import ItemGetRequest
-from plaid.model.item_public_token_exchange_request import ItemPublicTokenExchangeRequest
-from plaid.model.item_remove_request import ItemRemoveRequest
-from plaid.model.link_token_create_request import LinkTokenCreateRequest
-from plaid.model.link_token_create_request_user import LinkTokenCreateRequestUser
-from plaid.model.products import Products
-from plaid.model.transactions_get_request import TransactionsGetRequest
-from plaid.model.transactions_get_request_options import TransactionsGetRequestOptions
 
 from app.config import BACKEND_PUBLIC_URL, FILES, PLAID_CLIENT_NAME, PLAID_REDIRECT_URI, logger, plaid_client
 from app.extensions import db
 from app.models import Category
 from app.sql.forecast_logic import update_account_history
+from app.utils.metrics import observe_plaid_call
 
 LAST_TRANSACTIONS = FILES["LAST_TX_REFRESH"]
 PLAID_TOKENS = FILES["PLAID_TOKENS"]
@@ -148,9 +134,13 @@ def get_accounts(access_token: str, user_id: str):
         logger.error("Missing user_id in get_accounts() — aborting.")
         raise ValueError("user_id must be provided to get_accounts")
 
+    from plaid.exceptions import ApiException
+    from plaid.model.accounts_get_request import AccountsGetRequest
+
     try:
         plaid_request = AccountsGetRequest(access_token=access_token)
-        response = plaid_client.accounts_get(plaid_request)
+        with observe_plaid_call("accounts_get"):
+            response = plaid_client.accounts_get(plaid_request)
         accounts = response.accounts
 
         for acct in accounts:
@@ -199,6 +189,8 @@ def get_item(access_token: str):
 
     logger.info("Fetching Plaid item metadata")
 
+    from plaid.model.item_get_request import ItemGetRequest
+
     try:
         plaid_request = ItemGetRequest(access_token=access_token)
         response = plaid_client.item_get(plaid_request)
@@ -219,6 +211,11 @@ def generate_link_token(user_id: str, products=None):
         len(products),
     )
 
+    from plaid.model.country_code import CountryCode
+    from plaid.model.link_token_create_request import LinkTokenCreateRequest
+    from plaid.model.link_token_create_request_user import LinkTokenCreateRequestUser
+    from plaid.model.products import Products
+
     try:
         product_enums = [Products(p) for p in products]
         country_enum = [CountryCode("US")]
@@ -256,6 +253,11 @@ def generate_update_link_token(user_id: str, access_token: str):
     """Create a Plaid Link token in update mode for an existing item."""
 
     logger.info("Generating Plaid update link token for user %s", user_id)
+
+    from plaid.model.country_code import CountryCode
+    from plaid.model.link_token_create_request import LinkTokenCreateRequest
+    from plaid.model.link_token_create_request_user import LinkTokenCreateRequestUser
+
     try:
         country_enum = [CountryCode("US")]
         webhook_url = None
@@ -288,6 +290,8 @@ def exchange_public_token(public_token: str):
 
     logger.info("Exchanging Plaid public token for access token")
 
+    from plaid.model.item_public_token_exchange_request import ItemPublicTokenExchangeRequest
+
     try:
         plaid_request = ItemPublicTokenExchangeRequest(public_token=public_token)
         response = plaid_client.item_public_token_exchange(plaid_request)
@@ -308,6 +312,8 @@ def remove_item(access_token: str) -> None:
 
     logger.info("Requesting Plaid item removal")
 
+    from plaid.model.item_remove_request import ItemRemoveRequest
+
     try:
         plaid_request = ItemRemoveRequest(access_token=access_token)
         plaid_client.item_remove(plaid_request)
@@ -318,6 +324,9 @@ def remove_item(access_token: str) -> None:
 
 
 def get_institution_name(institution_id: str):
+    from plaid.model.country_code import CountryCode
+    from plaid.model.institutions_get_by_id_request import InstitutionsGetByIdRequest
+
     try:
         plaid_request = InstitutionsGetByIdRequest(institution_id=institution_id, country_codes=[CountryCode("US")])
         response = plaid_client.institutions_get_by_id(plaid_request)
@@ -369,6 +378,9 @@ def get_transactions(
 
     logger.info("Fetching transactions between %s and %s", start_dt, end_dt)
 
+    from plaid.model.transactions_get_request import TransactionsGetRequest
+    from plaid.model.transactions_get_request_options import TransactionsGetRequestOptions
+
     try:
         all_transactions = []
         offset = 0
@@ -382,7 +394,8 @@ def get_transactions(
                 end_date=end_dt,
                 options=options,
             )
-            response = plaid_client.transactions_get(plaid_request)
+            with observe_plaid_call("transactions_get"):
+                response = plaid_client.transactions_get(plaid_request)
 
             batch = [tx.to_dict() for tx in response.transactions]
             all_transactions.extend(batch)
@@ -423,6 +436,8 @@ def resolve_or_create_category(category_path):
 
 
 def get_investments(access_token: str):
+    from plaid.model.investments_holdings_get_request import InvestmentsHoldingsGetRequest
+
     try:
         plaid_request = InvestmentsHoldingsGetRequest(access_token=access_token)
         response = plaid_client.investments_holdings_get(plaid_request)
@@ -455,6 +470,9 @@ def get_investment_transactions(access_token: str, start_date, end_date):
                 return date.fromisoformat(value)
         return datetime.utcnow().date()
 
+    from plaid.model.investments_transactions_get_request import InvestmentsTransactionsGetRequest
+    from plaid.model.investments_transactions_get_request_options import InvestmentsTransactionsGetRequestOptions
+
     try:
         start_dt = _coerce_to_date(start_date)
         end_dt = _coerce_to_date(end_date)
@@ -27,11 +27,14 @@ from .planning_models import AllocationType, PlannedBill, PlanningScenario, Scen
 # Transactions
 from .transaction_models import (
     Category,
+    MerchantUsage,
     PlaidTransactionMeta,
+    RecurringSignature,
     RecurringTransaction,
     Tag,
     Transaction,
     TransactionRule,
+    TransactionSearchDocument,
     transaction_tags,
 )
 
@@ -57,7 +60,10 @@ __all__ = [
     "Transaction",
     "transaction_tags",
     "RecurringTransaction",
+    "RecurringSignature",
+    "MerchantUsage",
     "TransactionRule",
+    "TransactionSearchDocument",
     "PlaidTransactionMeta",
     # Planning
     "AllocationType",
@@ -21,7 +21,7 @@ class Account(db.Model, TimestampMixin):
 
     # Use business key as the primary key across the schema
     account_id = db.Column(db.String(64), primary_key=True, nullable=False, index=True)
-    user_id = db.Column(db.String(64), nullable=True)
+    user_id = db.Column(db.String(64), nullable=True, index=True)
     name = db.Column(db.String(128), nullable=False)
     type = db.Column(db.String(64), nullable=True)
     subtype = db.Column(db.String(64), nullable=True)
@@ -1,4 +1,4 @@
-"""Transaction models including categories, tags, recurring schedules, and Plaid metadata."""
+"""Transaction models including categories, tags, recurring schedules and signatures, and Plaid metadata."""
 
 from datetime import datetime
 from decimal import Decimal
@@ -136,6 +136,14 @@ class Transaction(db.Model):
     is_internal = db.Column(db.Boolean, default=False, index=True)
     transfer_type = db.Column(db.String(32), nullable=True, index=True)
     internal_match_id = db.Column(db.String(64), nullable=True)
+    # Naive UTC watermark for incremental exports; bulk SQL updates must set it explicitly.
+    updated_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.utcnow(),
+        onupdate=lambda: datetime.utcnow(),
+        server_default=sa.func.now(),
+        index=True,
+    )
 
     plaid_meta = db.relationship(
         "PlaidTransactionMeta",
@@ -222,6 +230,76 @@ class RecurringTransaction(db.Model):
     next_instance_id = db.Column(db.String(64), nullable=True)
 
 
+class RecurringSignature(db.Model, TimestampMixin):
+    """Running cadence statistics for one recurring-transaction signature.
+
+    A signature groups an account's transactions by merchant slug (or a short
+    description signature when no merchant is known) and exact amount in cents.
+    Ingest updates the row incrementally, so recurring candidates can be read
+    without regrouping transaction history.
+    """
+
+    __tablename__ = "recurring_signatures"
+    __table_args__ = (
+        db.UniqueConstraint("account_id", "signature", "amount_bucket", name="uq_recurring_signatures_key"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.String(64), nullable=True, index=True)
+    account_id = db.Column(
+        db.String(64),
+        db.ForeignKey("accounts.account_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    signature = db.Column(db.String(128), nullable=False)
+    amount_bucket = db.Column(db.BigInteger, nullable=False)
+    description = db.Column(db.String(256), nullable=True)
+    occurrence_count = db.Column(db.Integer, nullable=False, default=0)
+    first_date = db.Column(db.Date, nullable=True)
+    last_date = db.Column(db.Date, nullable=True, index=True)
+    gap_histogram = db.Column(db.JSON, nullable=False, default=dict)
+    last_transaction_id = db.Column(db.String(64), nullable=True)
+
+
+class MerchantUsage(db.Model, TimestampMixin):
+    """Per-user merchant dimension with usage counts for typeahead ranking.
+
+    Ingest increments ``usage_count`` for each new transaction's normalized
+    merchant, so suggestions never aggregate the transactions table.
+    """
+
+    __tablename__ = "merchant_usage"
+    __table_args__ = (db.UniqueConstraint("user_id", "merchant_slug", name="uq_merchant_usage_user_slug"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.String(64), nullable=False, index=True)
+    merchant_slug = db.Column(db.String(128), nullable=False)
+    display_name = db.Column(db.String(128), nullable=False)
+    usage_count = db.Column(db.Integer, nullable=False, default=0)
+    last_seen = db.Column(db.Date, nullable=True)
+
+
+class TransactionSearchDocument(db.Model):
+    """Denormalized search text for one transaction.
+
+    ``document`` joins the description, merchant name, category display, and
+    tag names and is rewritten whenever those change. On PostgreSQL the
+    migration adds a generated ``search_vector`` tsvector column with a GIN
+    index over it; other backends search the text in process.
+    """
+
+    __tablename__ = "transaction_search_documents"
+
+    transaction_id = db.Column(
+        db.String(64),
+        db.ForeignKey("transactions.transaction_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    document = db.Column(db.Text, nullable=False, default="")
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
+
 class TransactionRule(db.Model, TimestampMixin):
     __tablename__ = "transaction_rules"
 
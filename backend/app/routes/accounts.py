@@ -6,7 +6,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
 from flask import Blueprint, g, jsonify, request
-from plaid.exceptions import ApiException
+from sqlalchemy.orm import selectinload
 
 from app.config import logger
 from app.extensions import db
@@ -22,6 +22,7 @@ from app.sql.account_logic import (
 )
 from app.sql.forecast_logic import update_account_history
 from app.utils.finance_utils import display_transaction_amount, normalize_account_balance
+from app.utils.http_cache import conditional_get
 
 # Blueprint for generic accounts routes
 accounts = Blueprint("accounts", __name__)
@@ -205,6 +206,8 @@ def refresh_all_accounts():
         logger.debug("Skipping duplicate bulk refresh call in the same request.")
         return cached_response
     try:
+        from plaid.exceptions import ApiException
+
         from app.sql import account_logic
 
         data = request.get_json() or {}
@@ -615,6 +618,7 @@ def refresh_single_account(account_id):
 
 
 @accounts.route("/get_accounts", methods=["GET"])
+@conditional_get()
 def list_accounts():
     """Return serialized account data for the requesting client."""
     try:
@@ -689,7 +693,7 @@ def refresh_status():
     sla_hours = float(request.args.get("sla_hours", 6))
     sla = timedelta(hours=sla_hours)
 
-    query = Account.query
+    query = Account.query.options(selectinload(Account.plaid_account))
     if not include_hidden:
         query = query.filter(Account.is_hidden.is_(False))
 
@@ -864,6 +868,7 @@ def match_account_by_fields():
 
 
 @accounts.route("/<account_id>/net_changes", methods=["GET"])
+@conditional_get()
 def account_net_changes(account_id):
     """Return net balance change and breakdown for an account.
 
@@ -943,6 +948,7 @@ def account_net_changes(account_id):
 
 # Endpoint to fetch account balance history
 @accounts.route("/<account_id>/history", methods=["GET"])
+@conditional_get()
 def get_account_history(account_id):
     """Return reverse-mapped daily balance history for an account.
 
@@ -1024,6 +1030,7 @@ def get_account_history(account_id):
 
 
 @accounts.route("/<account_id>/transaction_history", methods=["GET"])
+@conditional_get()
 def transaction_history(account_id):
     """Return transaction history for an account.
 
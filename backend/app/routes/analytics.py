@@ -0,0 +1,92 @@
+"""Snapshot-backed analytics for all-time and heavy aggregate views."""
+
+from datetime import datetime
+
+from flask import Blueprint, jsonify, request
+
+from app.config import logger
+
+analytics = Blueprint("analytics", __name__)
+
+
+def _parse_filters(args) -> dict:
+    """Return date filters from ``start_date``/``end_date`` (YYYY-MM-DD).
+
+    Raises:
+        ValueError: If a date does not parse.
+    """
+
+    filters = {}
+    for name in ("start_date", "end_date"):
+        value = args.get(name)
+        if value:
+            try:
+                filters[name] = datetime.strptime(value, "%Y-%m-%d").date()
+            except ValueError as exc:
+                raise ValueError(f"Invalid {name}: {value}") from exc
+    return filters
+
+
+def _hidden_account_ids(user_id: str) -> list[str]:
+    """Return the user's hidden accounts, which dashboards leave out."""
+    from app.extensions import db
+    from app.models import Account
+
+    rows = db.session.query(Account.account_id).filter(Account.user_id == user_id, Account.is_hidden.is_(True)).all()
+    return [row.account_id for row in rows]
+
+
+def _run(query, **kwargs):
+    """Run an analytics ``query`` for the request's user and wrap the result."""
+    from app.services.analytics import AnalyticsUnavailable, snapshot_info
+
+    user_id = (request.args.get("user_id") or "").strip()
+    if not user_id:
+        return jsonify({"status": "error", "message": "user_id is required"}), 400
+    try:
+        filters = _parse_filters(request.args)
+        data = query(user_id, exclude_account_ids=_hidden_account_ids(user_id), **filters, **kwargs)
+        return jsonify({"status": "success", "data": data, "snapshot": snapshot_info(user_id)}), 200
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    except AnalyticsUnavailable as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+    except Exception as e:
+        logger.error("Error in analytics query: %s", e, exc_info=True)
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
+@analytics.route("/category_trends", methods=["GET"])
+def get_category_trends():
+    """Return monthly spending per category from the user's snapshot.
+
+    Query params: ``user_id`` (required), optional ``start_date``/``end_date``.
+    """
+    from app.services.analytics import category_trends
+
+    return _run(category_trends)
+
+
+@analytics.route("/merchant_totals", methods=["GET"])
+def get_merchant_totals():
+    """Return top merchants by spending from the user's snapshot.
+
+    Query params: ``user_id`` (required), optional ``start_date``/``end_date``
+    and ``top_n`` (default 50).
+    """
+    from app.services.analytics import merchant_totals
+
+    top_n = request.args.get("top_n", 50, type=int)
+    return _run(merchant_totals, top_n=max(1, top_n))
+
+
+@analytics.route("/year_over_year", methods=["GET"])
+def get_year_over_year():
+    """Compare monthly spending and income with the prior year.
+
+    Query params: ``user_id`` (required), optional ``year`` (defaults to the
+    current year).
+    """
+    from app.services.analytics import year_over_year
+
+    return _run(year_over_year, year=request.args.get("year", type=int))
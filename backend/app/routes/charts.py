@@ -14,6 +14,8 @@ from app.extensions import db
 from app.models import Account, Category, Tag, Transaction, transaction_tags
 from app.services.forecast_orchestrator import ForecastOrchestrator
 from app.utils.finance_utils import display_transaction_amount, normalize_account_balance
+from app.utils.http_cache import conditional_get
+from app.utils.read_replica import read_replica
 
 charts = Blueprint("charts", __name__)
 
@@ -45,6 +47,8 @@ def _request_cache():
 
 
 @charts.route("/category_breakdown", methods=["GET"])
+@read_replica()
+@conditional_get()
 def category_breakdown():
     logger.debug("Entered category_breakdown endpoint")
 
@@ -87,17 +91,10 @@ def category_breakdown():
             amount = abs(tx.amount)
 
             if key not in breakdown_map:
-                logger.debug("Initializing breakdown record for category: %s", key)
                 breakdown_map[key] = {"amount": 0, "date": tx.date}
 
             breakdown_map[key]["amount"] += amount
             if tx.date < breakdown_map[key]["date"]:
-                logger.debug(
-                    "Updating earliest transaction date for category '%s' from %s to %s",
-                    key,
-                    breakdown_map[key]["date"],
-                    tx.date,
-                )
                 breakdown_map[key]["date"] = tx.date
 
         # Sort by descending amount
@@ -112,7 +109,7 @@ def category_breakdown():
             for k, v in sorted_items
         ]
 
-        logger.debug("Prepared final breakdown data: %s", data)
+        logger.debug("Prepared breakdown for %d categories", len(data))
         return jsonify({"status": "success", "data": data}), 200
 
     except Exception as e:
@@ -122,6 +119,8 @@ def category_breakdown():
 
 
 @charts.route("/tag_metrics", methods=["GET"])
+@read_replica()
+@conditional_get()
 def tag_metrics() -> Dict[str, Any]:
     """Return tag totals and counts within a date range."""
     start_date_str = request.args.get("start_date")
@@ -179,6 +178,8 @@ def tag_metrics() -> Dict[str, Any]:
 
 
 @charts.route("/category_transactions", methods=["GET"])
+@read_replica()
+@conditional_get()
 def category_transactions() -> Dict[str, Any]:
     """Return visible expense transactions contributing to category chart bars."""
     ids_str = request.args.get("category_ids", "")
@@ -233,6 +234,8 @@ def category_transactions() -> Dict[str, Any]:
 
 
 @charts.route("/merchant_transactions", methods=["GET"])
+@read_replica()
+@conditional_get()
 def merchant_transactions() -> Dict[str, Any]:
     """Return visible expense transactions contributing to a merchant chart bar."""
 
@@ -272,6 +275,8 @@ def merchant_transactions() -> Dict[str, Any]:
 
 
 @charts.route("/cash_flow", methods=["GET"])
+@read_replica()
+@conditional_get()
 def get_cash_flow():
     try:
         granularity = request.args.get("granularity", "monthly")
@@ -335,6 +340,8 @@ def get_cash_flow():
 
 
 @charts.route("/net_assets", methods=["GET"])
+@read_replica()
+@conditional_get()
 def get_net_assets():
     """Return trended net asset values.
 
@@ -404,6 +411,8 @@ def get_net_assets():
 
 
 @charts.route("/daily_net", methods=["GET"])
+@read_replica()
+@conditional_get()
 def get_daily_net() -> Dict[str, Dict[str, Any]]:
     """
     Returns a dict mapping YYYY-MM-DD string to:
@@ -513,6 +522,8 @@ def get_daily_net() -> Dict[str, Dict[str, Any]]:
 
 
 @charts.route("/accounts-snapshot", methods=["GET"])
+@read_replica()
+@conditional_get()
 def accounts_snapshot():
     user_id = request.args.get("user_id")
     cache = _request_cache()
@@ -544,6 +555,8 @@ def accounts_snapshot():
 
 
 @charts.route("/forecast", methods=["GET"])
+@read_replica()
+@conditional_get()
 def forecast_route():
     """Return forecast vs actual lines for the authenticated user."""
     try:
@@ -599,6 +612,8 @@ def forecast_route():
 
 
 @charts.route("/category_breakdown_tree", methods=["GET"])
+@read_replica()
+@conditional_get()
 def category_breakdown_tree():
     """
     Returns expense breakdown by parent category (primary_category, one bar per parent),
@@ -686,7 +701,7 @@ def category_breakdown_tree():
         # Top-N by spending
         output_sorted = sorted(output, key=lambda x: x["amount"], reverse=True)[:top_n]
 
-        logger.debug("Category breakdown output (primary/detailed): %s", output_sorted)
+        logger.debug("Category breakdown tree: %d of %d parent categories", len(output_sorted), len(output))
         return (
             jsonify(
                 {
@@ -706,6 +721,8 @@ def category_breakdown_tree():
 
 
 @charts.route("/merchant_breakdown", methods=["GET"])
+@read_replica()
+@conditional_get()
 def merchant_breakdown():
     """Aggregate expense totals by merchant name for the requested range.
 
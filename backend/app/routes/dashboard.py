@@ -16,6 +16,7 @@ from app.services.safe_to_spend import (
     SafeToSpendInputs,
     build_safe_to_spend_payload,
 )
+from app.utils.http_cache import conditional_get
 
 dashboard = Blueprint("dashboard", __name__)
 
@@ -71,6 +72,7 @@ def get_account_snapshot():
 
 
 @dashboard.route("/activity-status", methods=["GET"])
+@conditional_get()
 def get_activity_status():
     """Return a parseable dashboard greeting status generated from recent activity."""
 
@@ -0,0 +1,51 @@
+"""Developer diagnostics for SQL workload per request and job."""
+
+from flask import Blueprint, abort, current_app, jsonify, request
+
+debug = Blueprint("debug", __name__)
+
+
+@debug.before_request
+def _require_debug_enabled():
+    """Hide the blueprint unless ``SQL_DEBUG_ENDPOINT`` (default: debug mode) is on."""
+
+    if not current_app.config.get("SQL_DEBUG_ENDPOINT", current_app.debug):
+        abort(404)
+
+
+@debug.route("/sql", methods=["GET"])
+def sql_stats():
+    """Return recent per-request SQL summaries and aggregated N+1 suspects.
+
+    Query params:
+    - limit: number of recent summaries to return (default 50)
+    """
+    from app.utils.sql_instrumentation import recent_query_stats
+
+    limit = max(1, request.args.get("limit", 50, type=int))
+    recent = recent_query_stats()
+    suspects: dict[str, dict] = {}
+    for entry in recent:
+        for item in entry["n_plus_one"]:
+            suspect = suspects.setdefault(
+                item["statement"], {"statement": item["statement"], "executions": 0, "db_ms": 0.0, "labels": []}
+            )
+            suspect["executions"] += item["count"]
+            suspect["db_ms"] = round(suspect["db_ms"] + item["db_ms"], 2)
+            if entry["label"] not in suspect["labels"]:
+                suspect["labels"].append(entry["label"])
+
+    data = {
+        "recent": recent[:limit],
+        "suspects": sorted(suspects.values(), key=lambda item: item["executions"], reverse=True),
+    }
+    return jsonify({"status": "success", "data": data}), 200
+
+
+@debug.route("/sql", methods=["DELETE"])
+def clear_sql_stats():
+    """Forget collected SQL summaries."""
+    from app.utils.sql_instrumentation import clear_query_stats
+
+    clear_query_stats()
+    return jsonify({"status": "success"}), 200
@@ -1,27 +1,82 @@
-"""CSV export routes for various models."""
+"""Export routes for streaming model data as CSV, NDJSON, or Parquet."""
 
 import csv
+from datetime import datetime, timezone
 from io import StringIO
 
-from flask import Blueprint, Response, jsonify
+from flask import Blueprint, Response, jsonify, request
 
 from app.extensions import db
 from app.models import Account, PlaidAccount
-from app.sql.export_logic import export_all_to_csv, export_csv_response
+from app.sql.export_logic import ExportFilters, export_all_to_csv, stream_export_response
 
 export = Blueprint("export", __name__)
 
 
+def _parse_export_filters(args) -> ExportFilters:
+    """Return :class:`ExportFilters` from query arguments.
+
+    ``account_ids`` accepts a comma-delimited string or repeated
+    ``account_ids[]`` values; dates are ``YYYY-MM-DD`` and ``since`` is an ISO
+    8601 timestamp in UTC.
+
+    Raises:
+        ValueError: If a date or timestamp does not parse.
+    """
+
+    account_ids: list[str] = []
+    for raw in args.getlist("account_ids[]") + args.getlist("account_ids"):
+        for candidate in raw.split(","):
+            cleaned = candidate.strip()
+            if cleaned and cleaned not in account_ids:
+                account_ids.append(cleaned)
+
+    def _date(name):
+        value = args.get(name)
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+        except ValueError as exc:
+            raise ValueError(f"Invalid {name}: {value}") from exc
+
+    since_raw = args.get("since")
+    try:
+        since = datetime.fromisoformat(since_raw.replace("Z", "+00:00")) if since_raw else None
+    except ValueError as exc:
+        raise ValueError(f"Invalid since: {since_raw}") from exc
+    if since is not None and since.tzinfo is not None:
+        # ``updated_at`` columns hold naive UTC.
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return ExportFilters(
+        user_id=args.get("user_id") or None,
+        start_date=_date("start_date"),
+        end_date=_date("end_date"),
+        account_ids=account_ids,
+        since=since,
+    )
+
+
 @export.route("/<model_name>", methods=["GET"])
-def export_model_csv(model_name):
+def export_model(model_name):
+    """Stream ``model_name`` as an attachment.
+
+    Query args: ``format`` (``csv`` default, ``ndjson``, ``parquet``),
+    ``user_id``, ``start_date``/``end_date``, ``account_ids``, and ``since``
+    (the ``X-Export-Watermark`` of a previous export) for incremental pulls.
+    """
+
     try:
-        response = export_csv_response(model_name)
-        if response is None:
-            return (
-                jsonify({"status": "error", "message": f"Unknown model '{model_name}'"}),
-                404,
-            )
-        return response
+        filters = _parse_export_filters(request.args)
+        return stream_export_response(model_name, request.args.get("format", "csv").lower(), filters)
+    except LookupError:
+        return (
+            jsonify({"status": "error", "message": f"Unknown model '{model_name}'"}),
+            404,
+        )
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    except RuntimeError as e:
+        return jsonify({"status": "error", "message": str(e)}), 501
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
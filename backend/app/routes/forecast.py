@@ -1,19 +1,38 @@
 from datetime import date, datetime, timedelta
 
 from flask import Blueprint, jsonify, request
+from forecast.cache import ForecastResultCache, request_cache_key
 from forecast.engine import compute_forecast
+from forecast.views import normalize_output_mode
 from sqlalchemy import case, func
 
 from app.config import logger
 from app.extensions import db
 from app.models import Account, AccountHistory, Transaction
 from app.services.forecast_orchestrator import ForecastOrchestrator
+from app.sql.data_version import get_data_version
+from app.utils.read_replica import read_replica
+
+# Optional dependency, imported by ``_vectorized_engine`` on first use so
+# workers do not load NumPy at boot. ``None`` means it is unavailable.
+_NOT_LOADED = object()
+compute_forecast_vectorized = _NOT_LOADED
 
 forecast = Blueprint("forecast", __name__)
 LOOKBACK_DAYS = 90
 WAGE_LOOKBACK_DAYS = 180
 AUTO_WAGE_SOURCE_TRANSACTION_LIMIT = 5
 AUTO_RENT_SOURCE_TRANSACTION_LIMIT = 5
+# ``engine="auto"`` switches to the array engine at this horizon length.
+VECTORIZED_ENGINE_MIN_HORIZON_DAYS = 180
+MAX_BATCH_SCENARIOS = 50
+FORECAST_CACHE_MAX_ENTRIES = 256
+FORECAST_CACHE_TTL_SECONDS = 600
+
+FORECAST_RESULT_CACHE = ForecastResultCache(
+    max_entries=FORECAST_CACHE_MAX_ENTRIES,
+    ttl_seconds=FORECAST_CACHE_TTL_SECONDS,
+)
 RENT_KEYWORDS = (
     "rent",
     "apartment",
@@ -122,6 +141,26 @@ def _parse_start_date(raw_value: str | None) -> date:
         raise ValueError("start_date must be ISO-8601 formatted (YYYY-MM-DD).") from exc
 
 
+def _parse_cashflow_range(payload: dict[str, object]) -> tuple[date | None, date | None] | None:
+    """Parse the optional ``cashflow_start``/``cashflow_end`` detail range."""
+    raw_start = payload.get("cashflow_start")
+    raw_end = payload.get("cashflow_end")
+    if raw_start is None and raw_end is None:
+        return None
+    bounds: list[date | None] = []
+    for field_name, raw_value in (("cashflow_start", raw_start), ("cashflow_end", raw_end)):
+        if raw_value is None:
+            bounds.append(None)
+            continue
+        try:
+            bounds.append(datetime.fromisoformat(str(raw_value)).date())
+        except ValueError as exc:
+            raise ValueError(f"{field_name} must be ISO-8601 formatted (YYYY-MM-DD).") from exc
+    if bounds[0] is not None and bounds[1] is not None and bounds[1] < bounds[0]:
+        raise ValueError("cashflow_end must be on or after cashflow_start.")
+    return bounds[0], bounds[1]
+
+
 def _parse_horizon_days(raw_value: object) -> int:
     """Normalize the horizon_days value into a positive integer."""
     if raw_value is None:
@@ -172,6 +211,41 @@ def _parse_normalize(raw_value: object) -> bool:
     raise ValueError("normalize must be a boolean.")
 
 
+def _parse_engine(raw_value: object) -> str:
+    """Normalize the forecast engine selector used by compute requests."""
+    if raw_value is None:
+        return "auto"
+    engine = str(raw_value).strip().lower()
+    if engine not in {"auto", "reference", "vectorized"}:
+        raise ValueError("engine must be one of auto, reference, or vectorized.")
+    return engine
+
+
+def _vectorized_engine():
+    """Return the array forecast engine, importing it on first use."""
+    global compute_forecast_vectorized
+    if compute_forecast_vectorized is _NOT_LOADED:
+        try:
+            from forecast.vectorized import compute_forecast_vectorized as engine
+        except Exception:  # pragma: no cover - slim installs ship without NumPy
+            engine = None
+        compute_forecast_vectorized = engine
+    return compute_forecast_vectorized
+
+
+def _resolve_compute_engine(engine: str, horizon_days: int):
+    """Return the forecast compute callable for an engine selector.
+
+    Falls back to the reference engine when NumPy is unavailable.
+    """
+    vectorized = _vectorized_engine()
+    if vectorized is None:
+        return compute_forecast
+    if engine == "vectorized" or (engine == "auto" and horizon_days >= VECTORIZED_ENGINE_MIN_HORIZON_DAYS):
+        return vectorized
+    return compute_forecast
+
+
 def _load_latest_snapshots(
     user_id: str,
     included_account_ids: list[str] | None = None,
@@ -240,28 +314,25 @@ def _load_latest_snapshots(
     return snapshots
 
 
-def _load_historical_aggregates(
+def _scope_transaction_query(
+    query,
+    *,
     user_id: str,
-    start_date: date,
+    since: date,
+    until: date,
     included_account_ids: list[str] | None = None,
     excluded_account_ids: list[str] | None = None,
-) -> list[dict[str, object]]:
-    """Return daily inflow/outflow aggregates for the lookback window."""
+):
+    """Apply the visibility, date-window, and account scoping shared by forecast loaders."""
     included_ids = included_account_ids or []
     excluded_ids = excluded_account_ids or []
 
-    lookback_start = start_date - timedelta(days=LOOKBACK_DAYS)
-    date_expr = func.date(Transaction.date).label("date")
-    inflow_sum = func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0)).label("inflow")
-    outflow_sum = func.sum(case((Transaction.amount < 0, func.abs(Transaction.amount)), else_=0)).label("outflow")
-
     query = (
-        db.session.query(date_expr, inflow_sum, outflow_sum)
-        .join(Account, Transaction.account_id == Account.account_id)
+        query.join(Account, Transaction.account_id == Account.account_id)
         .filter((Account.is_hidden.is_(False)) | (Account.is_hidden.is_(None)))
         .filter((Transaction.is_internal.is_(False)) | (Transaction.is_internal.is_(None)))
-        .filter(Transaction.date >= lookback_start)
-        .filter(Transaction.date <= start_date)
+        .filter(Transaction.date >= since)
+        .filter(Transaction.date <= until)
     )
     if user_id and not included_ids:
         query = query.filter(
@@ -271,7 +342,28 @@ def _load_historical_aggregates(
         query = query.filter(Transaction.account_id.in_(included_ids))
     if excluded_ids:
         query = query.filter(~Transaction.account_id.in_(excluded_ids))
+    return query
+
+
+def _load_historical_aggregates(
+    user_id: str,
+    start_date: date,
+    included_account_ids: list[str] | None = None,
+    excluded_account_ids: list[str] | None = None,
+) -> list[dict[str, object]]:
+    """Return daily inflow/outflow aggregates for the lookback window."""
+    date_expr = func.date(Transaction.date).label("date")
+    inflow_sum = func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0)).label("inflow")
+    outflow_sum = func.sum(case((Transaction.amount < 0, func.abs(Transaction.amount)), else_=0)).label("outflow")
 
+    query = _scope_transaction_query(
+        db.session.query(date_expr, inflow_sum, outflow_sum),
+        user_id=user_id,
+        since=start_date - timedelta(days=LOOKBACK_DAYS),
+        until=start_date,
+        included_account_ids=included_account_ids,
+        excluded_account_ids=excluded_account_ids,
+    )
     rows = query.group_by(date_expr).order_by(date_expr).all()
     return [
         {
@@ -283,6 +375,39 @@ def _load_historical_aggregates(
     ]
 
 
+def _load_account_historical_aggregates(
+    user_id: str,
+    start_date: date,
+    included_account_ids: list[str] | None = None,
+) -> list[dict[str, object]]:
+    """Return lookback-window inflow/outflow aggregates grouped by account and day.
+
+    Batch forecasts load this once and re-aggregate per scenario so account
+    filters can vary without another database round trip.
+    """
+    date_expr = func.date(Transaction.date).label("date")
+    inflow_sum = func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0)).label("inflow")
+    outflow_sum = func.sum(case((Transaction.amount < 0, func.abs(Transaction.amount)), else_=0)).label("outflow")
+
+    query = _scope_transaction_query(
+        db.session.query(Transaction.account_id, date_expr, inflow_sum, outflow_sum),
+        user_id=user_id,
+        since=start_date - timedelta(days=LOOKBACK_DAYS),
+        until=start_date,
+        included_account_ids=included_account_ids,
+    )
+    rows = query.group_by(Transaction.account_id, date_expr).order_by(date_expr).all()
+    return [
+        {
+            "account_id": row.account_id,
+            "date": row.date,
+            "inflow": float(row.inflow or 0),
+            "outflow": float(row.outflow or 0),
+        }
+        for row in rows
+    ]
+
+
 def _build_realized_history(
     *,
     start_date: date,
@@ -493,43 +618,40 @@ def _source_transaction_reference(tx: Transaction) -> dict[str, object]:
     }
 
 
-def _auto_wage_adjustments(
+def _load_auto_adjustment_candidates(
     *,
     user_id: str,
     start_date: date,
-    horizon_days: int,
     included_account_ids: list[str] | None = None,
     excluded_account_ids: list[str] | None = None,
+) -> list[Transaction]:
+    """Return lookback transactions, oldest first, for wage and rent inference."""
+    query = _scope_transaction_query(
+        db.session.query(Transaction),
+        user_id=user_id,
+        since=start_date - timedelta(days=WAGE_LOOKBACK_DAYS),
+        until=start_date,
+        included_account_ids=included_account_ids,
+        excluded_account_ids=excluded_account_ids,
+    )
+    return query.order_by(Transaction.date.asc()).all()
+
+
+def _wage_adjustments_from_transactions(
+    transactions: list[Transaction],
+    *,
+    start_date: date,
+    horizon_days: int,
 ) -> list[dict[str, object]]:
-    """Infer recurring wage income adjustments from historical transactions.
+    """Infer recurring wage income adjustments from candidate transactions.
 
     The generated adjustment metadata includes a bounded sample of recent source
     transactions so the API and frontend can explain why the income was inferred.
     """
-    included_ids = included_account_ids or []
-    excluded_ids = excluded_account_ids or []
-    lookback_start = start_date - timedelta(days=WAGE_LOOKBACK_DAYS)
     horizon_end = start_date + timedelta(days=max(horizon_days - 1, 0))
 
-    query = (
-        db.session.query(Transaction)
-        .join(Account, Transaction.account_id == Account.account_id)
-        .filter((Account.is_hidden.is_(False)) | (Account.is_hidden.is_(None)))
-        .filter((Transaction.is_internal.is_(False)) | (Transaction.is_internal.is_(None)))
-        .filter(Transaction.date >= lookback_start)
-        .filter(Transaction.date <= start_date)
-    )
-    if user_id and not included_ids:
-        query = query.filter(
-            (Account.user_id == user_id) | (Transaction.user_id == user_id) | (Account.user_id.is_(None))
-        )
-    if included_ids:
-        query = query.filter(Transaction.account_id.in_(included_ids))
-    if excluded_ids:
-        query = query.filter(~Transaction.account_id.in_(excluded_ids))
-
     wage_rows: list[Transaction] = []
-    for tx in query.order_by(Transaction.date.asc()).all():
+    for tx in transactions:
         amount = float(tx.amount or 0)
         if amount <= 0:
             continue
@@ -594,39 +716,17 @@ def _auto_wage_adjustments(
     return adjustments
 
 
-def _auto_rent_adjustments(
+def _rent_adjustments_from_transactions(
+    transactions: list[Transaction],
     *,
-    user_id: str,
     start_date: date,
     horizon_days: int,
-    included_account_ids: list[str] | None = None,
-    excluded_account_ids: list[str] | None = None,
 ) -> list[dict[str, object]]:
-    """Infer recurring rent expense adjustments from historical transactions."""
-    included_ids = included_account_ids or []
-    excluded_ids = excluded_account_ids or []
-    lookback_start = start_date - timedelta(days=WAGE_LOOKBACK_DAYS)
+    """Infer recurring rent expense adjustments from candidate transactions."""
     horizon_end = start_date + timedelta(days=max(horizon_days - 1, 0))
 
-    query = (
-        db.session.query(Transaction)
-        .join(Account, Transaction.account_id == Account.account_id)
-        .filter((Account.is_hidden.is_(False)) | (Account.is_hidden.is_(None)))
-        .filter((Transaction.is_internal.is_(False)) | (Transaction.is_internal.is_(None)))
-        .filter(Transaction.date >= lookback_start)
-        .filter(Transaction.date <= start_date)
-    )
-    if user_id and not included_ids:
-        query = query.filter(
-            (Account.user_id == user_id) | (Transaction.user_id == user_id) | (Account.user_id.is_(None))
-        )
-    if included_ids:
-        query = query.filter(Transaction.account_id.in_(included_ids))
-    if excluded_ids:
-        query = query.filter(~Transaction.account_id.in_(excluded_ids))
-
     rent_rows: list[Transaction] = []
-    for tx in query.order_by(Transaction.date.asc()).all():
+    for tx in transactions:
         amount = float(tx.amount or 0)
         if amount >= 0:
             continue
@@ -696,7 +796,44 @@ def _auto_rent_adjustments(
     return adjustments
 
 
+def _auto_wage_adjustments(
+    *,
+    user_id: str,
+    start_date: date,
+    horizon_days: int,
+    included_account_ids: list[str] | None = None,
+    excluded_account_ids: list[str] | None = None,
+) -> list[dict[str, object]]:
+    """Infer recurring wage income adjustments from historical transactions."""
+    transactions = _load_auto_adjustment_candidates(
+        user_id=user_id,
+        start_date=start_date,
+        included_account_ids=included_account_ids,
+        excluded_account_ids=excluded_account_ids,
+    )
+    return _wage_adjustments_from_transactions(transactions, start_date=start_date, horizon_days=horizon_days)
+
+
+def _auto_rent_adjustments(
+    *,
+    user_id: str,
+    start_date: date,
+    horizon_days: int,
+    included_account_ids: list[str] | None = None,
+    excluded_account_ids: list[str] | None = None,
+) -> list[dict[str, object]]:
+    """Infer recurring rent expense adjustments from historical transactions."""
+    transactions = _load_auto_adjustment_candidates(
+        user_id=user_id,
+        start_date=start_date,
+        included_account_ids=included_account_ids,
+        excluded_account_ids=excluded_account_ids,
+    )
+    return _rent_adjustments_from_transactions(transactions, start_date=start_date, horizon_days=horizon_days)
+
+
 @forecast.route("", methods=["GET"])
+@read_replica()
 def get_forecast():
     """Return forecast payload generated by :class:`ForecastOrchestrator`."""
     try:
@@ -717,6 +854,221 @@ def get_forecast():
         return jsonify({"error": "Unable to load forecast data."}), 500
 
 
+def _parse_compute_options(payload: dict[str, object], *, default_engine: str = "auto") -> dict[str, object]:
+    """Parse per-forecast options shared by single and batch compute requests."""
+    moving_average_window = _parse_moving_average_window(payload.get("moving_average_window"))
+    normalize = _parse_normalize(payload.get("normalize"))
+    graph_mode = _parse_graph_mode(payload.get("graph_mode"))
+    engine = _parse_engine(payload.get("engine", default_engine))
+    output = normalize_output_mode(payload.get("output"))
+    cashflow_range = _parse_cashflow_range(payload)
+    included_account_ids, excluded_account_ids = _parse_account_filters(payload)
+
+    adjustments = payload.get("adjustments", [])
+    if adjustments is None:
+        adjustments = []
+    if not isinstance(adjustments, list):
+        raise ValueError("adjustments must be a list.")
+
+    return {
+        "moving_average_window": moving_average_window,
+        "normalize": normalize,
+        "graph_mode": graph_mode,
+        "engine": engine,
+        "output": output,
+        "cashflow_range": cashflow_range,
+        "included_account_ids": included_account_ids,
+        "excluded_account_ids": excluded_account_ids,
+        "adjustments": adjustments,
+    }
+
+
+def _compute_forecast_result(
+    *,
+    user_id: str,
+    start_date: date,
+    horizon_days: int,
+    options: dict[str, object],
+    latest_snapshots: list[dict[str, object]],
+    historical_aggregates: list[dict[str, object]],
+    wage_adjustments: list[dict[str, object]],
+    rent_adjustments: list[dict[str, object]],
+) -> dict[str, object]:
+    """Run the forecast engine for loaded inputs and attach request metadata."""
+    included_account_ids = options["included_account_ids"]
+    excluded_account_ids = options["excluded_account_ids"]
+
+    asset_balance, liability_balance, net_snapshot_balance = _snapshot_balance_breakdown(latest_snapshots)
+    total_inflow = sum(float(item.get("inflow", 0) or 0) for item in historical_aggregates)
+    total_outflow = sum(float(item.get("outflow", 0) or 0) for item in historical_aggregates)
+    non_zero_historical_days = sum(
+        1
+        for item in historical_aggregates
+        if abs(float(item.get("inflow", 0) or 0)) + abs(float(item.get("outflow", 0) or 0)) > 0
+    )
+    realized_history = _build_realized_history(
+        start_date=start_date,
+        ending_balance=net_snapshot_balance,
+        historical_aggregates=historical_aggregates,
+        lookback_days=LOOKBACK_DAYS,
+    )
+    merged_adjustments = list(options["adjustments"]) + wage_adjustments + rent_adjustments
+
+    compute = _resolve_compute_engine(options["engine"], horizon_days)
+    return compute(
+        user_id=user_id,
+        start_date=start_date,
+        horizon_days=horizon_days,
+        latest_snapshots=latest_snapshots,
+        historical_aggregates=historical_aggregates,
+        adjustments=merged_adjustments,
+        moving_average_window=options["moving_average_window"],
+        normalize=options["normalize"],
+        graph_mode=options["graph_mode"],
+        output=options["output"],
+        cashflow_range=options["cashflow_range"],
+        metadata={
+            "lookback_days": LOOKBACK_DAYS,
+            "included_account_ids": included_account_ids,
+            "excluded_account_ids": excluded_account_ids,
+            "starting_balance": net_snapshot_balance,
+            "asset_balance": asset_balance,
+            "liability_balance": liability_balance,
+            "net_balance": net_snapshot_balance,
+            "contribution_totals": {
+                "snapshot_balance": net_snapshot_balance,
+                "historical_inflow": total_inflow,
+                "historical_outflow": total_outflow,
+            },
+            "historical_aggregate_days": len(historical_aggregates),
+            "historical_aggregate_non_zero_days": non_zero_historical_days,
+            "realized_history_lookback_days": LOOKBACK_DAYS,
+            "realized_history": realized_history,
+            "auto_wage_adjustment_count": len(wage_adjustments),
+            "auto_rent_adjustment_count": len(rent_adjustments),
+        },
+    )
+
+
+def _parse_batch_scenarios(payload: dict[str, object]) -> list[tuple[str, dict[str, object]]]:
+    """Validate batch scenarios and return ``(scenario_id, options)`` pairs in request order."""
+    raw_scenarios = payload.get("scenarios")
+    if not isinstance(raw_scenarios, list) or not raw_scenarios:
+        raise ValueError("scenarios must be a non-empty list.")
+    if len(raw_scenarios) > MAX_BATCH_SCENARIOS:
+        raise ValueError(f"scenarios must contain at most {MAX_BATCH_SCENARIOS} entries.")
+
+    scenarios: list[tuple[str, dict[str, object]]] = []
+    seen_ids: set[str] = set()
+    for index, raw_scenario in enumerate(raw_scenarios):
+        if not isinstance(raw_scenario, dict):
+            raise ValueError(f"scenario {index} must be an object.")
+        scenario_id = str(raw_scenario.get("id") or index)
+        if scenario_id in seen_ids:
+            raise ValueError(f"scenario id {scenario_id} is duplicated.")
+        seen_ids.add(scenario_id)
+        try:
+            options = _parse_compute_options(raw_scenario, default_engine="vectorized")
+        except ValueError as exc:
+            raise ValueError(f"scenario {scenario_id}: {exc}") from exc
+        scenarios.append((scenario_id, options))
+    return scenarios
+
+
+def _load_forecast_base_data(
+    user_id: str,
+    start_date: date,
+    included_account_ids: list[str],
+) -> dict[str, dict[str, list]]:
+    """Load forecast inputs once per account scope used by a batch request.
+
+    The ``user`` scope covers the user's visible accounts. The ``included`` scope is
+    only loaded when scenarios name explicit accounts and covers their union.
+    """
+    scopes: dict[str, dict[str, list]] = {}
+    for scope, scope_account_ids in (("user", None), ("included", included_account_ids)):
+        if scope == "included" and not scope_account_ids:
+            continue
+        scopes[scope] = {
+            "snapshots": _load_latest_snapshots(user_id, included_account_ids=scope_account_ids),
+            "aggregates": _load_account_historical_aggregates(
+                user_id, start_date, included_account_ids=scope_account_ids
+            ),
+            "transactions": _load_auto_adjustment_candidates(
+                user_id=user_id, start_date=start_date, included_account_ids=scope_account_ids
+            ),
+        }
+    return scopes
+
+
+def _scenario_forecast_inputs(
+    base_data: dict[str, dict[str, list]],
+    options: dict[str, object],
+    *,
+    start_date: date,
+    horizon_days: int,
+) -> dict[str, list]:
+    """Filter batch base data down to one scenario's account selection."""
+    included_ids = options["included_account_ids"] or []
+    excluded_ids = set(options["excluded_account_ids"])
+    scope = base_data["included"] if included_ids else base_data["user"]
+    allowed_ids = set(included_ids) if included_ids else None
+
+    def keep(account_id: object) -> bool:
+        return (allowed_ids is None or account_id in allowed_ids) and account_id not in excluded_ids
+
+    totals_by_date: dict[object, list[float]] = {}
+    for row in scope["aggregates"]:
+        if not keep(row["account_id"]):
+            continue
+        totals = totals_by_date.setdefault(row["date"], [0.0, 0.0])
+        totals[0] += row["inflow"]
+        totals[1] += row["outflow"]
+
+    transactions = [tx for tx in scope["transactions"] if keep(tx.account_id)]
+    return {
+        "latest_snapshots": [snapshot for snapshot in scope["snapshots"] if keep(snapshot["account_id"])],
+        "historical_aggregates": [
+            {"date": day, "inflow": inflow, "outflow": outflow}
+            for day, (inflow, outflow) in sorted(totals_by_date.items())
+        ],
+        "wage_adjustments": _wage_adjustments_from_transactions(
+            transactions, start_date=start_date, horizon_days=horizon_days
+        ),
+        "rent_adjustments": _rent_adjustments_from_transactions(
+            transactions, start_date=start_date, horizon_days=horizon_days
+        ),
+    }
+
+
+def _forecast_cache_key(
+    user_id: str,
+    start_date: date,
+    horizon_days: int,
+    options: dict[str, object],
+) -> str | None:
+    """Return the result-cache key for a compute request, or ``None`` to bypass the cache."""
+    try:
+        data_version = get_data_version(user_id)
+    except Exception as exc:
+        logger.warning("Forecast cache bypassed; data version unavailable: %s", exc)
+        return None
+    normalized_request = {
+        "user_id": user_id,
+        "start_date": start_date.isoformat(),
+        "horizon_days": horizon_days,
+        **options,
+    }
+    return request_cache_key(normalized_request, data_version)
+
+
+def _with_cache_metadata(result: dict[str, object], *, hit: bool) -> dict[str, object]:
+    """Attach result-cache counters to a forecast payload's metadata."""
+    metadata = dict(result.get("metadata") or {})
+    metadata["cache"] = {"hit": hit, **FORECAST_RESULT_CACHE.stats()}
+    return {**result, "metadata": metadata}
+
+
 @forecast.route("/compute", methods=["POST"])
 def compute_forecast_route():
     """Compute a forecast result for the requested horizon and adjustments."""
@@ -728,20 +1080,19 @@ def compute_forecast_route():
     try:
         start_date = _parse_start_date(payload.get("start_date"))
         horizon_days = _parse_horizon_days(payload.get("horizon_days"))
-        moving_average_window = _parse_moving_average_window(payload.get("moving_average_window"))
-        normalize = _parse_normalize(payload.get("normalize"))
-        graph_mode = _parse_graph_mode(payload.get("graph_mode"))
-        included_account_ids, excluded_account_ids = _parse_account_filters(payload)
+        options = _parse_compute_options(payload)
     except ValueError as exc:
         logger.warning("Invalid forecast compute request: %s", exc)
         return jsonify({"error": str(exc)}), 400
 
-    adjustments = payload.get("adjustments", [])
-    if adjustments is None:
-        adjustments = []
-    if not isinstance(adjustments, list):
-        return jsonify({"error": "adjustments must be a list."}), 400
+    cache_key = _forecast_cache_key(str(user_id), start_date, horizon_days, options)
+    if cache_key is not None:
+        cached = FORECAST_RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return jsonify(_with_cache_metadata(cached, hit=True)), 200
 
+    included_account_ids = options["included_account_ids"]
+    excluded_account_ids = options["excluded_account_ids"]
     try:
         latest_snapshots = _load_latest_snapshots(
             str(user_id),
@@ -754,21 +1105,6 @@ def compute_forecast_route():
             included_account_ids=included_account_ids,
             excluded_account_ids=excluded_account_ids,
         )
-
-        asset_balance, liability_balance, net_snapshot_balance = _snapshot_balance_breakdown(latest_snapshots)
-        total_inflow = sum(float(item.get("inflow", 0) or 0) for item in historical_aggregates)
-        total_outflow = sum(float(item.get("outflow", 0) or 0) for item in historical_aggregates)
-        non_zero_historical_days = sum(
-            1
-            for item in historical_aggregates
-            if abs(float(item.get("inflow", 0) or 0)) + abs(float(item.get("outflow", 0) or 0)) > 0
-        )
-        realized_history = _build_realized_history(
-            start_date=start_date,
-            ending_balance=net_snapshot_balance,
-            historical_aggregates=historical_aggregates,
-            lookback_days=LOOKBACK_DAYS,
-        )
         inferred_wage_adjustments = _auto_wage_adjustments(
             user_id=str(user_id),
             start_date=start_date,
@@ -783,40 +1119,91 @@ def compute_forecast_route():
             included_account_ids=included_account_ids,
             excluded_account_ids=excluded_account_ids,
         )
-        merged_adjustments = list(adjustments) + inferred_wage_adjustments + inferred_rent_adjustments
-
-        result = compute_forecast(
+        result = _compute_forecast_result(
             user_id=str(user_id),
             start_date=start_date,
             horizon_days=horizon_days,
+            options=options,
             latest_snapshots=latest_snapshots,
             historical_aggregates=historical_aggregates,
-            adjustments=merged_adjustments,
-            moving_average_window=moving_average_window,
-            normalize=normalize,
-            graph_mode=graph_mode,
-            metadata={
-                "lookback_days": LOOKBACK_DAYS,
-                "included_account_ids": included_account_ids,
-                "excluded_account_ids": excluded_account_ids,
-                "starting_balance": net_snapshot_balance,
-                "asset_balance": asset_balance,
-                "liability_balance": liability_balance,
-                "net_balance": net_snapshot_balance,
-                "contribution_totals": {
-                    "snapshot_balance": net_snapshot_balance,
-                    "historical_inflow": total_inflow,
-                    "historical_outflow": total_outflow,
-                },
-                "historical_aggregate_days": len(historical_aggregates),
-                "historical_aggregate_non_zero_days": non_zero_historical_days,
-                "realized_history_lookback_days": LOOKBACK_DAYS,
-                "realized_history": realized_history,
-                "auto_wage_adjustment_count": len(inferred_wage_adjustments),
-                "auto_rent_adjustment_count": len(inferred_rent_adjustments),
-            },
+            wage_adjustments=inferred_wage_adjustments,
+            rent_adjustments=inferred_rent_adjustments,
         )
+        if cache_key is not None:
+            FORECAST_RESULT_CACHE.set(cache_key, result)
+            result = _with_cache_metadata(result, hit=False)
         return jsonify(result), 200
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("Forecast compute failed: %s", exc, exc_info=True)
         return jsonify({"error": "Unable to compute forecast."}), 500
+
+
+@forecast.route("/compute/batch", methods=["POST"])
+def compute_forecast_batch_route():
+    """Compute several what-if scenarios that share one user and date range.
+
+    Snapshots, lookback aggregates, and auto-adjustment candidates are loaded once
+    per account scope; each scenario re-filters them in memory and scenarios with
+    identical account filters reuse the same derived inputs.
+    """
+    payload = request.get_json(silent=True) or {}
+    user_id = payload.get("user_id") or request.args.get("user_id")
+    if not user_id:
+        return jsonify({"error": "user_id is required."}), 400
+
+    try:
+        start_date = _parse_start_date(payload.get("start_date"))
+        horizon_days = _parse_horizon_days(payload.get("horizon_days"))
+        scenarios = _parse_batch_scenarios(payload)
+    except ValueError as exc:
+        logger.warning("Invalid forecast batch request: %s", exc)
+        return jsonify({"error": str(exc)}), 400
+
+    included_union: list[str] = []
+    for _, options in scenarios:
+        for account_id in options["included_account_ids"] or []:
+            if account_id not in included_union:
+                included_union.append(account_id)
+
+    try:
+        base_data = _load_forecast_base_data(str(user_id), start_date, included_union)
+        inputs_by_filter: dict[tuple, dict[str, list]] = {}
+        results: dict[str, dict[str, object]] = {}
+        for scenario_id, options in scenarios:
+            filter_key = (
+                tuple(options["included_account_ids"] or ()),
+                tuple(sorted(options["excluded_account_ids"])),
+            )
+            scenario_inputs = inputs_by_filter.get(filter_key)
+            if scenario_inputs is None:
+                scenario_inputs = _scenario_forecast_inputs(
+                    base_data, options, start_date=start_date, horizon_days=horizon_days
+                )
+                inputs_by_filter[filter_key] = scenario_inputs
+            results[scenario_id] = _compute_forecast_result(
+                user_id=str(user_id),
+                start_date=start_date,
+                horizon_days=horizon_days,
+                options=options,
+                **scenario_inputs,
+            )
+
+        return (
+            jsonify(
+                {
+                    "scenarios": results,
+                    "metadata": {
+                        "user_id": str(user_id),
+                        "start_date": start_date.isoformat(),
+                        "horizon_days": horizon_days,
+                        "scenario_ids": list(results),
+                        "scenario_count": len(results),
+                        "distinct_account_filters": len(inputs_by_filter),
+                    },
+                }
+            ),
+            200,
+        )
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.error("Forecast batch compute failed: %s", exc, exc_info=True)
+        return jsonify({"error": "Unable to compute forecast scenarios."}), 500
@@ -5,11 +5,12 @@ from __future__ import annotations
 from datetime import datetime
 
 from flask import Blueprint, jsonify, request
+from sqlalchemy.orm import selectinload
 
 from app.config import logger
 from app.extensions import db
 from app.helpers.plaid_helpers import get_accounts
-from app.models import Institution
+from app.models import Account, Institution
 from app.sql import account_logic
 from app.utils.finance_utils import normalize_account_balance
 
@@ -20,7 +21,10 @@ institutions = Blueprint("institutions", __name__)
 def list_institutions():
     """Return institutions with aggregated account info."""
     data = []
-    for inst in Institution.query.all():
+    institutions_query = Institution.query.options(
+        selectinload(Institution.accounts).selectinload(Account.plaid_account)
+    )
+    for inst in institutions_query.all():
         accounts = []
         last_refreshed = None
         for acc in inst.accounts:
@@ -0,0 +1,17 @@
+"""Prometheus scrape endpoint."""
+
+from flask import Blueprint, Response, jsonify
+
+metrics = Blueprint("metrics", __name__)
+
+
+@metrics.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Return every registered metric in the Prometheus text format."""
+    from app.utils.metrics import render_metrics
+
+    try:
+        payload, content_type = render_metrics()
+    except RuntimeError as exc:
+        return jsonify({"status": "error", "message": str(exc)}), 501
+    return Response(payload, content_type=content_type)
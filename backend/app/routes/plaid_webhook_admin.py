@@ -5,10 +5,15 @@ from flask import Blueprint, jsonify, request
 from app.config import BACKEND_PUBLIC_URL, logger, plaid_client
 from app.models import PlaidAccount
 
-try:  # Plaid SDK request model (v9+)
-    from plaid.model.item_webhook_update_request import ItemWebhookUpdateRequest
-except Exception:  # pragma: no cover
-    ItemWebhookUpdateRequest = None  # type: ignore
+
+def _webhook_update_request_class():
+    """Return the SDK ``ItemWebhookUpdateRequest`` model, or ``None`` if unavailable."""
+
+    try:  # Plaid SDK request model (v9+); imported on first use to keep startup light
+        from plaid.model.item_webhook_update_request import ItemWebhookUpdateRequest
+    except Exception:  # pragma: no cover
+        return None
+    return ItemWebhookUpdateRequest
 
 
 plaid_webhook_admin = Blueprint("plaid_webhook_admin", __name__)
@@ -23,6 +28,7 @@ def update_item_webhook():
       - account_id: local external account_id (we will resolve to item)
       - webhook_url: optional explicit URL; otherwise derived from BACKEND_PUBLIC_URL
     """
+    ItemWebhookUpdateRequest = _webhook_update_request_class()
     if ItemWebhookUpdateRequest is None:
         return (
             jsonify(
@@ -91,6 +97,7 @@ def update_item_webhook():
 @plaid_webhook_admin.route("/update_all", methods=["POST"])
 def update_all_items_webhook():
     """Update the webhook URL for all Plaid items in the database."""
+    ItemWebhookUpdateRequest = _webhook_update_request_class()
     if ItemWebhookUpdateRequest is None:
         return (
             jsonify(
@@ -0,0 +1,39 @@
+"""Admin-only listing and download of captured request profiles."""
+
+from flask import Blueprint, jsonify, request, send_from_directory
+
+profiles = Blueprint("profiles", __name__)
+
+
+@profiles.before_request
+def _require_admin_token():
+    """Reject callers without the profiler admin token."""
+    from app.utils.profiler import profiler_authorized
+
+    if not profiler_authorized(request.headers.get("X-Admin-Token")):
+        return jsonify({"status": "error", "error": "admin authorization required"}), 403
+    return None
+
+
+@profiles.route("/", methods=["GET"])
+def list_request_profiles():
+    """Return captured profiles, newest first."""
+    from app.utils.profiler import list_profiles, profile_directory
+
+    directory = profile_directory()
+    data = list_profiles(directory) if directory.exists() else []
+    return jsonify({"status": "success", "data": data}), 200
+
+
+@profiles.route("/<profile_id>", methods=["GET"])
+def download_request_profile(profile_id):
+    """Download one profile file (``.pstats`` or ``.folded``)."""
+    from app.utils.profiler import PROFILE_ID_RE, list_profiles, profile_directory
+
+    directory = profile_directory()
+    if not PROFILE_ID_RE.match(profile_id) or not directory.exists():
+        return jsonify({"status": "error", "error": "profile not found"}), 404
+    entry = next((item for item in list_profiles(directory) if item.get("id") == profile_id), None)
+    if entry is None:
+        return jsonify({"status": "error", "error": "profile not found"}), 404
+    return send_from_directory(directory, entry["file"], as_attachment=True)
@@ -158,11 +158,35 @@ def delete_recurring_tx(account_id):
 # --------------------------------------
 
 
+def _signature_candidates(account_id, since=None, rebuild=False):
+    """Return signature-table candidates, backfilling the account on first use.
+
+    Rebuilding deletes and commits, so only the POST scan calls this.
+    """
+    from app.models import RecurringSignature
+    from app.sql import recurring_logic
+
+    if rebuild or not RecurringSignature.query.filter_by(account_id=account_id).limit(1).first():
+        recurring_logic.rebuild_recurring_signatures(account_id)
+    return recurring_logic.recurring_candidates(account_id, since=since)
+
+
 @recurring.route("/scan/<account_id>", methods=["POST"])
 def scan_account_for_recurring(account_id):
-    """Detect recurring transactions for an account and persist them."""
+    """Detect recurring transactions for an account and persist them.
+
+    ``source=signatures`` persists candidates read from the recurring signature
+    table instead of regrouping the last 90 days of transactions. It backfills
+    the account's signatures from history on first use, or always with
+    ``rebuild=true``.
+    """
     try:
         cutoff = datetime.now(timezone.utc).date() - timedelta(days=90)
+        if request.args.get("source") == "signatures":
+            rebuild = str(request.args.get("rebuild", "")).lower() in {"1", "true", "yes"}
+            candidates = _signature_candidates(account_id, since=cutoff, rebuild=rebuild)
+            RecurringBridge([], candidates=candidates).sync_to_db()
+            return get_structured_recurring(account_id)
         rows = (
             Transaction.query.filter_by(account_id=account_id)
             .filter(Transaction.date >= cutoff)
@@ -193,6 +217,35 @@ def scan_account_for_recurring(account_id):
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+# --------------------------------------
+# GET /<account_id>/detected
+# Read recurring candidates from signatures
+# --------------------------------------
+
+
+@recurring.route("/<account_id>/detected", methods=["GET"])
+def get_detected_recurring(account_id):
+    """Return recurring candidates maintained incrementally by ingest.
+
+    Read-only. Query param ``since`` (ISO date) keeps signatures seen on or
+    after it. Accounts ingested before signatures existed return no candidates
+    until ``POST /scan/<account_id>?source=signatures`` backfills them.
+    """
+    try:
+        from app.sql import recurring_logic
+
+        since_raw = request.args.get("since")
+        try:
+            since = date.fromisoformat(since_raw) if since_raw else None
+        except ValueError:
+            return jsonify({"status": "error", "message": "since must be an ISO date."}), 400
+        candidates = recurring_logic.recurring_candidates(account_id, since=since)
+        return jsonify({"status": "success", "candidates": candidates}), 200
+    except Exception as e:
+        logger.error("Error reading recurring signatures for %s: %s", account_id, e, exc_info=True)
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
 # --------------------------------------
 # GET /<account_id>/recurring
 # Fetch all (user + auto) upcoming reminders
@@ -0,0 +1,43 @@
+"""Typeahead suggestions across merchants, tags, and categories."""
+
+from flask import Blueprint, jsonify, request
+
+from app.config import logger
+
+suggest = Blueprint("suggest", __name__)
+
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+
+
+@suggest.route("", methods=["GET"])
+def get_suggestions():
+    """Return ranked completions from the user's in-memory suggestion index.
+
+    Query params:
+    - user_id: required user scope
+    - q: typed prefix or fragment (empty returns the most used entries)
+    - kinds: optional comma list of ``merchant``, ``tag``, ``category``
+    - limit: max number of results (default 10, max 50)
+    """
+    from app.services.suggest_index import SUGGEST_KINDS
+    from app.services.suggest_index import suggest as run_suggest
+
+    user_id = (request.args.get("user_id") or "").strip()
+    if not user_id:
+        return jsonify({"status": "error", "message": "user_id is required"}), 400
+    try:
+        limit = max(1, min(int(request.args.get("limit", SUGGEST_DEFAULT_LIMIT)), SUGGEST_MAX_LIMIT))
+    except ValueError:
+        return jsonify({"status": "error", "message": "limit must be an integer"}), 400
+    kinds = [kind.strip() for kind in (request.args.get("kinds") or "").split(",") if kind.strip()]
+    unknown = sorted(set(kinds) - set(SUGGEST_KINDS))
+    if unknown:
+        return jsonify({"status": "error", "message": f"Unknown kinds: {', '.join(unknown)}"}), 400
+
+    try:
+        data = run_suggest(user_id, request.args.get("q") or "", limit=limit, kinds=kinds or None)
+        return jsonify({"status": "success", "data": data}), 200
+    except Exception as e:
+        logger.error("Error fetching suggestions: %s", e, exc_info=True)
+        return jsonify({"status": "error", "message": str(e)}), 500
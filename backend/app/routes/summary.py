@@ -10,6 +10,8 @@ from sqlalchemy import case, func, or_
 
 from app.extensions import db
 from app.models import Account, Transaction
+from app.utils.http_cache import conditional_get
+from app.utils.read_replica import read_replica
 
 summary = Blueprint("summary", __name__)
 
@@ -144,6 +146,8 @@ def compute_volatility_metrics(stats: Dict[str, Any], rows) -> Dict[str, Any]:
 
 
 @summary.route("/financial", methods=["GET"])
+@read_replica()
+@conditional_get()
 def financial_summary():
     """
     REST endpoint: returns daily income, expense, and volatility summary.
@@ -11,48 +11,24 @@ from collections import defaultdict
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from sqlalchemy import func
 
 from app.config import logger
 from app.extensions import db
 from app.models import Account, Category, Tag, Transaction
 from app.sql import account_logic
+from app.utils.http_cache import conditional_get
+from app.utils.read_replica import read_replica
 
 transactions = Blueprint("transactions", __name__)
 
 UTC = timezone.utc
 TWOPLACES = Decimal("0.01")
 AMOUNT_EPSILON = TWOPLACES
-INTERNAL_TRANSFER_KEYWORDS = {
-    "transfer",
-    "zelle",
-    "venmo",
-    "cashapp",
-    "cash app",
-    "payment",
-    "p2p",
-    "xfer",
-}
-NON_TRANSFER_KEYWORDS = {
-    "uber",
-    "ubereats",
-    "eats",
-    "doordash",
-    "grubhub",
-    "lyft",
-    "restaurant",
-    "grocery",
-    "groceries",
-    "amazon",
-    "target",
-    "walmart",
-    "shell",
-    "chevron",
-    "starbucks",
-    "netflix",
-    "spotify",
-}
+INTERNAL_SCAN_PAGE_SIZE = 200
+INTERNAL_SCAN_MAX_PAGE_SIZE = 1000
+TRANSACTION_LIST_SHAPES = ("rows", "dictionary")
 
 
 def _ensure_utc(dt: datetime | None) -> datetime | None:
@@ -89,6 +65,39 @@ def _parse_account_ids(args) -> list[str]:
     return account_ids
 
 
+def _parse_list_shape(args) -> tuple[str, list[str]]:
+    """Return the transaction list ``shape`` and sparse ``fields`` requested.
+
+    ``shape`` is ``rows`` (default) or ``dictionary``; ``fields`` accepts a
+    comma-delimited string or repeated ``fields[]`` parameters.
+
+    Raises:
+        ValueError: If ``shape`` is not supported.
+    """
+
+    shape = (args.get("shape") or "rows").strip().lower()
+    if shape not in TRANSACTION_LIST_SHAPES:
+        raise ValueError(f"shape must be one of: {', '.join(TRANSACTION_LIST_SHAPES)}")
+    fields = [
+        candidate.strip()
+        for key in ("fields[]", "fields")
+        for raw in args.getlist(key)
+        for candidate in raw.split(",")
+        if candidate.strip()
+    ]
+    return shape, fields
+
+
+def _transaction_list_payload(transactions: list[dict], total: int, meta: dict, shape: str) -> dict:
+    """Build the list response body, dictionary-encoding rows when requested."""
+
+    if shape == "dictionary":
+        data = account_logic.dictionary_encode_transactions(transactions)
+    else:
+        data = {"transactions": transactions}
+    return {"status": "success", "data": {**data, "total": total, "meta": meta}}
+
+
 def _parse_tag_filters(args) -> list[str]:
     """Return normalized tag names supplied via query parameters.
 
@@ -194,112 +203,6 @@ def _truthy_param(value: str | None, default: bool = False) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "on"}
 
 
-def _normalize_txn_datetime(value: date | datetime | None) -> datetime:
-    """Convert a transaction calendar date to UTC midnight for interval scoring."""
-
-    if isinstance(value, datetime):
-        return _ensure_utc(value) or datetime.min.replace(tzinfo=UTC)
-    if isinstance(value, date):
-        return datetime.combine(value, datetime.min.time(), tzinfo=UTC)
-    return datetime.min.replace(tzinfo=UTC)
-
-
-def _tokenize_transfer_text(value: str | None) -> set[str]:
-    """Extract lowercase alphanumeric tokens from transfer descriptions."""
-
-    if not value:
-        return set()
-    return set(re.findall(r"[a-z0-9]+", value.lower()))
-
-
-def _has_transfer_hint(tokens: set[str], raw_text: str | None = None) -> bool:
-    """Return whether tokens include common transfer/payment hints."""
-
-    if raw_text:
-        lowered = raw_text.lower()
-        if any(keyword in lowered for keyword in INTERNAL_TRANSFER_KEYWORDS):
-            return True
-    if not tokens:
-        return False
-    return any(token in INTERNAL_TRANSFER_KEYWORDS for token in tokens)
-
-
-def _has_non_transfer_hint(tokens: set[str], raw_text: str | None = None) -> bool:
-    """Return whether text looks like normal merchant spend (not transfers)."""
-
-    if raw_text:
-        lowered = raw_text.lower()
-        if any(keyword in lowered for keyword in NON_TRANSFER_KEYWORDS):
-            return True
-    if not tokens:
-        return False
-    return any(token in NON_TRANSFER_KEYWORDS for token in tokens)
-
-
-def _internal_match_score(
-    anchor: dict,
-    candidate: dict,
-    max_window_seconds: float,
-    amount_epsilon: Decimal,
-    allow_same_account: bool,
-) -> float | None:
-    """Score an internal-transfer candidate pair.
-
-    Lower scores are better. ``None`` means the pair is not eligible.
-    """
-
-    if anchor["transaction_id"] == candidate["transaction_id"]:
-        return None
-
-    if not allow_same_account and anchor["account_id"] == candidate["account_id"]:
-        return None
-
-    amount_a = anchor["amount"]
-    amount_b = candidate["amount"]
-    if amount_a == 0 or amount_b == 0:
-        return None
-    if amount_a * amount_b >= 0:
-        return None
-
-    amount_delta = abs(abs(amount_a) - abs(amount_b))
-    if amount_delta > amount_epsilon:
-        return None
-
-    time_delta_seconds = abs((anchor["date"] - candidate["date"]).total_seconds())
-    if time_delta_seconds > max_window_seconds:
-        return None
-
-    score = float(amount_delta * Decimal("1000"))
-    score += time_delta_seconds / 3600.0
-
-    # Prefer cross-account matches but still support same-account correction pairs.
-    if anchor["account_id"] == candidate["account_id"]:
-        score += 6.0
-    else:
-        score -= 0.5
-
-    overlap = anchor["tokens"] & candidate["tokens"]
-    if overlap:
-        score -= min(2.0, 0.5 * len(overlap))
-
-    hint_a = _has_transfer_hint(anchor["tokens"], anchor.get("description"))
-    hint_b = _has_transfer_hint(candidate["tokens"], candidate.get("description"))
-    if hint_a and hint_b:
-        score -= 4.0
-    elif hint_a or hint_b:
-        # Prevent transfer-looking rows from pairing with ordinary merchant spend.
-        score += 12.0
-
-    merchantish_a = _has_non_transfer_hint(anchor["tokens"], anchor.get("description"))
-    merchantish_b = _has_non_transfer_hint(candidate["tokens"], candidate.get("description"))
-    if merchantish_a and not hint_a:
-        score += 6.0
-    if merchantish_b and not hint_b:
-        score += 6.0
-
-    return score
-
-
 def display_transaction_amount(txn: Transaction) -> float:
     """Return signed transaction amount used by charting and spending insights."""
 
@@ -575,6 +478,9 @@ def update_transaction():
             existing_fields[field] = True
         txn.user_modified_fields = json.dumps(existing_fields)
 
+        from app.sql.search_logic import refresh_search_documents
+
+        refresh_search_documents([txn])
         db.session.commit()
 
         # Optional: save as a reusable rule with richer scoping
@@ -604,7 +510,7 @@ def update_transaction():
                 action[field] = value or getattr(txn, field)
 
             transaction_rules_logic.create_rule(txn.user_id, match_criteria, action)
-        account_logic.invalidate_tx_cache()
+        account_logic.invalidate_tx_cache(txn.user_id)
         return jsonify({"status": "success"}), 200
     except Exception as e:
         logger.error("Error updating transaction: %s", e, exc_info=True)
@@ -620,6 +526,11 @@ def scan_internal_transfers():
     - Equal and offsetting amount (within ``amount_epsilon``)
     - Near in time (within ``date_window_days``)
     - Same-account matches optionally allowed (enabled by default)
+
+    Results are paginated with ``page_size`` and the ``next_cursor`` of the
+    previous page; each page only scans the users it returns pairs for.
+    ``user_id`` limits the scan to one user. The number of matching processes
+    comes from the ``INTERNAL_SCAN_WORKERS`` setting.
     """
     try:
         date_window_days = _coerce_positive_int(request.args.get("date_window_days"), default=3, minimum=1, maximum=14)
@@ -635,109 +546,52 @@ def scan_internal_transfers():
                     400,
                 )
 
-        txns = (
-            db.session.query(Transaction, Account)
-            .join(Account, Transaction.account_id == Account.account_id)
-            .filter((Transaction.is_internal.is_(False)) | (Transaction.is_internal.is_(None)))
-            .filter((Transaction.pending.is_(False)) | (Transaction.pending.is_(None)))
-            .all()
+        page_size = _coerce_positive_int(
+            request.args.get("page_size"),
+            default=INTERNAL_SCAN_PAGE_SIZE,
+            minimum=1,
+            maximum=INTERNAL_SCAN_MAX_PAGE_SIZE,
         )
+        user_id = request.args.get("user_id")
 
-        records_by_user: dict[str, list[dict]] = defaultdict(list)
-        for txn, account in txns:
-            user_id = txn.user_id or account.user_id
-            if not user_id:
-                continue
-            date_value = _normalize_txn_datetime(getattr(txn, "date", None))
-            description = txn.description or txn.merchant_name or ""
-            records_by_user[user_id].append(
-                {
-                    "transaction_id": txn.transaction_id,
-                    "account_id": txn.account_id,
-                    "account_name": account.name,
-                    "institution_name": account.institution_name,
-                    "amount": Decimal(str(txn.amount)).quantize(TWOPLACES),
-                    "date": date_value,
-                    "description": description,
-                    "tokens": _tokenize_transfer_text(description),
-                    "txn": txn,
-                }
-            )
+        from app.services import internal_transfer_scan
 
-        pairs = []
-        seen = set()
-        max_window_seconds = float(date_window_days * 86400)
-
-        for user_id, records in records_by_user.items():
-            records.sort(key=lambda record: record["date"])
-            for index, anchor in enumerate(records):
-                anchor_id = anchor["transaction_id"]
-                if anchor_id in seen:
-                    continue
-
-                best_candidate = None
-                best_score = None
-
-                for candidate in records[index + 1 :]:
-                    candidate_id = candidate["transaction_id"]
-                    if candidate_id in seen:
-                        continue
-
-                    # Records are date-sorted; stop once we pass the max forward window.
-                    forward_seconds = (candidate["date"] - anchor["date"]).total_seconds()
-                    if forward_seconds > max_window_seconds:
-                        break
-
-                    score = _internal_match_score(
-                        anchor=anchor,
-                        candidate=candidate,
-                        max_window_seconds=max_window_seconds,
-                        amount_epsilon=amount_epsilon,
-                        allow_same_account=allow_same_account,
-                    )
-                    if score is None:
-                        continue
-                    if best_score is None or score < best_score:
-                        best_score = score
-                        best_candidate = candidate
-
-                if not best_candidate:
-                    continue
-
-                anchor_txn = anchor["txn"]
-                counterpart_txn = best_candidate["txn"]
-                pairs.append(
-                    {
-                        "transaction_id": anchor_txn.transaction_id,
-                        "counterpart_id": counterpart_txn.transaction_id,
-                        "amount": float(anchor["amount"]),
-                        "date": anchor["date"].isoformat(),
-                        "description": anchor["description"],
-                        "account_id": anchor["account_id"],
-                        "account_name": anchor.get("account_name"),
-                        "institution_name": anchor.get("institution_name"),
-                        "user_id": user_id,
-                        "time_delta_hours": round(
-                            abs((anchor["date"] - best_candidate["date"]).total_seconds()) / 3600.0,
-                            2,
-                        ),
-                        "amount_delta": float(abs(abs(anchor["amount"]) - abs(best_candidate["amount"]))),
-                        "match_score": round(float(best_score), 4),
-                        "counterpart": {
-                            "transaction_id": counterpart_txn.transaction_id,
-                            "amount": float(best_candidate["amount"]),
-                            "date": best_candidate["date"].isoformat(),
-                            "description": best_candidate["description"],
-                            "account_id": best_candidate["account_id"],
-                            "account_name": best_candidate.get("account_name"),
-                            "institution_name": best_candidate.get("institution_name"),
-                        },
-                    }
-                )
-                seen.add(anchor_id)
-                seen.add(best_candidate["transaction_id"])
+        cursor = request.args.get("cursor")
+        try:
+            after = internal_transfer_scan.decode_scan_cursor(cursor) if cursor else None
+        except internal_transfer_scan.InvalidScanCursor as exc:
+            return jsonify({"status": "error", "message": str(exc)}), 400
 
-        return jsonify({"status": "success", "pairs": pairs}), 200
+        pairs = internal_transfer_scan.scan_internal_transfers(
+            [user_id] if user_id else None,
+            date_window_days=date_window_days,
+            amount_epsilon=amount_epsilon,
+            allow_same_account=allow_same_account,
+            max_workers=max(1, int(current_app.config.get("INTERNAL_SCAN_WORKERS", 1))),
+            after=after,
+            limit=page_size + 1,
+        )
+        has_more = len(pairs) > page_size
+        pairs = pairs[:page_size]
+        next_cursor = None
+        if has_more:
+            last_user = pairs[-1]["user_id"]
+            returned = sum(1 for pair in pairs if pair["user_id"] == last_user)
+            if after and after[0] == last_user:
+                returned += after[1]
+            next_cursor = internal_transfer_scan.encode_scan_cursor(last_user, returned)
+        return (
+            jsonify(
+                {
+                    "status": "success",
+                    "pairs": pairs,
+                    "page_size": page_size,
+                    "has_more": has_more,
+                    "next_cursor": next_cursor,
+                }
+            ),
+            200,
+        )
     except Exception as e:
         logger.error("Error scanning internal transfers: %s", e, exc_info=True)
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -798,8 +652,11 @@ def user_modified_update_transaction():
             existing_fields[field] = True
         txn.user_modified_fields = json.dumps(existing_fields)
 
+        from app.sql.search_logic import refresh_search_documents
+
+        refresh_search_documents([txn])
         db.session.commit()
-        account_logic.invalidate_tx_cache()
+        account_logic.invalidate_tx_cache(txn.user_id)
         return jsonify({"status": "success"}), 200
     except Exception as e:
         logger.error("Error updating transaction: %s", e, exc_info=True)
@@ -807,6 +664,8 @@ def user_modified_update_transaction():
 
 
 @transactions.route("/get_transactions", methods=["GET"])
+@read_replica()
+@conditional_get()
 def get_transactions_paginated():
     """Return paginated transactions with optional filters.
 
@@ -815,7 +674,9 @@ def get_transactions_paginated():
     repeated parameters), ``transaction_id`` for a specific lookup and
     ``tx_type``/``transaction_type`` with values ``credit`` or ``debit``.
     Tag filters can be supplied through ``tag`` or ``tags`` parameters.
-    Unknown or empty parameters are ignored.
+    ``fields`` selects a sparse fieldset and ``shape=dictionary`` moves
+    account and category values into side tables. Unknown or empty
+    parameters are ignored.
     """
     try:
         page = int(request.args.get("page", 1))
@@ -839,36 +700,25 @@ def get_transactions_paginated():
         try:
             start_date = _parse_iso_date(start_date_str)
             end_date = _parse_iso_date(end_date_str)
+            shape, fields = _parse_list_shape(request.args)
+            transactions, total, meta = account_logic.get_paginated_transactions(
+                page,
+                page_size,
+                start_date=start_date,
+                end_date=end_date,
+                category=category,
+                merchant=merchant,
+                account_ids=account_ids or None,
+                tx_type=tx_type,
+                transaction_id=transaction_id,
+                tags=tags or None,
+                include_running_balance=include_running_balance,
+                fields=fields or None,
+            )
         except ValueError as exc:
             return jsonify({"status": "error", "message": str(exc)}), 400
 
-        transactions, total, meta = account_logic.get_paginated_transactions(
-            page,
-            page_size,
-            start_date=start_date,
-            end_date=end_date,
-            category=category,
-            merchant=merchant,
-            account_ids=account_ids or None,
-            tx_type=tx_type,
-            transaction_id=transaction_id,
-            tags=tags or None,
-            include_running_balance=include_running_balance,
-        )
-
-        return (
-            jsonify(
-                {
-                    "status": "success",
-                    "data": {
-                        "transactions": transactions,
-                        "total": total,
-                        "meta": meta,
-                    },
-                }
-            ),
-            200,
-        )
+        return jsonify(_transaction_list_payload(transactions, total, meta, shape)), 200
 
     except Exception as e:
         logger.error("Error in get_transactions_paginated: %s", e, exc_info=True)
@@ -876,8 +726,13 @@ def get_transactions_paginated():
 
 
 @transactions.route("/<account_id>/transactions", methods=["GET"])
+@read_replica()
+@conditional_get()
 def get_account_transactions(account_id):
-    """Return transactions for a specific account."""
+    """Return transactions for a specific account.
+
+    Supports the same ``fields`` and ``shape`` parameters as ``/get_transactions``.
+    """
     try:
         page = int(request.args.get("page", 1))
         page_size = int(request.args.get("page_size", 15))
@@ -906,37 +761,66 @@ def get_account_transactions(account_id):
             start_date = None
             end_date = None
 
-        transactions, total, meta = account_logic.get_paginated_transactions(
-            page,
-            page_size,
-            start_date=start_date,
-            end_date=end_date,
-            category=category,
-            account_id=account_id,
-            recent=recent,
-            limit=limit,
-        )
+        try:
+            shape, fields = _parse_list_shape(request.args)
+            transactions, total, meta = account_logic.get_paginated_transactions(
+                page,
+                page_size,
+                start_date=start_date,
+                end_date=end_date,
+                category=category,
+                account_id=account_id,
+                recent=recent,
+                limit=limit,
+                fields=fields or None,
+            )
+        except ValueError as exc:
+            return jsonify({"status": "error", "message": str(exc)}), 400
 
-        return (
-            jsonify(
-                {
-                    "status": "success",
-                    "data": {
-                        "transactions": transactions,
-                        "total": total,
-                        "meta": meta,
-                    },
-                }
-            ),
-            200,
-        )
+        return jsonify(_transaction_list_payload(transactions, total, meta, shape)), 200
 
     except Exception as e:
         logger.error("Error in get_account_transactions: %s", e, exc_info=True)
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+@transactions.route("/search", methods=["GET"])
+@read_replica()
+@conditional_get()
+def search_transactions():
+    """Full-text search over description, merchant, category, and tags.
+
+    Query params:
+    - user_id: required user scope
+    - q: search text; every word must match a word prefix
+    - page_size: results per page (default 50, max 200)
+    - cursor: ``next_cursor`` from the previous page
+    """
+    from app.sql import search_logic
+
+    user_id = (request.args.get("user_id") or "").strip()
+    if not user_id:
+        return jsonify({"status": "error", "message": "user_id is required"}), 400
+    try:
+        page_size = int(request.args.get("page_size", search_logic.SEARCH_PAGE_SIZE))
+        data = search_logic.search_transactions(
+            user_id,
+            request.args.get("q") or "",
+            page_size=page_size,
+            cursor=request.args.get("cursor") or None,
+        )
+    except ValueError as exc:
+        # Covers a non-integer page_size and InvalidSearchCursor.
+        return jsonify({"status": "error", "message": str(exc)}), 400
+    except Exception as e:
+        logger.error("Error searching transactions: %s", e, exc_info=True)
+        return jsonify({"status": "error", "message": str(e)}), 500
+    return jsonify({"status": "success", "data": data}), 200
+
+
 @transactions.route("/merchants", methods=["GET"])
+@read_replica()
+@conditional_get()
 def merchant_suggestions():
     """Return a list of merchant name suggestions.
 
@@ -964,6 +848,8 @@ def merchant_suggestions():
 
 
 @transactions.route("/top_merchants", methods=["GET"])
+@read_replica()
+@conditional_get()
 def top_merchants():
     """Return top spending merchants with trend points for sparklines."""
 
@@ -971,6 +857,8 @@ def top_merchants():
 
 
 @transactions.route("/top_categories", methods=["GET"])
+@read_replica()
+@conditional_get()
 def top_categories():
     """Return top spending categories with trend points for sparklines."""
 
@@ -978,6 +866,8 @@ def top_categories():
 
 
 @transactions.route("/tags", methods=["GET"])
+@read_replica()
+@conditional_get()
 def tag_suggestions():
     """Return a list of tag suggestions.
 
@@ -1047,6 +937,8 @@ def create_rule():
 
 
 @transactions.route("/manual", methods=["GET"])
+@read_replica()
+@conditional_get()
 def get_manual_transactions():
     """Return all transactions from manually managed accounts."""
     try:
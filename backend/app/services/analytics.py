@@ -0,0 +1,217 @@
+"""Aggregate analytics over columnar snapshot files.
+
+Queries read the per-user Parquet partitions written by
+:mod:`app.services.analytics_snapshots` rather than the live tables, so
+all-time trends cost a vectorized file scan and no database work. DuckDB runs
+the aggregation when it is installed; otherwise ``pyarrow`` datasets and
+``Table.group_by`` do. Amounts follow the dashboard convention: positive
+stored amounts are spending, negative ones income, and internal transfers are
+excluded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+
+from app.services.analytics_snapshots import MANIFEST_NAME, read_manifest, user_snapshot_dir
+
+try:  # Optional dependency
+    import duckdb
+except Exception:  # pragma: no cover - duckdb is an optional extra
+    duckdb = None
+
+try:  # Optional dependency
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except Exception:  # pragma: no cover - slim installs ship without pyarrow
+    pa = None
+    ds = None
+
+GROUP_KEYS = frozenset({"month", "category_label", "merchant_label", "account_id"})
+DIRECTIONS = ("spending", "income")
+
+
+class AnalyticsUnavailable(RuntimeError):
+    """Raised when no engine is installed or the user has no snapshot yet."""
+
+
+def analytics_engine() -> str | None:
+    """Return ``"duckdb"``, ``"pyarrow"``, or ``None`` when neither is installed."""
+
+    if duckdb is not None:
+        return "duckdb"
+    if ds is not None:
+        return "pyarrow"
+    return None
+
+
+def snapshot_info(user_id: str, root: Path | None = None) -> dict:
+    """Return the transactions snapshot's ``generated_at`` and partition count."""
+
+    manifest = read_manifest(user_snapshot_dir("transactions", user_id, root))
+    return {"generated_at": manifest.get("generated_at"), "partitions": len(manifest.get("partitions", {}))}
+
+
+def _snapshot_files(user_id: str, root: Path | None) -> list[str]:
+    directory = user_snapshot_dir("transactions", user_id, root)
+    if not (directory / MANIFEST_NAME).exists():
+        raise AnalyticsUnavailable(f"No analytics snapshot for user {user_id}.")
+    return sorted(str(path) for path in directory.glob("month=*.parquet"))
+
+
+def _aggregate_duckdb(files, keys, start_date, end_date, exclude_account_ids, direction):
+    where = ["coalesce(is_internal, false) = false"]
+    params: list = [files]
+    if start_date:
+        where.append("date >= ?")
+        params.append(start_date)
+    if end_date:
+        where.append("date <= ?")
+        params.append(end_date)
+    if exclude_account_ids:
+        where.append("NOT list_contains(?, account_id)")
+        params.append(list(exclude_account_ids))
+    if direction:
+        where.append("amount > 0" if direction == "spending" else "amount < 0")
+    key_sql = ", ".join(keys)
+    sql = (
+        f"SELECT {key_sql}, sum(amount) AS amount, count(*) AS count "
+        f"FROM read_parquet(?) WHERE {' AND '.join(where)} GROUP BY {key_sql}"
+    )
+    with duckdb.connect() as connection:
+        cursor = connection.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def _aggregate_pyarrow(files, keys, start_date, end_date, exclude_account_ids, direction):
+    dataset = ds.dataset(files, format="parquet")
+    is_internal = ds.field("is_internal")
+    expression = (is_internal == False) | is_internal.is_null()  # noqa: E712 - Arrow expression, not a bool
+    if start_date:
+        expression &= ds.field("date") >= pa.scalar(start_date, pa.date32())
+    if end_date:
+        expression &= ds.field("date") <= pa.scalar(end_date, pa.date32())
+    if exclude_account_ids:
+        expression &= ~ds.field("account_id").isin(list(exclude_account_ids))
+    if direction:
+        zero = pa.scalar(0, dataset.schema.field("amount").type)
+        expression &= ds.field("amount") > zero if direction == "spending" else ds.field("amount") < zero
+    table = dataset.to_table(columns=[*keys, "amount"], filter=expression)
+    grouped = table.group_by(keys).aggregate([("amount", "sum"), ("amount", "count")])
+    return [
+        {**{key: row[key] for key in keys}, "amount": row["amount_sum"], "count": row["amount_count"]}
+        for row in grouped.to_pylist()
+    ]
+
+
+def aggregate_transactions(
+    user_id: str,
+    keys: Iterable[str],
+    *,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    exclude_account_ids: Iterable[str] = (),
+    direction: str | None = None,
+    root: Path | None = None,
+) -> list[dict]:
+    """Sum and count ``user_id``'s snapshot transactions grouped by ``keys``.
+
+    Args:
+        user_id: Snapshot owner.
+        keys: Grouping columns drawn from :data:`GROUP_KEYS`.
+        start_date: Inclusive lower date bound.
+        end_date: Inclusive upper date bound.
+        exclude_account_ids: Accounts to leave out, typically hidden ones.
+        direction: ``"spending"`` (positive amounts), ``"income"`` (negative
+            amounts), or ``None`` for both.
+        root: Snapshot root directory override.
+
+    Returns:
+        One dict per group with the key columns, ``amount`` (absolute, rounded
+        to cents), and ``count``.
+
+    Raises:
+        AnalyticsUnavailable: If no engine is installed or no snapshot exists.
+        ValueError: If a key or direction is not supported.
+    """
+
+    keys = list(keys)
+    unknown = sorted(set(keys) - GROUP_KEYS)
+    if unknown:
+        raise ValueError(f"Unsupported analytics keys: {', '.join(unknown)}")
+    if direction not in (None, *DIRECTIONS):
+        raise ValueError(f"Unsupported direction: {direction}")
+    engine = analytics_engine()
+    if engine is None:
+        raise AnalyticsUnavailable("Analytics queries require duckdb or pyarrow.")
+    files = _snapshot_files(user_id, root)
+    if not files:
+        return []
+
+    aggregate = _aggregate_duckdb if engine == "duckdb" else _aggregate_pyarrow
+    rows = aggregate(files, keys, start_date, end_date, tuple(exclude_account_ids), direction)
+    for row in rows:
+        row["amount"] = round(abs(float(row["amount"] or 0)), 2)
+        row["count"] = int(row["count"])
+    return rows
+
+
+def category_trends(user_id: str, **filters) -> list[dict]:
+    """Return monthly spending per category, oldest month first."""
+
+    rows = aggregate_transactions(user_id, ["month", "category_label"], direction="spending", **filters)
+    rows.sort(key=lambda row: (row["month"], -row["amount"], row["category_label"]))
+    return [
+        {"month": row["month"], "category": row["category_label"], "amount": row["amount"], "count": row["count"]}
+        for row in rows
+    ]
+
+
+def merchant_totals(user_id: str, top_n: int = 50, **filters) -> list[dict]:
+    """Return the ``top_n`` merchants by total spending."""
+
+    rows = aggregate_transactions(user_id, ["merchant_label"], direction="spending", **filters)
+    rows.sort(key=lambda row: (-row["amount"], row["merchant_label"]))
+    return [{"label": row["merchant_label"], "amount": row["amount"], "count": row["count"]} for row in rows[:top_n]]
+
+
+def _change_pct(current: float, previous: float) -> float | None:
+    return round((current - previous) / previous * 100, 2) if previous else None
+
+
+def year_over_year(user_id: str, year: int | None = None, **filters) -> dict:
+    """Compare monthly spending and income for ``year`` against the prior year.
+
+    ``year`` defaults to the current calendar year. Date filters are replaced
+    by the two-year window being compared.
+    """
+
+    year = year or date.today().year
+    filters.pop("start_date", None)
+    filters.pop("end_date", None)
+    window = {"start_date": date(year - 1, 1, 1), "end_date": date(year, 12, 31), **filters}
+    totals: dict[tuple[str, str], float] = {}
+    for direction in DIRECTIONS:
+        for row in aggregate_transactions(user_id, ["month"], direction=direction, **window):
+            totals[(direction, row["month"])] = row["amount"]
+
+    months = []
+    for month in range(1, 13):
+        entry = {"month": month}
+        for direction in DIRECTIONS:
+            current = totals.get((direction, f"{year:04d}-{month:02d}"), 0.0)
+            previous = totals.get((direction, f"{year - 1:04d}-{month:02d}"), 0.0)
+            entry[direction] = current
+            entry[f"previous_{direction}"] = previous
+            entry[f"{direction}_change_pct"] = _change_pct(current, previous)
+        months.append(entry)
+
+    summary = {}
+    for direction in DIRECTIONS:
+        current = round(sum(entry[direction] for entry in months), 2)
+        previous = round(sum(entry[f"previous_{direction}"] for entry in months), 2)
+        summary[direction] = {"current": current, "previous": previous, "change_pct": _change_pct(current, previous)}
+    return {"year": year, "previous_year": year - 1, "months": months, "totals": summary}
@@ -0,0 +1,290 @@
+"""Per-user, month-partitioned Parquet snapshots of analytics source tables.
+
+Transactions, account history, and investment holdings are copied into
+``DATA_DIR/analytics/<dataset>/user_id=<user>/month=YYYY-MM.parquet`` so
+heavy or all-time aggregates (:mod:`app.services.analytics`) can scan columnar
+files instead of the OLTP tables. Each user directory keeps a manifest of
+per-partition fingerprints (row count, value sum, latest ``updated_at``, and
+highest id); a refresh recomputes them with one grouped query and rewrites only
+the partitions whose fingerprint changed. Writing requires ``pyarrow``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from urllib.parse import quote
+
+from sqlalchemy import extract, func, select
+
+from app.config import logger
+from app.config.paths import DIRECTORIES
+from app.extensions import db
+from app.models import Account, AccountHistory, InvestmentHolding, Transaction
+from app.sql.export_logic import arrow_type
+
+# Optional dependency, loaded by ``_load_pyarrow``. ``None`` means unavailable.
+_NOT_LOADED = object()
+pa = _NOT_LOADED
+pq = _NOT_LOADED
+
+SNAPSHOT_ROOT = DIRECTORIES["DATA_DIR"] / "analytics"
+MANIFEST_NAME = "_manifest.json"
+UNDATED_PARTITION = "undated"
+
+
+@dataclass(frozen=True)
+class SnapshotDataset:
+    """Source table, partitioning column, and copied columns for one dataset."""
+
+    name: str
+    model: type
+    date_column: str
+    value_column: str
+    columns: tuple[str, ...]
+
+
+DATASETS = {
+    "transactions": SnapshotDataset(
+        "transactions",
+        Transaction,
+        "date",
+        "amount",
+        (
+            "transaction_id",
+            "account_id",
+            "date",
+            "amount",
+            "description",
+            "merchant_name",
+            "merchant_slug",
+            "category",
+            "category_slug",
+            "category_display",
+            "pending",
+            "is_internal",
+            "transfer_type",
+        ),
+    ),
+    "account_history": SnapshotDataset(
+        "account_history",
+        AccountHistory,
+        "date",
+        "balance",
+        ("account_id", "date", "balance", "is_hidden"),
+    ),
+    "holdings": SnapshotDataset(
+        "holdings",
+        InvestmentHolding,
+        "as_of",
+        "institution_value",
+        ("account_id", "security_id", "quantity", "cost_basis", "institution_value", "as_of"),
+    ),
+}
+
+
+def _load_pyarrow() -> None:
+    """Import ``pyarrow`` the first time a snapshot is written, not at app startup."""
+
+    global pa, pq
+    if pq is not _NOT_LOADED:
+        return
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except Exception:  # pragma: no cover - slim installs ship without pyarrow
+        pa = pq = None
+        return
+    pa, pq = pyarrow, pyarrow.parquet
+
+
+def snapshot_available() -> bool:
+    """Return ``True`` when ``pyarrow`` is installed."""
+
+    _load_pyarrow()
+    return pq is not None
+
+
+def user_snapshot_dir(dataset: str, user_id: str, root: Path | None = None) -> Path:
+    """Return the directory holding ``user_id``'s partitions of ``dataset``."""
+
+    return Path(root or SNAPSHOT_ROOT) / dataset / f"user_id={quote(str(user_id), safe='')}"
+
+
+def read_manifest(directory: Path) -> dict:
+    """Return the manifest stored in ``directory`` or an empty one."""
+
+    try:
+        return json.loads((directory / MANIFEST_NAME).read_text())
+    except (FileNotFoundError, ValueError):
+        return {"partitions": {}}
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _owned(dataset: SnapshotDataset, stmt, user_id: str):
+    """Restrict ``stmt`` to ``dataset`` rows on accounts ``user_id`` owns.
+
+    Ownership comes from ``accounts.user_id``; transactions ingested by
+    ``refresh_data_for_plaid_account`` have no ``user_id`` of their own.
+    """
+
+    owned = select(Account.account_id).where(Account.user_id == user_id)
+    return stmt.where(dataset.model.__table__.c.account_id.in_(owned))
+
+
+def _partition_key(year, month) -> str:
+    if year is None or month is None:
+        return UNDATED_PARTITION
+    return f"{int(year):04d}-{int(month):02d}"
+
+
+def partition_fingerprints(dataset: SnapshotDataset, user_id: str) -> dict[str, list[str]]:
+    """Return ``{partition: fingerprint}`` for ``user_id`` from one grouped query."""
+
+    table = dataset.model.__table__
+    date_col = table.c[dataset.date_column]
+    year = extract("year", date_col).label("year")
+    month = extract("month", date_col).label("month")
+    stmt = select(
+        year,
+        month,
+        func.count(),
+        func.sum(table.c[dataset.value_column]),
+        func.max(table.c.updated_at),
+        func.max(table.c.id),
+    ).group_by(year, month)
+    rows = db.session.execute(_owned(dataset, stmt, user_id)).all()
+    return {_partition_key(row[0], row[1]): [str(value) for value in row[2:]] for row in rows}
+
+
+def _partition_bounds(key: str) -> tuple[date, date]:
+    year, month = (int(part) for part in key.split("-"))
+    start = date(year, month, 1)
+    end = date(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+def _transaction_labels(record: dict) -> dict:
+    """Precompute the grouping labels the dashboard charts use."""
+
+    return {
+        "category_label": record.get("category_display") or record.get("category") or "Uncategorized",
+        "merchant_label": record.get("merchant_name") or record.get("description") or "Unknown",
+    }
+
+
+def _partition_table(dataset: SnapshotDataset, user_id: str, key: str):
+    """Load one partition's rows from the database as an Arrow table."""
+
+    table = dataset.model.__table__
+    columns = [table.c[name] for name in dataset.columns]
+    date_col = table.c[dataset.date_column]
+    stmt = select(*columns).order_by(date_col, table.c.id)
+    if key == UNDATED_PARTITION:
+        stmt = stmt.where(date_col.is_(None))
+    else:
+        start, end = _partition_bounds(key)
+        stmt = stmt.where(date_col >= start, date_col < end)
+    rows = db.session.execute(_owned(dataset, stmt, user_id)).all()
+
+    data = {name: [row[index] for row in rows] for index, name in enumerate(dataset.columns)}
+    fields = [pa.field(column.name, arrow_type(column)) for column in columns]
+    data["month"] = [key] * len(rows)
+    fields.append(pa.field("month", pa.string()))
+    if dataset.name == "transactions":
+        labels = [_transaction_labels(dict(zip(dataset.columns, row))) for row in rows]
+        for name in ("category_label", "merchant_label"):
+            data[name] = [label[name] for label in labels]
+            fields.append(pa.field(name, pa.string()))
+    return pa.Table.from_pydict(data, schema=pa.schema(fields))
+
+
+def refresh_user_dataset(
+    dataset: SnapshotDataset, user_id: str, root: Path | None = None, force: bool = False
+) -> dict[str, int]:
+    """Bring ``user_id``'s snapshot of ``dataset`` up to date.
+
+    Returns:
+        Counts of ``written``, ``removed``, and ``unchanged`` partitions.
+    """
+
+    _load_pyarrow()
+    directory = user_snapshot_dir(dataset.name, user_id, root)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(directory)
+    previous = {} if force else manifest.get("partitions", {})
+    current = partition_fingerprints(dataset, user_id)
+    stats = {"written": 0, "removed": 0, "unchanged": 0}
+
+    for key, fingerprint in sorted(current.items()):
+        path = directory / f"month={key}.parquet"
+        if previous.get(key) == fingerprint and path.exists():
+            stats["unchanged"] += 1
+            continue
+        sink = pa.BufferOutputStream()
+        pq.write_table(_partition_table(dataset, user_id, key), sink)
+        _atomic_write_bytes(path, sink.getvalue().to_pybytes())
+        stats["written"] += 1
+
+    for path in directory.glob("month=*.parquet"):
+        if path.stem.split("=", 1)[1] not in current:
+            path.unlink()
+            stats["removed"] += 1
+
+    manifest = {
+        "dataset": dataset.name,
+        "generated_at": datetime.utcnow().isoformat(),
+        "partitions": current,
+    }
+    _atomic_write_bytes(directory / MANIFEST_NAME, json.dumps(manifest, sort_keys=True).encode("utf-8"))
+    return stats
+
+
+def write_analytics_snapshots(
+    user_id: str | None = None,
+    datasets: list[str] | None = None,
+    root: Path | None = None,
+    force: bool = False,
+) -> dict[str, dict[str, int]]:
+    """Refresh snapshots for ``user_id`` (or every account owner).
+
+    Args:
+        user_id: Optional user scope; defaults to every user that owns an account.
+        datasets: Dataset names to refresh; defaults to all of :data:`DATASETS`.
+        root: Snapshot root directory; defaults to :data:`SNAPSHOT_ROOT`.
+        force: Rewrite every partition even when its fingerprint is unchanged.
+
+    Returns:
+        Per-dataset ``written``/``removed``/``unchanged`` partition counts.
+
+    Raises:
+        RuntimeError: If ``pyarrow`` is not installed.
+        KeyError: If a dataset name is unknown.
+    """
+
+    if not snapshot_available():
+        raise RuntimeError("Analytics snapshots require pyarrow.")
+    selected = [DATASETS[name] for name in (datasets or DATASETS)]
+    if user_id:
+        users = [user_id]
+    else:
+        users = db.session.execute(
+            select(Account.user_id).where(Account.user_id.is_not(None)).distinct().order_by(Account.user_id)
+        ).scalars()
+
+    totals = {dataset.name: {"written": 0, "removed": 0, "unchanged": 0} for dataset in selected}
+    for user in users:
+        for dataset in selected:
+            stats = refresh_user_dataset(dataset, user, root=root, force=force)
+            for key, value in stats.items():
+                totals[dataset.name][key] += value
+    logger.info("Analytics snapshots refreshed: %s", totals)
+    return totals
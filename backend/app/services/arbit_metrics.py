@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import Dict, Tuple, TypedDict
 
-import requests
 from flask import current_app
 
 SERIES_CONFIG: Dict[str, Tuple[Tuple[str, str], ...]] = {
@@ -35,6 +34,8 @@ def fetch_metrics() -> Dict[str, float | int]:
     Returns:
         Mapping of metric names to numeric values.
     """
+    import requests
+
     base_url: str = current_app.config["ARBIT_EXPORTER_URL"]
     response = requests.get(f"{base_url}/metrics", timeout=5)
     response.raise_for_status()
@@ -177,9 +177,8 @@ def update_account_balance_history(account_id: str, days: int = 365, force_updat
         current_balance = normalize_account_balance(account.balance, account.type, account_id=account.account_id)
 
         logger.info(
-            "Updating balance history for %s (%s/%s) from %s to %s",
+            "Updating balance history for %s (%s) from %s to %s",
             account.name,
-            account.id,
             account.account_id,
             start_date,
             end_date,
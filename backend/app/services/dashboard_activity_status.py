@@ -8,7 +8,6 @@ from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-import requests
 from sqlalchemy import or_
 
 from app.config import logger
@@ -107,6 +106,8 @@ def _build_fallback_message(accounts: list[dict[str, Any]], transactions: list[d
 def _call_openai_for_status(payload: dict[str, Any]) -> dict[str, str]:
     """Request a single parseable status message from OpenAI."""
 
+    import requests
+
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is not configured")
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from sqlalchemy import func
 
+from app.config import logger
 from app.extensions import db
 from app.models import Account, AccountHistory, Transaction
 from app.services.account_history import compute_balance_history
@@ -80,7 +81,7 @@ def get_or_compute_account_history(
         return fresh_history
 
     except Exception as e:
-        print(f"Error in get_or_compute_account_history: {e}")
+        logger.error("Error in get_or_compute_account_history for %s: %s", account_id, e, exc_info=True)
         return []
 
 
@@ -170,7 +171,7 @@ def compute_fresh_history(
         return compute_balance_history(Decimal(str(current_balance)), transactions, start_date, end_date)
 
     except Exception as e:
-        print(f"Error computing fresh history: {e}")
+        logger.error("Error computing fresh history for %s: %s", account_id, e, exc_info=True)
         return []
 
 
@@ -231,13 +232,15 @@ def cache_history(account_id: str, user_id: str, history: List[Dict[str, float]]
 
         db.session.commit()
 
-        print(
-            "Cached balance history records for account "
-            f"{account_id} ({inserted_count} inserted, {updated_count} updated)"
+        logger.debug(
+            "Cached balance history records for account %s (%d inserted, %d updated)",
+            account_id,
+            inserted_count,
+            updated_count,
         )
 
     except Exception as e:
-        print(f"Error caching history: {e}")
+        logger.error("Error caching history for %s: %s", account_id, e)
         db.session.rollback()
 
 
@@ -248,7 +251,7 @@ def update_account_balance_history(account_id: str, force_update: bool = False):
         for days in [7, 30, 90, 365]:
             get_or_compute_account_history(account_id, days=days, force_recompute=True)
 
-        print(f"Updated balance history cache for account {account_id}")
+        logger.debug("Updated balance history cache for account %s", account_id)
 
     except Exception as e:
-        print(f"Error updating account balance history: {e}")
+        logger.error("Error updating account balance history for %s: %s", account_id, e)
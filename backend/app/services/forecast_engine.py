@@ -69,7 +69,8 @@ class ForecastEngine:
             .all()
         )
         for acc_id, bal in latest_balances:
-            balances[acc_id] = bal
+            # Numeric columns load as Decimal; projected deltas are floats.
+            balances[acc_id] = float(bal or 0)
 
         daily_txns = defaultdict(lambda: defaultdict(float))
         for txn in forecast_txns:
@@ -15,6 +15,11 @@ try:  # Optional dependency
 except Exception:  # pragma: no cover - allow missing heavy deps
     ForecastEngineStatModel = None
 
+try:  # Optional dependency
+    from .forecast_stat_model import get_stat_model_registry
+except Exception:  # pragma: no cover - registry unavailable with stubbed stat models
+    get_stat_model_registry = None
+
 
 class ForecastOrchestrator:
     """Compose forecast data from multiple prediction engines."""
@@ -23,9 +28,15 @@ class ForecastOrchestrator:
         self.db = db
         self.rule_engine = ForecastEngineRuleBased(db)
         self.stat_engine = ForecastEngineStatModel() if ForecastEngineStatModel else None
+        self.stat_registry = get_stat_model_registry() if get_stat_model_registry else None
+
+    def forecast(self, method="rule", days=60, stat_input=None, user_id=None, account_ids=None, series_version=None):
+        """Run either rule-based or statistical forecasts.
 
-    def forecast(self, method="rule", days=60, stat_input=None):
-        """Run either rule-based or statistical forecasts."""
+        Statistical forecasts for a known ``user_id`` go through the fitted-model
+        registry, which reuses the fit for an unchanged series and warm-starts the
+        refit when observations were only appended.
+        """
         if days <= 0:
             raise ValueError("days must be positive")
         if method == "rule":
@@ -35,6 +46,14 @@ class ForecastOrchestrator:
                 raise ImportError("Statistical forecast engine not available")
             if stat_input is None:
                 raise ValueError("Statistical forecast requires a time series input (pd.Series).")
+            if user_id is not None and self.stat_registry is not None:
+                engine = self.stat_registry.get_or_fit(
+                    user_id=user_id,
+                    series=stat_input,
+                    account_ids=account_ids,
+                    series_version=series_version,
+                )
+                return engine.forecast(steps=days)
             self.stat_engine.fit(stat_input)
             return self.stat_engine.forecast(steps=days)
         else:
@@ -1,28 +1,68 @@
-import pandas as pd
-from sklearn.metrics import mean_squared_error
-from statsmodels.tsa.arima.model import ARIMA
+"""ARIMA-based statistical forecasts with a fitted-model registry.
+
+``pandas``, ``statsmodels`` and ``sklearn`` are imported on first use so importing
+this module (and the orchestrator that wraps it) stays cheap when only rule-based
+forecasts are requested.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 from app.config import logger
 
-logger.info("Initializing forecast stat model")
+DEFAULT_ORDER = (2, 1, 2)
+DEFAULT_REGISTRY_SIZE = 32
+
+_ARIMA = None
+
+
+def _arima_class():
+    """Import and cache ``statsmodels``' ARIMA class on first use."""
+    global _ARIMA
+    if _ARIMA is None:
+        from statsmodels.tsa.arima.model import ARIMA
+
+        logger.info("Initializing forecast stat model")
+        _ARIMA = ARIMA
+    return _ARIMA
+
+
+def series_digest(series) -> str:
+    """Return a stable digest of a series' index and values."""
+    import pandas as pd
+
+    hashed = pd.util.hash_pandas_object(series, index=True).values
+    return hashlib.sha1(hashed.tobytes()).hexdigest()
 
 
 class ForecastEngine:
-    def __init__(self, order=(2, 1, 2)):
+    def __init__(self, order=DEFAULT_ORDER):
         self.order = order
         self.model = None
 
-    def fit(self, series: pd.Series):
-        self.model = ARIMA(series, order=self.order).fit()
+    def fit(self, series, start_params=None):
+        """Fit ARIMA on ``series``; ``start_params`` warm-starts the optimizer."""
+        self.model = _arima_class()(series, order=self.order).fit(start_params=start_params)
         return self
 
+    def refit(self, series):
+        """Refit on ``series`` starting from the current parameters when available."""
+        start_params = self.model.params if self.model is not None else None
+        return self.fit(series, start_params=start_params)
+
     def forecast(self, steps: int = 60):
         if not self.model:
             raise ValueError("Model not fit. Call `fit()` first.")
         forecast = self.model.forecast(steps=steps)
         return forecast.tolist()
 
-    def evaluate(self, series: pd.Series, steps: int = 10):
+    def evaluate(self, series, steps: int = 10):
+        from sklearn.metrics import mean_squared_error
+
         if len(series) <= steps:
             raise ValueError("Series too short for evaluation.")
         train, test = series[:-steps], series[-steps:]
@@ -31,3 +71,150 @@ class ForecastEngine:
         mse = mean_squared_error(test, preds)
         logger.info("ARIMA Evaluation MSE: %s", mse)
         return mse
+
+
+def _evaluate_series(task):
+    """Process-pool worker: backtest one series and return its MSE."""
+    series, steps, order = task
+    return ForecastEngine(order=order).evaluate(series, steps=steps)
+
+
+def evaluate_many(series_list, steps: int = 10, order=DEFAULT_ORDER, max_workers=None):
+    """Backtest several series, fanning out over a process pool.
+
+    Returns MSE values in input order. Runs inline for a single series or when
+    ``max_workers`` is ``1``.
+    """
+    tasks = [(series, steps, order) for series in series_list]
+    if len(tasks) <= 1 or max_workers == 1:
+        return [_evaluate_series(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_evaluate_series, tasks))
+
+
+class _RegistryEntry:
+    """Fitted engine plus the series fingerprint it was trained on."""
+
+    __slots__ = ("engine", "series_version", "length", "digest")
+
+    def __init__(self, engine, series_version, length, digest):
+        self.engine = engine
+        self.series_version = series_version
+        self.length = length
+        self.digest = digest
+
+
+class StatModelRegistry:
+    """LRU registry of fitted ARIMA engines keyed by user and account set.
+
+    Each entry remembers the series version and a digest of the series it was
+    fitted on. ``get_or_fit`` returns the cached engine when the version matches,
+    warm-refits from the cached parameters when the new series only appends
+    observations, and cold-fits otherwise. When ``persist_dir`` is set, fitted
+    entries are pickled there and reloaded after eviction or a restart.
+    """
+
+    def __init__(self, max_entries=DEFAULT_REGISTRY_SIZE, persist_dir=None, order=DEFAULT_ORDER):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.persist_dir = persist_dir
+        self.order = order
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "warm_refits": 0, "cold_fits": 0, "evictions": 0, "disk_loads": 0}
+
+    @staticmethod
+    def model_key(user_id, account_ids=None):
+        """Return the registry key for a user and (order-insensitive) account set."""
+        return (str(user_id), tuple(sorted(str(account_id) for account_id in account_ids or ())))
+
+    def _path_for(self, key):
+        name = hashlib.sha1(repr((key, self.order)).encode("utf-8")).hexdigest()
+        return os.path.join(self.persist_dir, f"stat_model_{name}.pkl")
+
+    def _load(self, key):
+        if not self.persist_dir:
+            return None
+        path = self._path_for(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as handle:
+                entry = pickle.load(handle)
+        except Exception as exc:
+            logger.warning("Discarding unreadable stat model %s: %s", path, exc)
+            return None
+        self.stats["disk_loads"] += 1
+        return entry
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        if self.persist_dir:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            path = self._path_for(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as handle:
+                pickle.dump(entry, handle)
+            os.replace(tmp_path, path)
+
+    def get_or_fit(self, *, user_id, series, account_ids=None, series_version=None):
+        """Return a fitted engine for ``series``, reusing or warm-starting cached fits.
+
+        Args:
+            user_id: Forecast owner.
+            series: Observations as a ``pd.Series``.
+            account_ids: Accounts whose balances produced the series.
+            series_version: Caller-supplied version token; defaults to a digest of
+                the series itself.
+        """
+        key = self.model_key(user_id, account_ids)
+        digest = series_digest(series)
+        version = series_version if series_version is not None else digest
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._load(key)
+            if entry is not None and entry.series_version == version and entry.length == len(series):
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry.engine
+
+        # Fit outside the lock so slow fits for one user do not block others.
+        appended = (
+            entry is not None
+            and len(series) > entry.length
+            and series_digest(series.iloc[: entry.length]) == entry.digest
+        )
+        engine = ForecastEngine(order=self.order)
+        if appended:
+            engine.fit(series, start_params=entry.engine.model.params)
+        else:
+            engine.fit(series)
+        with self._lock:
+            self.stats["warm_refits" if appended else "cold_fits"] += 1
+            self._store(key, _RegistryEntry(engine, version, len(series), digest))
+        return engine
+
+    def clear(self):
+        """Drop in-memory entries; persisted models stay on disk."""
+        with self._lock:
+            self._entries.clear()
+
+
+_REGISTRY = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_stat_model_registry():
+    """Return the process-wide registry, persisting under ``STAT_MODEL_DIR`` when set."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = StatModelRegistry(persist_dir=os.getenv("STAT_MODEL_DIR") or None)
+        return _REGISTRY
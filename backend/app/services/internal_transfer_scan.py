@@ -0,0 +1,463 @@
+"""Streaming detection of likely internal transfer pairs.
+
+Transactions are streamed per user in date order with ``yield_per`` and matched
+against a sliding window of recent rows. The window is a deque in arrival order
+plus a hash map keyed by absolute amount in cents, so each anchor only scores
+rows whose amount is within ``amount_epsilon`` of its own instead of every row in
+the date window. Matching is greedy in date order: the oldest unmatched row takes
+its best-scoring forward candidate, mirroring the original full-scan behavior.
+
+Transactions belong to the owner of their account (``accounts.user_id``, which
+is indexed); refresh-ingested rows carry no ``user_id`` of their own. Users are
+independent and scanned in ascending id order, so a page of results
+is a keyset position ``(user_id, pairs already returned for that user)``: a page
+only streams the users it returns pairs for, resuming a user by re-matching it
+and skipping the pairs already returned. Several users can be matched in
+parallel in a process pool. Rows are reduced to plain dictionaries before
+matching so they can be shipped to worker processes without ORM state.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import exists, select
+
+from app.extensions import db
+from app.models import Account, Transaction
+
+UTC = timezone.utc
+TWOPLACES = Decimal("0.01")
+DEFAULT_BATCH_SIZE = 1000
+INTERNAL_TRANSFER_KEYWORDS = {
+    "transfer",
+    "zelle",
+    "venmo",
+    "cashapp",
+    "cash app",
+    "payment",
+    "p2p",
+    "xfer",
+}
+NON_TRANSFER_KEYWORDS = {
+    "uber",
+    "ubereats",
+    "eats",
+    "doordash",
+    "grubhub",
+    "lyft",
+    "restaurant",
+    "grocery",
+    "groceries",
+    "amazon",
+    "target",
+    "walmart",
+    "shell",
+    "chevron",
+    "starbucks",
+    "netflix",
+    "spotify",
+}
+
+
+class InvalidScanCursor(ValueError):
+    """Raised when a scan pagination cursor cannot be decoded."""
+
+
+def _normalize_txn_datetime(value: date | datetime | None) -> datetime:
+    """Convert a transaction calendar date to UTC midnight for interval scoring."""
+
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time(), tzinfo=UTC)
+    return datetime.min.replace(tzinfo=UTC)
+
+
+def _tokenize_transfer_text(value: str | None) -> set[str]:
+    """Extract lowercase alphanumeric tokens from transfer descriptions."""
+
+    if not value:
+        return set()
+    return set(re.findall(r"[a-z0-9]+", value.lower()))
+
+
+def _has_transfer_hint(tokens: set[str], raw_text: str | None = None) -> bool:
+    """Return whether tokens include common transfer/payment hints."""
+
+    if raw_text:
+        lowered = raw_text.lower()
+        if any(keyword in lowered for keyword in INTERNAL_TRANSFER_KEYWORDS):
+            return True
+    if not tokens:
+        return False
+    return any(token in INTERNAL_TRANSFER_KEYWORDS for token in tokens)
+
+
+def _has_non_transfer_hint(tokens: set[str], raw_text: str | None = None) -> bool:
+    """Return whether text looks like normal merchant spend (not transfers)."""
+
+    if raw_text:
+        lowered = raw_text.lower()
+        if any(keyword in lowered for keyword in NON_TRANSFER_KEYWORDS):
+            return True
+    if not tokens:
+        return False
+    return any(token in NON_TRANSFER_KEYWORDS for token in tokens)
+
+
+def _internal_match_score(
+    anchor: dict,
+    candidate: dict,
+    max_window_seconds: float,
+    amount_epsilon: Decimal,
+    allow_same_account: bool,
+) -> float | None:
+    """Score an internal-transfer candidate pair.
+
+    Lower scores are better. ``None`` means the pair is not eligible.
+    """
+
+    if anchor["transaction_id"] == candidate["transaction_id"]:
+        return None
+
+    if not allow_same_account and anchor["account_id"] == candidate["account_id"]:
+        return None
+
+    amount_a = anchor["amount"]
+    amount_b = candidate["amount"]
+    if amount_a == 0 or amount_b == 0:
+        return None
+    if amount_a * amount_b >= 0:
+        return None
+
+    amount_delta = abs(abs(amount_a) - abs(amount_b))
+    if amount_delta > amount_epsilon:
+        return None
+
+    time_delta_seconds = abs((anchor["date"] - candidate["date"]).total_seconds())
+    if time_delta_seconds > max_window_seconds:
+        return None
+
+    score = float(amount_delta * Decimal("1000"))
+    score += time_delta_seconds / 3600.0
+
+    # Prefer cross-account matches but still support same-account correction pairs.
+    if anchor["account_id"] == candidate["account_id"]:
+        score += 6.0
+    else:
+        score -= 0.5
+
+    overlap = anchor["tokens"] & candidate["tokens"]
+    if overlap:
+        score -= min(2.0, 0.5 * len(overlap))
+
+    hint_a = _has_transfer_hint(anchor["tokens"], anchor.get("description"))
+    hint_b = _has_transfer_hint(candidate["tokens"], candidate.get("description"))
+    if hint_a and hint_b:
+        score -= 4.0
+    elif hint_a or hint_b:
+        # Prevent transfer-looking rows from pairing with ordinary merchant spend.
+        score += 12.0
+
+    merchantish_a = _has_non_transfer_hint(anchor["tokens"], anchor.get("description"))
+    merchantish_b = _has_non_transfer_hint(candidate["tokens"], candidate.get("description"))
+    if merchantish_a and not hint_a:
+        score += 6.0
+    if merchantish_b and not hint_b:
+        score += 6.0
+
+    return score
+
+
+def _amount_cents(amount: Decimal) -> int:
+    """Return the absolute amount in whole cents."""
+
+    return int(abs(amount) * 100)
+
+
+def _serialize_pair(user_id: str, anchor: dict, candidate: dict, score: float) -> dict[str, Any]:
+    """Return the response row for a matched anchor/counterpart pair."""
+
+    return {
+        "transaction_id": anchor["transaction_id"],
+        "counterpart_id": candidate["transaction_id"],
+        "amount": float(anchor["amount"]),
+        "date": anchor["date"].isoformat(),
+        "description": anchor["description"],
+        "account_id": anchor["account_id"],
+        "account_name": anchor.get("account_name"),
+        "institution_name": anchor.get("institution_name"),
+        "user_id": user_id,
+        "time_delta_hours": round(abs((anchor["date"] - candidate["date"]).total_seconds()) / 3600.0, 2),
+        "amount_delta": float(abs(abs(anchor["amount"]) - abs(candidate["amount"]))),
+        "match_score": round(float(score), 4),
+        "counterpart": {
+            "transaction_id": candidate["transaction_id"],
+            "amount": float(candidate["amount"]),
+            "date": candidate["date"].isoformat(),
+            "description": candidate["description"],
+            "account_id": candidate["account_id"],
+            "account_name": candidate.get("account_name"),
+            "institution_name": candidate.get("institution_name"),
+        },
+    }
+
+
+def iter_internal_transfers(
+    records: Iterable[dict],
+    *,
+    user_id: str,
+    date_window_days: int = 3,
+    amount_epsilon: Decimal = TWOPLACES,
+    allow_same_account: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Greedily pair offsetting records from a date-ordered stream.
+
+    Pairs are yielded as soon as their anchor leaves the window, so a caller
+    that stops early also stops reading ``records``.
+
+    Args:
+        records: Records for one user, ordered by ``date``. Each record carries
+            ``transaction_id``, ``account_id``, ``amount`` (``Decimal``), ``date``
+            (aware ``datetime``), ``description``, and ``tokens``.
+        user_id: Owner echoed on every pair.
+        date_window_days: Maximum forward distance between anchor and counterpart.
+        amount_epsilon: Maximum difference between absolute amounts.
+        allow_same_account: Whether both sides may belong to the same account.
+
+    Yields:
+        Serialized pairs in anchor date order.
+    """
+
+    max_window_seconds = float(date_window_days * 86400)
+    epsilon_cents = _amount_cents(amount_epsilon)
+    window: deque[tuple[int, dict]] = deque()
+    by_cents: dict[int, dict[int, dict]] = {}
+    matched: set[int] = set()
+
+    def unindex(sequence: int, record: dict) -> None:
+        bucket = by_cents.get(record["cents"])
+        if bucket is None:
+            return
+        bucket.pop(sequence, None)
+        if not bucket:
+            del by_cents[record["cents"]]
+
+    def candidates_for(anchor: dict) -> Iterator[tuple[int, dict]]:
+        cents = anchor["cents"]
+        if 2 * epsilon_cents + 1 > len(by_cents):
+            for key, bucket in by_cents.items():
+                if abs(key - cents) <= epsilon_cents:
+                    yield from bucket.items()
+            return
+        for key in range(max(0, cents - epsilon_cents), cents + epsilon_cents + 1):
+            bucket = by_cents.get(key)
+            if bucket:
+                yield from bucket.items()
+
+    def resolve_oldest() -> dict[str, Any] | None:
+        sequence, anchor = window.popleft()
+        if sequence in matched:
+            matched.discard(sequence)
+            return None
+        unindex(sequence, anchor)
+
+        best: tuple[float, int, dict] | None = None
+        for candidate_sequence, candidate in candidates_for(anchor):
+            score = _internal_match_score(
+                anchor=anchor,
+                candidate=candidate,
+                max_window_seconds=max_window_seconds,
+                amount_epsilon=amount_epsilon,
+                allow_same_account=allow_same_account,
+            )
+            if score is None:
+                continue
+            # Ties go to the earliest candidate, as in a forward date-order scan.
+            if best is None or (score, candidate_sequence) < (best[0], best[1]):
+                best = (score, candidate_sequence, candidate)
+
+        if best is None:
+            return None
+        score, candidate_sequence, candidate = best
+        unindex(candidate_sequence, candidate)
+        matched.add(candidate_sequence)
+        return _serialize_pair(user_id, anchor, candidate, score)
+
+    for sequence, record in enumerate(records):
+        # Everything still buffered is within the window of the oldest anchor, so
+        # an anchor can be resolved once a row arrives beyond its window.
+        while window and (record["date"] - window[0][1]["date"]).total_seconds() > max_window_seconds:
+            pair = resolve_oldest()
+            if pair is not None:
+                yield pair
+        record["cents"] = _amount_cents(record["amount"])
+        window.append((sequence, record))
+        by_cents.setdefault(record["cents"], {})[sequence] = record
+
+    while window:
+        pair = resolve_oldest()
+        if pair is not None:
+            yield pair
+
+
+def match_internal_transfers(records: Iterable[dict], *, user_id: str, **options) -> list[dict[str, Any]]:
+    """Return every pair :func:`iter_internal_transfers` finds in ``records``."""
+
+    return list(iter_internal_transfers(records, user_id=user_id, **options))
+
+
+def _scan_filters() -> list:
+    return [
+        (Transaction.is_internal.is_(False)) | (Transaction.is_internal.is_(None)),
+        (Transaction.pending.is_(False)) | (Transaction.pending.is_(None)),
+    ]
+
+
+def scan_user_ids(user_ids: Iterable[str] | None = None, starting_at: str | None = None) -> list[str]:
+    """Return users owning scannable transactions, optionally limited to ``user_ids``.
+
+    ``starting_at`` drops users ordered before it, to resume a paginated scan.
+    """
+
+    scannable = exists().where(Transaction.account_id == Account.account_id, *_scan_filters())
+    stmt = select(Account.user_id).where(Account.user_id.is_not(None), scannable).distinct().order_by(Account.user_id)
+    if user_ids is not None:
+        stmt = stmt.where(Account.user_id.in_(list(user_ids)))
+    if starting_at is not None:
+        stmt = stmt.where(Account.user_id >= starting_at)
+    return [row[0] for row in db.session.execute(stmt)]
+
+
+def iter_scan_records(user_id: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[dict]:
+    """Stream a user's scannable transactions in date order as plain records.
+
+    Only the columns needed for matching are selected and rows are fetched in
+    ``batch_size`` chunks, so no ORM objects are built or held.
+    """
+
+    stmt = (
+        select(
+            Transaction.transaction_id,
+            Transaction.account_id,
+            Transaction.amount,
+            Transaction.date,
+            Transaction.description,
+            Transaction.merchant_name,
+            Account.name,
+            Account.institution_name,
+        )
+        .join(Account, Transaction.account_id == Account.account_id)
+        .where(*_scan_filters(), Account.user_id == user_id)
+        .order_by(Transaction.date, Transaction.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in db.session.execute(stmt):
+        description = row.description or row.merchant_name or ""
+        yield {
+            "transaction_id": row.transaction_id,
+            "account_id": row.account_id,
+            "account_name": row.name,
+            "institution_name": row.institution_name,
+            "amount": Decimal(str(row.amount)).quantize(TWOPLACES),
+            "date": _normalize_txn_datetime(row.date),
+            "description": description,
+            "tokens": _tokenize_transfer_text(description),
+        }
+
+
+def _match_user_task(task: tuple) -> list[dict[str, Any]]:
+    """Process-pool worker: match one user's preloaded records."""
+
+    user_id, records, options = task
+    return match_internal_transfers(records, user_id=user_id, **options)
+
+
+def encode_scan_cursor(user_id: str, returned: int) -> str:
+    """Encode the keyset position after ``returned`` pairs of ``user_id``."""
+
+    payload = json.dumps([user_id, returned], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_scan_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor from :func:`encode_scan_cursor`."""
+
+    try:
+        user_id, returned = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(user_id, str) or not isinstance(returned, int) or returned < 0:
+            raise TypeError("malformed scan cursor")
+        return user_id, returned
+    except (ValueError, TypeError, UnicodeError) as exc:
+        raise InvalidScanCursor("Invalid scan cursor") from exc
+
+
+def scan_internal_transfers(
+    user_ids: Iterable[str] | None = None,
+    *,
+    date_window_days: int = 3,
+    amount_epsilon: Decimal = TWOPLACES,
+    allow_same_account: bool = True,
+    max_workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    after: tuple[str, int] | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Return likely internal transfer pairs for each user, grouped by user.
+
+    ``after`` is a keyset position ``(user_id, pairs already returned for that
+    user)`` and ``limit`` caps the result, so a page only streams the users it
+    returns pairs for. With ``max_workers`` of 1 (or a single user) each user's
+    stream is matched inline as it is read and reading stops once ``limit``
+    pairs are found. Otherwise users are matched ``max_workers`` at a time in a
+    process pool, fed by the parent's streams; workers never touch the database
+    session.
+    """
+
+    options = {
+        "date_window_days": date_window_days,
+        "amount_epsilon": amount_epsilon,
+        "allow_same_account": allow_same_account,
+    }
+    users = scan_user_ids(user_ids, starting_at=after[0] if after else None)
+    skip = {after[0]: after[1]} if after else {}
+    pairs: list[dict[str, Any]] = []
+
+    def full() -> bool:
+        return limit is not None and len(pairs) >= limit
+
+    if max_workers <= 1 or len(users) <= 1:
+        for user_id in users:
+            records = iter_scan_records(user_id, batch_size)
+            with closing(iter_internal_transfers(records, user_id=user_id, **options)) as found, closing(records):
+                for index, pair in enumerate(found):
+                    if index < skip.get(user_id, 0):
+                        continue
+                    pairs.append(pair)
+                    if full():
+                        return pairs
+        return pairs
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for start in range(0, len(users), max_workers):
+            chunk = users[start : start + max_workers]
+            futures = [
+                pool.submit(_match_user_task, (user_id, list(iter_scan_records(user_id, batch_size)), options))
+                for user_id in chunk
+            ]
+            for user_id, future in zip(chunk, futures):
+                pairs.extend(future.result()[skip.get(user_id, 0) :])
+            if full():
+                break
+    return pairs if limit is None else pairs[:limit]
@@ -0,0 +1,582 @@
+"""Offline stand-in for the Plaid API client.
+
+:class:`PlaidStandIn` implements the part of ``plaid_api.PlaidApi`` the refresh
+paths call -- ``transactions_sync``, ``transactions_get``, ``accounts_get``,
+``investments_holdings_get`` and ``investments_transactions_get`` -- over a
+deterministic generated dataset, so ingest can be exercised and timed without
+network access or sandbox credentials.
+
+- :meth:`PlaidStandIn.add_item` generates an item with accounts, transactions
+  (Plaid sign convention: positive amounts are outflows) and optionally an
+  investment account with holdings and trades.
+- ``transactions_sync`` follows Plaid's cursor semantics: an empty cursor
+  replays the item's history, every page returns an opaque ``next_cursor``,
+  ``count`` bounds the page size, and changes made later with
+  :meth:`PlaidStandIn.simulate_updates` surface on the next call.
+- ``latency``/``jitter`` seconds are slept per call. ``error_rate`` and
+  :meth:`PlaidStandIn.inject_error` raise :class:`plaid.exceptions.ApiException`
+  with a Plaid-shaped JSON body, so the app's retry and error paths run.
+
+Responses are :class:`StandInModel` dicts that also allow attribute access and
+``to_dict()``, matching how callers read SDK models. :func:`use_plaid_standin`
+swaps a stand-in into the modules that import ``plaid_client`` by name, and
+:func:`link_standin_item` persists an item the way the Link exchange route does.
+"""
+
+from __future__ import annotations
+
+import base64
+import importlib
+import json
+import math
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from plaid.exceptions import ApiException
+
+from app.services.synthetic_data import ACCOUNT_TEMPLATES, INCOME, MERCHANTS
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+TRANSIENT_ERROR_CODES = ("RATE_LIMIT_EXCEEDED", "INSTITUTION_DOWN", "PRODUCT_NOT_READY")
+OPERATIONS = (
+    "accounts_get",
+    "transactions_sync",
+    "transactions_get",
+    "investments_holdings_get",
+    "investments_transactions_get",
+)
+# Modules that bind ``plaid_client`` at import time on the refresh and sync paths.
+PLAID_CLIENT_MODULES = (
+    "app.config",
+    "app.config.plaid_config",
+    "app.helpers.plaid_helpers",
+    "app.services.plaid_sync",
+)
+
+# error_code -> (HTTP status, error_type)
+ERROR_TYPES = {
+    "RATE_LIMIT_EXCEEDED": (429, "RATE_LIMIT_EXCEEDED"),
+    "INSTITUTION_DOWN": (400, "INSTITUTION_ERROR"),
+    "PRODUCT_NOT_READY": (400, "ITEM_ERROR"),
+    "ITEM_LOGIN_REQUIRED": (400, "ITEM_ERROR"),
+    "INVALID_ACCESS_TOKEN": (400, "INVALID_INPUT"),
+    "INVALID_FIELD": (400, "INVALID_REQUEST"),
+    "INTERNAL_SERVER_ERROR": (500, "API_ERROR"),
+}
+
+# ticker, name, type, price
+SECURITIES = (
+    ("VTI", "Vanguard Total Stock Market ETF", "etf", 245.0),
+    ("BND", "Vanguard Total Bond Market ETF", "etf", 72.5),
+    ("AAPL", "Apple Inc.", "equity", 190.0),
+    ("CUR:USD", "U S Dollar", "cash", 1.0),
+)
+
+
+class StandInModel(dict):
+    """Response dict that also reads like a Plaid SDK model."""
+
+    def __getattr__(self, name):
+        try:
+            return _wrap(self[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def to_dict(self) -> dict:
+        return dict(self)
+
+
+def _wrap(value):
+    if isinstance(value, dict) and not isinstance(value, StandInModel):
+        return StandInModel(value)
+    if isinstance(value, list):
+        return [_wrap(entry) for entry in value]
+    return value
+
+
+def _field(request, name: str, default=None):
+    """Read ``name`` from an SDK request model or a plain dict."""
+
+    if request is None:
+        return default
+    if isinstance(request, dict):
+        return request.get(name, default)
+    return getattr(request, name, default)
+
+
+def _copy(row: dict) -> dict:
+    return {key: type(value)(value) if isinstance(value, (dict, list)) else value for key, value in row.items()}
+
+
+def plaid_error(code: str, message: str | None = None) -> ApiException:
+    """Return an ``ApiException`` shaped like a Plaid error response."""
+
+    status, error_type = ERROR_TYPES.get(code, (400, "API_ERROR"))
+    error = ApiException(status=status, reason=code)
+    error.body = json.dumps(
+        {
+            "error_type": error_type,
+            "error_code": code,
+            "error_message": message or f"offline stand-in raised {code}",
+            "display_message": None,
+            "request_id": f"standin-{code.lower()}",
+        }
+    )
+    return error
+
+
+@dataclass
+class StandInItem:
+    """One generated Plaid item and its change log."""
+
+    index: int
+    item_id: str
+    access_token: str
+    accounts: list[dict]
+    transactions: dict[str, dict] = field(default_factory=dict)
+    changes: list[tuple[str, str, str]] = field(default_factory=list)
+    holdings: list[dict] = field(default_factory=list)
+    investment_transactions: list[dict] = field(default_factory=list)
+    serial: int = 0
+
+    def account_ids(self, types: tuple[str, ...] = ("depository", "credit")) -> list[str]:
+        return [acct["account_id"] for acct in self.accounts if acct["type"] in types]
+
+
+class PlaidStandIn:
+    """In-memory Plaid client serving generated items with configurable faults.
+
+    Args:
+        seed: Seeds dataset generation; faults and jitter use a separate stream
+            so changing ``error_rate`` never changes the data.
+        page_size: ``transactions_sync`` page size when the request has no ``count``.
+        latency: Seconds slept before every call.
+        jitter: Extra uniform random seconds added to ``latency``.
+        error_rate: Probability that a call raises one of ``transient_codes``.
+        end_date: Last transaction date (default today).
+        sleep: Replaces :func:`time.sleep`, e.g. to record latency in tests.
+    """
+
+    institution_name = "Offline Stand-in Bank"
+
+    def __init__(
+        self,
+        *,
+        seed: int = 42,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        transient_codes: tuple[str, ...] = TRANSIENT_ERROR_CODES,
+        end_date: date | None = None,
+        sleep=time.sleep,
+    ) -> None:
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        self.seed = seed
+        self.page_size = page_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.transient_codes = transient_codes
+        self.end_date = end_date or date.today()
+        self.sleep = sleep
+        self.items: dict[str, StandInItem] = {}
+        self.calls: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.rows: Counter = Counter()
+        self.busy_seconds = 0.0
+        self._tokens: dict[str, StandInItem] = {}
+        self._injected: dict[str, list[str]] = {}
+        self._faults = random.Random(seed + 1)
+
+    # ------------------------------------------------------------------
+    # Dataset
+    # ------------------------------------------------------------------
+    def add_item(
+        self, *, accounts: int = 3, transactions: int = 1000, days: int = 365, investments: bool = False
+    ) -> StandInItem:
+        """Generate an item with ``accounts`` cash/credit accounts and ``transactions`` rows."""
+
+        if accounts < 1 or transactions < 0 or days < 1:
+            raise ValueError("accounts and days must be at least 1 and transactions non-negative")
+        index = len(self.items) + 1
+        rng = random.Random(self.seed * 1000 + index)
+        item = StandInItem(
+            index=index,
+            item_id=f"standin-item-{index:03d}",
+            access_token=f"access-offline-{index:03d}",
+            accounts=[],
+        )
+        for number in range(1, accounts + 1):
+            _, name, acc_type, subtype, balance = ACCOUNT_TEMPLATES[(number - 1) % len(ACCOUNT_TEMPLATES)]
+            current = float(balance) if acc_type == "depository" else round(rng.uniform(350, 2500), 2)
+            item.accounts.append(
+                {
+                    "account_id": f"standin-acc-{index:03d}-{number:02d}",
+                    "name": name,
+                    "official_name": f"{self.institution_name} {name}",
+                    "mask": f"{1000 + index * 37 + number:04d}"[-4:],
+                    "type": acc_type,
+                    "subtype": subtype,
+                    "balances": {
+                        "available": current if acc_type == "depository" else None,
+                        "current": current,
+                        "limit": 5000.0 if acc_type == "credit" else None,
+                        "iso_currency_code": "USD",
+                    },
+                }
+            )
+        if investments:
+            self._add_investments(item, rng, days)
+
+        first = self.end_date - timedelta(days=days - 1)
+        checking = item.account_ids(("depository",))[:1]
+        paydays = [first + timedelta(days=offset) for offset in range(4, days, 14)] if checking else []
+        rows = [self._new_transaction(item, checking[0], payday, rng, income=True) for payday in paydays]
+        cash_accounts = item.account_ids()
+        for _ in range(max(transactions - len(rows), 0)):
+            when = first + timedelta(days=rng.randrange(days))
+            rows.append(self._new_transaction(item, rng.choice(cash_accounts), when, rng))
+        for row in sorted(rows[:transactions], key=lambda row: (row["date"], row["transaction_id"])):
+            item.transactions[row["transaction_id"]] = row
+            item.changes.append(("added", row["transaction_id"], row["account_id"]))
+
+        self.items[item.item_id] = item
+        self._tokens[item.access_token] = item
+        return item
+
+    def _new_transaction(self, item: StandInItem, account_id: str, when: date, rng, income: bool = False) -> dict:
+        item.serial += 1
+        if income:
+            name, category, amount, channel = "ACME CORP PAYROLL", INCOME, -round(rng.uniform(2100, 2300), 2), "other"
+        else:
+            merchant = rng.choices(MERCHANTS, weights=[m.weight for m in MERCHANTS])[0]
+            name, category = merchant.name, merchant.category
+            amount = round(merchant.median * math.exp(rng.gauss(0, merchant.spread)), 2)
+            channel = "online" if name in {"Amazon", "Delta Air Lines", "Marriott"} else "in store"
+        primary, detailed = category.pfc_primary, category.pfc_detailed
+        return {
+            "transaction_id": f"standin-{item.index:03d}-{item.serial:07d}",
+            "account_id": account_id,
+            "amount": amount,
+            "iso_currency_code": "USD",
+            "date": when,
+            "authorized_date": when,
+            "name": f"{name.upper()} #{rng.randrange(100, 999)}",
+            "merchant_name": None if income else name,
+            "pending": (self.end_date - when).days < 2 and rng.random() < 0.5,
+            "payment_channel": channel,
+            "category": [primary.replace("_", " ").title(), detailed[len(primary) + 1 :].replace("_", " ").title()],
+            "personal_finance_category": {"primary": primary, "detailed": detailed, "confidence_level": "HIGH"},
+            "payment_meta": {"payment_method": None},
+            "location": {},
+            "transaction_type": "special" if income else "place",
+        }
+
+    def _add_investments(self, item: StandInItem, rng, days: int) -> None:
+        account_id = f"standin-acc-{item.index:03d}-{len(item.accounts) + 1:02d}"
+        for ticker, _, _, price in SECURITIES:
+            quantity = round(rng.uniform(5, 120), 4) if price > 1 else round(rng.uniform(100, 2000), 2)
+            item.holdings.append(
+                {
+                    "account_id": account_id,
+                    "security_id": f"standin-sec-{ticker.lower()}",
+                    "quantity": quantity,
+                    "institution_price": price,
+                    "institution_value": round(quantity * price, 2),
+                    "cost_basis": round(quantity * price * rng.uniform(0.7, 1.1), 2),
+                    "iso_currency_code": "USD",
+                }
+            )
+        item.accounts.append(
+            {
+                "account_id": account_id,
+                "name": "Brokerage",
+                "official_name": f"{self.institution_name} Brokerage",
+                "mask": f"{9000 + item.index:04d}"[-4:],
+                "type": "investment",
+                "subtype": "brokerage",
+                "balances": {
+                    "available": None,
+                    "current": round(sum(holding["institution_value"] for holding in item.holdings), 2),
+                    "limit": None,
+                    "iso_currency_code": "USD",
+                },
+            }
+        )
+        first = self.end_date - timedelta(days=days - 1)
+        for number, offset in enumerate(range(0, days, 30), start=1):
+            ticker, name, _, price = SECURITIES[number % 3]
+            quantity = round(rng.uniform(0.5, 4), 4)
+            item.investment_transactions.append(
+                {
+                    "investment_transaction_id": f"standin-inv-{item.index:03d}-{number:05d}",
+                    "account_id": account_id,
+                    "security_id": f"standin-sec-{ticker.lower()}",
+                    "date": first + timedelta(days=offset),
+                    "name": f"BUY {name}",
+                    "quantity": quantity,
+                    "price": price,
+                    "amount": round(quantity * price, 2),
+                    "fees": 0.0,
+                    "type": "buy",
+                    "subtype": "buy",
+                    "iso_currency_code": "USD",
+                }
+            )
+
+    def simulate_updates(self, item_id: str, *, added: int = 0, modified: int = 0, removed: int = 0) -> dict:
+        """Record new activity for ``item_id``; the next sync returns exactly these changes.
+
+        New rows land on the last two days, modified rows get a new amount and
+        settle, removed rows disappear from ``transactions_get`` too.
+        """
+
+        item = self.items[item_id]
+        rng = random.Random(f"{self.seed}-{item_id}-{len(item.changes)}")
+        cash_accounts = item.account_ids()
+        for _ in range(added):
+            when = self.end_date - timedelta(days=rng.randrange(2))
+            row = self._new_transaction(item, rng.choice(cash_accounts), when, rng)
+            item.transactions[row["transaction_id"]] = row
+            item.changes.append(("added", row["transaction_id"], row["account_id"]))
+        existing = sorted(item.transactions)
+        picked = rng.sample(existing, min(modified + removed, len(existing)))
+        for transaction_id in picked[:modified]:
+            row = item.transactions[transaction_id]
+            row["amount"] = round(row["amount"] * rng.uniform(0.9, 1.1), 2)
+            row["pending"] = False
+            item.changes.append(("modified", transaction_id, row["account_id"]))
+        for transaction_id in picked[modified:]:
+            row = item.transactions.pop(transaction_id)
+            item.changes.append(("removed", transaction_id, row["account_id"]))
+        return {"added": added, "modified": len(picked[:modified]), "removed": len(picked[modified:])}
+
+    def webhook_payload(self, item_id: str, code: str = "SYNC_UPDATES_AVAILABLE") -> dict:
+        """Return the TRANSACTIONS webhook body Plaid would POST for ``item_id``."""
+
+        return {
+            "webhook_type": "TRANSACTIONS",
+            "webhook_code": code,
+            "item_id": item_id,
+            "initial_update_complete": True,
+            "historical_update_complete": True,
+            "environment": "sandbox",
+        }
+
+    # ------------------------------------------------------------------
+    # Faults
+    # ------------------------------------------------------------------
+    def inject_error(self, operation: str, code: str = "RATE_LIMIT_EXCEEDED", times: int = 1) -> None:
+        """Make the next ``times`` calls to ``operation`` raise ``code``."""
+
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation {operation!r}")
+        self._injected.setdefault(operation, []).extend([code] * times)
+
+    def _call(self, operation: str, request) -> StandInItem:
+        self.calls[operation] += 1
+        delay = self.latency + (self._faults.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            self.sleep(delay)
+        queued = self._injected.get(operation)
+        code = queued.pop(0) if queued else None
+        if code is None and self.error_rate and self._faults.random() < self.error_rate:
+            code = self._faults.choice(self.transient_codes)
+        if code:
+            self.errors[code] += 1
+            raise plaid_error(code)
+        item = self._tokens.get(_field(request, "access_token"))
+        if item is None:
+            self.errors["INVALID_ACCESS_TOKEN"] += 1
+            raise plaid_error("INVALID_ACCESS_TOKEN", "the provided access token is not known to the stand-in")
+        return item
+
+    @contextmanager
+    def _timed(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.busy_seconds += time.perf_counter() - started
+
+    # ------------------------------------------------------------------
+    # Plaid API surface
+    # ------------------------------------------------------------------
+    def accounts_get(self, request) -> StandInModel:
+        with self._timed():
+            item = self._call("accounts_get", request)
+            return _wrap(self._envelope(item, accounts=[_copy(acct) for acct in item.accounts]))
+
+    def transactions_sync(self, request) -> StandInModel:
+        with self._timed():
+            item = self._call("transactions_sync", request)
+            position = self._decode_cursor(item, _field(request, "cursor"))
+            count = min(_field(request, "count") or self.page_size, MAX_PAGE_SIZE)
+            end = min(position + count, len(item.changes))
+            page = {"added": [], "modified": [], "removed": []}
+            for kind, transaction_id, account_id in item.changes[position:end]:
+                if kind == "removed":
+                    page["removed"].append({"transaction_id": transaction_id, "account_id": account_id})
+                elif transaction_id in item.transactions:
+                    page[kind].append(_copy(item.transactions[transaction_id]))
+            self.rows["transactions_sync"] += end - position
+            return _wrap(
+                self._envelope(
+                    item,
+                    accounts=[_copy(acct) for acct in item.accounts],
+                    next_cursor=self._encode_cursor(item, end),
+                    has_more=end < len(item.changes),
+                    transactions_update_status="HISTORICAL_UPDATE_COMPLETE",
+                    **page,
+                )
+            )
+
+    def transactions_get(self, request) -> StandInModel:
+        with self._timed():
+            item = self._call("transactions_get", request)
+            options = _field(request, "options")
+            count = min(_field(options, "count") or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+            offset = _field(options, "offset") or 0
+            account_ids = set(_field(options, "account_ids") or ())
+            start, end = _field(request, "start_date"), _field(request, "end_date")
+            rows = sorted(
+                (
+                    row
+                    for row in item.transactions.values()
+                    if start <= row["date"] <= end and (not account_ids or row["account_id"] in account_ids)
+                ),
+                key=lambda row: (row["date"], row["transaction_id"]),
+                reverse=True,
+            )
+            page = rows[offset : offset + count]
+            self.rows["transactions_get"] += len(page)
+            return _wrap(
+                self._envelope(
+                    item,
+                    accounts=[_copy(acct) for acct in item.accounts],
+                    transactions=[_copy(row) for row in page],
+                    total_transactions=len(rows),
+                )
+            )
+
+    def investments_holdings_get(self, request) -> StandInModel:
+        with self._timed():
+            item = self._call("investments_holdings_get", request)
+            self.rows["investments_holdings_get"] += len(item.holdings)
+            return _wrap(
+                self._envelope(
+                    item,
+                    accounts=[_copy(acct) for acct in item.accounts if acct["type"] == "investment"],
+                    holdings=[_copy(holding) for holding in item.holdings],
+                    securities=self._securities(item),
+                )
+            )
+
+    def investments_transactions_get(self, request) -> StandInModel:
+        with self._timed():
+            item = self._call("investments_transactions_get", request)
+            options = _field(request, "options")
+            count = min(_field(options, "count") or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+            offset = _field(options, "offset") or 0
+            start, end = _field(request, "start_date"), _field(request, "end_date")
+            rows = [row for row in reversed(item.investment_transactions) if start <= row["date"] <= end]
+            page = rows[offset : offset + count]
+            self.rows["investments_transactions_get"] += len(page)
+            return _wrap(
+                self._envelope(
+                    item,
+                    accounts=[_copy(acct) for acct in item.accounts if acct["type"] == "investment"],
+                    investment_transactions=[_copy(row) for row in page],
+                    total_investment_transactions=len(rows),
+                    securities=self._securities(item),
+                )
+            )
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _envelope(self, item: StandInItem, **payload) -> dict:
+        request_id = f"standin-{sum(self.calls.values()):08d}"
+        return {**payload, "item": {"item_id": item.item_id, "institution_id": "ins_standin"}, "request_id": request_id}
+
+    def _securities(self, item: StandInItem) -> list[dict]:
+        if not item.holdings:
+            return []
+        return [
+            {
+                "security_id": f"standin-sec-{ticker.lower()}",
+                "ticker_symbol": ticker,
+                "name": name,
+                "type": kind,
+                "close_price": price,
+                "iso_currency_code": "USD",
+            }
+            for ticker, name, kind, price in SECURITIES
+        ]
+
+    @staticmethod
+    def _encode_cursor(item: StandInItem, position: int) -> str:
+        return base64.urlsafe_b64encode(f"{item.item_id}:{position}".encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(item: StandInItem, cursor: str | None) -> int:
+        if not cursor:
+            return 0
+        try:
+            item_id, position = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit(":", 1)
+            position = int(position)
+        except ValueError:
+            item_id, position = None, -1
+        if item_id != item.item_id or not 0 <= position <= len(item.changes):
+            raise plaid_error("INVALID_FIELD", "cursor does not belong to this item")
+        return position
+
+
+@contextmanager
+def use_plaid_standin(client):
+    """Install ``client`` as ``plaid_client`` on the refresh and sync paths for the block."""
+
+    saved = []
+    for name in PLAID_CLIENT_MODULES:
+        module = importlib.import_module(name)
+        saved.append((module, module.plaid_client))
+        module.plaid_client = client
+    try:
+        yield client
+    finally:
+        for module, original in saved:
+            module.plaid_client = original
+
+
+def link_standin_item(client: PlaidStandIn, item: StandInItem, user_id: str, products=("transactions",)) -> list[str]:
+    """Persist ``item`` like the Link token exchange does; return its account ids."""
+
+    from app.extensions import db
+    from app.models import PlaidItem
+    from app.sql import account_logic
+
+    products = list(products)
+    accounts = [dict(_copy(acct), institution_name=client.institution_name) for acct in item.accounts]
+    db.session.add(
+        PlaidItem(
+            user_id=user_id,
+            item_id=item.item_id,
+            access_token=item.access_token,
+            institution_name=client.institution_name,
+            product=account_logic.serialize_plaid_products(products),
+            is_active=True,
+        )
+    )
+    account_logic.upsert_accounts(
+        user_id, accounts, provider="plaid", access_token=item.access_token, enabled_products=products
+    )
+    for acct in accounts:
+        account_logic.save_plaid_account(acct["account_id"], item.item_id, item.access_token, products)
+    return [acct["account_id"] for acct in accounts]
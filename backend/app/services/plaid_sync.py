@@ -19,12 +19,26 @@ from app.sql.account_logic import detect_internal_transfer, get_or_create_catego
 from app.sql.refresh_metadata import refresh_or_insert_plaid_metadata
 from app.sql.sequence_utils import ensure_transactions_sequence
 from app.utils.merchant_normalization import resolve_merchant
+from app.utils.metrics import observe_plaid_call, record_plaid_retry, record_transactions_ingested
+from app.utils.tracing import current_span, span, stage, traced
 
-try:
-    # Plaid SDK v13+ style imports
-    from plaid.model.transactions_sync_request import TransactionsSyncRequest
-except Exception:  # pragma: no cover - allow older SDKs
-    TransactionsSyncRequest = None  # type: ignore
+# Resolved on first sync by ``_sync_request_class`` so importing this module
+# does not load the Plaid SDK.
+TransactionsSyncRequest = None
+
+
+def _sync_request_class():
+    """Return the SDK ``TransactionsSyncRequest`` model, importing it on first use."""
+
+    global TransactionsSyncRequest
+    if TransactionsSyncRequest is None:
+        try:
+            # Plaid SDK v13+ style imports
+            from plaid.model.transactions_sync_request import TransactionsSyncRequest as request_class
+        except Exception:  # pragma: no cover - allow older SDKs
+            return None
+        TransactionsSyncRequest = request_class
+    return TransactionsSyncRequest
 
 
 TRANSIENT_PLAID_ERROR_CODES = {
@@ -159,7 +173,8 @@ def _transactions_sync_with_retry(
 
     for attempt in range(1, max_attempts + 1):
         try:
-            return plaid_client.transactions_sync(req)
+            with observe_plaid_call("transactions_sync"):
+                return plaid_client.transactions_sync(req)
         except Exception as error:
             error_code = _extract_plaid_error_code(error)
             is_transient = error_code in TRANSIENT_PLAID_ERROR_CODES
@@ -187,6 +202,9 @@ def _transactions_sync_with_retry(
             if attempt == max_attempts:
                 raise
 
+            record_plaid_retry("transactions_sync")
+            current_span().set_attribute("plaid.retries", attempt)
+            current_span().add_event("retry", {"attempt": attempt, "error_code": error_code})
             time.sleep(initial_backoff_seconds * (2 ** (attempt - 1)))
 
 
@@ -209,13 +227,15 @@ def _parse_txn_date(val) -> date:
         return datetime.now(timezone.utc).date()
 
 
-def _upsert_transaction(tx: dict, account: Account, plaid_acct: Optional[PlaidAccount]) -> None:
+def _upsert_transaction(tx: dict, account: Account, plaid_acct: Optional[PlaidAccount]) -> Optional[Transaction]:
+    """Insert or update one Plaid transaction and return the row when newly inserted."""
     txn_id = tx.get("transaction_id")
     if not txn_id:
-        return
+        return None
 
     # Apply rules prior to persistence
-    tx = transaction_rules_logic.apply_rules(account.user_id, dict(tx))
+    with stage("rules"):
+        tx = transaction_rules_logic.apply_rules(account.user_id, dict(tx))
 
     # Map Plaid categories to local Category
     pfc = tx.get("personal_finance_category") or {}
@@ -227,16 +247,18 @@ def _upsert_transaction(tx: dict, account: Account, plaid_acct: Optional[PlaidAc
     primary = legacy_path[0] if len(legacy_path) > 0 else "Unknown"
     detailed = legacy_path[1] if len(legacy_path) > 1 else "Unknown"
 
-    category: Category = get_or_create_category(primary, detailed, pfc_primary, pfc_detailed, pfc_icon)
+    with stage("category"):
+        category: Category = get_or_create_category(primary, detailed, pfc_primary, pfc_detailed, pfc_icon)
 
     # Normalize core fields
-    txn_date = _parse_txn_date(tx.get("date"))
-    description = tx.get("name") or tx.get("description") or "[no description]"
-    merchant = resolve_merchant(
-        merchant_name=tx.get("merchant_name"),
-        name=tx.get("name"),
-        description=tx.get("description"),
-    )
+    with stage("normalize"):
+        txn_date = _parse_txn_date(tx.get("date"))
+        description = tx.get("name") or tx.get("description") or "[no description]"
+        merchant = resolve_merchant(
+            merchant_name=tx.get("merchant_name"),
+            name=tx.get("name"),
+            description=tx.get("description"),
+        )
     merchant_name = merchant.display_name
     tx["merchant_slug"] = merchant.merchant_slug
     merchant_type = (tx.get("payment_meta", {}) or {}).get("payment_method") or "Unknown"
@@ -244,7 +266,8 @@ def _upsert_transaction(tx: dict, account: Account, plaid_acct: Optional[PlaidAc
 
     _update_account_apr_from_interest_charge(account, tx)
 
-    existing = Transaction.query.filter_by(transaction_id=txn_id).first()
+    with stage("upsert"):
+        existing = Transaction.query.filter_by(transaction_id=txn_id).first()
     if existing:
         changed = (
             existing.amount != tx.get("amount")
@@ -273,8 +296,10 @@ def _upsert_transaction(tx: dict, account: Account, plaid_acct: Optional[PlaidAc
             existing.personal_finance_category_icon_url = pfc_icon
         # Always refresh Plaid metadata (keeps aux fields current)
         if plaid_acct:
-            refresh_or_insert_plaid_metadata(tx, existing, plaid_acct.account_id)
-        detect_internal_transfer(existing)
+            with stage("metadata"):
+                refresh_or_insert_plaid_metadata(tx, existing, plaid_acct.account_id)
+        with stage("transfer_detection"):
+            detect_internal_transfer(existing)
     else:
         new_txn = Transaction(
             transaction_id=txn_id,
@@ -297,8 +322,12 @@ def _upsert_transaction(tx: dict, account: Account, plaid_acct: Optional[PlaidAc
         )
         db.session.add(new_txn)
         if plaid_acct:
-            refresh_or_insert_plaid_metadata(tx, new_txn, plaid_acct.account_id)
-        detect_internal_transfer(new_txn)
+            with stage("metadata"):
+                refresh_or_insert_plaid_metadata(tx, new_txn, plaid_acct.account_id)
+        with stage("transfer_detection"):
+            detect_internal_transfer(new_txn)
+        return new_txn
+    return None
 
 
 def _apply_removed(removed: List[dict]) -> int:
@@ -312,6 +341,7 @@ def _apply_removed(removed: List[dict]) -> int:
     return int(deleted or 0)
 
 
+@traced("plaid.sync_account", stages=True)
 def sync_account_transactions(account_id: str) -> Dict:
     """Run Plaid transactions/sync for a single account.
 
@@ -320,7 +350,8 @@ def sync_account_transactions(account_id: str) -> Dict:
     - Applies added/modified/removed atomically
     - Persists one item-scoped cursor update after all pages apply successfully
     """
-    if TransactionsSyncRequest is None:
+    request_class = _sync_request_class()
+    if request_class is None:
         raise RuntimeError("Plaid SDK missing TransactionsSyncRequest; upgrade SDK")
 
     account = Account.query.filter_by(account_id=account_id).first()
@@ -353,38 +384,63 @@ def sync_account_transactions(account_id: str) -> Dict:
     total_modified = 0
     total_removed = 0
     next_cursor = cursor
+    started = time.perf_counter()
+    pages = 0
+    current_span().set_attributes({"account.id": account_id, "plaid.item_id": item_id, "user.id": account.user_id})
     ensure_transactions_sequence()
 
     while True:
         req_kwargs = {"access_token": access_token}
         if next_cursor:
             req_kwargs["cursor"] = next_cursor
-        req = TransactionsSyncRequest(**req_kwargs)
-        resp = _transactions_sync_with_retry(req, account_id=account_id, item_id=item_id)
-        data = resp.to_dict() if hasattr(resp, "to_dict") else dict(resp)
-
-        added = data.get("added", [])
-        modified = data.get("modified", [])
-        removed = data.get("removed", [])
+        req = request_class(**req_kwargs)
+        pages += 1
+        with span("plaid.transactions_sync", **{"plaid.page": pages, "plaid.item_id": item_id}) as page_span:
+            resp = _transactions_sync_with_retry(req, account_id=account_id, item_id=item_id)
+            data = resp.to_dict() if hasattr(resp, "to_dict") else dict(resp)
+
+            added = data.get("added", [])
+            modified = data.get("modified", [])
+            removed = data.get("removed", [])
+            page_span.set_attributes(
+                {"rows.added": len(added), "rows.modified": len(modified), "rows.removed": len(removed)}
+            )
         next_cursor = data.get("next_cursor") or next_cursor
         has_more = bool(data.get("has_more"))
 
         # Atomic batch apply
         try:
+            inserted = []
             for tx in added:
-                _upsert_transaction(
+                new_txn = _upsert_transaction(
                     tx,
                     account_map.get(tx.get("account_id")) or account,
                     plaid_map.get(tx.get("account_id")),
                 )
+                if new_txn is not None:
+                    inserted.append(new_txn)
             for tx in modified:
-                _upsert_transaction(
+                new_txn = _upsert_transaction(
                     tx,
                     account_map.get(tx.get("account_id")) or account,
                     plaid_map.get(tx.get("account_id")),
                 )
-            total_removed += _apply_removed(removed)
-            db.session.commit()
+                if new_txn is not None:
+                    inserted.append(new_txn)
+            with stage("upsert"):
+                total_removed += _apply_removed(removed)
+            if inserted:
+                from app.sql.recurring_logic import record_recurring_observations
+                from app.sql.transactions_logic import record_merchant_usage
+
+                record_recurring_observations(inserted)
+                record_merchant_usage(inserted)
+            if added or modified:
+                from app.sql.search_logic import refresh_search_documents_by_id
+
+                refresh_search_documents_by_id(tx.get("transaction_id") for tx in [*added, *modified])
+            with stage("commit"):
+                db.session.commit()
         except Exception as e:
             db.session.rollback()
             logger.error("[SYNC] Failed applying batch for %s: %s", account_id, e)
@@ -402,7 +458,21 @@ def sync_account_transactions(account_id: str) -> Dict:
         pa.sync_cursor = next_cursor
         # Use naive timestamp to match DB
         pa.last_refreshed = datetime.now()
-    db.session.commit()
+    with stage("commit"):
+        db.session.commit()
+    if total_added or total_modified or total_removed:
+        from app.sql.data_version import bump_data_version
+
+        bump_data_version(account.user_id)
+    current_span().set_attributes(
+        {
+            "plaid.pages": pages,
+            "rows.added": total_added,
+            "rows.modified": total_modified,
+            "rows.removed": total_removed,
+        }
+    )
+    record_transactions_ingested("sync", total_added + total_modified, time.perf_counter() - started)
 
     logger.info(
         "[SYNC] account=%s added=%d modified=%d removed=%d",
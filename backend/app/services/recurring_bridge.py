@@ -5,11 +5,9 @@ transactions with database persistence utilities. Imports are deferred
 until synchronization to avoid loading heavy dependencies at import time.
 """
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from importlib import import_module
 
-from dateutil.parser import parse
-
 from app.services.recurring_detection import RecurringDetector
 from app.sql import recurring_logic
 
@@ -17,21 +15,37 @@ from app.sql import recurring_logic
 class RecurringBridge:
     """Bridge recurring detection results to database persistence."""
 
-    def __init__(self, transactions):
-        """Initialize with raw transaction dictionaries."""
+    def __init__(self, transactions, candidates=None):
+        """Initialize with raw transaction dictionaries.
+
+        Args:
+            transactions: Transaction dicts to run detection over.
+            candidates: Optional precomputed candidates (for example from
+                ``recurring_logic.recurring_candidates``); skips detection.
+        """
         self.transactions = transactions
+        self.candidates = candidates
         self.detector = RecurringDetector(transactions)
 
+    def _account_index(self):
+        """Map ``(amount, description signature)`` to the first account seen, in one pass."""
+        index = {}
+        for tx in self.transactions:
+            key = (round(tx["amount"], 2), recurring_logic.description_signature(tx["description"]))
+            index.setdefault(key, tx.get("account_id"))
+        return index
+
     def sync_to_db(self):
-        """Detect recurring patterns and upsert them into the database."""
+        """Detect recurring patterns and upsert them into the database in one commit."""
         # Import DB session and models only when syncing to avoid heavy
         # dependencies during module import. This also ensures models are
         # registered with the SQLAlchemy instance used by tests.
-        _ = import_module("app.extensions")
+        extensions = import_module("app.extensions")
         _ = import_module("app.models")
 
-        candidates = self.detector.detect()
+        candidates = self.candidates if self.candidates is not None else self.detector.detect()
         actions = []
+        account_index = None
 
         freq_map = {
             "daily": 1,
@@ -42,14 +56,12 @@ class RecurringBridge:
 
         for item in candidates:
             if not item.get("account_id"):
-                for tx in self.transactions:
-                    desc_sig = "".join(filter(str.isalnum, tx["description"].lower()))[:16]
-                    if round(tx["amount"], 2) == item["amount"] and desc_sig == item["description"]:
-                        item["account_id"] = tx.get("account_id")
-                        break
+                if account_index is None:
+                    account_index = self._account_index()
+                item["account_id"] = account_index.get((item["amount"], item["description"]))
 
-            last_seen = parse(item.get("last_seen")).date()
-            freq_days = freq_map.get(item["frequency"].lower(), 30)
+            last_seen = datetime.fromisoformat(str(item.get("last_seen"))).date()
+            freq_days = item.get("gap_days") or freq_map.get(item["frequency"].lower(), 30)
             next_due_date = last_seen + timedelta(days=freq_days)
             confidence = float(item.get("occurrences", 1)) / 10.0
 
@@ -60,7 +72,11 @@ class RecurringBridge:
                 next_due_date,
                 confidence,
                 item.get("account_id"),
+                transaction_id=item.get("transaction_id"),
+                commit=False,
             )
             actions.append(rec_id)
 
+        if actions:
+            extensions.db.session.commit()
         return actions
@@ -1,9 +1,20 @@
 from collections import Counter, defaultdict
+from datetime import datetime
+from functools import lru_cache
 from statistics import StatisticsError, mode
 
 from dateutil.parser import parse
 
 
+@lru_cache(maxsize=4096)
+def _parse_date(value):
+    """Parse a transaction date, using the ISO fast path before ``dateutil``."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse(value)
+
+
 class RecurringDetector:
     """
     Detect recurring transactions based on amount and timing patterns.
@@ -12,22 +23,29 @@ class RecurringDetector:
     def __init__(self, transactions):
         """
         Args:
-            transactions (List[dict]): Each dict must include 'amount', 'date', 'description'.
+            transactions (List[dict]): Each dict must include 'amount', 'date', 'description',
+                and may include 'account_id'.
         """
         self.transactions = transactions
+        self._accounts = {}
 
     def _group_by_signature(self):
         """
         Group transactions by (amount, cleaned description signature).
+        Also records the first ``account_id`` seen per group in ``self._accounts``.
+
         Returns:
             dict: {(amount, description_signature): List[datetime]}
         """
         groups = defaultdict(list)
+        self._accounts = {}
         for tx in self.transactions:
             amt = round(tx["amount"], 2)
             desc = "".join(filter(str.isalnum, tx["description"].lower()))[:16]
             key = (amt, desc)
-            groups[key].append(parse(tx["date"]))
+            groups[key].append(_parse_date(tx["date"]))
+            if tx.get("account_id"):
+                self._accounts.setdefault(key, tx["account_id"])
         return groups
 
     def detect(self, min_occurrences=3):
@@ -63,14 +81,15 @@ class RecurringDetector:
                 30: "monthly",
             }.get(freq, f"~{freq}d")
 
-            results.append(
-                {
-                    "amount": amt,
-                    "description": desc,
-                    "frequency": frequency_str,
-                    "last_seen": max(dates).isoformat(),
-                    "occurrences": len(dates),
-                }
-            )
+            result = {
+                "amount": amt,
+                "description": desc,
+                "frequency": frequency_str,
+                "last_seen": max(dates).isoformat(),
+                "occurrences": len(dates),
+            }
+            if (amt, desc) in self._accounts:
+                result["account_id"] = self._accounts[(amt, desc)]
+            results.append(result)
 
         return results
@@ -0,0 +1,227 @@
+"""In-process typeahead index over a user's merchants, tags, and categories.
+
+Suggestions are served from memory: each user's index is loaded lazily from
+the ``merchant_usage`` dimension (maintained at ingest), tag usage, and the
+category table, then kept until the user's data version changes (checked at
+most every few seconds, see :func:`get_cached_data_version`). Lookups use
+a sorted key list for prefix matches and a trigram posting list for fuzzy
+substring matches, so latency depends on the number of distinct labels rather
+than on the size of the transactions table.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from heapq import nsmallest
+
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models import Account, Category, MerchantUsage, Tag, Transaction, transaction_tags
+from app.sql.data_version import get_cached_data_version
+
+SUGGEST_KINDS = ("merchant", "tag", "category")
+SUGGEST_INDEX_MAX_USERS = 64
+TRIGRAM_MIN_SIMILARITY = 0.3
+
+_PREFIX_TIER = 2
+_WORD_PREFIX_TIER = 1
+_FUZZY_TIER = 0
+
+
+@dataclass(frozen=True)
+class SuggestEntry:
+    """One completion candidate."""
+
+    kind: str
+    label: str
+    value: str
+    weight: int = 0
+
+
+def _fold(text: str | None) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _trigrams(folded: str) -> set[str]:
+    padded = f"  {folded} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SuggestIndex:
+    """Prefix and trigram index over :class:`SuggestEntry` labels."""
+
+    def __init__(self, entries: Iterable[SuggestEntry]):
+        self.entries = list(entries)
+        self._folded = [_fold(entry.label) for entry in self.entries]
+        keys: list[tuple[str, int]] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._gram_counts: list[int] = []
+        for idx, folded in enumerate(self._folded):
+            # Index the label from every word start so "coffee" finds "Joes Coffee".
+            keys.append((folded, idx))
+            keys.extend((folded[pos + 1 :], idx) for pos, char in enumerate(folded) if char == " ")
+            grams = _trigrams(folded)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(idx)
+        keys.sort()
+        self._keys = [key for key, _ in keys]
+        self._key_ids = [idx for _, idx in keys]
+        self._by_weight = sorted(range(len(self.entries)), key=self._popularity)
+        self._rank = [0] * len(self.entries)
+        for rank, idx in enumerate(self._by_weight):
+            self._rank[idx] = rank
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _popularity(self, idx: int) -> tuple:
+        entry = self.entries[idx]
+        return (-entry.weight, entry.label.lower())
+
+    def search(self, query: str, limit: int = 10, kinds: Iterable[str] | None = None) -> list[dict]:
+        """Return up to ``limit`` ranked completions for ``query``.
+
+        Full-label prefix matches rank above word-prefix matches, which rank
+        above fuzzy trigram matches; ties go to higher usage, then label.
+        """
+
+        allowed = set(kinds) if kinds else None
+        folded = _fold(query)
+        if not folded:
+            ranked = (idx for idx in self._by_weight if allowed is None or self.entries[idx].kind in allowed)
+            return [self._serialize(idx, 0.0) for idx, _ in zip(ranked, range(limit))]
+
+        best: dict[int, tuple[int, float]] = {}
+        start = bisect_left(self._keys, folded)
+        end = bisect_left(self._keys, folded + "\uffff", lo=start)
+        for idx in self._key_ids[start:end]:
+            if idx not in best or best[idx][0] < _PREFIX_TIER:
+                best[idx] = (_PREFIX_TIER if self._folded[idx].startswith(folded) else _WORD_PREFIX_TIER, 1.0)
+
+        if len(best) < limit and len(folded) >= 3:
+            grams = _trigrams(folded)
+            shared = Counter(idx for gram in grams for idx in self._postings.get(gram, ()))
+            for idx, overlap in shared.items():
+                if idx in best:
+                    continue
+                similarity = overlap / (len(grams) + self._gram_counts[idx] - overlap)
+                if similarity >= TRIGRAM_MIN_SIMILARITY:
+                    best[idx] = (_FUZZY_TIER, similarity)
+
+        candidates = (
+            (-tier, -similarity, self._rank[idx])
+            for idx, (tier, similarity) in best.items()
+            if allowed is None or self.entries[idx].kind in allowed
+        )
+        ranked = nsmallest(limit, candidates)
+        return [self._serialize(self._by_weight[rank], -similarity) for _, similarity, rank in ranked]
+
+    def _serialize(self, idx: int, similarity: float) -> dict:
+        entry = self.entries[idx]
+        return {
+            "kind": entry.kind,
+            "label": entry.label,
+            "value": entry.value,
+            "count": entry.weight,
+            "score": round(similarity, 3),
+        }
+
+
+def _merchant_entries(user_id: str) -> list[SuggestEntry]:
+    from app.sql.transactions_logic import rebuild_merchant_usage
+
+    def _rows():
+        return db.session.execute(
+            select(MerchantUsage.merchant_slug, MerchantUsage.display_name, MerchantUsage.usage_count).where(
+                MerchantUsage.user_id == user_id
+            )
+        ).all()
+
+    rows = _rows()
+    if not rows:
+        # Users ingested before the dimension existed are backfilled on first use.
+        rebuild_merchant_usage(user_id)
+        rows = _rows()
+    return [SuggestEntry("merchant", name or slug, slug, count or 0) for slug, name, count in rows]
+
+
+def _tag_entries(user_id: str) -> list[SuggestEntry]:
+    rows = db.session.execute(
+        select(Tag.name, func.count(transaction_tags.c.transaction_id))
+        .outerjoin(transaction_tags, transaction_tags.c.tag_id == Tag.id)
+        .where(Tag.user_id == user_id)
+        .group_by(Tag.id, Tag.name)
+    ).all()
+    return [SuggestEntry("tag", name, name, count) for name, count in rows if name]
+
+
+def _category_entries(user_id: str) -> list[SuggestEntry]:
+    usage = dict(
+        db.session.execute(
+            select(Transaction.category_id, func.count(Transaction.id))
+            .join(Account, Transaction.account_id == Account.account_id)
+            .where(Account.user_id == user_id)
+            .where(Transaction.category_id.is_not(None))
+            .group_by(Transaction.category_id)
+        ).all()
+    )
+    entries = []
+    primary_usage: Counter = Counter()
+    for category in Category.query.all():
+        primary = category.display_primary or "Unknown"
+        count = usage.get(category.id, 0)
+        primary_usage[primary] += count
+        detailed = category.display_detailed
+        if detailed:
+            entries.append(SuggestEntry("category", f"{primary} - {detailed}", str(category.id), count))
+    entries.extend(SuggestEntry("category", label, label, count) for label, count in primary_usage.items())
+    return entries
+
+
+def load_suggest_index(user_id: str) -> SuggestIndex:
+    """Build a user's suggestion index from the database."""
+
+    return SuggestIndex([*_merchant_entries(user_id), *_tag_entries(user_id), *_category_entries(user_id)])
+
+
+_INDEX_LOCK = threading.Lock()
+_INDEXES: OrderedDict[str, tuple[str, SuggestIndex]] = OrderedDict()
+
+
+def get_suggest_index(user_id: str) -> SuggestIndex:
+    """Return the cached index for ``user_id``, reloading it when the data version moved."""
+
+    key = str(user_id)
+    version = get_cached_data_version(key)
+    with _INDEX_LOCK:
+        cached = _INDEXES.get(key)
+        if cached is not None and cached[0] == version:
+            _INDEXES.move_to_end(key)
+            return cached[1]
+
+    index = load_suggest_index(key)
+    with _INDEX_LOCK:
+        _INDEXES[key] = (version, index)
+        _INDEXES.move_to_end(key)
+        while len(_INDEXES) > SUGGEST_INDEX_MAX_USERS:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def clear_suggest_indexes() -> None:
+    """Drop every cached index."""
+
+    with _INDEX_LOCK:
+        _INDEXES.clear()
+
+
+def suggest(user_id: str, query: str, limit: int = 10, kinds: Iterable[str] | None = None) -> list[dict]:
+    """Return ranked completions for ``query`` from the user's index."""
+
+    return get_suggest_index(user_id).search(query, limit=limit, kinds=kinds)
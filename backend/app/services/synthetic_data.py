@@ -0,0 +1,485 @@
+"""Deterministic synthetic dataset for load testing and benchmarks.
+
+:func:`generate_synthetic_dataset` creates ``users`` synthetic users, each with
+a checking account, a credit card, a savings account (plus extra cards or
+checking accounts when ``accounts_per_user`` asks for more), a tag set, and
+``months`` of transactions with realistic structure:
+
+- biweekly paychecks into checking;
+- rent, utilities, phone and internet bills on fixed days with small amount drift;
+- card subscriptions on fixed days;
+- paired internal transfers (monthly card payment and savings sweep), left
+  unflagged the way Plaid delivers them so the transfer scan has work to do;
+- discretionary spending with a weekend bump, a skewed merchant mix and
+  log-normal amounts, filling the rest of ``transactions``.
+
+Rows are written with Core ``INSERT`` batches rather than ORM objects, so
+millions of transactions load in minutes. The same ``seed`` always yields the
+same rows relative to ``end_date``. Synthetic users are named
+``synthetic-user-NNNN`` and can be removed with :func:`delete_synthetic_dataset`.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import delete, insert, select
+
+from app.config import logger
+from app.extensions import db
+from app.models import Account, AccountHistory, Institution, Tag, Transaction, transaction_tags
+from app.sql.account_logic import get_or_create_category
+from app.sql.data_version import bump_data_version
+from app.utils.merchant_normalization import resolve_merchant
+
+SYNTHETIC_USER_PREFIX = "synthetic-user-"
+SYNTHETIC_INSTITUTION = "Synthetic Bank"
+DEFAULT_BATCH_SIZE = 5000
+HISTORY_DAYS = 365
+TAG_NAMES = ("#bills", "#subscriptions", "#groceries", "#reimbursable", "#travel")
+CENTS = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class SyntheticCategory:
+    """Plaid personal-finance category pair used for generated rows."""
+
+    pfc_primary: str
+    pfc_detailed: str
+
+
+@dataclass(frozen=True)
+class SyntheticMerchant:
+    """Discretionary merchant with its category, popularity and amount profile."""
+
+    name: str
+    category: SyntheticCategory
+    weight: float
+    median: float
+    spread: float
+    tag: str | None = None
+
+
+INCOME = SyntheticCategory("INCOME", "INCOME_WAGES")
+RENT = SyntheticCategory("RENT_AND_UTILITIES", "RENT_AND_UTILITIES_RENT")
+ELECTRIC = SyntheticCategory("RENT_AND_UTILITIES", "RENT_AND_UTILITIES_GAS_AND_ELECTRICITY")
+INTERNET = SyntheticCategory("RENT_AND_UTILITIES", "RENT_AND_UTILITIES_INTERNET_AND_CABLE")
+PHONE = SyntheticCategory("RENT_AND_UTILITIES", "RENT_AND_UTILITIES_TELEPHONE")
+STREAMING = SyntheticCategory("ENTERTAINMENT", "ENTERTAINMENT_TV_AND_MOVIES")
+MUSIC = SyntheticCategory("ENTERTAINMENT", "ENTERTAINMENT_MUSIC_AND_AUDIO")
+GYM = SyntheticCategory("PERSONAL_CARE", "PERSONAL_CARE_GYMS_AND_FITNESS_CENTERS")
+CARD_PAYMENT = SyntheticCategory("LOAN_PAYMENTS", "LOAN_PAYMENTS_CREDIT_CARD_PAYMENT")
+TRANSFER_OUT = SyntheticCategory("TRANSFER_OUT", "TRANSFER_OUT_SAVINGS")
+TRANSFER_IN = SyntheticCategory("TRANSFER_IN", "TRANSFER_IN_ACCOUNT_TRANSFER")
+INTEREST = SyntheticCategory("INCOME", "INCOME_INTEREST_EARNED")
+
+MERCHANTS = (
+    SyntheticMerchant(
+        "Whole Foods", SyntheticCategory("FOOD_AND_DRINK", "FOOD_AND_DRINK_GROCERIES"), 9, 68, 0.6, "#groceries"
+    ),
+    SyntheticMerchant(
+        "Trader Joe's", SyntheticCategory("FOOD_AND_DRINK", "FOOD_AND_DRINK_GROCERIES"), 7, 52, 0.5, "#groceries"
+    ),
+    SyntheticMerchant("Starbucks", SyntheticCategory("FOOD_AND_DRINK", "FOOD_AND_DRINK_COFFEE"), 14, 6.5, 0.35),
+    SyntheticMerchant("Chipotle", SyntheticCategory("FOOD_AND_DRINK", "FOOD_AND_DRINK_FAST_FOOD"), 8, 14, 0.3),
+    SyntheticMerchant("Local Bistro", SyntheticCategory("FOOD_AND_DRINK", "FOOD_AND_DRINK_RESTAURANT"), 5, 48, 0.5),
+    SyntheticMerchant("Shell", SyntheticCategory("TRANSPORTATION", "TRANSPORTATION_GAS"), 6, 42, 0.3),
+    SyntheticMerchant("Uber", SyntheticCategory("TRANSPORTATION", "TRANSPORTATION_TAXIS_AND_RIDE_SHARES"), 5, 19, 0.5),
+    SyntheticMerchant(
+        "Amazon", SyntheticCategory("GENERAL_MERCHANDISE", "GENERAL_MERCHANDISE_ONLINE_MARKETPLACES"), 10, 34, 0.9
+    ),
+    SyntheticMerchant(
+        "Target", SyntheticCategory("GENERAL_MERCHANDISE", "GENERAL_MERCHANDISE_SUPERSTORES"), 5, 57, 0.7
+    ),
+    SyntheticMerchant("CVS Pharmacy", SyntheticCategory("MEDICAL", "MEDICAL_PHARMACIES_AND_SUPPLEMENTS"), 3, 22, 0.6),
+    SyntheticMerchant("Home Depot", SyntheticCategory("HOME_IMPROVEMENT", "HOME_IMPROVEMENT_HARDWARE"), 2, 85, 0.9),
+    SyntheticMerchant("Delta Air Lines", SyntheticCategory("TRAVEL", "TRAVEL_FLIGHTS"), 0.4, 380, 0.4, "#travel"),
+    SyntheticMerchant("Marriott", SyntheticCategory("TRAVEL", "TRAVEL_LODGING"), 0.4, 240, 0.5, "#travel"),
+)
+
+# name, category, day of month, base amount, monthly drift, account role, tag
+BILLS = (
+    ("Oakwood Apartments", RENT, 1, 1850.0, 0.0, "checking", "#bills"),
+    ("City Power & Light", ELECTRIC, 15, 95.0, 0.25, "checking", "#bills"),
+    ("Comcast", INTERNET, 20, 79.99, 0.0, "checking", "#bills"),
+    ("Verizon Wireless", PHONE, 22, 65.0, 0.05, "card", "#bills"),
+    ("Netflix", STREAMING, 8, 15.49, 0.0, "card", "#subscriptions"),
+    ("Spotify", MUSIC, 12, 10.99, 0.0, "card", "#subscriptions"),
+    ("Planet Fitness", GYM, 17, 24.99, 0.0, "card", "#subscriptions"),
+)
+
+ACCOUNT_TEMPLATES = (
+    ("checking", "Everyday Checking", "depository", "checking", Decimal("2400.00")),
+    ("card", "Rewards Card", "credit", "credit card", Decimal("0.00")),
+    ("savings", "High Yield Savings", "depository", "savings", Decimal("8000.00")),
+    ("card", "Travel Card", "credit", "credit card", Decimal("0.00")),
+    ("checking", "Joint Checking", "depository", "checking", Decimal("1200.00")),
+)
+
+
+WEEKEND_FACTOR = (5 + 2 * 1.4) / 7
+MEAN_PURCHASE = sum(m.weight * m.median * math.exp(m.spread**2 / 2) for m in MERCHANTS) / sum(
+    m.weight for m in MERCHANTS
+)
+
+
+def _monthly_bills(rent_scale: float) -> float:
+    return sum(bill[3] * (rent_scale if bill[1] is RENT else 1.0) for bill in BILLS)
+
+
+def synthetic_user_id(index: int) -> str:
+    return f"{SYNTHETIC_USER_PREFIX}{index:04d}"
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(str(round(value, 2))).quantize(CENTS)
+
+
+def _month_starts(start: date, end: date):
+    current = date(start.year, start.month, 1)
+    while current <= end:
+        yield current
+        current = date(current.year + (current.month == 12), current.month % 12 + 1, 1)
+
+
+def _on_day(month_start: date, day: int) -> date:
+    return month_start.replace(day=min(day, 28))
+
+
+class _UserLedger:
+    """Collect one user's rows before they are flushed in batches."""
+
+    def __init__(self, user_index: int, categories: dict, tag_ids: dict, end_date: date) -> None:
+        self.user_id = synthetic_user_id(user_index)
+        self.user_index = user_index
+        self.categories = categories
+        self.tag_ids = tag_ids
+        self.end_date = end_date
+        self.rows: list[dict] = []
+        self.tags: list[dict] = []
+        self.totals: dict[str, Decimal] = defaultdict(Decimal)
+        self.daily: dict[str, dict[date, Decimal]] = defaultdict(lambda: defaultdict(Decimal))
+        self._sequence = 0
+
+    def add(self, account_id, when, amount, merchant, category, *, tag=None, pending=False, description=None):
+        self._sequence += 1
+        transaction_id = f"syn-{self.user_index:04d}-{self._sequence:09d}"
+        slug, display, category_id = self.categories[category]
+        resolved = resolve_merchant(merchant_name=merchant, name=merchant, description=None)
+        self.rows.append(
+            {
+                "transaction_id": transaction_id,
+                "user_id": self.user_id,
+                "account_id": account_id,
+                "amount": amount,
+                "date": when,
+                "description": description or merchant.upper(),
+                "provider": "manual",
+                "merchant_name": resolved.display_name,
+                "merchant_slug": resolved.merchant_slug,
+                "merchant_type": "Unknown",
+                "category_id": category_id,
+                "category": display,
+                "category_slug": slug,
+                "category_display": display,
+                "personal_finance_category": {"primary": category.pfc_primary, "detailed": category.pfc_detailed},
+                "pending": pending,
+                "is_internal": False,
+                "updated_at": datetime.utcnow(),
+            }
+        )
+        if tag:
+            self.tags.append({"transaction_id": transaction_id, "tag_id": self.tag_ids[tag]})
+        self.totals[account_id] += amount
+        self.daily[account_id][when] += amount
+
+
+def _ensure_categories() -> dict:
+    """Create (or reuse) every category the generator uses and return ``{category: (slug, display, id)}``."""
+
+    wanted = {
+        INCOME,
+        RENT,
+        ELECTRIC,
+        INTERNET,
+        PHONE,
+        STREAMING,
+        MUSIC,
+        GYM,
+        CARD_PAYMENT,
+        TRANSFER_OUT,
+        TRANSFER_IN,
+        INTEREST,
+        *(merchant.category for merchant in MERCHANTS),
+    }
+    resolved = {}
+    for category in sorted(wanted, key=lambda item: item.pfc_detailed):
+        row = get_or_create_category(
+            category.pfc_primary, category.pfc_detailed, category.pfc_primary, category.pfc_detailed, None
+        )
+        resolved[category] = (row.category_slug, row.computed_display_name, row.id)
+    db.session.commit()
+    return resolved
+
+
+def _generate_user(
+    ledger: _UserLedger, accounts: list[tuple[str, str]], rng: random.Random, start: date, target: int
+) -> None:
+    """Append one user's scheduled and discretionary transactions to ``ledger``."""
+
+    by_role = defaultdict(list)
+    for account_id, role in accounts:
+        by_role[role].append(account_id)
+    checking = by_role["checking"][0]
+    cards = by_role["card"] or [checking]
+    savings = by_role["savings"][0] if by_role["savings"] else None
+    end = ledger.end_date
+    days = (end - start).days + 1
+    months = days / 30.44
+    rent_scale = rng.uniform(0.6, 1.5)
+
+    # Size discretionary volume to the target, then pay enough to cover it plus
+    # bills and the savings sweep so balances stay plausible at any scale.
+    scheduled = days / 14 * 1.5 + months * (len(BILLS) + 3)
+    per_day = max(target - scheduled, 0) / (days * WEEKEND_FACTOR)
+    fortnight_spend = 14 * per_day * WEEKEND_FACTOR * MEAN_PURCHASE + 14 / 30.44 * _monthly_bills(rent_scale)
+    employer = f"Employer {ledger.user_index % 37:02d} Payroll"
+    paycheck = max(rng.uniform(1600, 4200), fortnight_spend * rng.uniform(1.05, 1.2))
+    payday = start + timedelta(days=(4 - start.weekday()) % 7)
+    paydays = []
+    while payday <= end:
+        ledger.add(
+            checking,
+            payday,
+            _money(paycheck * rng.uniform(0.98, 1.02)),
+            employer,
+            INCOME,
+            description=f"{employer.upper()} DIRECT DEP",
+        )
+        paydays.append(payday)
+        payday += timedelta(days=14)
+
+    card_charges: dict[tuple[str, date], Decimal] = defaultdict(Decimal)
+    for month_start in _month_starts(start, end):
+        for name, category, day, base, drift, role, tag in BILLS:
+            when = _on_day(month_start, day)
+            if when < start or when > end:
+                continue
+            amount = base * (rent_scale if category is RENT else 1.0)
+            if drift:
+                amount *= 1 + rng.uniform(-drift, drift)
+            account_id = cards[0] if role == "card" else checking
+            ledger.add(account_id, when, -_money(amount), name, category, tag=tag)
+            if role == "card":
+                card_charges[(account_id, month_start)] += _money(amount)
+        if savings:
+            when = _on_day(month_start, 3)
+            if start <= when <= end:
+                ledger.add(savings, when, _money(rng.uniform(4, 30)), "Interest Payment", INTEREST)
+
+    weights = [merchant.weight for merchant in MERCHANTS]
+    for offset in range(days):
+        when = start + timedelta(days=offset)
+        rate = per_day * (1.4 if when.weekday() >= 5 else 1.0)
+        count = int(rate) + (rng.random() < rate - int(rate))
+        for merchant in rng.choices(MERCHANTS, weights, k=count):
+            amount = _money(math.exp(rng.gauss(math.log(merchant.median), merchant.spread)))
+            on_card = rng.random() < 0.8
+            account_id = rng.choice(cards) if on_card else checking
+            tag = merchant.tag if rng.random() < 0.9 else None
+            if tag is None and rng.random() < 0.03:
+                tag = "#reimbursable"
+            pending = (end - when).days < 3 and rng.random() < 0.5
+            store = rng.randint(100, 9999)
+            ledger.add(
+                account_id,
+                when,
+                -amount,
+                merchant.name,
+                merchant.category,
+                tag=tag,
+                pending=pending,
+                description=f"{merchant.name.upper()} #{store}",
+            )
+            if on_card and account_id in by_role["card"]:
+                card_charges[(account_id, date(when.year, when.month, 1))] += amount
+
+    # Internal transfers come as equal-and-opposite pairs, sometimes a day apart.
+    for (card_id, month_start), charged in sorted(card_charges.items()):
+        due = _on_day(month_start + timedelta(days=32), 25)
+        if due > end or card_id == checking:
+            continue
+        settled = due + timedelta(days=rng.choice((0, 0, 1)))
+        if settled > end:
+            settled = due
+        ledger.add(checking, due, -charged, "Card Payment", CARD_PAYMENT, description="ONLINE PAYMENT TO CARD")
+        ledger.add(card_id, settled, charged, "Payment Thank You", CARD_PAYMENT, description="PAYMENT - THANK YOU")
+    if savings:
+        for payday in paydays[1::2]:
+            sweep = _money(paycheck * rng.uniform(0.05, 0.15))
+            ledger.add(
+                checking, payday, -sweep, "Transfer to Savings", TRANSFER_OUT, description="ONLINE TRANSFER TO SAVINGS"
+            )
+            ledger.add(
+                savings,
+                payday + timedelta(days=rng.choice((0, 1))),
+                sweep,
+                "Transfer from Checking",
+                TRANSFER_IN,
+                description="ONLINE TRANSFER FROM CHECKING",
+            )
+
+
+def _history_rows(ledger: _UserLedger, balances: dict[str, Decimal], history_days: int) -> list[dict]:
+    """Walk back from current balances to one ``account_history`` row per account-day."""
+
+    rows = []
+    first = ledger.end_date - timedelta(days=history_days - 1)
+    for account_id, balance in balances.items():
+        running = balance
+        daily = ledger.daily[account_id]
+        for offset in range(history_days):
+            when = ledger.end_date - timedelta(days=offset)
+            rows.append({"account_id": account_id, "user_id": ledger.user_id, "date": when, "balance": running})
+            running -= daily.get(when, Decimal("0"))
+            if when <= first:
+                break
+    return rows
+
+
+def _insert(table, rows: list[dict], batch_size: int) -> None:
+    for start in range(0, len(rows), batch_size):
+        db.session.execute(insert(table), rows[start : start + batch_size])
+
+
+def synthetic_data_present() -> bool:
+    """Return whether synthetic users already exist in the database."""
+
+    stmt = select(Account.account_id).where(Account.user_id.like(f"{SYNTHETIC_USER_PREFIX}%")).limit(1)
+    return db.session.execute(stmt).first() is not None
+
+
+def delete_synthetic_dataset() -> int:
+    """Delete every synthetic user's rows and return the number of accounts removed."""
+
+    user_filter = Transaction.user_id.like(f"{SYNTHETIC_USER_PREFIX}%")
+    synthetic_ids = select(Transaction.transaction_id).where(user_filter)
+    db.session.execute(delete(transaction_tags).where(transaction_tags.c.transaction_id.in_(synthetic_ids)))
+    db.session.execute(delete(Transaction).where(user_filter))
+    db.session.execute(delete(AccountHistory).where(AccountHistory.user_id.like(f"{SYNTHETIC_USER_PREFIX}%")))
+    db.session.execute(delete(Tag).where(Tag.user_id.like(f"{SYNTHETIC_USER_PREFIX}%")))
+    removed = db.session.execute(delete(Account).where(Account.user_id.like(f"{SYNTHETIC_USER_PREFIX}%"))).rowcount
+    db.session.commit()
+    bump_data_version()
+    return int(removed or 0)
+
+
+def generate_synthetic_dataset(
+    users: int = 5,
+    accounts_per_user: int = 3,
+    months: int = 24,
+    transactions: int = 50_000,
+    seed: int = 42,
+    end_date: date | None = None,
+    history_days: int = HISTORY_DAYS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress=None,
+) -> dict[str, int]:
+    """Insert a synthetic dataset and return row counts per table.
+
+    Args:
+        users: Number of synthetic users.
+        accounts_per_user: Accounts per user (at least 1; checking comes first).
+        months: Months of history ending at ``end_date``.
+        transactions: Approximate total transactions across all users.
+        seed: Random seed; the same seed yields the same rows.
+        end_date: Last transaction date (default today).
+        history_days: Days of ``account_history`` written per account.
+        batch_size: Rows per ``INSERT`` batch.
+        progress: Optional callable receiving ``(user_index, users)`` after each user.
+
+    Raises:
+        ValueError: If ``users`` or ``accounts_per_user`` is below 1, or
+            synthetic data already exists.
+    """
+
+    if users < 1 or accounts_per_user < 1:
+        raise ValueError("users and accounts_per_user must be at least 1")
+    if synthetic_data_present():
+        raise ValueError("Synthetic data already present; delete it first")
+
+    end = end_date or date.today()
+    start = end - timedelta(days=round(months * 30.44) - 1)
+    rng = random.Random(seed)
+    categories = _ensure_categories()
+    institution = Institution.query.filter_by(name=SYNTHETIC_INSTITUTION).first()
+    if institution is None:
+        institution = Institution(name=SYNTHETIC_INSTITUTION, provider="manual")
+        db.session.add(institution)
+        db.session.flush()
+
+    counts = {"users": users, "accounts": 0, "transactions": 0, "transaction_tags": 0, "account_history": 0}
+    per_user = max(transactions // users, 1)
+    for user_index in range(1, users + 1):
+        user_id = synthetic_user_id(user_index)
+        tags = [Tag(user_id=user_id, name=name) for name in TAG_NAMES]
+        db.session.add_all(tags)
+        db.session.flush()
+
+        accounts = []
+        account_rows = []
+        for position in range(accounts_per_user):
+            role, name, account_type, subtype, opening = ACCOUNT_TEMPLATES[position % len(ACCOUNT_TEMPLATES)]
+            account_id = f"syn-acc-{user_index:04d}-{position + 1:02d}"
+            accounts.append((account_id, role))
+            account_rows.append(
+                {
+                    "account_id": account_id,
+                    "user_id": user_id,
+                    "name": name if position < len(ACCOUNT_TEMPLATES) else f"{name} {position + 1}",
+                    "type": account_type,
+                    "subtype": subtype,
+                    "institution_name": SYNTHETIC_INSTITUTION,
+                    "institution_db_id": institution.id,
+                    "status": "active",
+                    "is_hidden": False,
+                    "balance": opening,
+                    "link_type": "manual",
+                    "is_investment": False,
+                    "investment_has_holdings": False,
+                    "investment_has_transactions": False,
+                }
+            )
+
+        ledger = _UserLedger(user_index, categories, {tag.name: tag.id for tag in tags}, end)
+        _generate_user(ledger, accounts, random.Random(rng.getrandbits(64)), start, per_user)
+
+        balances = {}
+        for row in account_rows:
+            total = ledger.totals[row["account_id"]]
+            balance = row["balance"] + total if row["type"] == "depository" else max(-total, Decimal("0"))
+            row["balance"] = balance.quantize(CENTS)
+            balances[row["account_id"]] = row["balance"] if row["type"] == "depository" else -row["balance"]
+        history = _history_rows(ledger, balances, history_days)
+
+        _insert(Account.__table__, account_rows, batch_size)
+        _insert(Transaction.__table__, ledger.rows, batch_size)
+        _insert(transaction_tags, ledger.tags, batch_size)
+        _insert(AccountHistory.__table__, history, batch_size)
+        db.session.commit()
+
+        counts["accounts"] += len(account_rows)
+        counts["transactions"] += len(ledger.rows)
+        counts["transaction_tags"] += len(ledger.tags)
+        counts["account_history"] += len(history)
+        if progress is not None:
+            progress(user_index, users)
+
+    bump_data_version()
+    logger.info("Synthetic dataset written: %s", counts)
+    return counts
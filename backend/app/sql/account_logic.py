@@ -7,9 +7,8 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Optional
 
-from plaid import ApiException
 from sqlalchemy import case, func, or_
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import aliased, load_only, noload
 
 from app.config import FILES, logger
 from app.extensions import db
@@ -17,12 +16,20 @@ from app.helpers.normalize import normalize_amount
 from app.helpers.plaid_helpers import get_accounts, get_transactions
 from app.models import Account, AccountHistory, Category, PlaidAccount, Tag, Transaction
 from app.sql import transaction_rules_logic
+from app.sql.data_version import bump_data_version
 from app.sql.dialect_utils import dialect_insert
 from app.sql.refresh_metadata import refresh_or_insert_plaid_metadata
 from app.sql.sequence_utils import ensure_transactions_sequence
 from app.utils.category_canonical import canonicalize_category
 from app.utils.finance_utils import display_transaction_amount
 from app.utils.merchant_normalization import resolve_merchant
+from app.utils.metrics import (
+    record_transactions_ingested,
+    record_tx_cache,
+    record_tx_cache_eviction,
+    record_upsert_totals,
+)
+from app.utils.tracing import current_span, span, stage, traced
 
 ParentCategory = aliased(Category)
 
@@ -248,6 +255,8 @@ def build_refresh_failure_status(error: Exception) -> dict:
         Structured refresh status payload for persistence.
     """
 
+    from plaid import ApiException
+
     if isinstance(error, ApiException):
         plaid_err = _extract_plaid_error_payload(error)
         plaid_error_code = plaid_err.get("plaid_error_code", "unknown")
@@ -441,6 +450,9 @@ def _tx_cache_key(
     include_running_balance,
     recent,
     limit,
+    merchant=None,
+    transaction_id=None,
+    fields=None,
 ):
     ids = None
     if account_ids:
@@ -465,19 +477,26 @@ def _tx_cache_key(
         bool(include_running_balance),
         bool(recent),
         limit,
+        merchant or "",
+        transaction_id or "",
+        fields,
     )
 
 
 def _get_cached_tx_page(key):
     entry = TX_PAGE_CACHE.get(key)
     if not entry:
+        record_tx_cache("miss")
         return None
     if entry["expires_at"] < time.time():
         try:
             TX_PAGE_CACHE.pop(key, None)
         except Exception:
             pass
+        record_tx_cache_eviction("expired")
+        record_tx_cache("miss")
         return None
+    record_tx_cache("hit")
     return entry
 
 
@@ -490,12 +509,18 @@ def _set_cached_tx_page(key, data, meta):
     }
 
 
-def invalidate_tx_cache():
-    """Bump the cache version to invalidate all cached transaction pages."""
+def invalidate_tx_cache(user_id=None):
+    """Bump the cache version to invalidate all cached transaction pages.
+
+    Also bumps the data version of ``user_id`` (or every user when omitted) so
+    derived-result caches such as the forecast cache drop stale entries.
+    """
 
     global TX_CACHE_VERSION
+    record_tx_cache_eviction("invalidated", len(TX_PAGE_CACHE))
     TX_PAGE_CACHE.clear()
     TX_CACHE_VERSION = int(time.time())
+    bump_data_version(user_id)
 
 
 def process_transaction_amount(amount):
@@ -893,6 +918,194 @@ def upsert_accounts(
     logger.info("Finished upserting accounts.")
 
 
+def _category_label(txn, cat):
+    # Prefer stored txn.category; fall back to joined Category computed label
+    if txn.category:
+        return txn.category
+    return cat.computed_display_name if cat else None
+
+
+# Output field -> (builder, Transaction columns, Account columns, needs Category).
+# Builders must only touch the columns they declare so sparse fieldsets can defer the rest.
+_TRANSACTION_ROW_FIELDS = {
+    "transaction_id": (lambda txn, acc, cat: txn.transaction_id, ("transaction_id",), (), False),
+    "date": (lambda txn, acc, cat: txn.date.isoformat() if txn.date else None, ("date",), (), False),
+    "amount": (lambda txn, acc, cat: display_transaction_amount(txn), ("amount",), (), False),
+    "description": (
+        lambda txn, acc, cat: txn.description or txn.merchant_name or "N/A",
+        ("description", "merchant_name"),
+        (),
+        False,
+    ),
+    "category": (lambda txn, acc, cat: _category_label(txn, cat) or "Uncategorized", ("category",), (), True),
+    "category_slug": (
+        lambda txn, acc, cat: txn.category_slug or getattr(cat, "category_slug", None),
+        ("category_slug",),
+        (),
+        True,
+    ),
+    "category_display": (
+        lambda txn, acc, cat: txn.category_display or _category_label(txn, cat) or "Uncategorized",
+        ("category_display", "category"),
+        (),
+        True,
+    ),
+    "category_id": (lambda txn, acc, cat: getattr(cat, "id", None), (), (), True),
+    "category_icon_url": (lambda txn, acc, cat: getattr(cat, "pfc_icon_url", None), (), (), True),
+    "merchant_name": (lambda txn, acc, cat: txn.merchant_name or "Unknown", ("merchant_name",), (), False),
+    "user_id": (
+        lambda txn, acc, cat: getattr(txn, "user_id", None) or getattr(acc, "user_id", None),
+        ("user_id",),
+        ("user_id",),
+        False,
+    ),
+    "account_name": (lambda txn, acc, cat: acc.name or "Unnamed Account", (), ("name",), False),
+    "institution_name": (lambda txn, acc, cat: acc.institution_name or "Unknown", (), ("institution_name",), False),
+    "subtype": (lambda txn, acc, cat: acc.subtype or "Unknown", (), ("subtype",), False),
+    "account_id": (lambda txn, acc, cat: acc.account_id or "Unknown", (), ("account_id",), False),
+    "pending": (lambda txn, acc, cat: getattr(txn, "pending", False), ("pending",), (), False),
+    "transfer_type": (lambda txn, acc, cat: getattr(txn, "transfer_type", None), ("transfer_type",), (), False),
+    "internal_transfer_flag": (
+        lambda txn, acc, cat: bool(getattr(txn, "is_internal", False)),
+        ("is_internal",),
+        (),
+        False,
+    ),
+    "isEditing": (lambda txn, acc, cat: False, (), (), False),
+    "tags": (lambda txn, acc, cat: _serialize_transaction_tags(txn), (), (), False),
+    "running_balance": (None, (), (), False),
+}
+TRANSACTION_ROW_FIELDS = tuple(_TRANSACTION_ROW_FIELDS)
+
+# Row fields moved into side tables by ``dictionary_encode_transactions``.
+ACCOUNT_SIDE_FIELDS = ("account_name", "institution_name", "subtype", "user_id")
+CATEGORY_SIDE_FIELDS = ("category_id", "category", "category_slug", "category_display", "category_icon_url")
+
+
+def normalize_transaction_fields(fields):
+    """Validate a sparse fieldset and return it in canonical row order.
+
+    Args:
+        fields: Iterable of output field names, or ``None`` for every field.
+
+    Returns:
+        Tuple of field names, or ``None`` when every field is requested.
+
+    Raises:
+        ValueError: If a field name is unknown.
+    """
+
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields if field and field.strip()}
+    unknown = sorted(requested.difference(_TRANSACTION_ROW_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown transaction fields: {', '.join(unknown)}")
+    if not requested:
+        return None
+    return tuple(field for field in TRANSACTION_ROW_FIELDS if field in requested)
+
+
+def serialize_transaction_row(txn, acc, cat, running_balance=None, fields=None):
+    """Serialize a ``(Transaction, Account, Category)`` row for transaction list responses.
+
+    ``fields`` limits the output to a normalized sparse fieldset (see
+    :func:`normalize_transaction_fields`); builders for omitted fields never run.
+    """
+
+    if fields is not None:
+        row = {}
+        for name in fields:
+            build = _TRANSACTION_ROW_FIELDS[name][0]
+            row[name] = build(txn, acc, cat) if build else _running_balance_value(running_balance)
+        return row
+
+    # Full rows skip the per-field builders; keep this literal in sync with them.
+    category_label = _category_label(txn, cat)
+    return {
+        "transaction_id": txn.transaction_id,
+        "date": txn.date.isoformat() if txn.date else None,
+        "amount": display_transaction_amount(txn),
+        "description": txn.description or txn.merchant_name or "N/A",
+        "category": category_label or "Uncategorized",
+        "category_slug": txn.category_slug or getattr(cat, "category_slug", None),
+        "category_display": txn.category_display or category_label or "Uncategorized",
+        "category_id": getattr(cat, "id", None),
+        "category_icon_url": getattr(cat, "pfc_icon_url", None),
+        "merchant_name": txn.merchant_name or "Unknown",
+        "user_id": getattr(txn, "user_id", None) or getattr(acc, "user_id", None),
+        "account_name": acc.name or "Unnamed Account",
+        "institution_name": acc.institution_name or "Unknown",
+        "subtype": acc.subtype or "Unknown",
+        "account_id": acc.account_id or "Unknown",
+        "pending": getattr(txn, "pending", False),
+        "transfer_type": getattr(txn, "transfer_type", None),
+        "internal_transfer_flag": bool(getattr(txn, "is_internal", False)),
+        "isEditing": False,
+        "tags": _serialize_transaction_tags(txn),
+        "running_balance": _running_balance_value(running_balance),
+    }
+
+
+def _running_balance_value(running_balance):
+    return float(running_balance) if running_balance is not None else None
+
+
+def _sparse_load_options(fields):
+    """Return ``(options, include_category)`` that defer columns ``fields`` never reads."""
+
+    txn_columns = {"id", "account_id"}
+    acc_columns = {"account_id"}
+    include_category = False
+    for name in fields:
+        _, txn_cols, acc_cols, needs_category = _TRANSACTION_ROW_FIELDS[name]
+        txn_columns.update(txn_cols)
+        acc_columns.update(acc_cols)
+        include_category = include_category or needs_category
+    options = [
+        load_only(*(getattr(Transaction, column) for column in sorted(txn_columns))),
+        load_only(*(getattr(Account, column) for column in sorted(acc_columns))),
+    ]
+    return options, include_category
+
+
+def dictionary_encode_transactions(rows):
+    """Move repeated account and category values of serialized rows into side tables.
+
+    Rows keep ``account_id`` and reference ``accounts[account_id]`` for
+    ``account_name``, ``institution_name``, ``subtype`` and ``user_id``.
+    Category values are replaced by ``category_ref``, an index into
+    ``categories``; each distinct combination of category values is sent once.
+    A row keeps any account value that differs from its account's entry, and
+    ``isEditing`` (always ``False``) is dropped.
+
+    Returns:
+        Dict with ``transactions``, ``accounts`` and ``categories`` keys.
+    """
+
+    accounts: dict = {}
+    categories: list[dict] = []
+    category_refs: dict = {}
+    encoded = []
+    for source in rows:
+        row = dict(source)
+        row.pop("isEditing", None)
+        account_id = row.get("account_id")
+        if account_id is not None:
+            side = {field: row.pop(field) for field in ACCOUNT_SIDE_FIELDS if field in row}
+            entry = accounts.setdefault(account_id, side)
+            row.update({field: value for field, value in side.items() if entry.get(field) != value})
+        category_values = tuple((field, row.pop(field)) for field in CATEGORY_SIDE_FIELDS if field in row)
+        if category_values:
+            ref = category_refs.get(category_values)
+            if ref is None:
+                ref = category_refs[category_values] = len(categories)
+                categories.append(dict(category_values))
+            row["category_ref"] = ref
+        encoded.append(row)
+    return {"transactions": encoded, "accounts": accounts, "categories": categories}
+
+
 def get_paginated_transactions(
     page,
     page_size,
@@ -909,6 +1122,7 @@ def get_paginated_transactions(
     limit=None,
     include_running_balance=False,
     merchant=None,
+    fields=None,
 ):
     """Return paginated transaction rows with optional filtering.
 
@@ -940,6 +1154,9 @@ def get_paginated_transactions(
     include_running_balance : bool, default False
         When ``True``, include a per-transaction running balance computed with a window
         function so pagination does not require loading every row into memory.
+    fields : Iterable[str], optional
+        Sparse fieldset; only these row keys are serialized and only the
+        columns they read are selected. Unknown names raise ``ValueError``.
 
     Returns
     -------
@@ -948,13 +1165,21 @@ def get_paginated_transactions(
         transaction includes a ``tags`` list with ``#untagged`` as a fallback.
     """
 
+    fields = normalize_transaction_fields(fields)
+    load_options, include_category = _sparse_load_options(fields) if fields else ([], True)
+    if fields is not None and "tags" not in fields:
+        # ``Transaction.tags`` is selectin-loaded by default; skip that query when unused.
+        load_options.append(noload(Transaction.tags))
+
+    entities = (Transaction, Account, Category) if include_category else (Transaction, Account)
+    query = db.session.query(*entities).join(Account, Transaction.account_id == Account.account_id)
+    if include_category:
+        query = query.outerjoin(Category, Transaction.category_id == Category.id)
     query = (
-        db.session.query(Transaction, Account, Category)
-        .join(Account, Transaction.account_id == Account.account_id)
-        .outerjoin(Category, Transaction.category_id == Category.id)
-        .filter(Account.is_hidden.is_(False))
+        query.filter(Account.is_hidden.is_(False))
         .filter((Transaction.is_internal.is_(False)) | (Transaction.is_internal.is_(None)))
         .order_by(Transaction.date.desc(), Transaction.transaction_id.desc())
+        .options(*load_options)
     )
 
     if user_id:
@@ -1016,6 +1241,9 @@ def get_paginated_transactions(
             include_running_balance,
             recent,
             limit,
+            merchant=merchant,
+            transaction_id=transaction_id,
+            fields=fields,
         )
         cached = _get_cached_tx_page(cache_key)
         if cached:
@@ -1045,43 +1273,10 @@ def get_paginated_transactions(
     # Unpack and serialize
     serialized = []
     for row in results:
-        if running_balance_expr is not None:
-            txn, acc, cat, running_balance = row
-        else:
-            txn, acc, cat = row
-            running_balance = None
-        # Prefer stored txn.category; fall back to joined Category computed label
-        category_label = txn.category
-        if not category_label and cat:
-            category_label = cat.computed_display_name
-        category_slug = txn.category_slug or getattr(cat, "category_slug", None)
-        category_display = txn.category_display or category_label
-
-        serialized.append(
-            {
-                "transaction_id": txn.transaction_id,
-                "date": txn.date.isoformat() if txn.date else None,
-                "amount": display_transaction_amount(txn),
-                "description": txn.description or txn.merchant_name or "N/A",
-                "category": category_label or "Uncategorized",
-                "category_slug": category_slug,
-                "category_display": category_display or "Uncategorized",
-                "category_id": getattr(cat, "id", None),
-                "category_icon_url": getattr(cat, "pfc_icon_url", None),
-                "merchant_name": txn.merchant_name or "Unknown",
-                "user_id": getattr(txn, "user_id", None) or getattr(acc, "user_id", None),
-                "account_name": acc.name or "Unnamed Account",
-                "institution_name": acc.institution_name or "Unknown",
-                "subtype": acc.subtype or "Unknown",
-                "account_id": acc.account_id or "Unknown",
-                "pending": getattr(txn, "pending", False),
-                "transfer_type": getattr(txn, "transfer_type", None),
-                "internal_transfer_flag": bool(getattr(txn, "is_internal", False)),
-                "isEditing": False,
-                "tags": _serialize_transaction_tags(txn),
-                "running_balance": (float(running_balance) if running_balance is not None else None),
-            }
-        )
+        txn, acc = row[0], row[1]
+        cat = row[2] if include_category else None
+        running_balance = row[-1] if running_balance_expr is not None else None
+        serialized.append(serialize_transaction_row(txn, acc, cat, running_balance, fields=fields))
 
     meta = {
         "page": page,
@@ -1252,6 +1447,7 @@ def get_or_create_category(primary, detailed, pfc_primary, pfc_detailed, pfc_ico
     return category
 
 
+@traced("plaid.refresh_account", stages=True)
 def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=None, start_date=None, end_date=None):
     """Refresh a single Plaid account and return update status and error info.
 
@@ -1260,9 +1456,12 @@ def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=No
     ``plaid_error_code`` and ``plaid_error_message`` when an exception is raised
     by the Plaid client.
     """
+    from plaid import ApiException
+
     plaid_account_obj = None
     updated = False
     now = datetime.now(timezone.utc)
+    started = time.perf_counter()
 
     PLAID_MAX_LOOKBACK_DAYS = 680
     end_date_obj = end_date or now.date()
@@ -1308,20 +1507,25 @@ def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=No
                 break
 
         account_label = account.name or f"[unnamed account] {account_id}"
+        current_span().set_attributes({"account.id": account_id, "user.id": account.user_id})
 
-        transactions = get_transactions(
-            access_token=access_token,
-            start_date=start_date_obj,
-            end_date=end_date_obj,
-        )
+        with span("plaid.transactions_get", **{"account.id": account_id}) as fetch_span:
+            transactions = get_transactions(
+                access_token=access_token,
+                start_date=start_date_obj,
+                end_date=end_date_obj,
+            )
+            fetch_span.set_attribute("rows.fetched", len(transactions))
         # Apply user-defined rules before upserting, with robust normalization
         normalized = []
         for tx in transactions:
-            tx = dict(tx)
-            # Some Plaid sandboxes can return category=None; normalize to list
-            if tx.get("category") is None:
-                tx["category"] = []
-            normalized.append(transaction_rules_logic.apply_rules(account.user_id, tx))
+            with stage("normalize"):
+                tx = dict(tx)
+                # Some Plaid sandboxes can return category=None; normalize to list
+                if tx.get("category") is None:
+                    tx["category"] = []
+            with stage("rules"):
+                normalized.append(transaction_rules_logic.apply_rules(account.user_id, tx))
         transactions = normalized
 
         fetched_count = len(transactions)
@@ -1339,6 +1543,8 @@ def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=No
             "skipped_missing_id": 0,
             "skipped_invalid_date": 0,
         }
+        inserted_txns = []
+        updated_txns = []
         ensure_transactions_sequence()
 
         for txn in transactions:
@@ -1375,21 +1581,24 @@ def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=No
             detailed = category_path[1] if len(category_path) > 1 else "Unknown"
 
             # Use robust category upsert logic
-            category = get_or_create_category(primary, detailed, pfc_primary, pfc_detailed, pfc_icon_url)
+            with stage("category"):
+                category = get_or_create_category(primary, detailed, pfc_primary, pfc_detailed, pfc_icon_url)
 
             description = txn.get("name") or txn.get("description") or "[no description]"
-            merchant = resolve_merchant(
-                merchant_name=txn.get("merchant_name"),
-                name=txn.get("name"),
-                description=txn.get("description"),
-            )
+            with stage("normalize"):
+                merchant = resolve_merchant(
+                    merchant_name=txn.get("merchant_name"),
+                    name=txn.get("name"),
+                    description=txn.get("description"),
+                )
             merchant_name = merchant.display_name
             merchant_type = txn.get("payment_meta", {}).get("payment_method") or "Unknown"
             txn["merchant_slug"] = merchant.merchant_slug
             pending = txn.get("pending", False)
             txn_amount = process_transaction_amount(txn.get("amount") or 0)
 
-            existing_txn = Transaction.query.filter_by(transaction_id=txn_id).first()
+            with stage("upsert"):
+                existing_txn = Transaction.query.filter_by(transaction_id=txn_id).first()
 
             totals["processed"] += 1
 
@@ -1419,14 +1628,17 @@ def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=No
                     existing_txn.provider = "plaid"
                     existing_txn.personal_finance_category = pfc_obj or None
                     existing_txn.personal_finance_category_icon_url = pfc_icon_url
+                    updated_txns.append(existing_txn)
                     totals["updated"] += 1
                     updated = True
                 else:
                     totals["unchanged"] += 1
                 # -- Update Plaid metadata on every refresh (even if not updating Transaction) --
                 if plaid_account_obj:
-                    refresh_or_insert_plaid_metadata(txn, existing_txn, plaid_account_obj.account_id)
-                detect_internal_transfer(existing_txn)
+                    with stage("metadata"):
+                        refresh_or_insert_plaid_metadata(txn, existing_txn, plaid_account_obj.account_id)
+                with stage("transfer_detection"):
+                    detect_internal_transfer(existing_txn)
             else:
                 new_txn = Transaction(
                     transaction_id=txn_id,
@@ -1447,17 +1659,41 @@ def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=No
                     personal_finance_category_icon_url=pfc_icon_url,
                 )
                 db.session.add(new_txn)
+                inserted_txns.append(new_txn)
                 totals["inserted"] += 1
                 updated = True
                 if plaid_account_obj:
-                    refresh_or_insert_plaid_metadata(txn, new_txn, plaid_account_obj.account_id)
-                detect_internal_transfer(new_txn)
+                    with stage("metadata"):
+                        refresh_or_insert_plaid_metadata(txn, new_txn, plaid_account_obj.account_id)
+                with stage("transfer_detection"):
+                    detect_internal_transfer(new_txn)
 
         mark_refresh_success(plaid_account_obj, commit=False)
 
-        db.session.commit()
+        if inserted_txns:
+            from app.sql.recurring_logic import record_recurring_observations
+            from app.sql.transactions_logic import record_merchant_usage
+
+            record_recurring_observations(inserted_txns, user_id=account.user_id)
+            record_merchant_usage(inserted_txns, user_id=account.user_id)
+        if inserted_txns or updated_txns:
+            from app.sql.search_logic import refresh_search_documents
+
+            refresh_search_documents([*inserted_txns, *updated_txns])
+
+        with stage("commit"):
+            db.session.commit()
         if updated:
-            invalidate_tx_cache()
+            invalidate_tx_cache(account.user_id)
+        current_span().set_attributes(
+            {
+                "plaid.item_id": getattr(plaid_account_obj, "item_id", None),
+                "rows.fetched": fetched_count,
+                **{f"rows.{key}": value for key, value in totals.items()},
+            }
+        )
+        record_upsert_totals(totals)
+        record_transactions_ingested("refresh", totals["inserted"] + totals["updated"], time.perf_counter() - started)
         logger.info(
             (
                 "[REFRESH] Account %s | fetched=%d | processed=%d | "
@@ -1479,6 +1715,7 @@ def refresh_data_for_plaid_account(access_token, account_or_id, accounts_data=No
         status = build_refresh_failure_status(e)
         institution = getattr(account, "institution_name", "Unknown")
         account_name = getattr(account, "name", account_id)
+        current_span().set_attribute("plaid.error_code", status.get("code"))
         logger.error(
             "Plaid error refreshing transactions for %s / %s: %s - %s",
             institution,
@@ -0,0 +1,121 @@
+"""Per-user data version tokens for derived-result caches.
+
+A data version changes whenever the rows that feed dashboards and forecasts
+change for a user. It combines an in-process write counter (bumped by request
+handlers and sync jobs that mutate data) with a cheap database fingerprint, so
+writes made by other workers or CLI jobs still invalidate cached results.
+Bumps also feed the read-replica lag guard (:mod:`app.utils.read_replica`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models import Account, AccountHistory, Tag, Transaction, transaction_tags
+from app.utils.read_replica import note_write
+
+# In-memory indexes re-run the fingerprint query at most this often.
+DATA_VERSION_RECHECK_SECONDS = 5.0
+
+_VERSION_LOCK = threading.Lock()
+_GLOBAL_EPOCH = 0
+_WRITE_COUNT = 0
+_USER_COUNTERS: dict[str, int] = {}
+_RECENT_VERSIONS: dict[str | None, tuple[float, tuple[int, int], str]] = {}
+
+
+def bump_data_version(user_id: str | None = None) -> None:
+    """Mark cached results stale for ``user_id`` or, when omitted, for every user."""
+
+    global _GLOBAL_EPOCH, _WRITE_COUNT
+    with _VERSION_LOCK:
+        _WRITE_COUNT += 1
+        if user_id is None:
+            _GLOBAL_EPOCH += 1
+            _USER_COUNTERS.clear()
+        else:
+            key = str(user_id)
+            _USER_COUNTERS[key] = _USER_COUNTERS.get(key, 0) + 1
+    note_write(user_id)
+
+
+def _user_fingerprint(user_id: str | None) -> tuple:
+    """Return row counts and high-water marks for the user's forecast inputs.
+
+    Transactions are scoped through their account's owner, since rows ingested
+    by ``refresh_data_for_plaid_account`` carry no ``user_id`` of their own.
+    ``max(transactions.updated_at)`` catches in-place edits (category, merchant,
+    amount) that leave counts and sums unchanged. Tag links do not touch the
+    transaction row, so the count and tag-id sum of the user's links stand in
+    for them. All aggregates are scalar subqueries so the fingerprint costs one
+    round trip. ``None`` fingerprints every user's rows.
+    """
+
+    def _aggregate(column, owner, stmt=None):
+        stmt = select(column) if stmt is None else stmt
+        return (stmt if user_id is None else stmt.where(owner == user_id)).scalar_subquery()
+
+    def _transactions(column):
+        stmt = select(column)
+        if user_id is not None:
+            stmt = stmt.join(Account, Transaction.account_id == Account.account_id)
+        return _aggregate(column, Account.user_id, stmt)
+
+    def _tag_links(column):
+        return _aggregate(column, Tag.user_id, select(column).join(Tag, Tag.id == transaction_tags.c.tag_id))
+
+    stmt = select(
+        _transactions(func.count(Transaction.id)),
+        _transactions(func.max(Transaction.id)),
+        _transactions(func.sum(Transaction.amount)),
+        _transactions(func.max(Transaction.updated_at)),
+        _tag_links(func.count(transaction_tags.c.tag_id)),
+        _tag_links(func.sum(transaction_tags.c.tag_id)),
+        _aggregate(func.max(Tag.updated_at), Tag.user_id),
+        _aggregate(func.count(Account.account_id), Account.user_id),
+        _aggregate(func.max(Account.updated_at), Account.user_id),
+        _aggregate(func.count(AccountHistory.id), AccountHistory.user_id),
+        _aggregate(func.max(AccountHistory.updated_at), AccountHistory.user_id),
+    )
+    return tuple(db.session.execute(stmt).one())
+
+
+def get_data_version(user_id: str | None) -> str:
+    """Return an opaque token that changes whenever the user's data changes.
+
+    With ``user_id=None`` the token covers every user, for endpoints that are
+    not scoped to one user; any bump changes it.
+    """
+
+    key = None if user_id is None else str(user_id)
+    with _VERSION_LOCK:
+        epoch = _GLOBAL_EPOCH
+        counter = _WRITE_COUNT if key is None else _USER_COUNTERS.get(key, 0)
+    digest = hashlib.sha1(repr(_user_fingerprint(key)).encode("utf-8")).hexdigest()[:16]
+    return f"{epoch}.{counter}.{digest}"
+
+
+def get_cached_data_version(user_id: str | None, max_age: float = DATA_VERSION_RECHECK_SECONDS) -> str:
+    """Return :func:`get_data_version`, reusing a result up to ``max_age`` seconds old.
+
+    For per-keystroke callers such as the suggestion and search indexes. A bump
+    in this process invalidates the reused result at once; writes from other
+    workers or CLI jobs are seen within ``max_age`` seconds.
+    """
+
+    key = None if user_id is None else str(user_id)
+    with _VERSION_LOCK:
+        counters = (_GLOBAL_EPOCH, _WRITE_COUNT if key is None else _USER_COUNTERS.get(key, 0))
+        cached = _RECENT_VERSIONS.get(key)
+    now = time.monotonic()
+    if cached is not None and cached[1] == counters and now - cached[0] < max_age:
+        return cached[2]
+    version = get_data_version(key)
+    with _VERSION_LOCK:
+        _RECENT_VERSIONS[key] = (now, counters, version)
+    return version
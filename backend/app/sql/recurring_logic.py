@@ -1,16 +1,20 @@
 # backend/app/sql/recurring_logic.py
 
 import uuid
-from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Optional
-
-from sqlalchemy import func
+from collections import Counter, defaultdict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Iterable, Optional
 
 from app.extensions import db
-from app.models import RecurringTransaction, Transaction
+from app.models import Account, RecurringSignature, RecurringTransaction, Transaction
+from app.sql.dialect_utils import dialect_insert
 from app.sql.sequence_utils import ensure_transactions_sequence
 
+DESCRIPTION_SIGNATURE_LENGTH = 16
+FREQUENCY_LABELS = {1: "daily", 7: "weekly", 14: "biweekly", 30: "monthly"}
+UPSERT_LOOKUP_LIMIT = 50
+
 
 def find_recurring_items(transactions):
     """
@@ -22,14 +26,13 @@ def find_recurring_items(transactions):
     for tx in transactions:
         merchant = tx.get("merchant_name") or tx.get("description") or "Unknown"
         amount = round(float(tx.get("amount", 0.0)), 2)
-        date_str = tx.get("date")
         try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except Exception:
+            tx_date = date.fromisoformat(tx.get("date"))
+        except (TypeError, ValueError):
             continue
 
         key = (merchant.lower(), amount)
-        grouped[key].append(date)
+        grouped[key].append(tx_date)
 
     recurring_items = []
     for (merchant, amount), dates in grouped.items():
@@ -57,18 +60,33 @@ def upsert_recurring(
     next_due_date: datetime,
     confidence: Optional[float],
     account_id: str,
+    transaction_id: Optional[str] = None,
+    commit: bool = True,
 ) -> int:
-    """Insert or update a RecurringTransaction linked to a matching Transaction."""
+    """Insert or update a RecurringTransaction linked to a matching Transaction.
+
+    ``transaction_id`` links the row directly (signature candidates carry the
+    latest matching transaction). Otherwise the newest transactions with the
+    same account and amount are compared case-insensitively on description.
+    Pass ``commit=False`` to batch several upserts into one commit.
+    """
     ensure_transactions_sequence()
 
-    tx = (
-        db.session.query(Transaction)
-        .filter(func.lower(Transaction.description) == description.lower())
-        .filter(Transaction.amount == amount)
-        .filter(Transaction.account_id == account_id)
-        .order_by(Transaction.date.desc())
-        .first()
-    )
+    tx = None
+    if transaction_id:
+        tx = Transaction.query.filter_by(transaction_id=transaction_id).first()
+    if not tx:
+        # Filter on indexed columns and compare descriptions in Python rather than
+        # with ``lower(description)``, which no index serves.
+        lowered = (description or "").lower()
+        recent = (
+            Transaction.query.filter(Transaction.account_id == account_id)
+            .filter(Transaction.amount == amount)
+            .order_by(Transaction.date.desc())
+            .limit(UPSERT_LOOKUP_LIMIT)
+            .all()
+        )
+        tx = next((row for row in recent if (row.description or "").lower() == lowered), None)
 
     if not tx:
         tx = Transaction(
@@ -98,5 +116,192 @@ def upsert_recurring(
         )
         db.session.add(rec)
 
-    db.session.commit()
+    if commit:
+        db.session.commit()
+    else:
+        db.session.flush()
     return rec.id
+
+
+def description_signature(description: Optional[str]) -> str:
+    """Return the short lowercase alphanumeric signature used to group descriptions."""
+    return "".join(filter(str.isalnum, (description or "").lower()))[:DESCRIPTION_SIGNATURE_LENGTH]
+
+
+def amount_bucket(amount) -> int:
+    """Return ``amount`` as signed whole cents."""
+    return int((Decimal(str(amount or 0)) * 100).quantize(Decimal("1")))
+
+
+def signature_key(txn) -> tuple[str, int]:
+    """Return the ``(signature, amount_bucket)`` a transaction contributes to."""
+    merchant_slug = (getattr(txn, "merchant_slug", None) or "").strip().lower()
+    if merchant_slug and merchant_slug != "unknown":
+        signature = merchant_slug
+    else:
+        signature = description_signature(getattr(txn, "description", None) or getattr(txn, "merchant_name", None))
+    return signature, amount_bucket(getattr(txn, "amount", 0))
+
+
+def frequency_label(gap_days: Optional[int]) -> Optional[str]:
+    """Return the cadence label for a dominant day gap."""
+    if gap_days is None:
+        return None
+    return FREQUENCY_LABELS.get(gap_days, f"~{gap_days}d")
+
+
+def dominant_gap(histogram: Optional[dict]) -> Optional[int]:
+    """Return the most frequent non-zero gap, preferring the shorter gap on ties."""
+    counts = Counter({int(gap): count for gap, count in (histogram or {}).items() if int(gap) > 0})
+    if not counts:
+        return None
+    return min(counts, key=lambda gap: (-counts[gap], gap))
+
+
+def _apply_observation(row: RecurringSignature, txn_date: date, transaction_id: str, description: str) -> None:
+    """Fold one transaction into a signature's running cadence statistics.
+
+    Gaps are only recorded for transactions on or after ``last_date``; older
+    (backfilled) transactions update the count and ``first_date``.
+    """
+    histogram = dict(row.gap_histogram or {})
+    if row.last_date is None:
+        row.first_date = txn_date
+        row.last_date = txn_date
+    elif txn_date >= row.last_date:
+        gap = str((txn_date - row.last_date).days)
+        histogram[gap] = histogram.get(gap, 0) + 1
+        row.last_date = txn_date
+    elif row.first_date is None or txn_date < row.first_date:
+        row.first_date = txn_date
+    if txn_date >= row.last_date:
+        row.last_transaction_id = transaction_id
+        row.description = description
+    row.occurrence_count = (row.occurrence_count or 0) + 1
+    # Reassign so the JSON column is flagged as modified.
+    row.gap_histogram = histogram
+
+
+def record_recurring_observations(transactions: Iterable, user_id: Optional[str] = None) -> int:
+    """Update recurring signatures for newly ingested transactions.
+
+    Does not commit; callers fold this into their ingest transaction. Pending
+    rows and rows without an account or date are ignored. Missing signature
+    rows are created with ``INSERT ... ON CONFLICT DO NOTHING`` on
+    ``uq_recurring_signatures_key`` and then locked and updated, so concurrent
+    ingests of the same account do not fail on the unique key.
+
+    Returns:
+        Number of transactions folded into signatures.
+    """
+    grouped: dict[tuple[str, str, int], list[tuple]] = defaultdict(list)
+    for txn in transactions:
+        if getattr(txn, "pending", False) or not getattr(txn, "account_id", None) or not getattr(txn, "date", None):
+            continue
+        signature, bucket = signature_key(txn)
+        if not signature or bucket == 0:
+            continue
+        txn_date = txn.date.date() if isinstance(txn.date, datetime) else txn.date
+        grouped[(txn.account_id, signature, bucket)].append(
+            (txn_date, txn.transaction_id, txn.description or txn.merchant_name or "", getattr(txn, "user_id", None))
+        )
+    if not grouped:
+        return 0
+
+    def _load_rows() -> dict:
+        return {
+            (row.account_id, row.signature, row.amount_bucket): row
+            for row in RecurringSignature.query.filter(RecurringSignature.account_id.in_({key[0] for key in grouped}))
+            .filter(RecurringSignature.signature.in_({key[1] for key in grouped}))
+            .with_for_update()
+            .all()
+        }
+
+    existing = _load_rows()
+    missing = [
+        {
+            "account_id": account_id,
+            "signature": signature,
+            "amount_bucket": bucket,
+            "occurrence_count": 0,
+            "gap_histogram": {},
+            "user_id": user_id or grouped[(account_id, signature, bucket)][0][3],
+        }
+        for account_id, signature, bucket in grouped
+        if (account_id, signature, bucket) not in existing
+    ]
+    if missing:
+        stmt = dialect_insert(RecurringSignature).values(missing)
+        on_conflict = getattr(stmt, "on_conflict_do_nothing", None)
+        if callable(on_conflict):
+            stmt = on_conflict(index_elements=["account_id", "signature", "amount_bucket"])
+        db.session.execute(stmt)
+        existing = _load_rows()
+
+    observed = 0
+    for key, observations in grouped.items():
+        row = existing[key]
+        for txn_date, transaction_id, description, _ in sorted(observations, key=lambda item: item[0]):
+            _apply_observation(row, txn_date, transaction_id, description)
+            observed += 1
+    return observed
+
+
+def rebuild_recurring_signatures(account_id: str, batch_size: int = 1000) -> int:
+    """Recompute an account's signatures from its full transaction history.
+
+    Used to backfill accounts ingested before signatures existed and to
+    reconcile edits or deletions, which incremental ingest does not replay.
+    Commits the rebuilt rows.
+    """
+    RecurringSignature.query.filter_by(account_id=account_id).delete(synchronize_session="fetch")
+    rows = (
+        Transaction.query.filter(Transaction.account_id == account_id)
+        .order_by(Transaction.date, Transaction.id)
+        .yield_per(batch_size)
+    )
+    user_id = db.session.query(Account.user_id).filter(Account.account_id == account_id).scalar()
+    observed = record_recurring_observations(rows, user_id=user_id)
+    db.session.commit()
+    return observed
+
+
+def recurring_candidates(
+    account_id: Optional[str] = None,
+    *,
+    user_id: Optional[str] = None,
+    min_occurrences: int = 3,
+    since: Optional[date] = None,
+) -> list[dict]:
+    """Read recurring candidates directly from the signature table.
+
+    Candidates mirror ``RecurringDetector.detect`` output and add ``account_id``,
+    ``transaction_id`` (latest occurrence), and ``gap_days``.
+    """
+    query = RecurringSignature.query.filter(RecurringSignature.occurrence_count >= min_occurrences)
+    if account_id is not None:
+        query = query.filter(RecurringSignature.account_id == account_id)
+    if user_id is not None:
+        query = query.filter(RecurringSignature.user_id == user_id)
+    if since is not None:
+        query = query.filter(RecurringSignature.last_date >= since)
+
+    candidates = []
+    for row in query.order_by(RecurringSignature.last_date.desc(), RecurringSignature.id).all():
+        gap = dominant_gap(row.gap_histogram)
+        if gap is None:
+            continue
+        candidates.append(
+            {
+                "amount": row.amount_bucket / 100,
+                "description": row.description or row.signature,
+                "signature": row.signature,
+                "frequency": frequency_label(gap),
+                "gap_days": gap,
+                "last_seen": row.last_date.isoformat(),
+                "occurrences": row.occurrence_count,
+                "account_id": row.account_id,
+                "transaction_id": row.last_transaction_id,
+            }
+        )
+    return candidates
@@ -0,0 +1,359 @@
+"""Full-text search over transaction history.
+
+Each transaction has a ``transaction_search_documents`` row whose ``document``
+joins its description, merchant name, category display, and tag names. Writers
+refresh documents in the same transaction as the change (see
+:func:`refresh_search_documents`). On PostgreSQL, search runs against the
+generated ``search_vector`` tsvector column and its GIN index; other backends
+(SQLite in tests and local development) use a per-user in-process inverted
+index that is reloaded when the user's (briefly cached) data version changes.
+
+Results are ranked, then ordered like transaction lists (date, then
+transaction id, both descending), and paginated with an opaque keyset cursor.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import Numeric, and_, cast, func, literal_column, or_
+from sqlalchemy.orm import selectinload
+
+from app.extensions import db
+from app.models import Account, Category, Transaction, TransactionSearchDocument
+from app.sql.data_version import get_cached_data_version
+from app.sql.dialect_utils import _current_dialect_name
+
+SEARCH_PAGE_SIZE = 50
+SEARCH_MAX_PAGE_SIZE = 200
+SEARCH_MAX_TERMS = 8
+SEARCH_INDEX_MAX_USERS = 32
+SEARCH_REBUILD_BATCH_SIZE = 1000
+_ID_CHUNK_SIZE = 500
+_RANK_PLACES = 6
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class InvalidSearchCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Split ``text`` into lowercase alphanumeric search terms."""
+
+    return _TOKEN.findall((text or "").lower())
+
+
+def build_search_document(txn) -> str:
+    """Return the searchable text for a transaction."""
+
+    merchant_name = txn.merchant_name if (txn.merchant_name or "").lower() != "unknown" else None
+    parts = [txn.description, merchant_name, txn.category_display or txn.category]
+    parts.extend(tag.name for tag in (txn.tags or []) if tag.name and tag.name != "#untagged")
+    seen = set()
+    unique = []
+    for part in parts:
+        part = (part or "").strip()
+        if part and part.lower() not in seen:
+            seen.add(part.lower())
+            unique.append(part)
+    return " ".join(unique)
+
+
+def refresh_search_documents(transactions: Iterable) -> int:
+    """Insert or rewrite search documents for ``transactions``.
+
+    Does not commit; callers refresh documents inside the transaction that
+    changed the rows.
+
+    Returns:
+        Number of documents inserted or changed.
+    """
+
+    by_id = {txn.transaction_id: txn for txn in transactions if getattr(txn, "transaction_id", None)}
+    if not by_id:
+        return 0
+    ids = list(by_id)
+    existing = {}
+    for start in range(0, len(ids), _ID_CHUNK_SIZE):
+        chunk = ids[start : start + _ID_CHUNK_SIZE]
+        for row in TransactionSearchDocument.query.filter(TransactionSearchDocument.transaction_id.in_(chunk)):
+            existing[row.transaction_id] = row
+
+    now = datetime.now(timezone.utc)
+    written = 0
+    for transaction_id, txn in by_id.items():
+        document = build_search_document(txn)
+        row = existing.get(transaction_id)
+        if row is None:
+            db.session.add(TransactionSearchDocument(transaction_id=transaction_id, document=document, updated_at=now))
+        elif row.document != document:
+            row.document = document
+            row.updated_at = now
+        else:
+            continue
+        written += 1
+    return written
+
+
+def refresh_search_documents_by_id(transaction_ids: Iterable[str]) -> int:
+    """Load transactions by id and refresh their documents (no commit)."""
+
+    ids = [transaction_id for transaction_id in dict.fromkeys(transaction_ids) if transaction_id]
+    written = 0
+    for start in range(0, len(ids), _ID_CHUNK_SIZE):
+        rows = (
+            Transaction.query.options(selectinload(Transaction.tags))
+            .filter(Transaction.transaction_id.in_(ids[start : start + _ID_CHUNK_SIZE]))
+            .all()
+        )
+        written += refresh_search_documents(rows)
+    return written
+
+
+def rebuild_search_documents(user_id: str | None = None, batch_size: int = SEARCH_REBUILD_BATCH_SIZE) -> int:
+    """Backfill or reconcile documents for every transaction (or one user's), committing per batch.
+
+    Returns:
+        Number of documents inserted or changed.
+    """
+
+    from app.sql.data_version import bump_data_version
+
+    written = 0
+    last_id = 0
+    while True:
+        query = Transaction.query.options(selectinload(Transaction.tags)).filter(Transaction.id > last_id)
+        if user_id is not None:
+            query = query.join(Account, Transaction.account_id == Account.account_id).filter(Account.user_id == user_id)
+        batch = query.order_by(Transaction.id).limit(batch_size).all()
+        if not batch:
+            break
+        written += refresh_search_documents(batch)
+        db.session.commit()
+        last_id = batch[-1].id
+    bump_data_version(user_id)
+    return written
+
+
+def encode_cursor(rank: float, txn_date: date, transaction_id: str) -> str:
+    """Encode the keyset position after a result row."""
+
+    payload = json.dumps([f"{rank:.{_RANK_PLACES}f}", txn_date.isoformat(), transaction_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[Decimal, date, str]:
+    """Decode a cursor from :func:`encode_cursor`."""
+
+    try:
+        rank, txn_date, transaction_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return Decimal(rank), date.fromisoformat(txn_date), str(transaction_id)
+    except (ValueError, TypeError, UnicodeError) as exc:
+        raise InvalidSearchCursor("Invalid search cursor") from exc
+
+
+def _visible_rows(query, user_id: str):
+    """Apply the visibility rules used by transaction lists."""
+
+    return (
+        query.filter(Account.user_id == user_id)
+        .filter(Account.is_hidden.is_(False))
+        .filter((Transaction.is_internal.is_(False)) | (Transaction.is_internal.is_(None)))
+    )
+
+
+def _search_postgres(user_id: str, terms: list[str], page_size: int, after) -> list[tuple]:
+    """Return ``(rank, Transaction, Account, Category)`` rows ranked by ``ts_rank``."""
+
+    tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+    vector = literal_column("transaction_search_documents.search_vector")
+    rank = func.round(cast(func.ts_rank(vector, tsquery), Numeric(12, _RANK_PLACES)), _RANK_PLACES)
+    query = _visible_rows(
+        db.session.query(rank.label("rank"), Transaction, Account, Category)
+        .select_from(Transaction)
+        .join(TransactionSearchDocument, TransactionSearchDocument.transaction_id == Transaction.transaction_id)
+        .join(Account, Transaction.account_id == Account.account_id)
+        .outerjoin(Category, Transaction.category_id == Category.id),
+        user_id,
+    ).filter(vector.op("@@")(tsquery))
+    if after is not None:
+        after_rank, after_date, after_id = after
+        query = query.filter(
+            or_(
+                rank < after_rank,
+                and_(
+                    rank == after_rank,
+                    or_(
+                        Transaction.date < after_date,
+                        and_(Transaction.date == after_date, Transaction.transaction_id < after_id),
+                    ),
+                ),
+            )
+        )
+    rows = (
+        query.order_by(rank.desc(), Transaction.date.desc(), Transaction.transaction_id.desc())
+        .limit(page_size + 1)
+        .all()
+    )
+    return [(float(row[0]), row[1], row[2], row[3]) for row in rows]
+
+
+class _InvertedIndex:
+    """Term -> posting map over one user's visible search documents."""
+
+    def __init__(self, rows: Iterable[tuple[str, date, str]]):
+        self.docs: list[tuple[str, date]] = []
+        postings: dict[str, dict[int, int]] = defaultdict(dict)
+        for transaction_id, txn_date, document in rows:
+            doc_idx = len(self.docs)
+            self.docs.append((transaction_id, txn_date))
+            for term in tokenize(document):
+                postings[term][doc_idx] = postings[term].get(doc_idx, 0) + 1
+        self.postings = dict(postings)
+        self.vocabulary = sorted(self.postings)
+
+    def _expand(self, term: str) -> list[str]:
+        start = bisect_left(self.vocabulary, term)
+        end = bisect_left(self.vocabulary, term + "\uffff", lo=start)
+        return self.vocabulary[start:end]
+
+    def search(self, terms: list[str]) -> list[tuple[float, date, str]]:
+        """Return ``(rank, date, transaction_id)`` for documents matching every term (prefix match)."""
+
+        total = len(self.docs) or 1
+        scores: dict[int, float] | None = None
+        for term in terms:
+            term_scores: dict[int, float] = defaultdict(float)
+            for token in self._expand(term):
+                posting = self.postings[token]
+                idf = math.log(1 + total / len(posting))
+                for doc_idx, freq in posting.items():
+                    term_scores[doc_idx] += freq * idf
+            if scores is None:
+                scores = dict(term_scores)
+            else:
+                scores = {
+                    doc_idx: score + term_scores[doc_idx] for doc_idx, score in scores.items() if doc_idx in term_scores
+                }
+            if not scores:
+                return []
+        results = []
+        for doc_idx, score in (scores or {}).items():
+            transaction_id, txn_date = self.docs[doc_idx]
+            results.append((round(score, _RANK_PLACES), txn_date, transaction_id))
+        results.sort(key=lambda item: item[2], reverse=True)
+        results.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return results
+
+
+_INDEX_LOCK = threading.Lock()
+_INDEXES: OrderedDict[str, tuple[str, _InvertedIndex]] = OrderedDict()
+
+
+def _load_inverted_index(user_id: str) -> _InvertedIndex:
+    rows = _visible_rows(
+        db.session.query(Transaction.transaction_id, Transaction.date, TransactionSearchDocument.document)
+        .join(TransactionSearchDocument, TransactionSearchDocument.transaction_id == Transaction.transaction_id)
+        .join(Account, Transaction.account_id == Account.account_id),
+        user_id,
+    )
+    return _InvertedIndex(rows.all())
+
+
+def _user_inverted_index(user_id: str) -> _InvertedIndex:
+    version = get_cached_data_version(user_id)
+    with _INDEX_LOCK:
+        cached = _INDEXES.get(user_id)
+        if cached is not None and cached[0] == version:
+            _INDEXES.move_to_end(user_id)
+            return cached[1]
+    index = _load_inverted_index(user_id)
+    with _INDEX_LOCK:
+        _INDEXES[user_id] = (version, index)
+        _INDEXES.move_to_end(user_id)
+        while len(_INDEXES) > SEARCH_INDEX_MAX_USERS:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def clear_search_indexes() -> None:
+    """Drop every cached in-process index."""
+
+    with _INDEX_LOCK:
+        _INDEXES.clear()
+
+
+def _search_in_process(user_id: str, terms: list[str], page_size: int, after) -> list[tuple]:
+    """Return ``(rank, Transaction, Account, Category)`` rows from the in-process index."""
+
+    matches = _user_inverted_index(user_id).search(terms)
+    if after is not None:
+        after_rank, after_date, after_id = float(after[0]), after[1], after[2]
+        matches = [
+            item
+            for item in matches
+            if item[0] < after_rank or (item[0] == after_rank and (item[1], item[2]) < (after_date, after_id))
+        ]
+    page = matches[: page_size + 1]
+    if not page:
+        return []
+    rows = (
+        db.session.query(Transaction, Account, Category)
+        .join(Account, Transaction.account_id == Account.account_id)
+        .outerjoin(Category, Transaction.category_id == Category.id)
+        .filter(Transaction.transaction_id.in_([item[2] for item in page]))
+        .all()
+    )
+    by_id = {row[0].transaction_id: row for row in rows}
+    return [(item[0], *by_id[item[2]]) for item in page if item[2] in by_id]
+
+
+def search_transactions(user_id: str, query: str, page_size: int = SEARCH_PAGE_SIZE, cursor: str | None = None) -> dict:
+    """Search a user's visible transactions.
+
+    Every query term must match a word prefix in the transaction's document.
+
+    Returns:
+        ``{"transactions": [...], "next_cursor": str | None, "page_size": int}``
+        where each transaction is serialized like transaction lists plus ``rank``.
+
+    Raises:
+        InvalidSearchCursor: If ``cursor`` is malformed.
+    """
+
+    from app.sql.account_logic import serialize_transaction_row
+
+    page_size = max(1, min(int(page_size), SEARCH_MAX_PAGE_SIZE))
+    after = decode_cursor(cursor) if cursor else None
+    terms = list(dict.fromkeys(tokenize(query)))[:SEARCH_MAX_TERMS]
+    if not terms:
+        return {"transactions": [], "next_cursor": None, "page_size": page_size}
+
+    if _current_dialect_name() == "postgresql":
+        rows = _search_postgres(user_id, terms, page_size, after)
+    else:
+        rows = _search_in_process(str(user_id), terms, page_size, after)
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    transactions = []
+    for rank, txn, acc, cat in rows:
+        item = serialize_transaction_row(txn, acc, cat)
+        item["rank"] = rank
+        transactions.append(item)
+    next_cursor = None
+    if has_more and rows:
+        rank, txn, _, _ = rows[-1]
+        next_cursor = encode_cursor(rank, txn.date, txn.transaction_id)
+    return {"transactions": transactions, "next_cursor": next_cursor, "page_size": page_size}
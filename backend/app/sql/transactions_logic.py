@@ -1,3 +1,203 @@
 # transactions_logic.py
 # This module to be used for transactions business logic (sql db upserting / fetching)
 #
+"""Set-based maintenance operations over stored transactions and merchant usage."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models import Account, MerchantUsage, Transaction
+from app.sql.data_version import bump_data_version
+from app.utils.merchant_normalization import MerchantNormalizationResult, resolve_merchant
+
+RENORMALIZE_CHUNK_SIZE = 500
+
+
+def _resolve_stored_merchant(
+    merchant_name: str | None, description: str | None
+) -> tuple[str, MerchantNormalizationResult]:
+    """Return the merchant input a stored row resolves from, and its resolution.
+
+    The stored merchant name is the input (``Unknown`` counts as missing), so
+    rows sharing a merchant name resolve once whatever their descriptions. The
+    description is only the input when the name is missing or cleans to nothing.
+    """
+
+    if (merchant_name or "").strip().lower() not in {"", "unknown"}:
+        resolved = resolve_merchant(merchant_name=merchant_name, name=None, description=None)
+        if resolved.source != "fallback":
+            return merchant_name, resolved
+    return description or "", resolve_merchant(merchant_name=None, name=description, description=None)
+
+
+def renormalize_transaction_merchants(chunk_size: int = RENORMALIZE_CHUNK_SIZE, dry_run: bool = False) -> dict:
+    """Re-apply merchant normalization to stored transactions.
+
+    Editable rows are read in id order, ``chunk_size`` at a time, with only the
+    merchant columns selected. Each row is resolved from its merchant input
+    (memoized, so cost scales with distinct inputs), and the changed rows of a
+    chunk are written with one ``UPDATE`` per distinct new value, keyed on the
+    chunk's id range and ids so every write is a primary-key lookup. Each chunk
+    commits. Rows edited by users are left alone. Merchant usage is dropped only
+    for the owners of accounts with rewritten rows, so it rebuilds lazily.
+
+    Returns:
+        Counts of distinct merchant inputs (``groups``), inputs with at least
+        one changed row (``changed_groups``), and ``rows_updated``
+        (``rows_updated`` is ``0`` for a dry run).
+    """
+
+    table = Transaction.__table__
+    groups: set[str] = set()
+    changed_groups: set[str] = set()
+    stats = {"groups": 0, "changed_groups": 0, "rows_updated": 0}
+    changed_accounts: set[str] = set()
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            select(
+                Transaction.id,
+                Transaction.account_id,
+                Transaction.merchant_name,
+                Transaction.description,
+                Transaction.merchant_slug,
+            )
+            .where((Transaction.user_modified.is_(False)) | (Transaction.user_modified.is_(None)))
+            .where(Transaction.id > last_id)
+            .order_by(Transaction.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        first_id, last_id = rows[0].id, rows[-1].id
+
+        updates: dict[tuple[str, str], list[int]] = {}
+        for row in rows:
+            merchant_input, resolved = _resolve_stored_merchant(row.merchant_name, row.description)
+            groups.add(merchant_input)
+            if resolved.display_name == row.merchant_name and resolved.merchant_slug == row.merchant_slug:
+                continue
+            changed_groups.add(merchant_input)
+            changed_accounts.add(row.account_id)
+            updates.setdefault((resolved.display_name, resolved.merchant_slug), []).append(row.id)
+
+        if dry_run or not updates:
+            continue
+        for (display_name, merchant_slug), ids in updates.items():
+            result = db.session.execute(
+                table.update()
+                .where(table.c.id.between(first_id, last_id), table.c.id.in_(ids))
+                .where((table.c.user_modified.is_(False)) | (table.c.user_modified.is_(None)))
+                .values(merchant_name=display_name, merchant_slug=merchant_slug)
+            )
+            stats["rows_updated"] += max(result.rowcount or 0, 0)
+        db.session.commit()
+
+    stats["groups"], stats["changed_groups"] = len(groups), len(changed_groups)
+    if dry_run or not stats["rows_updated"]:
+        return stats
+
+    # Usage rows are keyed by slug; drop the affected owners' rows so suggestions rebuild them lazily.
+    owners = select(Account.user_id).where(Account.account_id.in_(changed_accounts))
+    MerchantUsage.query.filter(MerchantUsage.user_id.in_(owners)).delete(synchronize_session=False)
+    db.session.commit()
+    bump_data_version()
+    return stats
+
+
+def _usage_slug(merchant_slug: str | None) -> str | None:
+    slug = (merchant_slug or "").strip().lower()
+    return None if not slug or slug == "unknown" else slug
+
+
+def record_merchant_usage(transactions: Iterable, user_id: str | None = None) -> int:
+    """Increment per-user merchant usage counts for newly ingested transactions.
+
+    Does not commit; callers fold this into their ingest transaction.
+    ``user_id`` is the fallback for rows without one; rows without a user or a
+    known merchant slug are ignored.
+
+    Returns:
+        Number of transactions counted.
+    """
+
+    grouped: dict[tuple[str, str], list] = {}
+    for txn in transactions:
+        slug = _usage_slug(getattr(txn, "merchant_slug", None))
+        owner = getattr(txn, "user_id", None) or user_id
+        if not slug or not owner:
+            continue
+        txn_date = txn.date.date() if isinstance(txn.date, datetime) else txn.date
+        entry = grouped.setdefault((owner, slug), [0, None, None])
+        entry[0] += 1
+        if txn_date is not None and (entry[1] is None or txn_date >= entry[1]):
+            entry[1] = txn_date
+            entry[2] = txn.merchant_name
+    if not grouped:
+        return 0
+
+    existing = {
+        (row.user_id, row.merchant_slug): row
+        for row in MerchantUsage.query.filter(MerchantUsage.user_id.in_({key[0] for key in grouped}))
+        .filter(MerchantUsage.merchant_slug.in_({key[1] for key in grouped}))
+        .all()
+    }
+    counted = 0
+    for (owner, slug), (count, last_seen, display_name) in grouped.items():
+        row = existing.get((owner, slug))
+        if row is None:
+            row = MerchantUsage(user_id=owner, merchant_slug=slug, display_name=display_name or slug, usage_count=0)
+            db.session.add(row)
+        row.usage_count = (row.usage_count or 0) + count
+        if last_seen is not None and (row.last_seen is None or last_seen >= row.last_seen):
+            row.last_seen = last_seen
+            row.display_name = display_name or row.display_name
+        counted += count
+    return counted
+
+
+def rebuild_merchant_usage(user_id: str) -> int:
+    """Recompute a user's merchant usage rows with one ``GROUP BY`` and commit.
+
+    Backfills users ingested before the table existed and reconciles edits or
+    deletions, which incremental ingest does not replay.
+
+    Returns:
+        Number of merchant rows written.
+    """
+
+    MerchantUsage.query.filter_by(user_id=user_id).delete(synchronize_session="fetch")
+    rows = db.session.execute(
+        select(
+            Transaction.merchant_slug,
+            func.max(Transaction.merchant_name),
+            func.count(Transaction.id),
+            func.max(Transaction.date),
+        )
+        .join(Account, Transaction.account_id == Account.account_id)
+        .where(Account.user_id == user_id)
+        .where(Transaction.merchant_slug.is_not(None))
+        .group_by(Transaction.merchant_slug)
+    ).all()
+    written = 0
+    for merchant_slug, display_name, count, last_seen in rows:
+        slug = _usage_slug(merchant_slug)
+        if not slug:
+            continue
+        db.session.add(
+            MerchantUsage(
+                user_id=user_id,
+                merchant_slug=slug,
+                display_name=display_name or slug,
+                usage_count=count,
+                last_seen=last_seen,
+            )
+        )
+        written += 1
+    db.session.commit()
+    return written
@@ -0,0 +1,98 @@
+"""Negotiated response compression for large JSON and text bodies.
+
+:func:`init_compression` registers an ``after_request`` hook that compresses
+buffered responses above ``COMPRESS_MIN_SIZE`` bytes with Brotli (when the
+``brotli`` package is installed) or gzip, whichever the client prefers in
+``Accept-Encoding``. Streamed, already-encoded, and non-text responses pass
+through untouched.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+from flask import Flask, Response, request
+
+try:  # Optional dependency
+    import brotli
+except Exception:  # pragma: no cover - brotli is an optional extra
+    brotli = None
+
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_GZIP_LEVEL = 6
+COMPRESS_BROTLI_QUALITY = 4
+COMPRESSIBLE_MIMETYPES = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "application/x-ndjson",
+        "text/css",
+        "text/csv",
+        "text/html",
+        "text/plain",
+    }
+)
+
+
+def available_encodings() -> list[str]:
+    """Return supported content codings, preferred first."""
+
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def compress_body(body: bytes, encoding: str, level: int | None = None) -> bytes:
+    """Compress ``body`` with ``encoding`` (``"br"`` or ``"gzip"``)."""
+
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("brotli is not installed")
+        return brotli.compress(body, quality=COMPRESS_BROTLI_QUALITY if level is None else level)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=COMPRESS_GZIP_LEVEL if level is None else level, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress_response(response: Response, min_size: int = COMPRESS_MIN_SIZE) -> Response:
+    """Compress ``response`` in place when the client accepts a supported encoding."""
+
+    if (
+        response.status_code < 200
+        or response.status_code in {204, 206, 304}
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = request.accept_encodings.best_match(available_encodings())
+    if encoding is None:
+        return response
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    response.set_data(compress_body(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The encoded bytes differ from the identity body a strong validator describes.
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    """Register response compression on ``app``.
+
+    ``COMPRESS_MIN_SIZE`` in the app config overrides the size threshold;
+    ``COMPRESS_RESPONSES = False`` disables compression entirely.
+    """
+
+    if not app.config.get("COMPRESS_RESPONSES", True):
+        return
+    min_size = int(app.config.get("COMPRESS_MIN_SIZE", COMPRESS_MIN_SIZE))
+
+    @app.after_request
+    def _compress(response: Response) -> Response:
+        return compress_response(response, min_size=min_size)
@@ -0,0 +1,87 @@
+"""HTTP conditional request support for read-only JSON endpoints.
+
+:func:`conditional_get` derives a weak ETag from the caller's data version
+(:mod:`app.sql.data_version`), the endpoint, its normalized query and path
+arguments, and the current date, then answers a matching ``If-None-Match``
+with ``304 Not Modified`` before the view runs. Payloads are never hashed, so
+a revalidation costs one fingerprint query instead of a full recompute.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date
+from functools import wraps
+
+from flask import make_response, request
+
+from app.config import logger
+
+DEFAULT_CACHE_CONTROL = "private, no-cache"
+
+
+def _normalized_args() -> list[tuple[str, list[str]]]:
+    """Return query args sorted by name; repeated values keep their order."""
+
+    return sorted((key, request.args.getlist(key)) for key in request.args)
+
+
+def compute_etag(user_id: str | None) -> str | None:
+    """Return the validator for the current request, or ``None`` to bypass caching."""
+
+    try:
+        from app.sql.data_version import get_data_version
+
+        data_version = get_data_version(user_id)
+    except Exception as exc:
+        logger.warning("Conditional GET bypassed; data version unavailable: %s", exc)
+        return None
+    material = {
+        "endpoint": request.endpoint,
+        "view_args": request.view_args or {},
+        "args": _normalized_args(),
+        # Views default their date windows to "today", so a new day is a new representation.
+        "today": date.today().isoformat(),
+        "data_version": data_version,
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def conditional_get(user_arg: str | None = "user_id", cache_control: str = DEFAULT_CACHE_CONTROL):
+    """Decorate a GET view with ETag validation and ``Cache-Control`` headers.
+
+    Args:
+        user_arg: Query argument naming the user whose data version scopes the
+            ETag. When it is absent (or ``user_arg`` is ``None``) the global
+            data version is used.
+        cache_control: ``Cache-Control`` value for 200 and 304 responses. The
+            default makes clients revalidate on every use.
+
+    Only successful responses carry an ETag; errors pass through untouched.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in {"GET", "HEAD"}:
+                return view(*args, **kwargs)
+            user_id = request.args.get(user_arg) if user_arg else None
+            etag = compute_etag(user_id or None)
+            if etag is None:
+                return view(*args, **kwargs)
+
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = cache_control
+            return response
+
+        return wrapper
+
+    return decorator
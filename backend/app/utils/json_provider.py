@@ -0,0 +1,109 @@
+"""Flask JSON provider with native ``Decimal`` and date handling.
+
+Routes can hand ``Decimal`` amounts and ``date``/``datetime`` values straight
+to ``jsonify``: decimals serialize as JSON numbers and dates as ISO 8601
+strings, matching what routes produce today with ``float(...)`` and
+``.isoformat()``. Encoding uses ``orjson`` when it is installed and falls back
+to the standard library otherwise; both paths emit the same JSON values.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:  # Optional dependency
+    import orjson
+except Exception:  # pragma: no cover - slim installs ship without orjson
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the encoders do not handle natively."""
+
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars from the forecast engines
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by ``orjson`` with a ``json`` fallback.
+
+    Keys are not sorted, since route payloads are already built in a stable
+    order, and non-ASCII text is emitted as UTF-8.
+    """
+
+    default = staticmethod(_default)
+    ensure_ascii = False
+    sort_keys = False
+
+    def _orjson_options(self, indent: Any = None, sort_keys: bool | None = None) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        if self.sort_keys if sort_keys is None else sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps_bytes(self, obj: Any, *, indent: Any = None) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+
+        if orjson is not None:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_options(indent))
+        separators = None if indent else (",", ":")
+        text = json.dumps(
+            obj,
+            default=self.default,
+            ensure_ascii=self.ensure_ascii,
+            sort_keys=self.sort_keys,
+            indent=indent,
+            separators=separators,
+        )
+        return text.encode("utf-8")
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string.
+
+        Extra ``json.dumps`` keyword arguments (other than ``indent`` and
+        ``sort_keys``) route through the standard library encoder.
+        """
+
+        indent = kwargs.pop("indent", None)
+        sort_keys = kwargs.pop("sort_keys", None)
+        kwargs.pop("separators", None)
+        if orjson is not None and not kwargs:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_options(indent, sort_keys)).decode()
+        kwargs.setdefault("default", self.default)
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys if sort_keys is None else sort_keys)
+        if not indent:
+            kwargs.setdefault("separators", (",", ":"))
+        return json.dumps(obj, indent=indent, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Return a JSON response, encoding straight to bytes."""
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if (self.compact is None and self._app.debug) or self.compact is False else None
+        return self._app.response_class(self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype)
@@ -4,20 +4,28 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-
-_PREFIX_PATTERNS = [
-    re.compile(r"^pos\s+", re.IGNORECASE),
-    re.compile(r"^debit\s+", re.IGNORECASE),
-    re.compile(r"^purchase\s+", re.IGNORECASE),
-    re.compile(r"^sq\s*\*\s*", re.IGNORECASE),
-    re.compile(r"^tst\*\s*", re.IGNORECASE),
-    re.compile(r"^pp\*\s*", re.IGNORECASE),
-    re.compile(r"^paypal\s*\*\s*", re.IGNORECASE),
-    re.compile(r"^card\s+\d+\s+", re.IGNORECASE),
-]
+from functools import lru_cache
+
+# Processor prefixes, in the order they are stripped. Each is optional, so one
+# anchored pass strips any leading run of them in this order.
+_PREFIXES = (
+    r"pos\s+",
+    r"debit\s+",
+    r"purchase\s+",
+    r"sq\s*\*\s*",
+    r"tst\*\s*",
+    r"pp\*\s*",
+    r"paypal\s*\*\s*",
+    r"card\s+\d+\s+",
+)
+_PREFIX_PATTERN = re.compile("^" + "".join(f"(?:{prefix})?" for prefix in _PREFIXES), re.IGNORECASE)
 _TRAILING_NOISE = re.compile(r"\b(?:pending|debit|card\s*\d+|ach|online|purchase|pos)\b", re.IGNORECASE)
 _SEPARATOR = re.compile(r"\s*[-:/|]\s*")
 _SPACES = re.compile(r"\s+")
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+# Raw merchant/name/description triples repeat heavily across ingests.
+MERCHANT_CACHE_SIZE = 8192
 
 
 @dataclass(frozen=True)
@@ -43,8 +51,7 @@ def _clean_candidate(value: str) -> str:
     if not cleaned:
         return ""
 
-    for pattern in _PREFIX_PATTERNS:
-        cleaned = pattern.sub("", cleaned)
+    cleaned = _PREFIX_PATTERN.sub("", cleaned, count=1)
 
     cleaned = _SEPARATOR.split(cleaned, maxsplit=1)[0]
     cleaned = _TRAILING_NOISE.sub("", cleaned)
@@ -63,7 +70,7 @@ def _to_title_case(value: str) -> str:
 
 
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _NON_SLUG.sub("-", value.lower()).strip("-")
     return slug or "unknown"
 
 
@@ -77,8 +84,18 @@ def resolve_merchant(
     2. ``name`` field.
     3. ``description`` field.
     4. ``Unknown`` fallback.
+
+    Results are memoized per raw input triple (bounded LRU); the returned value
+    is immutable, so cached instances are safe to share.
     """
 
+    return _resolve_merchant_cached(merchant_name, name, description)
+
+
+@lru_cache(maxsize=MERCHANT_CACHE_SIZE)
+def _resolve_merchant_cached(
+    merchant_name: str | None, name: str | None, description: str | None
+) -> MerchantNormalizationResult:
     candidates = [
         (merchant_name, "merchant_name"),
         (name, "name"),
@@ -96,3 +113,9 @@ def resolve_merchant(
             )
 
     return MerchantNormalizationResult(display_name="Unknown", merchant_slug="unknown", source="fallback")
+
+
+def clear_merchant_cache() -> None:
+    """Drop memoized results, e.g. after normalization rules change in-process."""
+
+    _resolve_merchant_cached.cache_clear()
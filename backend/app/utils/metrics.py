@@ -0,0 +1,214 @@
+"""Prometheus metrics for request latency, Plaid traffic, ingestion, and caching.
+
+Every recorder here is a no-op when ``prometheus_client`` is not installed, so
+callers can instrument hot paths unconditionally. Metrics live in the default
+registry next to ``plaid_webhook_events_total`` and are served by
+``GET /metrics``; under a multi-process server set ``PROMETHEUS_MULTIPROC_DIR``
+so the endpoint aggregates every worker.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+
+from flask import Flask, g, request
+
+try:  # pragma: no cover - optional dependency
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except Exception:  # pragma: no cover
+    Counter = Gauge = Histogram = None  # type: ignore[assignment]
+    REGISTRY = CollectorRegistry = multiprocess = generate_latest = None  # type: ignore[assignment]
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+PLAID_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def metrics_available() -> bool:
+    """Return ``True`` when ``prometheus_client`` is installed."""
+
+    return Counter is not None
+
+
+def _build_metric(factory, name: str, documentation: str, labels: list[str], **kwargs):
+    """Create or retrieve a collector, mirroring the webhook counter pattern."""
+
+    if factory is None:  # Dependency not installed
+        return None
+
+    try:
+        return factory(name, documentation, labels, **kwargs)
+    except ValueError:  # pragma: no cover - already registered (module reloaded)
+        try:
+            return REGISTRY._names_to_collectors.get(name)  # type: ignore[attr-defined]
+        except Exception:  # pragma: no cover - registry internals changed
+            return None
+
+
+REQUEST_LATENCY = _build_metric(
+    Histogram,
+    "http_request_duration_seconds",
+    "Flask request latency by blueprint and endpoint",
+    ["blueprint", "endpoint", "method"],
+)
+REQUEST_ERRORS = _build_metric(
+    Counter,
+    "http_request_errors_total",
+    "Flask responses with a 4xx or 5xx status by blueprint and endpoint",
+    ["blueprint", "endpoint", "status"],
+)
+PLAID_LATENCY = _build_metric(
+    Histogram,
+    "plaid_api_request_duration_seconds",
+    "Plaid API call latency by operation and outcome",
+    ["operation", "outcome"],
+    buckets=PLAID_LATENCY_BUCKETS,
+)
+PLAID_RETRIES = _build_metric(
+    Counter,
+    "plaid_api_retries_total",
+    "Plaid API calls retried after a transient error",
+    ["operation"],
+)
+TRANSACTIONS_INGESTED = _build_metric(
+    Counter,
+    "plaid_transactions_ingested_total",
+    "Plaid transactions applied to the database by ingestion path",
+    ["source"],
+)
+INGEST_RATE = _build_metric(
+    Gauge,
+    "plaid_transactions_ingest_rate",
+    "Transactions per second achieved by the most recent ingestion run",
+    ["source"],
+    multiprocess_mode="max",
+)
+TRANSACTION_UPSERTS = _build_metric(
+    Counter,
+    "transaction_upserts_total",
+    "Rows handled by refresh_data_for_plaid_account by outcome",
+    ["outcome"],
+)
+TX_CACHE_REQUESTS = _build_metric(
+    Counter,
+    "tx_page_cache_requests_total",
+    "Transaction page cache lookups by result",
+    ["result"],
+)
+TX_CACHE_EVICTIONS = _build_metric(
+    Counter,
+    "tx_page_cache_evictions_total",
+    "Transaction page cache entries dropped by reason",
+    ["reason"],
+)
+
+
+def observe_request(blueprint: str, endpoint: str, method: str, status: int, seconds: float) -> None:
+    """Record one request's latency and, for 4xx/5xx responses, its error."""
+
+    if REQUEST_LATENCY is None:
+        return
+    REQUEST_LATENCY.labels(blueprint=blueprint, endpoint=endpoint, method=method).observe(seconds)
+    if status >= 400:
+        REQUEST_ERRORS.labels(blueprint=blueprint, endpoint=endpoint, status=str(status)).inc()
+
+
+@contextmanager
+def observe_plaid_call(operation: str):
+    """Time a Plaid API call, labelling it ``success`` or ``error``."""
+
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        if PLAID_LATENCY is not None:
+            PLAID_LATENCY.labels(operation=operation, outcome=outcome).observe(time.perf_counter() - started)
+
+
+def record_plaid_retry(operation: str) -> None:
+    if PLAID_RETRIES is not None:
+        PLAID_RETRIES.labels(operation=operation).inc()
+
+
+def record_transactions_ingested(source: str, count: int, seconds: float) -> None:
+    """Count ``count`` ingested transactions and publish the run's throughput."""
+
+    if TRANSACTIONS_INGESTED is None:
+        return
+    TRANSACTIONS_INGESTED.labels(source=source).inc(count)
+    if seconds > 0:
+        INGEST_RATE.labels(source=source).set(count / seconds)
+
+
+def record_upsert_totals(totals: dict[str, int]) -> None:
+    """Add ``refresh_data_for_plaid_account`` outcome totals (``processed`` excluded)."""
+
+    if TRANSACTION_UPSERTS is None:
+        return
+    for outcome, count in totals.items():
+        if outcome != "processed" and count:
+            TRANSACTION_UPSERTS.labels(outcome=outcome).inc(count)
+
+
+def record_tx_cache(result: str) -> None:
+    """Record a transaction page cache ``hit`` or ``miss``."""
+
+    if TX_CACHE_REQUESTS is not None:
+        TX_CACHE_REQUESTS.labels(result=result).inc()
+
+
+def record_tx_cache_eviction(reason: str, count: int = 1) -> None:
+    if TX_CACHE_EVICTIONS is not None and count:
+        TX_CACHE_EVICTIONS.labels(reason=reason).inc(count)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition payload and its content type.
+
+    Raises:
+        RuntimeError: If ``prometheus_client`` is not installed.
+    """
+
+    if not metrics_available():
+        raise RuntimeError("Metrics require prometheus_client.")
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def init_metrics(app: Flask) -> None:
+    """Observe request latency and errors on ``app`` (``METRICS_ENABLED``, default ``True``)."""
+
+    if not app.config.get("METRICS_ENABLED", True) or not metrics_available():
+        return
+
+    @app.before_request
+    def _start_request_timer():
+        g._metrics_started = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        started = g.pop("_metrics_started", None)
+        if started is not None:
+            observe_request(
+                request.blueprint or "app",
+                request.endpoint or "unmatched",
+                request.method,
+                response.status_code,
+                time.perf_counter() - started,
+            )
+        return response
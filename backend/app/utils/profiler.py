@@ -0,0 +1,251 @@
+"""On-demand request profiling without a redeploy.
+
+An admin enables profiling for one request with the ``X-Profile`` header or a
+``_profile`` query flag plus a matching ``X-Admin-Token``
+(``PROFILER_ADMIN_TOKEN``). ``PROFILER_SAMPLE_EVERY=N`` additionally profiles
+one in every ``N`` requests. Two profilers are available:
+
+- ``cprofile`` (default): deterministic ``cProfile`` saved as ``.pstats`` for
+  ``pstats``/``snakeviz``.
+- ``sample``: a background thread samples the request thread's stack every
+  ``PROFILER_SAMPLE_INTERVAL_MS`` and saves collapsed stacks (``.folded``)
+  that ``flamegraph.pl`` and speedscope render directly; overhead stays flat
+  however many calls the request makes.
+
+Profiles and a JSON sidecar per capture are written to
+``LOGS_DIR/profiles``; only the ``PROFILER_KEEP`` most recent are kept.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import itertools
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from flask import Flask, current_app, g, request
+
+logger = logging.getLogger(__name__)
+
+PROFILER_MODES = ("cprofile", "sample")
+PROFILE_EXTENSIONS = {"cprofile": ".pstats", "sample": ".folded"}
+PROFILER_KEEP = 20
+PROFILER_SAMPLE_INTERVAL_MS = 5
+PROFILE_ID_RE = re.compile(r"^[0-9]{8}T[0-9]{12}-[A-Za-z0-9_.-]+$")
+_TRUTHY = {"1", "true", "yes", "on"}
+
+_REQUEST_COUNTER = itertools.count(1)
+_WRITE_LOCK = threading.Lock()
+
+
+class StackSampler:
+    """Sample one thread's Python stack on an interval into collapsed stacks."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        own_file = __file__
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename != own_file:
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def dump(self, path: Path) -> None:
+        lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        path.write_text("\n".join(lines) + "\n" if lines else "", encoding="utf-8")
+
+
+class _Profile:
+    """A running capture of one request."""
+
+    def __init__(self, mode: str, interval: float) -> None:
+        self.mode = mode
+        self.started = time.perf_counter()
+        if mode == "sample":
+            self.profiler = StackSampler(threading.get_ident(), interval)
+            self.profiler.start()
+        else:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop(self) -> float:
+        if self.mode == "sample":
+            self.profiler.stop()
+        else:
+            self.profiler.disable()
+        return (time.perf_counter() - self.started) * 1000
+
+    def dump(self, path: Path) -> None:
+        if self.mode == "sample":
+            self.profiler.dump(path)
+        else:
+            self.profiler.dump_stats(str(path))
+
+
+def profile_directory(app: Flask | None = None) -> Path:
+    """Return the directory profiles are written to."""
+
+    configured = (app or current_app).config.get("PROFILER_DIR")
+    if configured:
+        return Path(configured)
+    from app.config.paths import DIRECTORIES
+
+    return DIRECTORIES["LOGS_DIR"] / "profiles"
+
+
+def profiler_authorized(admin_token: str | None, app: Flask | None = None) -> bool:
+    """Return whether ``admin_token`` matches ``PROFILER_ADMIN_TOKEN``."""
+
+    configured = str(
+        (app or current_app).config.get("PROFILER_ADMIN_TOKEN") or os.getenv("PROFILER_ADMIN_TOKEN", "")
+    ).strip()
+    provided = (admin_token or "").strip()
+    return bool(configured) and hmac.compare_digest(configured, provided)
+
+
+def _requested_mode(app: Flask) -> str | None:
+    """Return the profiler mode for the current request, or ``None`` to skip it."""
+
+    default_mode = app.config.get("PROFILER_MODE", "cprofile")
+    flag = (request.headers.get("X-Profile") or request.args.get("_profile") or "").strip().lower()
+    if flag:
+        if not profiler_authorized(request.headers.get("X-Admin-Token"), app):
+            logger.warning("Ignoring unauthorized profiling request for %s %s", request.method, request.path)
+            return None
+        if flag in PROFILER_MODES:
+            return flag
+        return default_mode if flag in _TRUTHY else None
+    every = int(app.config.get("PROFILER_SAMPLE_EVERY") or 0)
+    if every > 0 and next(_REQUEST_COUNTER) % every == 0:
+        return default_mode
+    return None
+
+
+def list_profiles(directory: Path) -> list[dict]:
+    """Return capture metadata, newest first."""
+
+    entries = []
+    for sidecar in directory.glob("*.json"):
+        try:
+            entries.append(json.loads(sidecar.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return sorted(entries, key=lambda entry: entry.get("id", ""), reverse=True)
+
+
+def prune_profiles(directory: Path, keep: int) -> int:
+    """Delete all but the ``keep`` most recent captures and return how many were removed."""
+
+    removed = 0
+    for entry in list_profiles(directory)[keep:]:
+        for name in (entry.get("file"), f"{entry.get('id')}.json"):
+            if name:
+                (directory / name).unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def _save_profile(app: Flask, capture: _Profile, duration_ms: float, status: int) -> str:
+    """Write ``capture`` and its sidecar, prune old captures, and return the id."""
+
+    directory = profile_directory(app)
+    directory.mkdir(parents=True, exist_ok=True)
+    endpoint = re.sub(r"[^A-Za-z0-9_.-]", "_", request.endpoint or "unmatched")
+    now = datetime.now(timezone.utc)
+    profile_id = f"{now:%Y%m%dT%H%M%S%f}-{endpoint}"
+    filename = f"{profile_id}{PROFILE_EXTENSIONS[capture.mode]}"
+    capture.dump(directory / filename)
+    meta = {
+        "id": profile_id,
+        "file": filename,
+        "mode": capture.mode,
+        "method": request.method,
+        "path": request.path,
+        "endpoint": request.endpoint,
+        "status": status,
+        "duration_ms": round(duration_ms, 2),
+        "created_at": now.isoformat(),
+    }
+    (directory / f"{profile_id}.json").write_text(json.dumps(meta), encoding="utf-8")
+    with _WRITE_LOCK:
+        prune_profiles(directory, int(app.config.get("PROFILER_KEEP", PROFILER_KEEP)))
+    return profile_id
+
+
+def init_request_profiler(app: Flask) -> None:
+    """Profile flagged or sampled requests on ``app``.
+
+    Config keys (environment variables of the same name are the fallback):
+    ``PROFILER_ADMIN_TOKEN``, ``PROFILER_MODE`` (``cprofile`` or ``sample``),
+    ``PROFILER_SAMPLE_EVERY`` (``0`` disables sampling),
+    ``PROFILER_SAMPLE_INTERVAL_MS``, ``PROFILER_KEEP``, and ``PROFILER_DIR``.
+    """
+
+    for key, default in (
+        ("PROFILER_MODE", "cprofile"),
+        ("PROFILER_SAMPLE_EVERY", "0"),
+        ("PROFILER_SAMPLE_INTERVAL_MS", str(PROFILER_SAMPLE_INTERVAL_MS)),
+        ("PROFILER_KEEP", str(PROFILER_KEEP)),
+    ):
+        app.config.setdefault(key, os.getenv(key, default))
+    if app.config["PROFILER_MODE"] not in PROFILER_MODES:
+        raise ValueError(f"Unsupported PROFILER_MODE: {app.config['PROFILER_MODE']}")
+
+    @app.before_request
+    def _start_profile():
+        mode = _requested_mode(app)
+        if mode is None:
+            return
+        interval = float(app.config["PROFILER_SAMPLE_INTERVAL_MS"]) / 1000
+        try:
+            g._request_profile = _Profile(mode, interval)
+        except ValueError as exc:  # another profiler is already active on this thread
+            logger.warning("Request profiling unavailable: %s", exc)
+
+    @app.after_request
+    def _finish_profile(response):
+        capture = g.pop("_request_profile", None)
+        if capture is None:
+            return response
+        duration_ms = capture.stop()
+        try:
+            profile_id = _save_profile(app, capture, duration_ms, response.status_code)
+        except OSError as exc:
+            logger.error("Failed to save request profile: %s", exc)
+            return response
+        response.headers["X-Profile-Id"] = profile_id
+        logger.info("Profiled %s %s in %.1f ms -> %s", request.method, request.path, duration_ms, profile_id)
+        return response
+
+    @app.teardown_request
+    def _abandon_profile(exc):
+        capture = g.pop("_request_profile", None)
+        if capture is not None:
+            capture.stop()
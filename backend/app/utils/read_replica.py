@@ -0,0 +1,196 @@
+"""Route read-only request traffic to an optional read replica.
+
+When ``SQLALCHEMY_REPLICA_URI`` is set, the replica is registered as the
+``replica`` bind and :func:`init_read_replica` (called by ``create_app``)
+makes :class:`RoutingSession` the session class of ``app.extensions.db``. It
+sends plain ``SELECT`` statements to the replica while a view decorated with
+:func:`read_replica` runs. Everything else stays on the primary:
+
+- flushes, DML and ``SELECT ... FOR UPDATE``, and every statement after them in
+  the same request (the session is pinned to the primary once it writes);
+- raw ``text()`` SQL, which may write;
+- requests from a client that wrote within ``REPLICA_MAX_LAG_SECONDS``: a
+  request that flushes or bumps the data version gets a ``replica_fence``
+  cookie, so the client's next reads hit the primary whichever worker serves
+  them;
+- requests for a user this process wrote to within ``REPLICA_MAX_LAG_SECONDS``
+  (:func:`note_write` is called by ``bump_data_version``), which also covers
+  sync jobs running in the web process.
+
+Writes from other clients in other processes (cron syncs, other workers)
+become visible once the replica applies them. Without a replica every
+statement uses the primary exactly as before.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND = "replica"
+WRITE_FENCE_COOKIE = "replica_fence"
+
+# ``Session.info`` keys
+_ROUTE_KEY = "read_replica"
+_PINNED_KEY = "replica_pinned"
+
+_WRITES_LOCK = threading.Lock()
+_LAST_WRITE_AT: dict[str, float] = {}
+_LAST_GLOBAL_WRITE_AT = 0.0
+
+
+def note_write(user_id: str | None = None) -> None:
+    """Record that ``user_id`` (or, when omitted, every user) was just written to."""
+
+    global _LAST_GLOBAL_WRITE_AT
+    now = time.monotonic()
+    with _WRITES_LOCK:
+        if user_id is None:
+            _LAST_GLOBAL_WRITE_AT = now
+            _LAST_WRITE_AT.clear()
+        else:
+            _LAST_WRITE_AT[str(user_id)] = now
+    _mark_request_write()
+
+
+def _mark_request_write() -> None:
+    """Ask :func:`init_read_replica`'s response hook to set the write-fence cookie."""
+
+    if has_request_context():
+        g.replica_write_at = time.time()
+
+
+def _fenced_by_cookie(max_lag: float) -> bool:
+    """Return ``True`` when this client wrote within ``max_lag`` seconds (any worker)."""
+
+    try:
+        written_at = float(request.cookies.get(WRITE_FENCE_COOKIE, ""))
+    except ValueError:
+        return False
+    return time.time() - written_at < max_lag
+
+
+def seconds_since_write(user_id: str | None = None) -> float:
+    """Return seconds since this process last wrote ``user_id``'s data.
+
+    ``None`` asks about any user. Returns ``inf`` when nothing was written.
+    """
+
+    with _WRITES_LOCK:
+        if user_id is None:
+            last = max(_LAST_WRITE_AT.values(), default=_LAST_GLOBAL_WRITE_AT)
+            last = max(last, _LAST_GLOBAL_WRITE_AT)
+        else:
+            last = max(_LAST_WRITE_AT.get(str(user_id), 0.0), _LAST_GLOBAL_WRITE_AT)
+    return time.monotonic() - last if last else math.inf
+
+
+def replica_configured(app=None) -> bool:
+    """Return ``True`` when the app has a ``replica`` bind."""
+
+    app = app or current_app
+    return REPLICA_BIND in (app.config.get("SQLALCHEMY_BINDS") or {})
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that reads from the replica while a view opts in."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        if not self.info.get(_ROUTE_KEY) or bind is not None:
+            return engine
+        if getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None:
+            self.info[_PINNED_KEY] = True
+            return engine
+        if (
+            self.info.get(_PINNED_KEY)
+            or self._flushing
+            or not getattr(clause, "is_select", False)
+            or self.new
+            or self.deleted
+            or self.dirty
+        ):
+            return engine
+        engines = self._db.engines
+        # Only statements bound to the default database move to the replica.
+        if engine is not engines[None] or REPLICA_BIND not in engines:
+            return engine
+        return engines[REPLICA_BIND]
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _pin_to_primary(session, flush_context, instances):
+    """Keep a session that writes on the primary for the rest of the request."""
+
+    session.info[_PINNED_KEY] = True
+    _mark_request_write()
+
+
+def init_read_replica(app, db) -> None:
+    """Route :func:`read_replica` views of ``app`` to its ``replica`` bind, if one is configured.
+
+    Installs :class:`RoutingSession` as ``db``'s session class and sets the
+    write-fence cookie on responses to requests that wrote.
+    """
+
+    if not replica_configured(app):
+        return
+    db.session.session_factory.class_ = RoutingSession
+    max_lag = float(app.config.get("REPLICA_MAX_LAG_SECONDS", 0))
+
+    @app.after_request
+    def _set_write_fence(response):
+        written_at = g.pop("replica_write_at", None)
+        if written_at is not None and max_lag > 0:
+            response.set_cookie(
+                WRITE_FENCE_COOKIE,
+                f"{written_at:.3f}",
+                max_age=math.ceil(max_lag),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+def read_replica(user_arg: str | None = "user_id"):
+    """Decorate a read-only GET view so its ``SELECT`` statements use the replica.
+
+    Args:
+        user_arg: Query argument naming the user the view reads. When that user
+            (or, if the argument is absent, any user) was written to by this
+            process within ``REPLICA_MAX_LAG_SECONDS``, the request reads from
+            the primary.
+
+    Other methods, apps without a replica, clients holding a fresh write-fence
+    cookie, and requests that write stay on the primary. Place it above
+    :func:`app.utils.http_cache.conditional_get` so the ETag fingerprint is
+    read from the replica too.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in {"GET", "HEAD"} or not replica_configured():
+                return view(*args, **kwargs)
+            user_id = request.args.get(user_arg) if user_arg else None
+            max_lag = float(current_app.config.get("REPLICA_MAX_LAG_SECONDS", 0))
+            if _fenced_by_cookie(max_lag) or seconds_since_write(user_id or None) < max_lag:
+                return view(*args, **kwargs)
+
+            session = current_app.extensions["sqlalchemy"].session()
+            session.info[_ROUTE_KEY] = True
+            try:
+                return view(*args, **kwargs)
+            finally:
+                session.info.pop(_ROUTE_KEY, None)
+                session.info.pop(_PINNED_KEY, None)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,262 @@
+"""Per-request and per-job SQL statement accounting with N+1 detection.
+
+Engine-wide SQLAlchemy ``before/after_cursor_execute`` hooks record every
+statement into the :class:`QueryStats` active for the current context: one per
+Flask request (installed by :func:`init_sql_instrumentation`) or one per CLI
+command, cron job, or test block (:func:`track_queries`). Statements are
+grouped by a literal-free fingerprint, so a helper that issues the same query
+once per row shows up as one fingerprint with a high count and is logged as an
+N+1 suspect. Request totals are returned in ``Server-Timing`` and
+``X-DB-Query-Count`` headers and kept in a bounded history for
+``GET /api/debug/sql``.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+
+from flask import Flask, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SQL_N_PLUS_ONE_THRESHOLD = 5
+SQL_MAX_QUERIES_WARNING = 50
+SQL_STATS_HISTORY = 100
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_POSITIONAL_RE = re.compile(r"%\([^)]+\)s|%s|\$\d+")
+
+_ACTIVE: ContextVar[QueryStats | None] = ContextVar("sql_query_stats", default=None)
+_HISTORY: deque[dict] = deque(maxlen=SQL_STATS_HISTORY)
+_INSTALL_LOCK = threading.Lock()
+_INSTALLED = False
+
+
+def fingerprint(statement: str) -> str:
+    """Return ``statement`` with literals and bind markers replaced by ``?``.
+
+    ``IN`` lists of any length collapse to ``(?+)`` so batched lookups of
+    different sizes share a fingerprint.
+    """
+
+    text = _WHITESPACE_RE.sub(" ", statement).strip()
+    text = _POSITIONAL_RE.sub("?", text)
+    text = _LITERAL_RE.sub("?", text)
+    return _IN_LIST_RE.sub("(?+)", text)
+
+
+@dataclass
+class QueryStats:
+    """Statement counts and timings collected for one request or job."""
+
+    label: str
+    count: int = 0
+    db_ms: float = 0.0
+    by_fingerprint: Counter = field(default_factory=Counter)
+    ms_by_fingerprint: Counter = field(default_factory=Counter)
+    started: float = field(default_factory=time.perf_counter)
+    elapsed_ms: float | None = None
+    parent: QueryStats | None = field(default=None, repr=False)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        key = fingerprint(statement)
+        self.count += 1
+        self.db_ms += elapsed_ms
+        self.by_fingerprint[key] += 1
+        self.ms_by_fingerprint[key] += elapsed_ms
+        if self.parent is not None:
+            self.parent.record(statement, elapsed_ms)
+
+    def finish(self) -> None:
+        if self.elapsed_ms is None:
+            self.elapsed_ms = (time.perf_counter() - self.started) * 1000
+
+    def repeated(self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """Return ``(fingerprint, count)`` pairs run at least ``threshold`` times."""
+
+        return [(key, count) for key, count in self.by_fingerprint.most_common() if count >= threshold]
+
+    def summary(self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD, top: int = 5) -> dict:
+        """Return a JSON-ready summary with the top repeated statements."""
+
+        return {
+            "label": self.label,
+            "queries": self.count,
+            "db_ms": round(self.db_ms, 2),
+            "elapsed_ms": round(self.elapsed_ms, 2) if self.elapsed_ms is not None else None,
+            "distinct_statements": len(self.by_fingerprint),
+            "n_plus_one": [
+                {"statement": key, "count": count, "db_ms": round(self.ms_by_fingerprint[key], 2)}
+                for key, count in self.repeated(threshold)[:top]
+            ],
+        }
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _ACTIVE.get() is not None and context is not None:
+        context._sql_instrumentation_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _ACTIVE.get()
+    started = getattr(context, "_sql_instrumentation_start", None)
+    if stats is not None and started is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def install_listeners() -> None:
+    """Attach the cursor hooks to every SQLAlchemy engine (idempotent)."""
+
+    global _INSTALLED
+    with _INSTALL_LOCK:
+        if _INSTALLED:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _INSTALLED = True
+
+
+def current_query_stats() -> QueryStats | None:
+    """Return the stats collecting statements in this context, if any."""
+
+    return _ACTIVE.get()
+
+
+def recent_query_stats() -> list[dict]:
+    """Return summaries of recently finished requests and jobs, newest first."""
+
+    return list(reversed(_HISTORY))
+
+
+def clear_query_stats() -> None:
+    _HISTORY.clear()
+
+
+def _report(stats: QueryStats, threshold: int, max_queries: int) -> None:
+    """Log N+1 suspects and oversized workloads, then store the summary."""
+
+    stats.finish()
+    for key, count in stats.repeated(threshold):
+        logger.warning(
+            "N+1 suspect in %s: %d executions (%.1f ms) of %s",
+            stats.label,
+            count,
+            stats.ms_by_fingerprint[key],
+            key[:300],
+        )
+    if stats.count > max_queries:
+        logger.warning("%s ran %d SQL statements (%.1f ms)", stats.label, stats.count, stats.db_ms)
+    else:
+        logger.debug("%s ran %d SQL statements (%.1f ms)", stats.label, stats.count, stats.db_ms)
+    _HISTORY.append(stats.summary(threshold))
+
+
+@contextmanager
+def track_queries(
+    label: str,
+    *,
+    n_plus_one_threshold: int = SQL_N_PLUS_ONE_THRESHOLD,
+    max_queries: int = SQL_MAX_QUERIES_WARNING,
+    report: bool = True,
+):
+    """Collect statements run inside the block into a fresh :class:`QueryStats`.
+
+    Usable as a context manager or decorator around CLI commands, cron jobs,
+    and tests. Blocks nest: statements also count toward the enclosing
+    request or job. With ``report=True`` suspects are logged and the summary
+    joins the debug history when the block exits.
+    """
+
+    install_listeners()
+    stats = QueryStats(label, parent=_ACTIVE.get())
+    token = _ACTIVE.set(stats)
+    try:
+        yield stats
+    finally:
+        _ACTIVE.reset(token)
+        stats.finish()
+        if report:
+            _report(stats, n_plus_one_threshold, max_queries)
+
+
+def instrument_cli_commands(app: Flask) -> None:
+    """Wrap each registered ``flask`` CLI command in :func:`track_queries`."""
+
+    for name, command in app.cli.commands.items():
+        callback = command.callback
+        if callback is None or getattr(callback, "_sql_instrumented", False):
+            continue
+
+        def _wrap(callback=callback, label=f"cli:{name}"):
+            @wraps(callback)
+            def wrapper(*args, **kwargs):
+                with track_queries(label):
+                    return callback(*args, **kwargs)
+
+            wrapper._sql_instrumented = True
+            return wrapper
+
+        command.callback = _wrap()
+
+
+def init_sql_instrumentation(app: Flask) -> None:
+    """Record SQL statements per request on ``app``.
+
+    Config keys: ``SQL_INSTRUMENTATION`` (default ``True``),
+    ``SQL_N_PLUS_ONE_THRESHOLD`` (repeats of one statement that count as an
+    N+1 suspect), ``SQL_MAX_QUERIES_WARNING`` (statements per request before a
+    warning), and ``SQL_STATS_HISTORY`` (summaries kept for the debug endpoint).
+    """
+
+    global _HISTORY
+    if not app.config.get("SQL_INSTRUMENTATION", True):
+        return
+    install_listeners()
+    threshold = int(app.config.get("SQL_N_PLUS_ONE_THRESHOLD", SQL_N_PLUS_ONE_THRESHOLD))
+    max_queries = int(app.config.get("SQL_MAX_QUERIES_WARNING", SQL_MAX_QUERIES_WARNING))
+    history_size = int(app.config.get("SQL_STATS_HISTORY", SQL_STATS_HISTORY))
+    if _HISTORY.maxlen != history_size:
+        _HISTORY = deque(_HISTORY, maxlen=history_size)
+
+    @app.before_request
+    def _start_query_stats():
+        # A request served inside a tracked job (e.g. a test client call) also counts toward it.
+        stats = QueryStats(f"{request.method} {request.path}", parent=_ACTIVE.get())
+        g._sql_query_stats = (stats, _ACTIVE.set(stats))
+
+    @app.after_request
+    def _query_stats_headers(response):
+        entry = g.get("_sql_query_stats")
+        if entry is not None:
+            stats = entry[0]
+            stats.finish()
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={stats.db_ms:.1f};desc="{stats.count} queries", app;dur={stats.elapsed_ms:.1f}',
+            )
+            response.headers["X-DB-Query-Count"] = str(stats.count)
+        return response
+
+    @app.teardown_request
+    def _finish_query_stats(exc):
+        entry = g.pop("_sql_query_stats", None)
+        if entry is None:
+            return
+        stats, token = entry
+        try:
+            _ACTIVE.reset(token)
+        except ValueError:  # torn down from a different context
+            _ACTIVE.set(None)
+        _report(stats, threshold, max_queries)
@@ -0,0 +1,377 @@
+"""OpenTelemetry-compatible spans for the sync and refresh pipeline.
+
+Tracing is off unless ``TRACING_EXPORTER`` is ``console`` or ``file`` (JSON
+lines at ``TRACING_FILE``, default ``backend/app/logs/traces.jsonl``); no
+collector is needed. With ``opentelemetry-sdk`` installed spans go through a
+private ``TracerProvider`` and the SDK's own JSON; without it a built-in
+recorder writes the same span shape (``name``, ``context``, ``parent_id``,
+``start_time``, ``end_time``, ``status``, ``attributes``, ``events``).
+
+Per-row stages (rules, category resolution, upserts, ...) would drown a trace
+in tiny spans, so :func:`stage` accumulates their time in the active
+:class:`StageTimer` and one aggregate child span per stage is emitted when the
+traced function returns, carrying ``stage.calls`` for the number of timings.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+from pathlib import Path
+
+from flask import Flask, g, request
+
+try:  # pragma: no cover - optional dependency
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+        SpanExporter,
+        SpanExportResult,
+    )
+except Exception:  # pragma: no cover
+    otel_trace = None  # type: ignore[assignment]
+
+DEFAULT_TRACE_FILE = Path(__file__).resolve().parent.parent / "logs" / "traces.jsonl"
+DEFAULT_SERVICE_NAME = "pynance-backend"
+EXPORTERS = ("console", "file")
+
+_STATE: dict = {"configured": False, "enabled": False, "tracer": None, "provider": None, "writer": None}
+_CONFIG_LOCK = threading.Lock()
+_CURRENT: ContextVar[_Span | None] = ContextVar("tracing_span", default=None)
+_STAGES: ContextVar[StageTimer | None] = ContextVar("tracing_stages", default=None)
+
+
+class _NoopSpan:
+    """Stand-in yielded while tracing is disabled."""
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, attributes):
+        pass
+
+    def add_event(self, name, attributes=None):
+        pass
+
+    def is_recording(self):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _OtelSpan:
+    """Wrap an SDK span so ``None`` attribute values are skipped, as in :class:`_Span`."""
+
+    def __init__(self, wrapped):
+        self._wrapped = wrapped
+
+    def set_attribute(self, key, value):
+        if value is not None:
+            self._wrapped.set_attribute(key, value)
+
+    def set_attributes(self, attributes):
+        self._wrapped.set_attributes(_clean(attributes))
+
+    def add_event(self, name, attributes=None):
+        self._wrapped.add_event(name, _clean(attributes or {}))
+
+    def is_recording(self):
+        return self._wrapped.is_recording()
+
+
+def _iso(ns: int) -> str:
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _clean(attributes: dict) -> dict:
+    """Drop ``None`` values, which OpenTelemetry attributes do not allow."""
+
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+class _Span:
+    """Minimal span recorded when ``opentelemetry-sdk`` is not installed."""
+
+    def __init__(self, name: str, parent: _Span | None, attributes: dict, start_ns: int | None = None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = _clean(attributes)
+        self.events: list[dict] = []
+        self.status = {"status_code": "UNSET"}
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: int | None = None
+
+    def set_attribute(self, key, value):
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes):
+        self.attributes.update(_clean(attributes))
+
+    def add_event(self, name, attributes=None):
+        self.events.append({"name": name, "timestamp": _iso(time.time_ns()), "attributes": _clean(attributes or {})})
+
+    def is_recording(self):
+        return self.end_ns is None
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.add_event("exception", {"exception.type": type(exc).__name__, "exception.message": str(exc)})
+        self.status = {"status_code": "ERROR", "description": f"{type(exc).__name__}: {exc}"}
+
+    def end(self, end_ns: int | None = None) -> None:
+        self.end_ns = end_ns or time.time_ns()
+        writer = _STATE["writer"]
+        if writer is not None:
+            writer(self.to_dict())
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "context": {"trace_id": f"0x{self.trace_id}", "span_id": f"0x{self.span_id}", "trace_state": "[]"},
+            "kind": "SpanKind.INTERNAL",
+            "parent_id": f"0x{self.parent_id}" if self.parent_id else None,
+            "start_time": _iso(self.start_ns),
+            "end_time": _iso(self.end_ns) if self.end_ns else None,
+            "status": self.status,
+            "attributes": self.attributes,
+            "events": self.events,
+            "links": [],
+            "resource": {"attributes": {"service.name": _STATE.get("service_name", DEFAULT_SERVICE_NAME)}},
+        }
+
+
+def _line_writer(stream=None, path: Path | None = None):
+    """Return a thread-safe callable that appends one JSON document per line."""
+
+    lock = threading.Lock()
+
+    def write(document) -> None:
+        line = document if isinstance(document, str) else json.dumps(document, default=str)
+        with lock:
+            if path is None:
+                (stream or sys.stdout).write(line + "\n")
+            else:
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+
+    return write
+
+
+def _otel_file_exporter(path: Path):
+    write = _line_writer(path=path)
+
+    class JsonLinesSpanExporter(SpanExporter):
+        """Append each finished span as one line of the SDK's JSON."""
+
+        def export(self, spans):
+            for finished in spans:
+                write(finished.to_json(indent=None))
+            return SpanExportResult.SUCCESS
+
+        def shutdown(self):
+            pass
+
+    return JsonLinesSpanExporter()
+
+
+def configure_tracing(
+    exporter: str | None = None, path: str | Path | None = None, service_name: str | None = None
+) -> bool:
+    """(Re)configure tracing and return whether it is enabled.
+
+    Arguments default to the ``TRACING_EXPORTER``, ``TRACING_FILE``, and
+    ``TRACING_SERVICE_NAME`` environment variables.
+
+    Raises:
+        ValueError: If the exporter is not ``none``, ``console``, or ``file``.
+    """
+
+    exporter = (exporter if exporter is not None else os.getenv("TRACING_EXPORTER", "none")).strip().lower()
+    if exporter not in (*EXPORTERS, "", "none", "off"):
+        raise ValueError(f"Unsupported TRACING_EXPORTER: {exporter}")
+    with _CONFIG_LOCK:
+        if _STATE["provider"] is not None:
+            _STATE["provider"].shutdown()
+        _STATE.update(configured=True, enabled=False, tracer=None, provider=None, writer=None)
+        if exporter not in EXPORTERS:
+            return False
+
+        service_name = service_name or os.getenv("TRACING_SERVICE_NAME", DEFAULT_SERVICE_NAME)
+        trace_file = None
+        if exporter == "file":
+            trace_file = Path(path or os.getenv("TRACING_FILE") or DEFAULT_TRACE_FILE)
+            trace_file.parent.mkdir(parents=True, exist_ok=True)
+        if otel_trace is not None:
+            provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+            span_exporter = ConsoleSpanExporter() if trace_file is None else _otel_file_exporter(trace_file)
+            provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+            _STATE.update(provider=provider, tracer=provider.get_tracer("app.utils.tracing"))
+        else:
+            _STATE["writer"] = _line_writer(path=trace_file)
+        _STATE.update(enabled=True, service_name=service_name)
+    return True
+
+
+def tracing_enabled() -> bool:
+    if not _STATE["configured"]:
+        configure_tracing()
+    return _STATE["enabled"]
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Run the block inside a child span of the current one.
+
+    Exceptions are recorded on the span and re-raised.
+    """
+
+    if not tracing_enabled():
+        yield NOOP_SPAN
+        return
+    tracer = _STATE["tracer"]
+    if tracer is not None:
+        with tracer.start_as_current_span(name, attributes=_clean(attributes)) as current:
+            yield _OtelSpan(current)
+        return
+
+    current = _Span(name, _CURRENT.get(), attributes)
+    token = _CURRENT.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.record_exception(exc)
+        raise
+    finally:
+        _CURRENT.reset(token)
+        current.end()
+
+
+def current_span():
+    """Return the active span, or a no-op stand-in outside any span."""
+
+    if not _STATE["enabled"]:
+        return NOOP_SPAN
+    if _STATE["tracer"] is not None:
+        return _OtelSpan(otel_trace.get_current_span())
+    return _CURRENT.get() or NOOP_SPAN
+
+
+def record_span(name: str, start_ns: int, end_ns: int, attributes: dict) -> None:
+    """Emit an already-finished child span of the current span."""
+
+    tracer = _STATE["tracer"]
+    if tracer is not None:
+        finished = tracer.start_span(name, start_time=start_ns, attributes=_clean(attributes))
+        finished.end(end_time=end_ns)
+    elif _STATE["enabled"]:
+        _Span(name, _CURRENT.get(), attributes, start_ns=start_ns).end(end_ns)
+
+
+class StageTimer:
+    """Accumulate per-stage durations and emit one aggregate span per stage."""
+
+    def __init__(self) -> None:
+        self._stages: dict[str, list[int]] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        started_wall = time.time_ns()
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            entry = self._stages.setdefault(name, [started_wall, 0, 0])
+            entry[1] += elapsed
+            entry[2] += 1
+
+    def totals_ms(self) -> dict[str, float]:
+        return {name: round(total / 1e6, 3) for name, (_, total, _) in self._stages.items()}
+
+    def emit(self) -> None:
+        for name, (first_start, total, calls) in self._stages.items():
+            record_span(name, first_start, first_start + total, {"stage.calls": calls, "stage.aggregated": True})
+        self._stages.clear()
+
+
+def stage(name: str):
+    """Time the block into the active :class:`StageTimer`, if any."""
+
+    timer = _STAGES.get()
+    if timer is None:
+        return nullcontext()
+    return timer.stage(name)
+
+
+def traced(name: str, *, stages: bool = False):
+    """Decorate a function to run inside ``span(name)``.
+
+    With ``stages=True`` a :class:`StageTimer` collects :func:`stage` blocks
+    run by the function and its callees and emits them as child spans.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracing_enabled():
+                return func(*args, **kwargs)
+            with span(name):
+                if not stages:
+                    return func(*args, **kwargs)
+                timer = StageTimer()
+                token = _STAGES.set(timer)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    _STAGES.reset(token)
+                    timer.emit()
+
+        return wrapper
+
+    return decorator
+
+
+def init_tracing(app: Flask) -> None:
+    """Open a root span per request on ``app`` when tracing is enabled."""
+
+    if not tracing_enabled():
+        return
+
+    @app.before_request
+    def _start_request_span():
+        stack = ExitStack()
+        current = stack.enter_context(span(f"{request.method} {request.path}", **{"http.method": request.method}))
+        g._trace_span = (stack, current)
+
+    @app.after_request
+    def _tag_request_span(response):
+        entry = g.get("_trace_span")
+        if entry is not None:
+            entry[1].set_attributes(
+                {"http.status_code": response.status_code, "http.route": request.endpoint or "unmatched"}
+            )
+        return response
+
+    @app.teardown_request
+    def _end_request_span(exc):
+        entry = g.pop("_trace_span", None)
+        if entry is None:
+            return
+        if exc is None:
+            entry[0].close()
+        else:
+            entry[0].__exit__(type(exc), exc, exc.__traceback__)
@@ -0,0 +1,4 @@
+"""Standalone performance benchmarks for backend hot paths.
+
+Run modules from ``backend/`` with ``python -m benchmarks.<name>``.
+"""
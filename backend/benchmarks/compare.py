@@ -0,0 +1,109 @@
+"""Compare two benchmark JSON result files and flag regressions.
+
+Rows are matched on ``case`` when present, otherwise on their string fields
+(``payload``/``provider`` for ``json_payloads``). A row regresses when the
+chosen metric grew by more than ``--threshold`` (relative) *and* by more than
+``--min-delta-ms``, so sub-millisecond noise never fails a build.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.compare baseline.json current.json [--metric median_ms] [--threshold 0.2]
+
+Exits 1 when any case regressed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+DEFAULT_METRIC = "median_ms"
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA_MS = 2.0
+
+
+def result_key(row: dict) -> str:
+    if "case" in row:
+        return str(row["case"])
+    return "/".join(str(value) for value in row.values() if isinstance(value, str))
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    metric: str = DEFAULT_METRIC,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[dict]:
+    """Return one row per case with both values, the relative change, and a status.
+
+    Status is ``regression``, ``improvement``, ``ok``, ``new`` (only in
+    ``current``), or ``missing`` (only in ``baseline``).
+    """
+
+    before = {result_key(row): row for row in baseline.get("results", [])}
+    after = {result_key(row): row for row in current.get("results", [])}
+    rows = []
+    for key in [*after, *(key for key in before if key not in after)]:
+        old = before.get(key, {}).get(metric)
+        new = after.get(key, {}).get(metric)
+        row = {"case": key, "baseline": old, "current": new, "change": None}
+        if old is None or new is None:
+            row["status"] = "new" if old is None else "missing"
+        else:
+            delta = new - old
+            row["change"] = round(delta / old, 4) if old else None
+            relative = delta / old if old else (float("inf") if delta > 0 else 0.0)
+            if abs(delta) > min_delta_ms and relative > threshold:
+                row["status"] = "regression"
+            elif abs(delta) > min_delta_ms and relative < -threshold:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_comparison(rows: list[dict], metric: str = DEFAULT_METRIC) -> str:
+    width = max([len(row["case"]) for row in rows] + [4])
+    lines = [f"{'case':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}  status ({metric})"]
+    for row in rows:
+        change = f"{row['change']:+.1%}" if row["change"] is not None else "-"
+        baseline = "-" if row["baseline"] is None else f"{row['baseline']:.3f}"
+        current = "-" if row["current"] is None else f"{row['current']:.3f}"
+        lines.append(f"{row['case']:<{width}}  {baseline:>10}  {current:>10}  {change:>8}  {row['status']}")
+    return "\n".join(lines)
+
+
+def add_threshold_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--metric", default=DEFAULT_METRIC, help="Result field to compare.")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative slowdown that counts as a regression."
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS, help="Ignore absolute changes below this."
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="Baseline results JSON (e.g. from the main branch).")
+    parser.add_argument("current", help="Results JSON to check.")
+    add_threshold_arguments(parser)
+    args = parser.parse_args(argv)
+
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    rows = compare_results(baseline, current, args.metric, args.threshold, args.min_delta_ms)
+    print(f"baseline: {baseline.get('commit') or args.baseline}  current: {current.get('commit') or args.current}")
+    print(format_comparison(rows, args.metric))
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+"""Benchmark backend hot paths against a seeded synthetic dataset.
+
+Seeds :mod:`app.services.synthetic_data` into a throwaway database (SQLite in
+a temporary directory unless ``--database-url`` points elsewhere, e.g. a
+scratch PostgreSQL database) and times:
+
+- ``get_transactions`` pagination at shallow, middle, and last-page depths;
+- every ``/api/charts`` endpoint;
+- forecast compute (``POST /api/forecast/compute``);
+- the balance-history rebuild for every account;
+- the internal-transfer scan;
+- a Plaid ``transactions/sync`` ingest against a stubbed client.
+
+Caches are invalidated before every timed call, so each number is a cold
+request. Results carry the commit hash and dataset scale so runs can be
+compared across commits with :mod:`benchmarks.compare`.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.hot_paths [--scale small] [--repeat 5] [--json results.json]
+    python -m benchmarks.hot_paths --json new.json --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+
+from benchmarks.compare import add_threshold_arguments, compare_results, format_comparison
+
+SCALES = {
+    "small": {"users": 2, "accounts_per_user": 3, "months": 12, "transactions": 20_000},
+    "medium": {"users": 10, "accounts_per_user": 4, "months": 24, "transactions": 250_000},
+    "large": {"users": 50, "accounts_per_user": 4, "months": 36, "transactions": 2_000_000},
+}
+PAGE_SIZE = 50
+SYNC_USER = "benchmark-sync-user"
+SYNC_ACCOUNT = "benchmark-sync-account"
+SYNC_PAGE_SIZE = 250
+
+
+class StubPlaidClient:
+    """Serve ``transactions_sync`` pages of generated transactions; no network."""
+
+    def __init__(self, account_id: str, rows: int, run: int, page_size: int = SYNC_PAGE_SIZE) -> None:
+        self.account_id = account_id
+        self.rows = rows
+        self.run = run
+        self.page_size = page_size
+        self.calls = 0
+
+    def transactions_sync(self, request):
+        start = self.calls * self.page_size
+        self.calls += 1
+        end = min(start + self.page_size, self.rows)
+        today = date.today()
+        added = [
+            {
+                "transaction_id": f"bench-sync-{self.run:03d}-{index:07d}",
+                "account_id": self.account_id,
+                "amount": round(4.5 + (index * 7919) % 12000 / 100, 2),
+                "date": (today - timedelta(days=index % 90)).isoformat(),
+                "name": f"MERCHANT {index % 60} PURCHASE",
+                "merchant_name": f"Merchant {index % 60}",
+                "personal_finance_category": {"primary": "FOOD_AND_DRINK", "detailed": "FOOD_AND_DRINK_GROCERIES"},
+                "payment_channel": "in store",
+                "iso_currency_code": "USD",
+                "pending": False,
+            }
+            for index in range(start, end)
+        ]
+        return {
+            "added": added,
+            "modified": [],
+            "removed": [],
+            "next_cursor": f"cursor-{self.run}-{self.calls}",
+            "has_more": end < self.rows,
+        }
+
+
+def _commit_hash() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _timings(fn, repeat: int, before=None) -> tuple[list[float], object]:
+    """Run ``fn`` once to warm up, then ``repeat`` timed runs; ``before`` runs untimed first."""
+
+    if before:
+        before(0)
+    outcome = fn()
+    samples = []
+    for run in range(1, repeat + 1):
+        if before:
+            before(run)
+        started = time.perf_counter()
+        outcome = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, outcome
+
+
+@contextmanager
+def _quiet_logging():
+    """Keep log formatting and file writes out of the timings."""
+
+    logging.disable(logging.WARNING)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def _http_cases(client, end: date, user_id: str, total: int, category_ids: list[int], merchant: str) -> list:
+    start = (end - timedelta(days=90)).isoformat()
+    window = f"start_date={start}&end_date={end.isoformat()}"
+    last_page = max((total + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+    pages = {"page_1": 1, "page_10": 10, "page_mid": max(last_page // 2, 1), "page_last": last_page}
+
+    cases = [
+        (f"transactions.{name}", "get", f"/api/transactions/get_transactions?page={page}&page_size={PAGE_SIZE}")
+        for name, page in pages.items()
+    ]
+    cases += [
+        ("charts.category_breakdown", "get", f"/api/charts/category_breakdown?{window}"),
+        ("charts.category_breakdown_tree", "get", f"/api/charts/category_breakdown_tree?{window}"),
+        ("charts.merchant_breakdown", "get", f"/api/charts/merchant_breakdown?{window}"),
+        ("charts.tag_metrics", "get", f"/api/charts/tag_metrics?{window}"),
+        (
+            "charts.category_transactions",
+            "get",
+            f"/api/charts/category_transactions?category_ids={','.join(map(str, category_ids))}&{window}",
+        ),
+        ("charts.merchant_transactions", "get", f"/api/charts/merchant_transactions?merchant={merchant}&{window}"),
+        ("charts.cash_flow", "get", "/api/charts/cash_flow?granularity=monthly"),
+        ("charts.net_assets", "get", "/api/charts/net_assets"),
+        ("charts.daily_net", "get", f"/api/charts/daily_net?{window}"),
+        ("charts.accounts_snapshot", "get", f"/api/charts/accounts-snapshot?user_id={user_id}"),
+        ("charts.forecast", "get", "/api/charts/forecast?view_type=Month"),
+        ("forecast.compute_365d", "post", "/api/forecast/compute"),
+    ]
+
+    def request(method, url):
+        def call():
+            if method == "post":
+                response = client.post(url, json={"user_id": user_id, "horizon_days": 365})
+            else:
+                response = client.get(url)
+            if response.status_code != 200:
+                raise RuntimeError(f"{url} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+            return None
+
+        return call
+
+    return [(name, request(method, url), None) for name, method, url in cases]
+
+
+def _ensure_sync_account() -> None:
+    from app.extensions import db
+    from app.models import Account, PlaidAccount, Transaction
+    from sqlalchemy import delete
+
+    db.session.execute(delete(Transaction).where(Transaction.user_id == SYNC_USER))
+    if db.session.get(Account, SYNC_ACCOUNT) is None:
+        db.session.add(
+            Account(
+                account_id=SYNC_ACCOUNT,
+                user_id=SYNC_USER,
+                name="Benchmark Sync Checking",
+                type="depository",
+                subtype="checking",
+                link_type="plaid",
+            )
+        )
+        db.session.add(PlaidAccount(account_id=SYNC_ACCOUNT, access_token="access-benchmark", item_id="item-bench"))
+    db.session.commit()
+
+
+def _service_cases(sync_rows: int) -> list:
+    from app.services import plaid_sync
+    from app.services.balance_history import update_all_accounts_balance_history
+    from app.services.internal_transfer_scan import scan_internal_transfers
+
+    _ensure_sync_account()
+    stub = {}
+
+    def new_stub(run):
+        stub["client"] = StubPlaidClient(SYNC_ACCOUNT, sync_rows, run)
+
+    def sync():
+        original = plaid_sync.plaid_client
+        plaid_sync.plaid_client = stub["client"]
+        try:
+            return plaid_sync.sync_account_transactions(SYNC_ACCOUNT)["added"]
+        finally:
+            plaid_sync.plaid_client = original
+
+    return [
+        (
+            "balance_history.rebuild_all",
+            lambda: sum(update_all_accounts_balance_history(force_update=True).values()),
+            None,
+        ),
+        ("transfers.scan", lambda: len(scan_internal_transfers()), None),
+        (f"plaid_sync.ingest_{sync_rows}", sync, new_stub),
+    ]
+
+
+def run(
+    scale: str = "small",
+    repeat: int = 5,
+    database_url: str | None = None,
+    seed: int = 42,
+    sync_rows: int = 1000,
+    only: str | None = None,
+) -> dict:
+    """Seed (if needed) and benchmark every case; return the JSON-ready report."""
+
+    workdir = None
+    if database_url is None:
+        workdir = tempfile.mkdtemp(prefix="hot_paths-")
+        database_url = f"sqlite:///{os.path.join(workdir, 'hot_paths.db')}"
+    os.environ["SQLALCHEMY_DATABASE_URI"] = database_url
+
+    from app import create_app
+    from app.extensions import db
+    from app.models import Transaction
+    from app.services.synthetic_data import generate_synthetic_dataset, synthetic_data_present, synthetic_user_id
+    from app.sql.data_version import bump_data_version
+    from sqlalchemy import func
+
+    app = create_app()
+    report = {
+        "benchmark": "hot_paths",
+        "commit": _commit_hash(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "repeat": repeat,
+        "scale": {"name": scale, **SCALES[scale]},
+        "results": [],
+    }
+    with app.app_context(), _quiet_logging():
+        db.create_all()
+        report["database"] = db.engine.dialect.name
+        if synthetic_data_present():
+            report["seed_seconds"] = None
+        else:
+            started = time.perf_counter()
+            report["dataset"] = generate_synthetic_dataset(seed=seed, **SCALES[scale])
+            report["seed_seconds"] = round(time.perf_counter() - started, 2)
+
+        user_id = synthetic_user_id(1)
+        total = db.session.query(func.count(Transaction.id)).scalar()
+        end = db.session.query(func.max(Transaction.date)).scalar()
+        top_categories = (
+            db.session.query(Transaction.category_id)
+            .filter(Transaction.amount < 0)
+            .group_by(Transaction.category_id)
+            .order_by(func.count().desc())
+            .limit(3)
+            .all()
+        )
+        merchant = (
+            db.session.query(Transaction.merchant_name)
+            .group_by(Transaction.merchant_name)
+            .order_by(func.count().desc())
+            .limit(1)
+            .scalar()
+        )
+        cases = _http_cases(app.test_client(), end, user_id, total, [row[0] for row in top_categories], merchant)
+        cases += _service_cases(sync_rows)
+
+        for name, fn, before in cases:
+            if only and only not in name:
+                continue
+
+            def cold(run, before=before):
+                bump_data_version()
+                if before:
+                    before(run)
+
+            samples, outcome = _timings(fn, repeat, cold)
+            row = {
+                "case": name,
+                "best_ms": round(min(samples), 3),
+                "median_ms": round(statistics.median(samples), 3),
+            }
+            if isinstance(outcome, int):
+                row["rows"] = outcome
+            report["results"].append(row)
+        db.session.remove()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="Synthetic dataset size.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case after one warm-up.")
+    parser.add_argument("--database-url", help="Database to seed and query (default: temporary SQLite file).")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed.")
+    parser.add_argument("--sync-rows", type=int, default=1000, help="Transactions served by the stubbed sync.")
+    parser.add_argument("--only", help="Only run cases whose name contains this text.")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file.")
+    parser.add_argument("--compare", dest="baseline_path", help="Baseline JSON to compare against.")
+    add_threshold_arguments(parser)
+    args = parser.parse_args(argv)
+
+    report = run(args.scale, args.repeat, args.database_url, args.seed, args.sync_rows, args.only)
+    print(f"commit: {report['commit']}  database: {report['database']}  scale: {args.scale}")
+    print(f"{'case':<36}  {'best ms':>10}  {'median ms':>10}  {'rows':>8}")
+    for row in report["results"]:
+        print(f"{row['case']:<36}  {row['best_ms']:>10.3f}  {row['median_ms']:>10.3f}  {row.get('rows', ''):>8}")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.baseline_path:
+        with open(args.baseline_path, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        rows = compare_results(baseline, report, args.metric, args.threshold, args.min_delta_ms)
+        print(format_comparison(rows, args.metric))
+        return 1 if any(row["status"] == "regression" for row in rows) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
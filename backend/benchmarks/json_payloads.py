@@ -0,0 +1,193 @@
+"""Benchmark JSON serialization and compression of the largest API payloads.
+
+Compares Flask's default provider on today's pre-converted payloads with
+:class:`app.utils.json_provider.FastJSONProvider` on both pre-converted and
+raw (``Decimal``/``date``) payloads, and reports bytes on the wire for each
+negotiated content encoding.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.json_payloads [--repeat 50] [--json results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from app.utils.compression import available_encodings, compress_body  # noqa: E402
+from app.utils.json_provider import FastJSONProvider, orjson  # noqa: E402
+from forecast.engine import compute_forecast  # noqa: E402
+
+ACCOUNTS = [
+    ("acc-checking", "Everyday Checking", "First Bank", "checking"),
+    ("acc-savings", "High Yield Savings", "First Bank", "savings"),
+    ("acc-card", "Rewards Card", "Card Co", "credit card"),
+]
+
+
+def transaction_page(rows: int = 500, raw: bool = False, seed: int = 7) -> dict:
+    """Return a ``get_transactions`` response page shaped like ``serialize_transaction_row``."""
+
+    rng = random.Random(seed)
+    start = date(2026, 1, 1)
+    items = []
+    for index in range(rows):
+        account_id, name, institution, subtype = ACCOUNTS[index % len(ACCOUNTS)]
+        amount = Decimal(rng.randint(-25000, 5000)) / 100
+        txn_date = start + timedelta(days=index // 5)
+        items.append(
+            {
+                "transaction_id": f"txn-{index:06d}",
+                "date": txn_date if raw else txn_date.isoformat(),
+                "amount": amount if raw else float(amount),
+                "description": f"Merchant {index % 40} purchase",
+                "category": "Food and Drink",
+                "category_slug": "food-and-drink",
+                "category_display": "Food and Drink - Coffee",
+                "category_id": index % 12,
+                "category_icon_url": "https://plaid-category-icons.plaid.com/PFC_FOOD_AND_DRINK.png",
+                "merchant_name": f"Merchant {index % 40}",
+                "user_id": "user-1",
+                "account_name": name,
+                "institution_name": institution,
+                "subtype": subtype,
+                "account_id": account_id,
+                "pending": False,
+                "transfer_type": None,
+                "internal_transfer_flag": False,
+                "isEditing": False,
+                "tags": ["#untagged"],
+                "running_balance": None,
+            }
+        )
+    return {"status": "success", "data": {"transactions": items, "total": rows * 20}}
+
+
+def forecast_payload(horizon_days: int = 365) -> dict:
+    """Return a full ``compute_forecast`` payload."""
+
+    history = [
+        {"date": (date(2026, 1, 1) + timedelta(days=day)).isoformat(), "inflow": 140.0, "outflow": 95.5}
+        for day in range(180)
+    ]
+    return compute_forecast(
+        user_id=1,
+        start_date=date(2026, 7, 1),
+        horizon_days=horizon_days,
+        latest_snapshots=[{"account_id": account_id, "balance": 2500.0} for account_id, *_ in ACCOUNTS],
+        historical_aggregates=history,
+    )
+
+
+def category_tree(parents: int = 16, children: int = 12, raw: bool = False) -> dict:
+    """Return a ``category_breakdown_tree`` response with nested detail rows."""
+
+    generated = datetime(2026, 7, 1, tzinfo=timezone.utc)
+    data = []
+    for parent in range(parents):
+        detail = []
+        for child in range(children):
+            amount = Decimal(parent * 1000 + child * 37) / 100
+            detail.append(
+                {
+                    "id": f"cat-{parent}-{child}",
+                    "label": f"Detail {parent}.{child}",
+                    "amount": amount if raw else float(amount),
+                    "category_ids": list(range(child, child + 4)),
+                }
+            )
+        data.append(
+            {
+                "id": f"cat-{parent}",
+                "label": f"Category {parent}",
+                "amount": sum(item["amount"] for item in detail),
+                "children": detail,
+            }
+        )
+    return {"status": "success", "data": data, "generated_at": generated if raw else generated.isoformat()}
+
+
+def _time_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def _encoder(provider, obj):
+    """Return a zero-argument callable producing the response body bytes."""
+
+    if isinstance(provider, FastJSONProvider):
+        return lambda: provider.dumps_bytes(obj)
+    # Mirrors ``DefaultJSONProvider.response`` outside debug mode.
+    return lambda: provider.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def run(repeat: int = 30) -> list[dict]:
+    """Benchmark each payload and return one result dict per payload/provider."""
+
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    fast_provider = FastJSONProvider(app)
+    payloads = {
+        "transactions_page_500": (transaction_page(), transaction_page(raw=True)),
+        "forecast_365d": (forecast_payload(),) * 2,
+        "category_tree": (category_tree(), category_tree(raw=True)),
+    }
+    cases = [
+        ("flask_default", default_provider, 0),
+        ("fast_preconverted", fast_provider, 0),
+        ("fast_raw", fast_provider, 1),
+    ]
+    results = []
+    for name, variants in payloads.items():
+        for label, provider, variant in cases:
+            encode = _encoder(provider, variants[variant])
+            body = encode()
+            row = {
+                "payload": name,
+                "provider": label,
+                "serialize_ms": round(_time_ms(encode, repeat), 3),
+                "bytes_identity": len(body),
+            }
+            for encoding in available_encodings():
+                row[f"bytes_{encoding}"] = len(compress_body(body, encoding))
+                row[f"{encoding}_ms"] = round(_time_ms(lambda: compress_body(body, encoding), max(repeat // 5, 1)), 3)
+            results.append(row)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30, help="Timing repetitions per case (best run is kept).")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = run(repeat=args.repeat)
+    print(f"encoder: {'orjson ' + orjson.__version__ if orjson else 'json (stdlib)'}")
+    columns = list(results[0])
+    print("  ".join(f"{column:>22}" for column in columns))
+    for row in results:
+        print("  ".join(f"{str(row[column]):>22}" for column in columns))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump({"benchmark": "json_payloads", "results": results}, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Benchmark what logging costs the thread that logs.
+
+A hot loop logs ``--records`` INFO records from one call site, each with a
+small list payload, through four handler set-ups built from
+:mod:`app.config.log_setup`:
+
+- ``direct`` -- a ``RotatingFileHandler`` on the logging thread (the old set-up);
+- ``queued`` -- :class:`~app.config.log_setup.AppQueueHandler` feeding a
+  ``QueueListener`` that owns the same file handler;
+- ``queued_json`` -- as ``queued`` with :class:`~app.config.log_setup.JsonFormatter`;
+- ``queued_rate_limited`` -- as ``queued`` with the default
+  :class:`~app.config.log_setup.RateLimitFilter`.
+
+``caller_us`` is the mean time per call on the logging thread. ``drain_ms``
+is how long the listener then needed to write the backlog, and ``written``
+counts the lines that reached the file.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.logging_overhead [--records 20000] [--json results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+from logging.handlers import QueueListener, RotatingFileHandler
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from app.config.log_setup import (  # noqa: E402
+    TEXT_FORMAT,
+    AppQueueHandler,
+    JsonFormatter,
+    RateLimitFilter,
+)
+
+CASES = ("direct", "queued", "queued_json", "queued_rate_limited")
+
+
+def run_case(name: str, records: int = 20000) -> dict:
+    """Log ``records`` records through the ``name`` set-up and time both sides."""
+
+    payload = [{"category": f"Category {index}", "amount": index * 1.25} for index in range(20)]
+    with tempfile.TemporaryDirectory(prefix="logbench-") as workdir:
+        path = os.path.join(workdir, "app.log")
+        file_handler = RotatingFileHandler(path, maxBytes=512 * 1024 * 1024, encoding="utf-8")
+        file_handler.setFormatter(JsonFormatter() if name == "queued_json" else logging.Formatter(TEXT_FORMAT))
+
+        bench_logger = logging.getLogger(f"benchmarks.logging_overhead.{name}")
+        bench_logger.propagate = False
+        bench_logger.setLevel(logging.INFO)
+        listener = None
+        if name == "direct":
+            handler = file_handler
+        else:
+            handler = AppQueueHandler(queue.SimpleQueue())
+            if name == "queued_rate_limited":
+                handler.addFilter(RateLimitFilter())
+            listener = QueueListener(handler.queue, file_handler)
+            listener.start()
+        bench_logger.addHandler(handler)
+
+        started = time.perf_counter()
+        for index in range(records):
+            bench_logger.info("Processed record %d: %s", index, payload)
+        caller_s = time.perf_counter() - started
+
+        drain_started = time.perf_counter()
+        if listener is not None:
+            listener.stop()
+        drain_s = time.perf_counter() - drain_started
+
+        bench_logger.removeHandler(handler)
+        file_handler.close()
+        with open(path, encoding="utf-8") as handle:
+            written = sum(1 for _ in handle)
+    return {
+        "case": name,
+        "records": records,
+        "caller_us": round(caller_s / records * 1e6, 3),
+        "caller_ms": round(caller_s * 1000, 3),
+        "drain_ms": round(drain_s * 1000, 3),
+        "written": written,
+    }
+
+
+def run(records: int = 20000) -> list[dict]:
+    """Run every case and return one result dict per case."""
+
+    return [run_case(name, records) for name in CASES]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000, help="Records logged per case.")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = run(args.records)
+    columns = list(results[0])
+    print("  ".join(f"{column:>20}" for column in columns))
+    for row in results:
+        print("  ".join(f"{str(row[column]):>20}" for column in columns))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump({"benchmark": "logging_overhead", "results": results}, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
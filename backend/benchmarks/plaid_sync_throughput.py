@@ -0,0 +1,327 @@
+"""Measure Plaid ingest throughput against the offline stand-in client.
+
+Links items generated by :mod:`app.services.plaid_standin` into a throwaway
+database (SQLite in a temporary directory unless ``--database-url`` names a
+scratch database) and drives the ingest entry points end to end:
+
+- ``sync.initial`` -- ``plaid_sync.sync_account_transactions`` from an empty cursor;
+- ``webhook.sync_updates`` -- signed ``SYNC_UPDATES_AVAILABLE`` webhooks posted
+  to ``/api/webhooks/plaid`` after new, modified and removed activity;
+- ``refresh.transactions_get`` -- ``get_accounts`` plus
+  ``refresh_data_for_plaid_account`` for every linked account, the way the
+  accounts refresh route does.
+
+Each case gets its own items and reports rows per second, SQL statements per
+row (counted with :func:`app.utils.sql_instrumentation.track_queries`),
+stand-in calls, rows served and injected errors. ``--latency-ms``,
+``--page-size`` and ``--error-rate`` shape the simulated Plaid side; time
+spent inside the stand-in (latency included) is reported as ``plaid_ms`` so
+database-side changes stay visible. Transient errors go through the app's
+real retry backoff.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.plaid_sync_throughput [--items 2] [--transactions 2000] [--json results.json]
+    python -m benchmarks.plaid_sync_throughput --latency-ms 150 --error-rate 0.05
+    python -m benchmarks.plaid_sync_throughput --json new.json --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.compare import add_threshold_arguments, compare_results, format_comparison
+from benchmarks.hot_paths import _commit_hash, _quiet_logging
+
+STANDIN_USER = "benchmark-standin-user"
+WEBHOOK_SECRET = "offline-standin-webhook-secret"
+CASES = ("sync.initial", "webhook.sync_updates", "refresh.transactions_get")
+
+
+def _signed_webhook(client, payload: dict, secret: str):
+    body = json.dumps(payload)
+    timestamp = str(int(time.time()))
+    signature = hmac.new(secret.encode("utf-8"), f"{timestamp}.{body}".encode("utf-8"), hashlib.sha256).hexdigest()
+    return client.post(
+        "/api/webhooks/plaid",
+        data=body,
+        content_type="application/json",
+        headers={"Plaid-Signature": f"t={timestamp},v1={signature}"},
+    )
+
+
+@contextmanager
+def _quiet_standin(standin):
+    """Install ``standin`` without latency or faults for untimed setup work."""
+
+    from app.services.plaid_standin import use_plaid_standin
+
+    saved = (standin.latency, standin.jitter, standin.error_rate)
+    standin.latency = standin.jitter = standin.error_rate = 0.0
+    try:
+        with use_plaid_standin(standin):
+            yield standin
+    finally:
+        standin.latency, standin.jitter, standin.error_rate = saved
+
+
+def _measure(name: str, standin, fn) -> dict:
+    """Run ``fn`` (returning rows ingested and failed calls) and summarize throughput and SQL cost."""
+
+    from app.services.plaid_standin import use_plaid_standin
+    from app.utils.sql_instrumentation import track_queries
+
+    calls, served, errors = sum(standin.calls.values()), sum(standin.rows.values()), sum(standin.errors.values())
+    busy = standin.busy_seconds
+    with use_plaid_standin(standin), track_queries(name, report=False) as stats:
+        started = time.perf_counter()
+        rows, failures = fn()
+        seconds = time.perf_counter() - started
+    return {
+        "case": name,
+        "rows": rows,
+        "elapsed_ms": round(seconds * 1000, 3),
+        "ms_per_row": round(seconds * 1000 / rows, 4) if rows else None,
+        "rows_per_sec": round(rows / seconds, 1) if seconds else None,
+        "queries": stats.count,
+        "queries_per_row": round(stats.count / rows, 2) if rows else None,
+        "db_ms": round(stats.db_ms, 3),
+        "plaid_ms": round((standin.busy_seconds - busy) * 1000, 3),
+        "plaid_calls": sum(standin.calls.values()) - calls,
+        "rows_served": sum(standin.rows.values()) - served,
+        "plaid_errors": sum(standin.errors.values()) - errors,
+        "failures": failures,
+    }
+
+
+def _link_items(standin, count: int, accounts: int, transactions: int) -> list:
+    from app.extensions import db
+    from app.services.plaid_standin import link_standin_item
+
+    items = [standin.add_item(accounts=accounts, transactions=transactions) for _ in range(count)]
+    for item in items:
+        link_standin_item(standin, item, STANDIN_USER)
+    db.session.commit()
+    return items
+
+
+def run(
+    items: int = 2,
+    accounts_per_item: int = 3,
+    transactions: int = 2000,
+    updates: int = 200,
+    page_size: int = 250,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    database_url: str | None = None,
+    seed: int = 42,
+    only: str | None = None,
+) -> dict:
+    """Link stand-in items, drive each ingest path once and return the JSON-ready report."""
+
+    workdir = None
+    if database_url is None:
+        workdir = tempfile.mkdtemp(prefix="plaid_sync_throughput-")
+        database_url = f"sqlite:///{os.path.join(workdir, 'plaid_sync.db')}"
+    os.environ["SQLALCHEMY_DATABASE_URI"] = database_url
+    os.environ.setdefault("PLAID_WEBHOOK_SECRET", WEBHOOK_SECRET)
+
+    from app import create_app
+    from app.extensions import db
+    from app.helpers.plaid_helpers import get_accounts
+    from app.models import Account, PlaidItem
+    from app.routes import plaid_webhook
+    from app.services import plaid_sync
+    from app.services.plaid_standin import PlaidStandIn
+    from app.sql.account_logic import refresh_data_for_plaid_account
+
+    app = create_app()
+    standin = PlaidStandIn(
+        seed=seed,
+        page_size=page_size,
+        latency=latency_ms / 1000,
+        jitter=jitter_ms / 1000,
+        error_rate=error_rate,
+    )
+    report = {
+        "benchmark": "plaid_sync_throughput",
+        "commit": _commit_hash(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "items": items,
+            "accounts_per_item": accounts_per_item,
+            "transactions_per_item": transactions,
+            "updates_per_item": updates,
+            "page_size": page_size,
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "error_rate": error_rate,
+            "seed": seed,
+        },
+        "results": [],
+    }
+    with app.app_context(), _quiet_logging():
+        db.create_all()
+        report["database"] = db.engine.dialect.name
+        if PlaidItem.query.filter(PlaidItem.item_id.like("standin-item-%")).first() is not None:
+            raise SystemExit("Stand-in items already exist in this database; point --database-url at a scratch one.")
+
+        def initial_sync():
+            linked = _link_items(standin, items, accounts_per_item, transactions)
+
+            def body():
+                rows = failures = 0
+                for item in linked:
+                    try:
+                        result = plaid_sync.sync_account_transactions(item.accounts[0]["account_id"])
+                    except Exception:
+                        failures += 1
+                        continue
+                    rows += result["added"] + result["modified"] + result["removed"]
+                return rows, failures
+
+            return body
+
+        def webhook_updates():
+            linked = _link_items(standin, items, accounts_per_item, transactions)
+            with _quiet_standin(standin):
+                for item in linked:
+                    plaid_sync.sync_account_transactions(item.accounts[0]["account_id"])
+            changes = [
+                standin.simulate_updates(item.item_id, added=updates, modified=updates // 4, removed=updates // 10)
+                for item in linked
+            ]
+            client = app.test_client()
+
+            def body():
+                failures = 0
+                for item in linked:
+                    response = _signed_webhook(
+                        client, standin.webhook_payload(item.item_id), plaid_webhook.PLAID_WEBHOOK_SECRET
+                    )
+                    if response.status_code != 200:
+                        raise RuntimeError(
+                            f"webhook returned {response.status_code}: {response.get_data(as_text=True)}"
+                        )
+                    failures += len(item.accounts) - len(response.get_json().get("triggered", []))
+                return sum(sum(counts.values()) for counts in changes), failures
+
+            return body
+
+        def refresh_transactions_get():
+            linked = _link_items(standin, items, accounts_per_item, transactions)
+            end = standin.end_date
+            start = end - timedelta(days=365)
+
+            def body():
+                rows = failures = 0
+                for item in linked:
+                    per_account = Counter(row["account_id"] for row in item.transactions.values())
+                    try:
+                        accounts_data = get_accounts(item.access_token, STANDIN_USER)
+                    except Exception:
+                        accounts_data = None
+                    if accounts_data is None:
+                        failures += len(item.accounts)
+                        continue
+                    accounts_data = [acct.to_dict() for acct in accounts_data]
+                    for acct in item.accounts:
+                        account = Account.query.filter_by(account_id=acct["account_id"]).first()
+                        _, error = refresh_data_for_plaid_account(
+                            item.access_token, account, accounts_data=accounts_data, start_date=start, end_date=end
+                        )
+                        if error:
+                            failures += 1
+                        else:
+                            rows += per_account[acct["account_id"]]
+                return rows, failures
+
+            return body
+
+        setups = {
+            "sync.initial": initial_sync,
+            "webhook.sync_updates": webhook_updates,
+            "refresh.transactions_get": refresh_transactions_get,
+        }
+        for name in CASES:
+            if only and only not in name:
+                continue
+            report["results"].append(_measure(name, standin, setups[name]()))
+        db.session.remove()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2, help="Stand-in items linked per case.")
+    parser.add_argument("--accounts-per-item", type=int, default=3)
+    parser.add_argument("--transactions", type=int, default=2000, help="Generated history per item.")
+    parser.add_argument("--updates", type=int, default=200, help="New transactions per item before the webhook.")
+    parser.add_argument("--page-size", type=int, default=250, help="transactions_sync page size.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated Plaid latency per call.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random latency per call.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a transient Plaid error.")
+    parser.add_argument("--database-url", help="Scratch database (default: temporary SQLite file).")
+    parser.add_argument("--seed", type=int, default=42, help="Stand-in dataset seed.")
+    parser.add_argument("--only", help="Only run cases whose name contains this text.")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file.")
+    parser.add_argument("--compare", dest="baseline_path", help="Baseline JSON to compare against.")
+    add_threshold_arguments(parser)
+    parser.set_defaults(metric="ms_per_row", min_delta_ms=0.1)
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.items,
+        args.accounts_per_item,
+        args.transactions,
+        args.updates,
+        args.page_size,
+        args.latency_ms,
+        args.jitter_ms,
+        args.error_rate,
+        args.database_url,
+        args.seed,
+        args.only,
+    )
+    print(f"commit: {report['commit']}  database: {report['database']}")
+    columns = (
+        "rows",
+        "rows_per_sec",
+        "queries_per_row",
+        "db_ms",
+        "plaid_ms",
+        "plaid_calls",
+        "plaid_errors",
+        "failures",
+    )
+    print(f"{'case':<26}" + "".join(f"  {column:>{len(column)}}" for column in columns))
+    for row in report["results"]:
+        print(
+            f"{row['case']:<26}"
+            + "".join(f"  {row[column] if row[column] is not None else '-':>{len(column)}}" for column in columns)
+        )
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.baseline_path:
+        with open(args.baseline_path, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        rows = compare_results(baseline, report, args.metric, args.threshold, args.min_delta_ms)
+        print(format_comparison(rows, args.metric))
+        return 1 if any(row["status"] == "regression" for row in rows) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Measure application start-up time and the heavy modules it imports.
+
+Each case runs in a fresh interpreter under ``python -X importtime`` so module
+caches never carry over between runs:
+
+- ``create_app`` -- ``from app import create_app; create_app()``, a web worker boot;
+- ``create_app.no_routes`` -- ``create_app(register_routes=False)``, what the
+  cron entry points build before opening an app context.
+
+For every case the report gives the median wall time across ``--repeat`` runs
+(measured inside the child, interpreter start-up excluded, and written to a
+marker file so app log lines on stdout cannot garble it), the cumulative
+import time, the top-level packages that spent the most time importing, and
+which :data:`HEAVY_MODULES` were loaded. Heavy modules belong behind lazy
+imports at first use; ``--check`` exits 1 when a case imports one or runs past
+:data:`BUDGET_MS`.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.startup [--repeat 5] [--json results.json]
+    python -m benchmarks.startup --check
+    python -m benchmarks.startup --json new.json --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.compare import add_threshold_arguments, compare_results, format_comparison
+from benchmarks.hot_paths import _commit_hash
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+CASES = {
+    "create_app": "create_app()",
+    "create_app.no_routes": "create_app(register_routes=False)",
+}
+
+# Packages that must not load while the app starts; each is imported where it
+# is first used instead.
+HEAVY_MODULES = (
+    "alembic",
+    "numpy",
+    "pandas",
+    "pdfplumber",
+    "plaid",
+    "pyarrow",
+    "requests",
+    "sklearn",
+    "statsmodels",
+)
+
+# Generous per-case ceiling on the in-process wall time, in milliseconds.
+BUDGET_MS = 2500.0
+
+# The timing goes to the file named by ``sys.argv[1]``; stdout carries app log lines.
+_CHILD = """\
+import sys, time
+started = time.perf_counter()
+from app import create_app
+{call}
+elapsed_ms = (time.perf_counter() - started) * 1000
+with open(sys.argv[1], "w", encoding="utf-8") as handle:
+    handle.write("%.3f" % elapsed_ms)
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Return ``(module, self_us, cumulative_us, depth)`` rows from ``-X importtime`` output."""
+
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # column header
+        module = name.rstrip()
+        depth = (len(module) - len(module.lstrip(" ")) - 1) // 2
+        rows.append((module.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def _child_env(database_url: str | None, workdir: str) -> dict:
+    env = dict(os.environ)
+    env["SQLALCHEMY_DATABASE_URI"] = database_url or f"sqlite:///{os.path.join(workdir, 'startup.db')}"
+    env["LOGS_DIR"] = os.path.join(workdir, "logs")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(BACKEND_DIR), env.get("PYTHONPATH")]))
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def run_case(name: str, repeat: int = 3, database_url: str | None = None, top: int = 10) -> dict:
+    """Start the app ``repeat`` times for case ``name`` and summarize the runs."""
+
+    code = _CHILD.format(call=CASES[name])
+    timings, imports = [], []
+    with tempfile.TemporaryDirectory(prefix="startup-") as workdir:
+        env = _child_env(database_url, workdir)
+        marker = Path(workdir) / "elapsed_ms"
+        for _ in range(repeat):
+            marker.unlink(missing_ok=True)
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", code, str(marker)],
+                cwd=BACKEND_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode != 0 or not marker.exists():
+                raise RuntimeError(f"{name} failed to start (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+            timings.append(float(marker.read_text(encoding="utf-8")))
+            imports = parse_importtime(proc.stderr)
+
+    modules = {module for module, *_ in imports}
+    by_package = Counter()
+    for module, self_us, _, _ in imports:
+        by_package[module.split(".", 1)[0]] += self_us
+    return {
+        "case": name,
+        "runs": repeat,
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "import_ms": round(sum(cumulative for _, _, cumulative, depth in imports if depth == 0) / 1000, 3),
+        "modules": len(modules),
+        "heavy_modules": sorted(name for name in HEAVY_MODULES if name in modules),
+        "top_packages": [[package, round(us / 1000, 3)] for package, us in by_package.most_common(top)],
+    }
+
+
+def budget_violations(row: dict, budget_ms: float = BUDGET_MS) -> list[str]:
+    """Return human-readable reasons ``row`` breaks the start-up budget."""
+
+    problems = [f"imports {module}" for module in row["heavy_modules"]]
+    if row["median_ms"] > budget_ms:
+        problems.append(f"median {row['median_ms']:.0f} ms exceeds {budget_ms:.0f} ms")
+    return problems
+
+
+def run(repeat: int = 3, database_url: str | None = None, only: str | None = None) -> dict:
+    """Run every start-up case and return the JSON-ready report."""
+
+    return {
+        "benchmark": "startup",
+        "commit": _commit_hash(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "budget_ms": BUDGET_MS,
+        "results": [run_case(name, repeat, database_url) for name in CASES if not only or only in name],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters started per case.")
+    parser.add_argument("--database-url", help="Database URL for the child processes (default: temporary SQLite).")
+    parser.add_argument("--only", help="Only run cases whose name contains this text.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when a case breaks the start-up budget.")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file.")
+    parser.add_argument("--compare", dest="baseline_path", help="Baseline JSON to compare against.")
+    add_threshold_arguments(parser)
+    parser.set_defaults(min_delta_ms=25.0)
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat, args.database_url, args.only)
+    print(f"commit: {report['commit']}  python: {report['python']}  budget: {BUDGET_MS:.0f} ms")
+    failed = False
+    for row in report["results"]:
+        print(
+            f"{row['case']:<22}  median {row['median_ms']:>8.1f} ms  imports {row['import_ms']:>8.1f} ms"
+            f"  modules {row['modules']:>5}"
+        )
+        top = ", ".join(f"{package} {ms:.0f}" for package, ms in row["top_packages"])
+        print(f"  top packages (self ms): {top}")
+        problems = budget_violations(row)
+        if problems:
+            print(f"  over budget: {'; '.join(problems)}")
+            failed = True
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    status = 1 if args.check and failed else 0
+    if args.baseline_path:
+        with open(args.baseline_path, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        rows = compare_results(baseline, report, args.metric, args.threshold, args.min_delta_ms)
+        print(format_comparison(rows, args.metric))
+        if any(row["status"] == "regression" for row in rows):
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,15 +3,17 @@
 from app import create_app
 from app.config import logger
 from app.services.balance_history import update_all_accounts_balance_history
+from app.utils.sql_instrumentation import track_queries
 
 
 def main():
     """Trigger balance history refresh for all accounts."""
     logger.info("[CRON] 🧮 Starting scheduled balance history update...")
-    app = create_app()
+    app = create_app(register_routes=False)
     with app.app_context():
         try:
-            update_all_accounts_balance_history(days=365, force_update=False)
+            with track_queries("cron:balance_history"):
+                update_all_accounts_balance_history(days=365, force_update=False)
             logger.info("[CRON] ✅ Balance history update completed successfully.")
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("[CRON] ❌ Balance history update failed: %s", e, exc_info=True)
@@ -1,17 +1,22 @@
 """CLI entrypoint for running the scheduled account sync."""
 
+from app import create_app
 from app.config import logger
 from app.helpers.account_refresh_dispatcher import refresh_all_accounts
+from app.utils.sql_instrumentation import track_queries
 
 
 def main():
     """Trigger a refresh of all accounts for scheduled runs."""
     logger.info("[CRON] 🔄 Starting scheduled account sync...")
-    try:
-        refresh_all_accounts()
-        logger.info("[CRON] ✅ Account sync completed successfully.")
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        logger.error("[CRON] ❌ Sync failed: %s", e, exc_info=True)
+    app = create_app(register_routes=False)
+    with app.app_context():
+        try:
+            with track_queries("cron:sync"):
+                refresh_all_accounts()
+            logger.info("[CRON] ✅ Account sync completed successfully.")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("[CRON] ❌ Sync failed: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
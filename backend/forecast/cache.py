@@ -0,0 +1,100 @@
+"""Bounded LRU + TTL cache for computed forecast payloads.
+
+Forecast inputs only change when a user's transactions, balances, or adjustments
+change, so identical compute requests can reuse the previous payload. Callers
+build a key from the normalized request and the user's data version (see
+:func:`request_cache_key`); a data-version bump therefore makes older entries
+unreachable, and the LRU bound evicts them over time.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def request_cache_key(normalized_request: Mapping[str, Any], data_version: str) -> str:
+    """Hash a normalized compute request together with the user's data version."""
+
+    encoded = json.dumps(normalized_request, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    return f"{data_version}:{digest}"
+
+
+class ForecastResultCache:
+    """Thread-safe LRU cache whose entries also expire after ``ttl_seconds``.
+
+    Payloads are deep-copied on the way in and out so callers can attach
+    per-request metadata without mutating the cached value.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of the cached payload for ``key`` or ``None`` on a miss."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            payload = entry[1]
+        return copy.deepcopy(payload)
+
+    def set(self, key: str, payload: Mapping[str, Any]) -> None:
+        """Store ``payload`` under ``key``, evicting the least recently used entries."""
+
+        stored = copy.deepcopy(dict(payload))
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry while keeping the counters."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return counters suitable for response metadata."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
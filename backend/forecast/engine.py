@@ -18,6 +18,7 @@ from .models import (
     ForecastSummary,
     ForecastTimelinePoint,
 )
+from .views import shape_forecast_payload
 
 DEFAULT_CATEGORY_CONFIDENCE = Decimal("0.6")
 DEFAULT_RECURRING_CONFIDENCE = Decimal("0.85")
@@ -818,6 +819,147 @@ def _build_forecast_series(
     )
 
 
+def _select_historical_window(
+    historical_aggregates: Sequence[Mapping[str, Any]],
+    window: int,
+) -> list[Mapping[str, Any]]:
+    """Return the most recent ``window`` aggregates in ascending date order."""
+    sorted_aggregates = sorted(
+        historical_aggregates,
+        key=lambda item: _parse_date(item.get("date"), fallback=date.today()),
+    )
+    return sorted_aggregates[-window:] if sorted_aggregates else []
+
+
+def _normalize_historical_window(
+    historical_window: Sequence[Mapping[str, Any]],
+    normalize: bool,
+) -> tuple[Decimal, Sequence[Mapping[str, Any]]]:
+    """Scale historical aggregates by their largest daily magnitude when requested.
+
+    Returns:
+        A ``(normalization_factor, aggregates)`` tuple. The factor is ``1`` and the
+        window is returned unchanged when normalization is disabled or impossible.
+    """
+    normalization_factor = Decimal("1")
+    if not normalize or not historical_window:
+        return normalization_factor, historical_window
+
+    magnitudes = [
+        abs(_extract_amount(item, ("inflow", "income", "credit")))
+        + abs(_extract_amount(item, ("outflow", "expense", "debit")))
+        for item in historical_window
+    ]
+    non_zero = [value for value in magnitudes if value > 0]
+    if not non_zero:
+        return normalization_factor, historical_window
+
+    normalization_factor = max(non_zero)
+    normalized_aggregates = []
+    for item in historical_window:
+        normalized_aggregates.append(
+            {
+                **item,
+                "inflow": float(_extract_amount(item, ("inflow", "income", "credit")) / normalization_factor),
+                "outflow": float(_extract_amount(item, ("outflow", "expense", "debit")) / normalization_factor),
+            }
+        )
+    return normalization_factor, normalized_aggregates
+
+
+def _resolve_realized_history(
+    metadata_map: Mapping[str, Any],
+    historical_window: Sequence[Mapping[str, Any]],
+    *,
+    start_date: DateLike,
+    starting_balance: float,
+) -> list[dict[str, object]]:
+    """Return realized balance history from caller metadata or the historical window.
+
+    Caller-provided ``realized_history`` points are normalized and sorted. When none
+    are supplied, history is reconstructed by walking backwards from the starting
+    balance through the daily net of each historical aggregate.
+    """
+    realized_history: list[dict[str, object]] = []
+    provided_realized_history = metadata_map.get("realized_history")
+    if isinstance(provided_realized_history, list):
+        normalized_points: list[tuple[date, dict[str, object]]] = []
+        for point in provided_realized_history:
+            if not isinstance(point, Mapping):
+                continue
+            realized_date = _parse_date(point.get("date"), fallback=date.today())
+            normalized_points.append(
+                (
+                    realized_date,
+                    {
+                        "date": realized_date.isoformat(),
+                        "label": str(point.get("label") or realized_date.isoformat()),
+                        "balance": float(
+                            _to_decimal(point.get("balance") or point.get("value") or point.get("amount"))
+                        ),
+                    },
+                )
+            )
+        normalized_points.sort(key=lambda item: item[0])
+        realized_history = [item[1] for item in normalized_points]
+
+    if not realized_history and historical_window:
+        anchor_date = _parse_date(start_date, fallback=date.today())
+        running_history_balance = Decimal(str(starting_balance))
+        daily_net_by_date: dict[date, Decimal] = {}
+        for item in historical_window:
+            realized_date = _parse_date(item.get("date"), fallback=anchor_date)
+            daily_net_by_date[realized_date] = (
+                daily_net_by_date.get(realized_date, Decimal("0"))
+                + _extract_amount(item, ("inflow", "income", "credit"))
+                - _extract_amount(item, ("outflow", "expense", "debit"))
+            )
+
+        oldest_date = min(daily_net_by_date)
+        realized_history_desc: list[dict[str, object]] = []
+        current_date = anchor_date
+        while current_date >= oldest_date:
+            iso_date = current_date.isoformat()
+            realized_history_desc.append(
+                {
+                    "date": iso_date,
+                    "label": iso_date,
+                    "balance": float(running_history_balance),
+                }
+            )
+            running_history_balance -= daily_net_by_date.get(current_date, Decimal("0"))
+            current_date -= timedelta(days=1)
+
+        realized_history_desc.reverse()
+        realized_history = realized_history_desc
+
+    return realized_history
+
+
+def _projection_metadata(
+    *,
+    window: int,
+    normalize: bool,
+    graph_mode: Any,
+    normalization_factor: Decimal,
+    summary: ForecastSummary,
+    realized_history: list[dict[str, object]],
+) -> dict[str, Any]:
+    """Return projection metadata shared by the summary and result payloads."""
+    projected_change = summary.net_change
+    projected_change_percent = (projected_change / summary.starting_balance) * 100 if summary.starting_balance else 0.0
+    return {
+        "moving_average_window": window,
+        "normalize": normalize,
+        "graph_mode": _normalize_graph_mode(graph_mode),
+        "normalization_factor": float(normalization_factor),
+        "projected_amount": summary.ending_balance,
+        "projected_change": projected_change,
+        "projected_change_percent": projected_change_percent,
+        "realized_history": realized_history,
+    }
+
+
 def compute_forecast(
     *,
     user_id: int,
@@ -833,6 +975,8 @@ def compute_forecast(
     graph_mode: str = "combined",
     currency: str = "USD",
     metadata: Mapping[str, Any] | None = None,
+    output: str = "full",
+    cashflow_range: tuple[DateLike | None, DateLike | None] | None = None,
 ) -> dict[str, Any]:
     """Compute a full forecast payload for API responses.
 
@@ -850,37 +994,17 @@ def compute_forecast(
         graph_mode: Chart mode hint (combined, forecast, historical).
         currency: ISO currency code for summary display.
         metadata: Optional metadata to attach to the forecast result.
+        output: Payload shape: ``full``, ``summary``, or ``columnar`` (see
+            :mod:`forecast.views`).
+        cashflow_range: Optional inclusive ``(start, end)`` dates limiting the
+            cashflows returned.
 
     Returns:
-        Fully serialized forecast payload.
+        Serialized forecast payload in the requested output shape.
     """
     window = _normalize_window(moving_average_window)
-    sorted_aggregates = sorted(
-        historical_aggregates,
-        key=lambda item: _parse_date(item.get("date"), fallback=date.today()),
-    )
-    historical_window = sorted_aggregates[-window:] if sorted_aggregates else []
-
-    normalization_factor = Decimal("1")
-    normalized_aggregates = historical_window
-    if normalize and historical_window:
-        magnitudes = [
-            abs(_extract_amount(item, ("inflow", "income", "credit")))
-            + abs(_extract_amount(item, ("outflow", "expense", "debit")))
-            for item in historical_window
-        ]
-        non_zero = [value for value in magnitudes if value > 0]
-        if non_zero:
-            normalization_factor = max(non_zero)
-            normalized_aggregates = []
-            for item in historical_window:
-                normalized_aggregates.append(
-                    {
-                        **item,
-                        "inflow": float(_extract_amount(item, ("inflow", "income", "credit")) / normalization_factor),
-                        "outflow": float(_extract_amount(item, ("outflow", "expense", "debit")) / normalization_factor),
-                    }
-                )
+    historical_window = _select_historical_window(historical_aggregates, window)
+    normalization_factor, normalized_aggregates = _normalize_historical_window(historical_window, normalize)
 
     baseline_timeline = project_balances(
         user_id=user_id,
@@ -925,78 +1049,24 @@ def compute_forecast(
     )
     summary = compute_summary(adjusted_timeline)
     summary.currency = currency
-    projected_amount = summary.ending_balance
-    projected_change = summary.net_change
-    projected_change_percent = (projected_change / summary.starting_balance) * 100 if summary.starting_balance else 0.0
 
-    realized_history: list[dict[str, object]] = []
     metadata_map = dict(metadata or {})
-    provided_realized_history = metadata_map.get("realized_history")
-    if isinstance(provided_realized_history, list):
-        normalized_points: list[tuple[date, dict[str, object]]] = []
-        for point in provided_realized_history:
-            if not isinstance(point, Mapping):
-                continue
-            realized_date = _parse_date(point.get("date"), fallback=date.today())
-            normalized_points.append(
-                (
-                    realized_date,
-                    {
-                        "date": realized_date.isoformat(),
-                        "label": str(point.get("label") or realized_date.isoformat()),
-                        "balance": float(
-                            _to_decimal(point.get("balance") or point.get("value") or point.get("amount"))
-                        ),
-                    },
-                )
-            )
-        normalized_points.sort(key=lambda item: item[0])
-        realized_history = [item[1] for item in normalized_points]
-
-    if not realized_history and historical_window:
-        anchor_date = _parse_date(start_date, fallback=date.today())
-        running_history_balance = Decimal(str(summary.starting_balance))
-        daily_net_by_date: dict[date, Decimal] = {}
-        for item in historical_window:
-            realized_date = _parse_date(item.get("date"), fallback=anchor_date)
-            daily_net_by_date[realized_date] = (
-                daily_net_by_date.get(realized_date, Decimal("0"))
-                + _extract_amount(item, ("inflow", "income", "credit"))
-                - _extract_amount(item, ("outflow", "expense", "debit"))
-            )
-
-        oldest_date = min(daily_net_by_date)
-        realized_history_desc: list[dict[str, object]] = []
-        current_date = anchor_date
-        while current_date >= oldest_date:
-            iso_date = current_date.isoformat()
-            realized_history_desc.append(
-                {
-                    "date": iso_date,
-                    "label": iso_date,
-                    "balance": float(running_history_balance),
-                }
-            )
-            running_history_balance -= daily_net_by_date.get(current_date, Decimal("0"))
-            current_date -= timedelta(days=1)
-
-        realized_history_desc.reverse()
-        realized_history = realized_history_desc
-
-    normalized_graph_mode = _normalize_graph_mode(graph_mode)
-    summary_metadata = dict(summary.metadata or {})
-    summary_metadata.update(
-        {
-            "moving_average_window": window,
-            "normalize": normalize,
-            "graph_mode": normalized_graph_mode,
-            "normalization_factor": float(normalization_factor),
-            "projected_amount": projected_amount,
-            "projected_change": projected_change,
-            "projected_change_percent": projected_change_percent,
-            "realized_history": realized_history,
-        }
+    realized_history = _resolve_realized_history(
+        metadata_map,
+        historical_window,
+        start_date=start_date,
+        starting_balance=summary.starting_balance,
+    )
+    projection_metadata = _projection_metadata(
+        window=window,
+        normalize=normalize,
+        graph_mode=graph_mode,
+        normalization_factor=normalization_factor,
+        summary=summary,
+        realized_history=realized_history,
     )
+    summary_metadata = dict(summary.metadata or {})
+    summary_metadata.update(projection_metadata)
     summary.metadata = summary_metadata
 
     result = ForecastResult(
@@ -1005,19 +1075,9 @@ def compute_forecast(
         cashflows=cashflows,
         adjustments=_build_adjustment_models(adjustments),
         series=series,
-        metadata={
-            **metadata_map,
-            "moving_average_window": window,
-            "normalize": normalize,
-            "graph_mode": normalized_graph_mode,
-            "normalization_factor": float(normalization_factor),
-            "projected_amount": projected_amount,
-            "projected_change": projected_change,
-            "projected_change_percent": projected_change_percent,
-            "realized_history": realized_history,
-        },
+        metadata={**metadata_map, **projection_metadata},
     )
-    return result.to_dict()
+    return shape_forecast_payload(result.to_dict(), output=output, cashflow_range=cashflow_range)
 
 
 def _build_adjustment_schedule(
@@ -1070,34 +1130,12 @@ def _build_adjustment_schedule(
     return schedule
 
 
-def project_balances(
+def _latest_snapshot_total(
     user_id: int,
-    start_date: DateLike,
-    horizon_days: int,
     latest_snapshots: Sequence[Mapping[str, Any]],
-    historical_aggregates: Sequence[Mapping[str, Any]],
-) -> list[ForecastTimelinePoint]:
-    """Project a daily balance timeline using average inflows/outflows.
-
-    Args:
-        user_id: Identifier for the user owning the balances.
-        start_date: First date included in the projection.
-        horizon_days: Number of days to project, including the start date.
-        latest_snapshots: Latest balance snapshots for the user. Each mapping should include a
-            ``balance`` field and ideally an ``account_id`` and ``date`` for deterministic
-            selection.
-        historical_aggregates: Historical daily aggregates with inflow/outflow totals. Each mapping
-            should include a ``date`` plus inflow/outflow fields such as ``inflow``/``outflow`` or
-            ``income``/``expense``.
-
-    Returns:
-        A list of :class:`ForecastTimelinePoint` entries ordered by date.
-    """
-
-    anchor_date = _parse_date(start_date, fallback=date.today())
-    horizon_days = max(int(horizon_days), 0)
-
-    # Select the latest snapshot per account for the requested user to anchor the forecast.
+    anchor_date: date,
+) -> Decimal:
+    """Sum the latest snapshot balance per account for the requested user."""
     latest_by_account: dict[str, tuple[date, Decimal]] = {}
     for index, snapshot in enumerate(latest_snapshots):
         snapshot_user = snapshot.get("user_id")
@@ -1120,9 +1158,14 @@ def project_balances(
         if snapshot_date > existing_date or (snapshot_date == existing_date and balance > existing_balance):
             latest_by_account[account_id] = (snapshot_date, balance)
 
-    starting_balance = sum((balance for _, balance in latest_by_account.values()), Decimal("0"))
+    return sum((balance for _, balance in latest_by_account.values()), Decimal("0"))
 
-    # Compute the average inflow/outflow per day from historical aggregates.
+
+def _average_daily_flows(
+    historical_aggregates: Sequence[Mapping[str, Any]],
+    anchor_date: date,
+) -> tuple[Decimal, Decimal]:
+    """Return the average daily ``(inflow, outflow)`` across historical aggregates."""
     inflow_keys = (
         "inflow",
         "inflows",
@@ -1165,11 +1208,38 @@ def project_balances(
 
     day_count = len(aggregate_dates) if aggregate_dates else len(historical_aggregates)
     if day_count <= 0:
-        average_inflow = Decimal("0")
-        average_outflow = Decimal("0")
-    else:
-        average_inflow = total_inflow / Decimal(day_count)
-        average_outflow = total_outflow / Decimal(day_count)
+        return Decimal("0"), Decimal("0")
+    return total_inflow / Decimal(day_count), total_outflow / Decimal(day_count)
+
+
+def project_balances(
+    user_id: int,
+    start_date: DateLike,
+    horizon_days: int,
+    latest_snapshots: Sequence[Mapping[str, Any]],
+    historical_aggregates: Sequence[Mapping[str, Any]],
+) -> list[ForecastTimelinePoint]:
+    """Project a daily balance timeline using average inflows/outflows.
+
+    Args:
+        user_id: Identifier for the user owning the balances.
+        start_date: First date included in the projection.
+        horizon_days: Number of days to project, including the start date.
+        latest_snapshots: Latest balance snapshots for the user. Each mapping should include a
+            ``balance`` field and ideally an ``account_id`` and ``date`` for deterministic
+            selection.
+        historical_aggregates: Historical daily aggregates with inflow/outflow totals. Each mapping
+            should include a ``date`` plus inflow/outflow fields such as ``inflow``/``outflow`` or
+            ``income``/``expense``.
+
+    Returns:
+        A list of :class:`ForecastTimelinePoint` entries ordered by date.
+    """
+
+    anchor_date = _parse_date(start_date, fallback=date.today())
+    horizon_days = max(int(horizon_days), 0)
+    starting_balance = _latest_snapshot_total(user_id, latest_snapshots, anchor_date)
+    average_inflow, average_outflow = _average_daily_flows(historical_aggregates, anchor_date)
 
     # Build the projection by applying the average daily net change to the latest balance.
     points: list[ForecastTimelinePoint] = []
@@ -0,0 +1,785 @@
+"""NumPy-backed forecast engine for long horizons and many adjustments.
+
+:func:`forecast.engine.compute_forecast` expands every adjustment and recurring
+source by walking each timeline date with ``Decimal`` arithmetic, which costs
+O(adjustments x days). This module keeps the same inputs and payload shape but
+represents the timeline as day offsets and money as cent arrays:
+
+* recurrence occurrences are generated arithmetically as index sets (daily and
+  weekly strides, monthly day-of-month lookups),
+* adjustment schedules are scattered into a cent array and turned into running
+  totals with a cumulative sum,
+* balances, deltas and aspect series are derived from those arrays in bulk.
+
+The reference engine stays authoritative; parity is asserted in
+``tests/test_forecast_vectorized.py``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+import numpy as np
+
+from .engine import (
+    DEFAULT_ADJUSTMENT_CONFIDENCE,
+    DEFAULT_RECURRING_CONFIDENCE,
+    DEFAULT_UNCATEGORIZED_CONFIDENCE,
+    _average_daily_flows,
+    _build_adjustment_models,
+    _build_daily_series,
+    _category_sources,
+    _derive_cashflow_sources,
+    _is_liability_account_type,
+    _latest_snapshot_total,
+    _normalize_frequency,
+    _normalize_historical_window,
+    _normalize_window,
+    _parse_date,
+    _projection_metadata,
+    _read_entry_value,
+    _realized_income_values_by_date,
+    _resolve_realized_history,
+    _select_historical_window,
+    _to_decimal,
+    compute_summary,
+)
+from .models import DateLike, ForecastSummary, _serialize_value
+from .views import assemble_compact_payload, cashflow_range_metadata, columnar_series, normalize_output_mode
+
+CENT = Decimal("0.01")
+_EMPTY_INDEX = np.empty(0, dtype=np.int64)
+
+
+def to_cents(value: Any) -> int:
+    """Return ``value`` rounded half-up to whole cents."""
+    return int(_to_decimal(value).quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+
+
+class ForecastCalendar:
+    """Day-offset calendar for a contiguous forecast horizon.
+
+    Offsets are zero-based from ``anchor``. Day-of-month positions are indexed once
+    so monthly recurrences resolve with a lookup instead of a per-day scan.
+    """
+
+    def __init__(self, anchor: date, horizon_days: int):
+        self.anchor = anchor
+        self.horizon_days = max(int(horizon_days), 0)
+        self.dates = np.datetime64(anchor, "D") + np.arange(self.horizon_days, dtype=np.int64)
+        month_starts = self.dates.astype("datetime64[M]").astype("datetime64[D]")
+        self.day_of_month = (self.dates - month_starts).astype(np.int64) + 1
+        self._day_of_month_index: dict[int, np.ndarray] = {}
+
+    def offset(self, value: date) -> int:
+        """Return the zero-based offset of ``value`` relative to the anchor."""
+        return (value - self.anchor).days
+
+    def date_at(self, offset: int) -> date:
+        """Return the calendar date for a timeline offset."""
+        return self.anchor + timedelta(days=int(offset))
+
+    def iso_dates(self) -> list[str]:
+        """Return ISO-8601 strings for every timeline date."""
+        return np.datetime_as_string(self.dates, unit="D").tolist()
+
+    def _days_matching(self, day: int) -> np.ndarray:
+        indices = self._day_of_month_index.get(day)
+        if indices is None:
+            indices = np.flatnonzero(self.day_of_month == day)
+            self._day_of_month_index[day] = indices
+        return indices
+
+    def occurrences(self, start: date, frequency: str | None) -> np.ndarray:
+        """Return sorted timeline offsets on which a cadence starting at ``start`` fires.
+
+        Mirrors :func:`forecast.engine._matches_frequency`: one-time entries fire on
+        their start date, ``daily``/``weekly`` entries on every 1st/7th day from the
+        start, and ``monthly`` entries on each date sharing the start's day of month.
+        """
+        horizon = self.horizon_days
+        start_offset = self.offset(start)
+        if horizon == 0 or start_offset >= horizon:
+            return _EMPTY_INDEX
+        if frequency is None:
+            if start_offset < 0:
+                return _EMPTY_INDEX
+            return np.array([start_offset], dtype=np.int64)
+        if frequency == "daily":
+            return np.arange(max(start_offset, 0), horizon, dtype=np.int64)
+        if frequency == "weekly":
+            first = start_offset if start_offset >= 0 else start_offset % 7
+            return np.arange(first, horizon, 7, dtype=np.int64)
+        if frequency == "monthly":
+            matching = self._days_matching(start.day)
+            return matching[np.searchsorted(matching, start_offset) :]
+        return _EMPTY_INDEX
+
+    def range_offsets(self, range_start: date, range_end: date) -> tuple[int, int]:
+        """Return the inclusive ``(low, high)`` offsets clipped to the horizon."""
+        low = max(self.offset(range_start), 0)
+        high = min(self.offset(range_end), self.horizon_days - 1)
+        return low, high
+
+
+def _spread_share_cents(amount: Decimal, count: int) -> float:
+    """Return the per-day share of a spread adjustment, in cents.
+
+    The share is ``amount / count`` in ``Decimal`` like the reference engine, not
+    a whole-cent split, so overlapping spreads cannot accumulate rounding drift.
+    """
+    return float(amount / Decimal(count) * 100)
+
+
+def adjustment_schedule_cents(
+    adjustments: Sequence[Any],
+    calendar: ForecastCalendar,
+) -> np.ndarray:
+    """Return per-day adjustment totals in cents for the calendar horizon.
+
+    Vectorized counterpart of :func:`forecast.engine._build_adjustment_schedule`.
+    One-time and recurring amounts are whole cents; spread adjustments add their
+    unrounded per-day share.
+    """
+    schedule = np.zeros(calendar.horizon_days, dtype=np.float64)
+    if calendar.horizon_days == 0:
+        return schedule
+
+    for adjustment in adjustments:
+        amount = _to_decimal(_read_entry_value(adjustment, "amount", 0))
+        if amount == 0:
+            continue
+
+        distribution = str(_read_entry_value(adjustment, "distribution", "single")).strip().lower()
+        if distribution in {"spread", "distributed"}:
+            range_start = _parse_date(
+                _read_entry_value(adjustment, "range_start") or _read_entry_value(adjustment, "date"),
+                fallback=calendar.anchor,
+            )
+            range_end = _parse_date(
+                _read_entry_value(adjustment, "range_end") or _read_entry_value(adjustment, "date"),
+                fallback=range_start,
+            )
+            if range_end < range_start:
+                range_start, range_end = range_end, range_start
+            low, high = calendar.range_offsets(range_start, range_end)
+            if low <= high:
+                schedule[low : high + 1] += _spread_share_cents(amount, high - low + 1)
+            continue
+
+        frequency = _normalize_frequency(_read_entry_value(adjustment, "frequency"))
+        start = _parse_date(
+            _read_entry_value(adjustment, "date") or _read_entry_value(adjustment, "start_date"),
+            fallback=calendar.anchor,
+        )
+        schedule[calendar.occurrences(start, frequency)] += to_cents(amount)
+
+    return schedule
+
+
+@dataclass
+class ForecastArrays:
+    """Array form of a projected forecast horizon.
+
+    Attributes:
+        calendar: Day-offset calendar covering the horizon.
+        starting_balance: Latest snapshot total anchoring the projection.
+        average_inflow: Average daily inflow from the (normalized) historical window.
+        average_outflow: Average daily outflow from the (normalized) historical window.
+        normalization_factor: Factor applied when ``normalize`` was requested.
+        baseline_cents: Projected balance per day before adjustments.
+        adjustment_cents: Adjustment delta scheduled on each day.
+        running_adjustment_cents: Cumulative adjustment total per day.
+        balance_cents: Adjusted projected balance per day.
+    """
+
+    calendar: ForecastCalendar
+    starting_balance: Decimal
+    average_inflow: Decimal
+    average_outflow: Decimal
+    normalization_factor: Decimal
+    baseline_cents: np.ndarray
+    adjustment_cents: np.ndarray
+    running_adjustment_cents: np.ndarray = field(init=False)
+    balance_cents: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.running_adjustment_cents = np.cumsum(self.adjustment_cents)
+        self.balance_cents = self.baseline_cents + self.running_adjustment_cents
+
+    @property
+    def starting_balance_cents(self) -> float:
+        """Return the starting balance expressed in cents."""
+        return float(self.starting_balance * 100)
+
+    def baseline_deltas_cents(self) -> np.ndarray:
+        """Return day-over-day baseline deltas, starting from the snapshot total."""
+        return np.diff(self.baseline_cents, prepend=self.starting_balance_cents)
+
+    def balance_deltas_cents(self) -> np.ndarray:
+        """Return day-over-day adjusted balance deltas."""
+        return np.diff(self.balance_cents, prepend=self.starting_balance_cents)
+
+    def reference_baseline_deltas(self, stop: int) -> list[Decimal]:
+        """Return the reference engine's ``Decimal`` baseline deltas for offsets below ``stop``.
+
+        Mirrors :func:`forecast.engine.project_balances` and
+        :func:`forecast.engine._daily_deltas`: balances are accumulated in ``Decimal``,
+        stored as floats, optionally denormalized, and differenced from the
+        unnormalized starting balance. Cashflow attribution uses these so its
+        remainder entries match the reference exactly.
+        """
+        net = self.average_inflow - self.average_outflow
+        previous = _to_decimal(float(self.starting_balance))
+        balance = self.starting_balance
+        deltas: list[Decimal] = []
+        for _ in range(min(stop, self.calendar.horizon_days)):
+            balance += net
+            current = _to_decimal(float(balance))
+            if self.normalization_factor != Decimal("1"):
+                current = _to_decimal(float(current * self.normalization_factor))
+            deltas.append(current - previous)
+            previous = current
+        return deltas
+
+
+def project_forecast_arrays(
+    *,
+    user_id: int,
+    start_date: DateLike,
+    horizon_days: int,
+    latest_snapshots: Sequence[Mapping[str, Any]],
+    historical_window: Sequence[Mapping[str, Any]],
+    adjustments: Sequence[Any] | None = None,
+    normalize: bool = False,
+) -> ForecastArrays:
+    """Project baseline and adjusted balances as cent arrays.
+
+    Args:
+        user_id: Identifier for the forecast owner.
+        start_date: First date included in the projection.
+        horizon_days: Number of days to project.
+        latest_snapshots: Latest per-account balance snapshots.
+        historical_window: Historical aggregates already limited to the averaging window.
+        adjustments: Optional manual or automated adjustments.
+        normalize: Whether to normalize historical amounts before projection.
+
+    Returns:
+        :class:`ForecastArrays` for the requested horizon.
+    """
+    anchor_date = _parse_date(start_date, fallback=date.today())
+    calendar = ForecastCalendar(anchor_date, horizon_days)
+    normalization_factor, normalized_window = _normalize_historical_window(historical_window, normalize)
+    starting_balance = _latest_snapshot_total(user_id, latest_snapshots, anchor_date)
+    average_inflow, average_outflow = _average_daily_flows(normalized_window, anchor_date)
+
+    steps = np.arange(1, calendar.horizon_days + 1, dtype=np.float64)
+    baseline_cents = float(starting_balance * 100) + float((average_inflow - average_outflow) * 100) * steps
+    if normalization_factor != Decimal("1"):
+        baseline_cents = baseline_cents * float(normalization_factor)
+
+    return ForecastArrays(
+        calendar=calendar,
+        starting_balance=starting_balance,
+        average_inflow=average_inflow,
+        average_outflow=average_outflow,
+        normalization_factor=normalization_factor,
+        baseline_cents=baseline_cents,
+        adjustment_cents=adjustment_schedule_cents(adjustments or [], calendar),
+    )
+
+
+def _manual_adjustments(adjustments: Sequence[Any] | None) -> list[Any]:
+    """Return adjustments entered by the user rather than inferred automatically."""
+    return [
+        adjustment
+        for adjustment in adjustments or []
+        if not str(_read_entry_value(adjustment, "adjustment_type", "manual")).strip().lower().startswith("auto")
+    ]
+
+
+def _series_payload(
+    series_id: str,
+    label: str,
+    iso_dates: Sequence[str],
+    values: Sequence[float],
+    metadata: Mapping[str, Any],
+) -> dict[str, Any]:
+    """Return a serialized aspect series built from parallel date/value lists."""
+    return {
+        "id": series_id,
+        "label": label,
+        "points": [
+            {"date": iso_date, "label": iso_date, "value": value, "metadata": {}}
+            for iso_date, value in zip(iso_dates, values)
+        ],
+        "metadata": dict(metadata),
+    }
+
+
+def _cashflow_payload(
+    *,
+    iso_date: str,
+    amount: float,
+    label: str,
+    category: str,
+    source: str,
+    confidence: float,
+    sources: Any,
+    metadata: Any,
+) -> dict[str, Any]:
+    """Return a serialized cashflow item matching ``ForecastCashflowItem.to_dict``."""
+    return {
+        "date": iso_date,
+        "amount": amount,
+        "label": label,
+        "category": category,
+        "source": source,
+        "type": "income" if amount >= 0 else "expense",
+        "confidence": confidence,
+        "account_id": None,
+        "recurring_id": None,
+        "direction": "inflow" if amount >= 0 else "outflow",
+        "sources": sources,
+        "metadata": metadata,
+    }
+
+
+def _recurring_templates(
+    recurring_sources: Sequence[Mapping[str, Any]] | None,
+    calendar: ForecastCalendar,
+) -> list[tuple[np.ndarray, int, dict[str, Any]]]:
+    """Return ``(offsets, cents, serialized_fields)`` for each recurring source."""
+    templates: list[tuple[np.ndarray, int, dict[str, Any]]] = []
+    if not recurring_sources or calendar.horizon_days == 0:
+        return templates
+
+    for entry in recurring_sources:
+        cents = to_cents(entry.get("amount"))
+        if cents == 0:
+            continue
+        start = _parse_date(entry.get("date") or entry.get("start_date"), fallback=calendar.anchor)
+        frequency = _normalize_frequency(entry.get("frequency"))
+        category = str(entry.get("category") or "Recurring")
+        confidence = _to_decimal(entry.get("confidence", DEFAULT_RECURRING_CONFIDENCE))
+        expanded = {
+            "label": str(entry.get("label") or entry.get("merchant") or entry.get("description") or "Recurring"),
+            "category": category,
+            "confidence": confidence,
+            "source": "recurring",
+            "sources": _derive_cashflow_sources(entry, default_type="recurring_rule"),
+            "metadata": {"frequency": frequency or "one-time", "recurring_id": entry.get("recurring_id")},
+        }
+        templates.append(
+            (
+                calendar.occurrences(start, frequency),
+                cents,
+                {
+                    "label": expanded["label"],
+                    "category": category,
+                    "source": "recurring",
+                    "confidence": float(confidence),
+                    "sources": _serialize_value(_derive_cashflow_sources(expanded, default_type="recurring_rule")),
+                    "metadata": _serialize_value(expanded["metadata"]),
+                },
+            )
+        )
+    return templates
+
+
+def _baseline_cashflows(
+    arrays: ForecastArrays,
+    iso_dates: Sequence[str],
+    *,
+    category_averages: Sequence[Mapping[str, Any]] | None,
+    recurring_sources: Sequence[Mapping[str, Any]] | None,
+    uncategorized_label: str = "Uncategorized",
+    offsets: range | None = None,
+) -> tuple[list[dict[str, Any]], np.ndarray, np.ndarray]:
+    """Attribute baseline deltas to recurring, category and remainder cashflows.
+
+    Per-day totals are computed from the cent arrays. Serialized items repeat the
+    reference engine's ``Decimal`` attribution for their day, so category shares
+    and tiny delta-remainder entries match :func:`forecast.engine.build_cashflow_items`.
+
+    Args:
+        offsets: Timeline offsets whose cashflow items are serialized; defaults to
+            the whole horizon. Per-day totals always cover the whole horizon.
+
+    Returns:
+        Serialized cashflow items in reference order, per-day inflow in cents, and
+        per-day spending (negative cents).
+    """
+    calendar = arrays.calendar
+    horizon = calendar.horizon_days
+    deltas = arrays.baseline_deltas_cents()
+    templates = _recurring_templates(recurring_sources, calendar)
+
+    recurring_by_day: list[list[int]] = [[] for _ in range(horizon)]
+    recurring_total = np.zeros(horizon, dtype=np.float64)
+    recurring_income = np.zeros(horizon, dtype=np.float64)
+    recurring_spending = np.zeros(horizon, dtype=np.float64)
+    for template_index, (occurrences, cents, _) in enumerate(templates):
+        recurring_total[occurrences] += cents
+        if cents < 0:
+            recurring_spending[occurrences] += cents
+        else:
+            recurring_income[occurrences] += cents
+        for offset in occurrences.tolist():
+            recurring_by_day[offset].append(template_index)
+
+    remaining = deltas - recurring_total
+    category_sources = _category_sources(category_averages)
+    category_cents = np.array([float(_to_decimal(source["amount"]) * 100) for source in category_sources])
+    category_total = float(category_cents.sum()) if category_sources else 0.0
+    if category_sources and category_total != 0:
+        scaled = np.outer(category_cents / category_total, remaining)
+    else:
+        scaled = np.zeros((0, horizon), dtype=np.float64)
+    category_fields = [
+        {
+            "label": str(source.get("label")),
+            "category": str(source.get("category") or uncategorized_label),
+            "source": str(source.get("source") or "category_average"),
+            "confidence": float(source.get("confidence")),
+            "sources": _serialize_value(
+                _derive_cashflow_sources(
+                    {key: value for key, value in source.items() if key != "amount"},
+                    default_type="historical_average",
+                )
+            ),
+        }
+        for source in category_sources
+    ]
+    remainder = remaining - scaled.sum(axis=0)
+
+    spending = recurring_spending + np.where(scaled < 0, scaled, 0.0).sum(axis=0) + np.minimum(remainder, 0.0)
+    income = recurring_income + np.where(scaled > 0, scaled, 0.0).sum(axis=0) + np.maximum(remainder, 0.0)
+
+    offsets = range(horizon) if offsets is None else offsets
+    reference_deltas = arrays.reference_baseline_deltas(offsets.stop) if offsets else []
+    source_amounts = [_to_decimal(source["amount"]) for source in category_sources]
+    source_total = sum(source_amounts, Decimal("0"))
+    template_amounts = [Decimal(cents) / 100 for _, cents, _ in templates]
+    uncategorized_confidence = float(DEFAULT_UNCATEGORIZED_CONFIDENCE)
+    cashflows: list[dict[str, Any]] = []
+    for offset in offsets:
+        iso_date = iso_dates[offset]
+        delta = reference_deltas[offset]
+        day_amounts: list[Decimal] = []
+        for template_index in recurring_by_day[offset]:
+            _, cents, fields = templates[template_index]
+            day_amounts.append(template_amounts[template_index])
+            cashflows.append(_cashflow_payload(iso_date=iso_date, amount=cents / 100, **fields))
+        remaining_amount = delta - sum(day_amounts, Decimal("0"))
+        if remaining_amount != 0 and source_total != 0:
+            scale = remaining_amount / source_total
+            for source_amount, fields in zip(source_amounts, category_fields):
+                amount = source_amount * scale
+                if amount == 0:
+                    continue
+                day_amounts.append(amount)
+                cashflows.append(_cashflow_payload(iso_date=iso_date, amount=float(amount), metadata={}, **fields))
+        amount = delta - sum(day_amounts, Decimal("0"))
+        if amount != 0:
+            cashflows.append(
+                _cashflow_payload(
+                    iso_date=iso_date,
+                    amount=float(amount),
+                    label=uncategorized_label,
+                    category=uncategorized_label,
+                    source="uncategorized",
+                    confidence=uncategorized_confidence,
+                    sources=None,
+                    metadata={"reason": "delta-remainder"},
+                )
+            )
+    return cashflows, income, spending
+
+
+def _adjustment_cashflows(
+    adjustments: Sequence[Any] | None,
+    calendar: ForecastCalendar,
+    iso_dates: Sequence[str],
+    offsets: range | None = None,
+) -> tuple[list[dict[str, Any]], np.ndarray, np.ndarray]:
+    """Return serialized adjustment cashflows grouped by adjustment, then date.
+
+    Only occurrences inside ``offsets`` (default: the whole horizon) are serialized;
+    the per-day inflow and outflow cent totals always cover the whole horizon.
+    """
+    cashflows: list[dict[str, Any]] = []
+    inflow = np.zeros(calendar.horizon_days, dtype=np.int64)
+    outflow = np.zeros(calendar.horizon_days, dtype=np.int64)
+    if calendar.horizon_days == 0:
+        return cashflows, inflow, outflow
+
+    for adjustment in adjustments or []:
+        cents = to_cents(_read_entry_value(adjustment, "amount", 0))
+        if cents == 0:
+            continue
+        frequency = _normalize_frequency(_read_entry_value(adjustment, "frequency"))
+        start = _parse_date(
+            _read_entry_value(adjustment, "date") or _read_entry_value(adjustment, "start_date"),
+            fallback=calendar.anchor,
+        )
+        fields = {
+            "amount": cents / 100,
+            "label": str(_read_entry_value(adjustment, "label", "Adjustment")),
+            "category": "Adjustment",
+            "source": "adjustment",
+            "confidence": float(_read_entry_value(adjustment, "confidence", DEFAULT_ADJUSTMENT_CONFIDENCE)),
+            "sources": _serialize_value(_derive_cashflow_sources(adjustment, default_type="adjustment")),
+            "metadata": _serialize_value(
+                {
+                    "adjustment_type": _read_entry_value(adjustment, "adjustment_type", "manual"),
+                    "adjustment_id": _read_entry_value(adjustment, "adjustment_id"),
+                    "reason": _read_entry_value(adjustment, "reason"),
+                    "frequency": frequency or "one-time",
+                }
+            ),
+        }
+        occurrences = calendar.occurrences(start, frequency)
+        np.add.at(inflow if cents > 0 else outflow, occurrences, abs(cents))
+        if offsets is not None:
+            occurrences = occurrences[(occurrences >= offsets.start) & (occurrences < offsets.stop)]
+        for offset in occurrences.tolist():
+            cashflows.append(_cashflow_payload(iso_date=iso_dates[offset], **fields))
+    return cashflows, inflow, outflow
+
+
+def summarize_arrays(arrays: ForecastArrays) -> ForecastSummary:
+    """Compute :class:`ForecastSummary` metrics from adjusted balance arrays."""
+    calendar = arrays.calendar
+    if calendar.horizon_days == 0:
+        return compute_summary([])
+
+    balances = arrays.balance_cents
+    starting = arrays.starting_balance_cents
+    ending = float(balances[-1])
+    deltas = arrays.balance_deltas_cents()
+    net_change = ending - starting
+
+    depletion_date: date | None = None
+    if starting <= 0:
+        depletion_date = calendar.anchor
+    else:
+        depleted = np.flatnonzero(balances <= 0)
+        if depleted.size:
+            depletion_date = calendar.date_at(depleted[0])
+
+    return ForecastSummary(
+        start_date=calendar.anchor,
+        end_date=calendar.date_at(calendar.horizon_days - 1),
+        starting_balance=starting / 100,
+        ending_balance=ending / 100,
+        net_change=net_change / 100,
+        total_inflows=float(deltas[deltas > 0].sum()) / 100,
+        total_outflows=float(-deltas[deltas < 0].sum()) / 100,
+        average_daily_change=net_change / calendar.horizon_days / 100,
+        min_balance=min(starting, float(balances.min())) / 100,
+        max_balance=max(starting, float(balances.max())) / 100,
+        depletion_date=depletion_date,
+    )
+
+
+def _emit_offsets(
+    calendar: ForecastCalendar,
+    output: str,
+    cashflow_range: tuple[DateLike | None, DateLike | None] | None,
+) -> range:
+    """Return the timeline offsets whose cashflow items should be serialized."""
+    if cashflow_range is None:
+        return range(calendar.horizon_days) if output == "full" else range(0)
+    range_start, range_end = cashflow_range
+    low, high = calendar.range_offsets(
+        _parse_date(range_start, fallback=calendar.anchor) if range_start is not None else calendar.anchor,
+        (
+            _parse_date(range_end, fallback=calendar.anchor)
+            if range_end is not None
+            else calendar.date_at(calendar.horizon_days)
+        ),
+    )
+    return range(low, high + 1)
+
+
+def compute_forecast_vectorized(
+    *,
+    user_id: int,
+    start_date: DateLike,
+    horizon_days: int,
+    latest_snapshots: Sequence[Mapping[str, Any]],
+    historical_aggregates: Sequence[Mapping[str, Any]],
+    category_averages: Sequence[Mapping[str, Any]] | None = None,
+    recurring_sources: Sequence[Mapping[str, Any]] | None = None,
+    adjustments: Sequence[Mapping[str, Any]] | None = None,
+    moving_average_window: int = 30,
+    normalize: bool = False,
+    graph_mode: str = "combined",
+    currency: str = "USD",
+    metadata: Mapping[str, Any] | None = None,
+    output: str = "full",
+    cashflow_range: tuple[DateLike | None, DateLike | None] | None = None,
+) -> dict[str, Any]:
+    """Compute a forecast payload with the array engine.
+
+    Accepts the same arguments and returns the same payload shapes as
+    :func:`forecast.engine.compute_forecast`. One-time, recurring and adjustment
+    cashflow amounts are settled in whole cents; spread adjustments keep the
+    reference's per-day share, so balances only differ by float rounding for
+    whole-cent inputs.
+
+    The ``summary`` and ``columnar`` outputs are built straight from the arrays:
+    no per-day timeline, series, or cashflow dictionaries are created except for
+    cashflows inside ``cashflow_range``.
+    """
+    output = normalize_output_mode(output)
+    window = _normalize_window(moving_average_window)
+    historical_window = _select_historical_window(historical_aggregates, window)
+    arrays = project_forecast_arrays(
+        user_id=user_id,
+        start_date=start_date,
+        horizon_days=horizon_days,
+        latest_snapshots=latest_snapshots,
+        historical_window=historical_window,
+        adjustments=adjustments,
+        normalize=normalize,
+    )
+    calendar = arrays.calendar
+    iso_dates = calendar.iso_dates()
+    offsets = _emit_offsets(calendar, output, cashflow_range)
+
+    cashflows, baseline_inflow_cents, spending_cents = _baseline_cashflows(
+        arrays,
+        iso_dates,
+        category_averages=category_averages,
+        recurring_sources=recurring_sources,
+        offsets=offsets,
+    )
+    adjustment_cashflows, adjustment_inflow_cents, adjustment_outflow_cents = _adjustment_cashflows(
+        adjustments, calendar, iso_dates, offsets=offsets
+    )
+    cashflows.extend(adjustment_cashflows)
+
+    historical_dates = [_parse_date(item.get("date"), fallback=date.today()) for item in historical_window]
+    manual_cents = adjustment_schedule_cents(_manual_adjustments(adjustments), calendar)
+    debt_total = float(
+        sum(
+            (
+                abs(_to_decimal(snapshot.get("balance")))
+                for snapshot in latest_snapshots
+                if _is_liability_account_type(snapshot.get("account_type"))
+            ),
+            Decimal("0"),
+        )
+    )
+    realized_income_series = _build_daily_series(
+        series_id="realized_income",
+        label="Realized income used for auto-calculation",
+        dates=historical_dates,
+        values_by_date=_realized_income_values_by_date(historical_window, historical_dates),
+        metadata={"timeframe": "historical", "source": "historical_aggregates"},
+    ).to_dict()
+    forecast_series = {
+        "manual_adjustments": (
+            "Manual adjustments",
+            (manual_cents / 100).tolist(),
+            {"timeframe": "forecast", "source": "adjustments"},
+        ),
+        "spending": ("Spending", (spending_cents / 100).tolist(), {"timeframe": "forecast", "source": "cashflows"}),
+        "debt_totals": (
+            "Debt totals",
+            [debt_total] * calendar.horizon_days,
+            {"timeframe": "forecast", "source": "latest_snapshots"},
+        ),
+    }
+
+    summary = summarize_arrays(arrays)
+    summary.currency = currency
+    metadata_map = dict(metadata or {})
+    realized_history = _resolve_realized_history(
+        metadata_map,
+        historical_window,
+        start_date=start_date,
+        starting_balance=summary.starting_balance,
+    )
+    projection_metadata = _projection_metadata(
+        window=window,
+        normalize=normalize,
+        graph_mode=graph_mode,
+        normalization_factor=arrays.normalization_factor,
+        summary=summary,
+        realized_history=realized_history,
+    )
+    summary.metadata = {**summary.metadata, **projection_metadata}
+    serialized_adjustments = [model.to_dict() for model in _build_adjustment_models(adjustments)]
+    serialized_metadata = _serialize_value({**metadata_map, **projection_metadata})
+
+    if output != "full":
+        columns = None
+        series = None
+        if output == "columnar":
+            columns = {
+                "dates": iso_dates,
+                "forecast_balance": (arrays.balance_cents / 100).tolist(),
+                "baseline_balance": (arrays.baseline_cents / 100).tolist(),
+                "adjustment_total": (arrays.running_adjustment_cents / 100).tolist(),
+                "inflow": np.round((baseline_inflow_cents + adjustment_inflow_cents) / 100, 2).tolist(),
+                "outflow": np.round((adjustment_outflow_cents - spending_cents) / 100, 2).tolist(),
+            }
+            series = {"realized_income": columnar_series(realized_income_series, iso_dates)}
+            for series_id, (label, values, series_metadata) in forecast_series.items():
+                series[series_id] = {"label": label, "values": values, "metadata": dict(series_metadata)}
+        return assemble_compact_payload(
+            output=output,
+            summary=summary.to_dict(),
+            adjustments=serialized_adjustments,
+            metadata=serialized_metadata,
+            cashflows=cashflows,
+            cashflow_range=cashflow_range,
+            columns=columns,
+            series=series,
+        )
+
+    point_metadata: dict[str, Any] = {
+        "average_inflow": float(arrays.average_inflow),
+        "average_outflow": float(arrays.average_outflow),
+        "starting_balance": float(arrays.starting_balance),
+    }
+    if arrays.normalization_factor != Decimal("1"):
+        point_metadata["normalization_factor"] = float(arrays.normalization_factor)
+    timeline = [
+        {
+            "date": iso_date,
+            "label": iso_date,
+            "forecast_balance": balance,
+            "actual_balance": None,
+            "delta": None,
+            "metadata": {**point_metadata, "baseline_balance": baseline, "adjustment_total": adjustment_total},
+        }
+        for iso_date, balance, baseline, adjustment_total in zip(
+            iso_dates,
+            (arrays.balance_cents / 100).tolist(),
+            (arrays.baseline_cents / 100).tolist(),
+            (arrays.running_adjustment_cents / 100).tolist(),
+        )
+    ]
+    series = {"realized_income": realized_income_series}
+    for series_id, (label, values, series_metadata) in forecast_series.items():
+        series[series_id] = _series_payload(series_id, label, iso_dates, values, series_metadata)
+
+    payload = {
+        "timeline": timeline,
+        "summary": summary.to_dict(),
+        "cashflows": cashflows,
+        "adjustments": serialized_adjustments,
+        "series": series,
+        "metadata": serialized_metadata,
+    }
+    if cashflow_range is not None:
+        payload["metadata"] = {**serialized_metadata, "cashflow_range": cashflow_range_metadata(cashflow_range)}
+    return payload
@@ -0,0 +1,209 @@
+"""Compact output shapes for serialized forecast payloads.
+
+The full payload emits one dictionary per timeline day, per series point, and per
+cashflow, which dominates response size for long horizons. This module offers two
+leaner views of the same forecast:
+
+* ``summary`` keeps the summary, adjustments, and metadata only.
+* ``columnar`` lists the horizon dates once and returns balances, daily inflow and
+  outflow, and aspect series as parallel value lists.
+
+Both views omit per-day cashflows unless a cashflow date range is requested, in
+which case only the cashflows inside that inclusive range are returned.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import date
+from typing import Any
+
+FORECAST_OUTPUT_MODES = ("full", "summary", "columnar")
+
+
+def normalize_output_mode(value: Any) -> str:
+    """Return a supported output mode, defaulting to ``full``."""
+    if value is None:
+        return "full"
+    normalized = str(value).strip().lower()
+    if normalized not in FORECAST_OUTPUT_MODES:
+        raise ValueError("output must be one of full, summary, or columnar.")
+    return normalized
+
+
+def _iso(value: date | str | None) -> str | None:
+    if value is None:
+        return None
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def select_cashflows(
+    cashflows: Sequence[Mapping[str, Any]],
+    cashflow_range: tuple[date | str | None, date | str | None],
+) -> list[Mapping[str, Any]]:
+    """Return cashflows dated within the inclusive ``(start, end)`` range, preserving order.
+
+    Either bound may be ``None`` to leave that side of the range open.
+    """
+    start, end = (_iso(bound) for bound in cashflow_range)
+    return [
+        item
+        for item in cashflows
+        if (start is None or str(item.get("date")) >= start) and (end is None or str(item.get("date")) <= end)
+    ]
+
+
+def cashflow_range_metadata(cashflow_range: tuple[date | str | None, date | str | None]) -> dict[str, str | None]:
+    """Return the serialized cashflow range echoed in payload metadata."""
+    start, end = cashflow_range
+    return {"start": _iso(start), "end": _iso(end)}
+
+
+def columnar_series(series: Mapping[str, Any], dates: Sequence[str]) -> dict[str, Any]:
+    """Convert a serialized aspect series into parallel value lists.
+
+    ``dates`` is only repeated on the series when its points do not line up with
+    the horizon dates (for example, the historical ``realized_income`` series).
+    """
+    points = series.get("points") or []
+    series_dates = [point["date"] for point in points]
+    payload: dict[str, Any] = {
+        "label": series.get("label"),
+        "values": [point["value"] for point in points],
+        "metadata": dict(series.get("metadata") or {}),
+    }
+    if series_dates != list(dates):
+        payload["dates"] = series_dates
+    return payload
+
+
+def _split_realized_history(metadata: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, list[Any]]]:
+    """Remove realized history from metadata and return it as parallel lists."""
+    remaining = {key: value for key, value in metadata.items() if key != "realized_history"}
+    history = metadata.get("realized_history") or []
+    return remaining, {
+        "dates": [point.get("date") for point in history],
+        "balance": [point.get("balance") for point in history],
+    }
+
+
+def _compact_summary(summary: Mapping[str, Any] | None) -> Mapping[str, Any] | None:
+    """Drop the realized-history copy that the summary metadata repeats."""
+    if not summary:
+        return summary
+    summary_metadata = {
+        key: value for key, value in (summary.get("metadata") or {}).items() if key != "realized_history"
+    }
+    return {**summary, "metadata": summary_metadata}
+
+
+def daily_flows(
+    cashflows: Sequence[Mapping[str, Any]],
+    dates: Sequence[str],
+) -> tuple[list[float], list[float]]:
+    """Return per-date inflow and outflow magnitudes summed from cashflow items."""
+    index = {iso_date: position for position, iso_date in enumerate(dates)}
+    inflow = [0.0] * len(dates)
+    outflow = [0.0] * len(dates)
+    for item in cashflows:
+        position = index.get(str(item.get("date")))
+        if position is None:
+            continue
+        amount = float(item.get("amount") or 0)
+        if amount >= 0:
+            inflow[position] += amount
+        else:
+            outflow[position] -= amount
+    return [round(value, 2) for value in inflow], [round(value, 2) for value in outflow]
+
+
+def assemble_compact_payload(
+    *,
+    output: str,
+    summary: Mapping[str, Any] | None,
+    adjustments: list[Any],
+    metadata: Mapping[str, Any],
+    cashflows: list[Any] | None,
+    cashflow_range: tuple[date | str | None, date | str | None] | None,
+    columns: dict[str, list[Any]] | None = None,
+    series: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build a ``summary`` or ``columnar`` payload from already-computed parts."""
+    remaining_metadata, realized_history = _split_realized_history(metadata)
+    remaining_metadata["output"] = output
+    if cashflow_range is not None:
+        remaining_metadata["cashflow_range"] = cashflow_range_metadata(cashflow_range)
+
+    payload: dict[str, Any] = {"summary": _compact_summary(summary)}
+    if output == "columnar":
+        payload["columns"] = columns or {}
+        payload["series"] = series or {}
+        payload["realized_history"] = realized_history
+    payload["adjustments"] = adjustments
+    if cashflow_range is not None:
+        payload["cashflows"] = cashflows or []
+    payload["metadata"] = remaining_metadata
+    return payload
+
+
+def shape_forecast_payload(
+    payload: Mapping[str, Any],
+    *,
+    output: str = "full",
+    cashflow_range: tuple[date | str | None, date | str | None] | None = None,
+) -> dict[str, Any]:
+    """Reshape a full forecast payload into the requested output mode.
+
+    Args:
+        payload: Full payload as returned by ``compute_forecast``.
+        output: ``full``, ``summary``, or ``columnar``.
+        cashflow_range: Optional inclusive ``(start, end)`` dates limiting the
+            cashflows returned; ``None`` keeps every cashflow in ``full`` mode and
+            omits them in the compact modes.
+
+    Returns:
+        The payload unchanged for ``full`` without a range, otherwise a new dictionary.
+    """
+    output = normalize_output_mode(output)
+    cashflows = payload.get("cashflows") or []
+    if output == "full":
+        if cashflow_range is None:
+            return dict(payload)
+        return {
+            **payload,
+            "cashflows": select_cashflows(cashflows, cashflow_range),
+            "metadata": {
+                **(payload.get("metadata") or {}),
+                "cashflow_range": cashflow_range_metadata(cashflow_range),
+            },
+        }
+
+    columns = None
+    series = None
+    if output == "columnar":
+        timeline = payload.get("timeline") or []
+        dates = [point["date"] for point in timeline]
+        inflow, outflow = daily_flows(cashflows, dates)
+        columns = {
+            "dates": dates,
+            "forecast_balance": [point.get("forecast_balance") for point in timeline],
+            "baseline_balance": [(point.get("metadata") or {}).get("baseline_balance") for point in timeline],
+            "adjustment_total": [(point.get("metadata") or {}).get("adjustment_total") for point in timeline],
+            "inflow": inflow,
+            "outflow": outflow,
+        }
+        series = {
+            series_id: columnar_series(series_payload, dates)
+            for series_id, series_payload in (payload.get("series") or {}).items()
+        }
+
+    return assemble_compact_payload(
+        output=output,
+        summary=payload.get("summary"),
+        adjustments=list(payload.get("adjustments") or []),
+        metadata=payload.get("metadata") or {},
+        cashflows=select_cashflows(cashflows, cashflow_range) if cashflow_range is not None else None,
+        cashflow_range=cashflow_range,
+        columns=columns,
+        series=series,
+    )
@@ -0,0 +1,57 @@
+"""Add recurring signature table for incremental recurring detection.
+
+Revision ID: 3e5a7c9b1d24
+Revises: 8d2f0a5b3c7e
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3e5a7c9b1d24"
+down_revision = "8d2f0a5b3c7e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create ``recurring_signatures`` keyed by account, signature, and amount bucket."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "recurring_signatures" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "recurring_signatures",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.String(length=64), nullable=True),
+        sa.Column(
+            "account_id",
+            sa.String(length=64),
+            sa.ForeignKey("accounts.account_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("signature", sa.String(length=128), nullable=False),
+        sa.Column("amount_bucket", sa.BigInteger(), nullable=False),
+        sa.Column("description", sa.String(length=256), nullable=True),
+        sa.Column("occurrence_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("first_date", sa.Date(), nullable=True),
+        sa.Column("last_date", sa.Date(), nullable=True),
+        sa.Column("gap_histogram", sa.JSON(), nullable=False),
+        sa.Column("last_transaction_id", sa.String(length=64), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("account_id", "signature", "amount_bucket", name="uq_recurring_signatures_key"),
+    )
+    op.create_index("ix_recurring_signatures_user_id", "recurring_signatures", ["user_id"], unique=False)
+    op.create_index("ix_recurring_signatures_account_id", "recurring_signatures", ["account_id"], unique=False)
+    op.create_index("ix_recurring_signatures_last_date", "recurring_signatures", ["last_date"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the recurring signature table and its indexes."""
+    op.drop_index("ix_recurring_signatures_last_date", table_name="recurring_signatures")
+    op.drop_index("ix_recurring_signatures_account_id", table_name="recurring_signatures")
+    op.drop_index("ix_recurring_signatures_user_id", table_name="recurring_signatures")
+    op.drop_table("recurring_signatures")
@@ -0,0 +1,43 @@
+"""Add per-user merchant usage table for typeahead suggestions.
+
+Revision ID: 5b8e2d4f6a10
+Revises: 3e5a7c9b1d24
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b8e2d4f6a10"
+down_revision = "3e5a7c9b1d24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create ``merchant_usage`` keyed by user and merchant slug."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "merchant_usage" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "merchant_usage",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.String(length=64), nullable=False),
+        sa.Column("merchant_slug", sa.String(length=128), nullable=False),
+        sa.Column("display_name", sa.String(length=128), nullable=False),
+        sa.Column("usage_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_seen", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("user_id", "merchant_slug", name="uq_merchant_usage_user_slug"),
+    )
+    op.create_index("ix_merchant_usage_user_id", "merchant_usage", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the merchant usage table and its index."""
+    op.drop_index("ix_merchant_usage_user_id", table_name="merchant_usage")
+    op.drop_table("merchant_usage")
@@ -0,0 +1,38 @@
+"""Add an ``updated_at`` watermark column to transactions.
+
+Revision ID: 6e1a9c3b7d42
+Revises: 9c4f1e7a2d58
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6e1a9c3b7d42"
+down_revision = "9c4f1e7a2d58"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add ``transactions.updated_at`` and index it for incremental exports."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    transaction_columns = {column["name"] for column in inspector.get_columns("transactions")}
+    transaction_indexes = {index["name"] for index in inspector.get_indexes("transactions")}
+
+    if "updated_at" not in transaction_columns:
+        # Existing rows take the upgrade time, so the next incremental export includes them.
+        op.add_column(
+            "transactions",
+            sa.Column("updated_at", sa.DateTime(), nullable=True, server_default=sa.func.now()),
+        )
+    if "ix_transactions_updated_at" not in transaction_indexes:
+        op.create_index("ix_transactions_updated_at", "transactions", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop ``transactions.updated_at`` and its index."""
+    op.drop_index("ix_transactions_updated_at", table_name="transactions")
+    op.drop_column("transactions", "updated_at")
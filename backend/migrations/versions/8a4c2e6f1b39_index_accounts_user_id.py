@@ -0,0 +1,30 @@
+"""Index ``accounts.user_id`` for account-ownership lookups.
+
+Revision ID: 8a4c2e6f1b39
+Revises: 6e1a9c3b7d42
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8a4c2e6f1b39"
+down_revision = "6e1a9c3b7d42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index ``accounts.user_id``; transactions are scoped to users through their account."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    account_indexes = {index["name"] for index in inspector.get_indexes("accounts")}
+
+    if "ix_accounts_user_id" not in account_indexes:
+        op.create_index("ix_accounts_user_id", "accounts", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the ``accounts.user_id`` index."""
+    op.drop_index("ix_accounts_user_id", table_name="accounts")
@@ -0,0 +1,52 @@
+"""Add transaction search documents with a PostgreSQL full-text index.
+
+Revision ID: 9c4f1e7a2d58
+Revises: 5b8e2d4f6a10
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c4f1e7a2d58"
+down_revision = "5b8e2d4f6a10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create ``transaction_search_documents`` and, on PostgreSQL, its tsvector GIN index."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "transaction_search_documents" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "transaction_search_documents",
+        sa.Column(
+            "transaction_id",
+            sa.String(length=64),
+            sa.ForeignKey("transactions.transaction_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("document", sa.Text(), nullable=False, server_default=""),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE transaction_search_documents ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', document)) STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_transaction_search_documents_vector "
+            "ON transaction_search_documents USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the search document table and its indexes."""
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_transaction_search_documents_vector")
+    op.drop_table("transaction_search_documents")
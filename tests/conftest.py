@@ -0,0 +1,133 @@
+"""Shared pytest fixtures.
+
+Many test modules replace ``app`` packages in ``sys.modules`` with stubs while
+they import. The hooks below keep each module's replacements to that module:
+whatever a module changes under ``app`` (and any stub module it installs) is
+recorded and rolled back once it is collected, then reinstalled only while its
+own tests run. The real ``app.extensions`` and ``app.models`` are imported first
+so every module that does not stub them shares one ``db`` and model registry.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+BASE_BACKEND = Path(__file__).resolve().parent.parent / "backend"
+UTILS_DIR = BASE_BACKEND / "app" / "utils"
+_sql_instrumentation = None
+
+if str(BASE_BACKEND) not in sys.path:
+    sys.path.insert(0, str(BASE_BACKEND))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+import app.extensions  # noqa: E402
+import app.models  # noqa: E402,F401
+
+_MISSING = object()
+_MODULE_STUBS: dict[str, dict[str, object]] = {}
+
+
+def _is_scoped(name: str, module: object) -> bool:
+    """Return whether a ``sys.modules`` entry added by a test module is rolled back."""
+
+    if name.partition(".")[0] == "app" or not isinstance(module, types.ModuleType):
+        return True
+    spec = getattr(module, "__spec__", None)
+    return spec is None or spec.name != name
+
+
+def _roll_back(before: dict[str, object]) -> dict[str, object]:
+    """Restore ``sys.modules`` to ``before`` and return the entries that were undone.
+
+    Third-party modules imported for the first time stay loaded; re-importing
+    them (NumPy in particular) is not safe.
+    """
+
+    changes: dict[str, object] = {}
+    for name, module in list(sys.modules.items()):
+        previous = before.get(name, _MISSING)
+        if previous is module or (previous is _MISSING and not _is_scoped(name, module)):
+            continue
+        changes[name] = module
+        if previous is _MISSING:
+            del sys.modules[name]
+        else:
+            sys.modules[name] = previous
+    for name, previous in before.items():
+        if name not in sys.modules:
+            changes[name] = _MISSING
+            sys.modules[name] = previous
+    return changes
+
+
+def _install(changes: dict[str, object]) -> None:
+    for name, module in changes.items():
+        if module is _MISSING:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    """Record and undo the ``sys.modules`` stubs a test module installs on import."""
+
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+    before = dict(sys.modules)
+    yield
+    _MODULE_STUBS[collector.nodeid] = _roll_back(before)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _module_stubs(request):
+    """Reinstall a test module's own stubs while its tests run, then undo them."""
+
+    before = dict(sys.modules)
+    _install(_MODULE_STUBS.get(request.node.nodeid, {}))
+    yield
+    _roll_back(before)
+
+
+def _load_sql_instrumentation():
+    """Load the instrumentation module by path; test modules stub ``app.utils``."""
+
+    global _sql_instrumentation
+    if _sql_instrumentation is None:
+        path = UTILS_DIR / "sql_instrumentation.py"
+        spec = importlib.util.spec_from_file_location("sql_instrumentation_fixture", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+        spec.loader.exec_module(module)
+        _sql_instrumentation = module
+    return _sql_instrumentation
+
+
+@pytest.fixture()
+def assert_max_queries():
+    """Fail the test when a block runs more SQL statements than allowed.
+
+    Usage::
+
+        def test_list(client, assert_max_queries):
+            with assert_max_queries(3):
+                client.get("/api/institutions/")
+    """
+
+    module = _load_sql_instrumentation()
+
+    @contextmanager
+    def _assert_max_queries(limit: int, label: str = "test"):
+        with module.track_queries(label, report=False) as stats:
+            yield stats
+        if stats.count > limit:
+            statements = "\n".join(f"  {count}x {key}" for key, count in stats.by_fingerprint.most_common())
+            pytest.fail(f"{label} ran {stats.count} SQL statements (limit {limit}):\n{statements}")
+
+    return _assert_max_queries
@@ -22,6 +22,7 @@ os.environ.setdefault("BACKEND_PUBLIC_URL", "http://localhost")
 from app.extensions import db
 from app.models import Account, Tag, Transaction
 from app.routes.transactions import transactions as transactions_blueprint
+from app.sql import account_logic
 from app.sql.account_logic import get_or_create_category, get_paginated_transactions
 
 
@@ -240,6 +241,62 @@ def test_get_paginated_transactions_filters_by_tags(app_context):
     assert {row["transaction_id"] for row in rows} == {"tx-1", "tx-3"}
 
 
+def test_get_paginated_transactions_sparse_fields_defer_unused_columns(app_context):
+    _seed_transactions(tags={"tx-1": ["groceries"]})
+    account_logic.TX_PAGE_CACHE.clear()
+    statements = []
+
+    def capture_sql(_conn, _cursor, statement, _parameters, _context, _executemany):
+        statements.append(statement.lower())
+
+    event.listen(db.engine, "before_cursor_execute", capture_sql)
+    try:
+        rows, total, _ = get_paginated_transactions(
+            1, 3, user_id="user-1", fields=["amount", "transaction_id", "account_name"]
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture_sql)
+
+    assert total == 3
+    assert rows[0] == {"transaction_id": "tx-1", "amount": -10.0, "account_name": "Checking"}
+    page_select = next(stmt for stmt in statements if "limit" in stmt)
+    assert "transactions.description" not in page_select
+    assert "accounts.institution_name" not in page_select
+    assert "categories" not in page_select
+    assert not any("transaction_tags" in stmt for stmt in statements)
+
+    full, _, _ = get_paginated_transactions(1, 3, user_id="user-1", include_running_balance=True)
+    every_field, _, _ = get_paginated_transactions(
+        1, 3, user_id="user-1", include_running_balance=True, fields=account_logic.TRANSACTION_ROW_FIELDS
+    )
+    assert every_field == full
+
+    with pytest.raises(ValueError, match="bogus"):
+        get_paginated_transactions(1, 3, fields=["amount", "bogus"])
+
+
+def test_transactions_route_dictionary_shape_round_trips_rows(app_client):
+    _seed_transactions()
+    account_logic.TX_PAGE_CACHE.clear()
+
+    rows = app_client.get("/transactions/get_transactions", query_string={"page_size": 3}).get_json()["data"]
+    encoded = app_client.get(
+        "/transactions/get_transactions", query_string={"page_size": 3, "shape": "dictionary"}
+    ).get_json()["data"]
+
+    assert encoded["total"] == rows["total"] == 3
+    assert list(encoded["accounts"]) == ["acc-1"]
+    assert len(encoded["categories"]) == 1
+    for plain, compact in zip(rows["transactions"], encoded["transactions"]):
+        category = encoded["categories"][compact.pop("category_ref")]
+        rebuilt = {**compact, **encoded["accounts"][compact["account_id"]], **category, "isEditing": False}
+        assert rebuilt == plain
+
+    bad = app_client.get("/transactions/get_transactions", query_string={"fields": "amount,nope"})
+    assert bad.status_code == 400
+    assert app_client.get("/transactions/get_transactions", query_string={"shape": "columns"}).status_code == 400
+
+
 def test_get_or_create_category_merges_pfc_and_legacy_variants(app_context):
     """Ensure legacy and PFC category variants resolve to one canonical row."""
 
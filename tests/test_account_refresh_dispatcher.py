@@ -11,6 +11,9 @@ app_stub = types.ModuleType("app")
 config_stub = types.ModuleType("app.config")
 models_stub = types.ModuleType("app.models")
 services_stub = types.ModuleType("app.services")
+extensions_stub = types.ModuleType("app.extensions")
+sql_stub = types.ModuleType("app.sql")
+account_logic_stub = types.ModuleType("app.sql.account_logic")
 
 
 class DummyLogger:
@@ -33,11 +36,17 @@ config_stub.logger = DummyLogger()
 models_stub.Account = object
 models_stub.db = types.SimpleNamespace()
 services_stub.sync_service = types.SimpleNamespace()
+extensions_stub.db = models_stub.db
+account_logic_stub.should_throttle_refresh = lambda *a, **k: False
+sql_stub.account_logic = account_logic_stub
 
 sys.modules.setdefault("app", app_stub)
 sys.modules["app.config"] = config_stub
 sys.modules["app.models"] = models_stub
 sys.modules["app.services"] = services_stub
+sys.modules["app.extensions"] = extensions_stub
+sys.modules["app.sql"] = sql_stub
+sys.modules["app.sql.account_logic"] = account_logic_stub
 
 MODULE_PATH = os.path.join(
     os.path.dirname(__file__),
@@ -0,0 +1,156 @@
+"""Tests for columnar analytics snapshots and the queries that read them."""
+
+import os
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture()
+def modules():
+    from app.extensions import db
+    from app.models import Account, Transaction
+    from app.routes.analytics import analytics as analytics_blueprint
+    from app.services import analytics, analytics_snapshots
+
+    return db, Account, Transaction, analytics_blueprint, analytics, analytics_snapshots
+
+
+@pytest.fixture()
+def app(modules):
+    """Provide an app with the analytics blueprint and seeded transactions."""
+
+    db, Account, Transaction, analytics_blueprint, _, _ = modules
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+    app.register_blueprint(analytics_blueprint, url_prefix="/api/analytics")
+    with app.app_context():
+        db.create_all()
+        db.session.add(Account(account_id="acc-1", user_id="user-1", name="Checking", balance=Decimal("0")))
+        db.session.add(
+            Account(account_id="acc-hidden", user_id="user-1", name="Old", balance=Decimal("0"), is_hidden=True)
+        )
+        rows = [
+            ("t1", "acc-1", date(2025, 3, 4), "12.50", "Coffee Co", "Food"),
+            ("t2", "acc-1", date(2025, 3, 20), "7.50", "Coffee Co", "Food"),
+            # Ingested by refresh_data_for_plaid_account, which leaves user_id empty.
+            ("t3", "acc-1", date(2026, 3, 2), "30.00", "Grocer", "Groceries"),
+            ("t4", "acc-1", date(2026, 3, 15), "-1000.00", "Employer", "Income"),
+            ("t5", "acc-hidden", date(2026, 3, 16), "99.00", "Hidden Shop", "Food"),
+            ("t6", "acc-1", date(2026, 4, 1), "20.00", "Coffee Co", "Food"),
+        ]
+        for txn_id, account_id, txn_date, amount, merchant, category in rows:
+            db.session.add(
+                Transaction(
+                    transaction_id=txn_id,
+                    user_id=None if txn_id == "t3" else "user-1",
+                    account_id=account_id,
+                    date=txn_date,
+                    amount=Decimal(amount),
+                    merchant_name=merchant,
+                    category_display=category,
+                )
+            )
+        db.session.add(
+            Transaction(
+                transaction_id="t7",
+                user_id="user-1",
+                account_id="acc-1",
+                date=date(2026, 4, 2),
+                amount=Decimal("500.00"),
+                merchant_name="Savings",
+                is_internal=True,
+            )
+        )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def test_snapshot_refresh_rewrites_only_changed_partitions(app, modules, tmp_path):
+    db, _, Transaction, _, _, snapshots = modules
+    first = snapshots.write_analytics_snapshots(root=tmp_path, datasets=["transactions"])
+    assert first["transactions"] == {"written": 3, "removed": 0, "unchanged": 0}
+    files = sorted(path.name for path in snapshots.user_snapshot_dir("transactions", "user-1", tmp_path).iterdir())
+    assert files == ["_manifest.json", "month=2025-03.parquet", "month=2026-03.parquet", "month=2026-04.parquet"]
+
+    txn = db.session.query(Transaction).filter_by(transaction_id="t6").one()
+    txn.amount = Decimal("25.00")
+    db.session.query(Transaction).filter_by(transaction_id="t1").delete()
+    db.session.query(Transaction).filter_by(transaction_id="t2").delete()
+    db.session.commit()
+
+    second = snapshots.write_analytics_snapshots(root=tmp_path, datasets=["transactions"])
+    assert second["transactions"] == {"written": 1, "removed": 1, "unchanged": 1}
+    forced = snapshots.write_analytics_snapshots(user_id="user-1", root=tmp_path, force=True)
+    assert forced["transactions"]["written"] == 2
+    assert set(forced) == {"transactions", "account_history", "holdings"}
+
+
+@pytest.mark.parametrize("engine", ["duckdb", "pyarrow"])
+def test_analytics_queries_read_snapshots_without_the_database(app, modules, tmp_path, monkeypatch, engine):
+    _, _, _, _, analytics, snapshots = modules
+    if engine == "duckdb" and analytics.duckdb is None:
+        pytest.skip("duckdb is not installed")
+    if engine == "pyarrow":
+        monkeypatch.setattr(analytics, "duckdb", None)
+    snapshots.write_analytics_snapshots(root=tmp_path)
+
+    def _no_database(*args, **kwargs):
+        raise AssertionError("analytics queries must not touch the database")
+
+    monkeypatch.setattr(snapshots.db.session, "execute", _no_database)
+    hidden = {"exclude_account_ids": ["acc-hidden"], "root": tmp_path}
+
+    assert analytics.category_trends("user-1", **hidden) == [
+        {"month": "2025-03", "category": "Food", "amount": 20.0, "count": 2},
+        {"month": "2026-03", "category": "Groceries", "amount": 30.0, "count": 1},
+        {"month": "2026-04", "category": "Food", "amount": 20.0, "count": 1},
+    ]
+    assert analytics.merchant_totals("user-1", top_n=1, root=tmp_path) == [
+        {"label": "Hidden Shop", "amount": 99.0, "count": 1}
+    ]
+    assert analytics.merchant_totals("user-1", start_date=date(2026, 1, 1), **hidden) == [
+        {"label": "Grocer", "amount": 30.0, "count": 1},
+        {"label": "Coffee Co", "amount": 20.0, "count": 1},
+    ]
+
+    yoy = analytics.year_over_year("user-1", year=2026, **hidden)
+    march = yoy["months"][2]
+    assert march["spending"] == 30.0 and march["previous_spending"] == 20.0
+    assert march["spending_change_pct"] == 50.0
+    assert march["income"] == 1000.0 and march["income_change_pct"] is None
+    assert yoy["totals"]["spending"] == {"current": 50.0, "previous": 20.0, "change_pct": 150.0}
+
+
+def test_analytics_routes(app, modules, tmp_path, monkeypatch):
+    _, _, _, _, _, snapshots = modules
+    monkeypatch.setattr(snapshots, "SNAPSHOT_ROOT", tmp_path)
+    client = app.test_client()
+
+    assert client.get("/api/analytics/category_trends").status_code == 400
+    assert client.get("/api/analytics/category_trends?user_id=user-1").status_code == 503
+
+    snapshots.write_analytics_snapshots()
+    response = client.get("/api/analytics/merchant_totals?user_id=user-1&start_date=2026-01-01")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert [row["label"] for row in payload["data"]] == ["Grocer", "Coffee Co"]
+    assert payload["snapshot"]["partitions"] == 3
+    assert datetime.fromisoformat(payload["snapshot"]["generated_at"])
+    assert client.get("/api/analytics/merchant_totals?user_id=user-1&end_date=soon").status_code == 400
+    yoy = client.get("/api/analytics/year_over_year?user_id=user-1&year=2026").get_json()["data"]
+    assert yoy["totals"]["spending"]["current"] == 50.0
@@ -29,15 +29,18 @@ session_ns = types.SimpleNamespace(commit=lambda: None, rollback=lambda: None)
 extensions_stub.db = types.SimpleNamespace(session=session_ns, commit=lambda: None, rollback=lambda: None)
 sys.modules["app.extensions"] = extensions_stub
 
-# Helpers stub
 # Helpers package stub
 helpers_pkg = types.ModuleType("app.helpers")
+plaid_helpers_stub = types.ModuleType("app.helpers.plaid_helpers")
+plaid_helpers_stub.get_accounts = lambda token, user_id: []
+helpers_pkg.plaid_helpers = plaid_helpers_stub
 sys.modules["app.helpers"] = helpers_pkg
+sys.modules["app.helpers.plaid_helpers"] = plaid_helpers_stub
 
 # Utils stub
 utils_pkg = types.ModuleType("app.utils")
 finance_utils_stub = types.ModuleType("app.utils.finance_utils")
-finance_utils_stub.normalize_account_balance = lambda bal, t: bal
+finance_utils_stub.normalize_account_balance = lambda bal, t, **kwargs: bal
 utils_pkg.finance_utils = finance_utils_stub
 sys.modules["app.utils"] = utils_pkg
 sys.modules["app.utils.finance_utils"] = finance_utils_stub
@@ -55,6 +58,8 @@ models_stub = types.ModuleType("app.models")
 
 
 class DummyAccount:
+    plaid_account = None
+
     def __init__(self, aid, link_type="Plaid"):
         self.account_id = aid
         self.name = aid
@@ -69,6 +74,8 @@ class DummyAccount:
 
 
 class DummyInstitution:
+    accounts = ()
+
     def __init__(self, iid, accounts):
         self.id = iid
         self.name = f"Inst {iid}"
@@ -81,6 +88,9 @@ class InstQuery:
     def __init__(self, insts):
         self.insts = {i.id: i for i in insts}
 
+    def options(self, *options):
+        return self
+
     def all(self):
         return list(self.insts.values())
 
@@ -88,6 +98,12 @@ class InstQuery:
         return self.insts[iid]
 
 
+class DummyLoaderOption:
+    def selectinload(self, *attrs):
+        return self
+
+
+models_stub.Account = DummyAccount
 models_stub.Institution = DummyInstitution
 sys.modules["app.models"] = models_stub
 
@@ -95,6 +111,7 @@ ROUTE_PATH = os.path.join(BASE_BACKEND, "app", "routes", "institutions.py")
 spec = importlib.util.spec_from_file_location("app.routes.institutions", ROUTE_PATH)
 inst_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(inst_module)
+inst_module.selectinload = lambda *attrs: DummyLoaderOption()
 
 
 @pytest.fixture
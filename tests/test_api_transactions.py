@@ -41,10 +41,12 @@ sys.modules["app.extensions"] = extensions_stub
 sql_pkg = types.ModuleType("app.sql")
 account_logic_stub = types.ModuleType("app.sql.account_logic")
 account_logic_stub.get_paginated_transactions = lambda *a, **k: ([{"id": "t1"}], 1, {})
-account_logic_stub.invalidate_tx_cache = lambda: None
+account_logic_stub.invalidate_tx_cache = lambda *a, **k: None
 sys.modules["app.sql"] = sql_pkg
 sys.modules["app.sql.account_logic"] = account_logic_stub
 sql_pkg.account_logic = account_logic_stub
+search_logic_stub = types.ModuleType("app.sql.search_logic")
+search_logic_stub.refresh_search_documents = lambda *a, **k: 0
 
 models_stub = types.ModuleType("app.models")
 models_stub.Account = type("Account", (), {})
@@ -54,10 +56,28 @@ models_stub.Transaction = type("Transaction", (), {})
 models_stub.AccountHistory = type("AccountHistory", (), {})
 sys.modules["app.models"] = models_stub
 
+http_cache_stub = types.ModuleType("app.utils.http_cache")
+http_cache_stub.conditional_get = lambda *a, **k: lambda view: view
+sys.modules["app.utils.http_cache"] = http_cache_stub
+
+# Stubbed only while the route module imports; later test modules need the real router.
+read_replica_stub = types.ModuleType("app.utils.read_replica")
+read_replica_stub.read_replica = lambda *a, **k: lambda view: view
+read_replica_stub.RoutingSession = type("RoutingSession", (), {})
+read_replica_stub.note_write = lambda user_id=None: None
+_real_read_replica = sys.modules.get("app.utils.read_replica")
+sys.modules["app.utils.read_replica"] = read_replica_stub
+
 ROUTE_PATH = os.path.join(BASE_BACKEND, "app", "routes", "transactions.py")
 spec = importlib.util.spec_from_file_location("app.routes.transactions", ROUTE_PATH)
 transactions_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(transactions_module)
+try:
+    spec.loader.exec_module(transactions_module)
+finally:
+    if _real_read_replica is None:
+        sys.modules.pop("app.utils.read_replica", None)
+    else:
+        sys.modules["app.utils.read_replica"] = _real_read_replica
 
 
 class _Expr:
@@ -81,7 +101,9 @@ class _Expr:
 
 
 @pytest.fixture
-def client():
+def client(monkeypatch):
+    # Routes import search_logic lazily; other test modules may replace app.sql.
+    monkeypatch.setitem(sys.modules, "app.sql.search_logic", search_logic_stub)
     app = Flask(__name__)
     app.register_blueprint(transactions_module.transactions, url_prefix="/api/transactions")
     app.config["TESTING"] = True
@@ -127,6 +149,7 @@ def test_account_transactions_recent_limited_and_sorted(client, monkeypatch):
         tx_type=None,
         transaction_id=None,
         include_running_balance=False,
+        fields=None,
     ):
         captured["recent"] = recent
         captured["limit"] = limit
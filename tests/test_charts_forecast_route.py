@@ -66,6 +66,18 @@ def _load_charts_module():
     finance_utils_stub.normalize_account_balance = lambda balance, *_args, **_kwargs: balance
     sys.modules["app.utils.finance_utils"] = finance_utils_stub
 
+    http_cache_stub = types.ModuleType("app.utils.http_cache")
+    http_cache_stub.conditional_get = lambda *a, **k: lambda view: view
+    sys.modules["app.utils.http_cache"] = http_cache_stub
+
+    # Stubbed only while the route module imports; later test modules need the real router.
+    read_replica_stub = types.ModuleType("app.utils.read_replica")
+    read_replica_stub.read_replica = lambda *a, **k: lambda view: view
+    read_replica_stub.RoutingSession = type("RoutingSession", (), {})
+    read_replica_stub.note_write = lambda user_id=None: None
+    _real_read_replica = sys.modules.get("app.utils.read_replica")
+    sys.modules["app.utils.read_replica"] = read_replica_stub
+
     sqlalchemy_stub = types.ModuleType("sqlalchemy")
     sqlalchemy_stub.case = lambda *args, **kwargs: None
     sqlalchemy_stub.func = types.SimpleNamespace(
@@ -141,7 +153,13 @@ def _load_charts_module():
     spec = importlib.util.spec_from_file_location("app.routes.charts", CHARTS_PATH)
     module = importlib.util.module_from_spec(spec)
     assert spec and spec.loader
-    spec.loader.exec_module(module)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        if _real_read_replica is None:
+            sys.modules.pop("app.utils.read_replica", None)
+        else:
+            sys.modules["app.utils.read_replica"] = _real_read_replica
     return module
 
 
@@ -66,6 +66,10 @@ safe_to_spend_stub.build_safe_to_spend_payload = lambda inputs: {
 }
 sys.modules["app.services.safe_to_spend"] = safe_to_spend_stub
 
+http_cache_stub = types.ModuleType("app.utils.http_cache")
+http_cache_stub.conditional_get = lambda *a, **k: lambda view: view
+sys.modules["app.utils.http_cache"] = http_cache_stub
+
 ROUTE_PATH = os.path.join(BASE_BACKEND, "app", "routes", "dashboard.py")
 spec = importlib.util.spec_from_file_location("app.routes.dashboard", ROUTE_PATH)
 dashboard_module = importlib.util.module_from_spec(spec)
@@ -0,0 +1,127 @@
+"""Tests for per-user data version tokens."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+from app.extensions import db  # noqa: E402
+from app.models import Account, Tag, Transaction  # noqa: E402
+from app.sql.data_version import bump_data_version, get_cached_data_version, get_data_version  # noqa: E402
+
+
+@pytest.fixture()
+def app_context():
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Account(account_id="acc-1", user_id="user-1", name="Checking", balance=Decimal("10.00")))
+        db.session.commit()
+        yield
+        db.session.remove()
+        db.drop_all()
+
+
+def test_data_version_changes_when_user_rows_change(app_context):
+    before = get_data_version("user-1")
+    assert get_data_version("user-1") == before
+
+    db.session.add(
+        Transaction(
+            transaction_id="tx-1",
+            user_id="user-1",
+            account_id="acc-1",
+            amount=Decimal("-5.00"),
+            date=date(2026, 1, 2),
+        )
+    )
+    db.session.commit()
+
+    assert get_data_version("user-1") != before
+
+
+def test_data_version_sees_transactions_owned_through_their_account(app_context):
+    # Refresh-ingested rows have no user_id; the account says who owns them.
+    transaction = Transaction(transaction_id="tx-1", account_id="acc-1", amount=Decimal("-5.00"), date=date(2026, 1, 2))
+    db.session.add(transaction)
+    db.session.commit()
+    before_edit = get_data_version("user-1")
+
+    transaction.amount = Decimal("-7.00")
+    transaction.category = "Travel"
+    db.session.commit()
+
+    assert get_data_version("user-1") != before_edit
+
+
+def test_bump_data_version_scopes_to_user_or_everyone(app_context):
+    user_1 = get_data_version("user-1")
+    user_2 = get_data_version("user-2")
+
+    bump_data_version("user-1")
+    assert get_data_version("user-1") != user_1
+    assert get_data_version("user-2") == user_2
+
+    bump_data_version()
+    assert get_data_version("user-2") != user_2
+
+
+def test_global_data_version_tracks_any_user(app_context):
+    everyone = get_data_version(None)
+    user_2 = get_data_version("user-2")
+
+    bump_data_version("user-1")
+    assert get_data_version(None) != everyone
+    assert get_data_version("user-2") == user_2
+
+
+def test_data_version_sees_in_place_edits_and_tag_links(app_context):
+    transaction = Transaction(
+        transaction_id="tx-1",
+        user_id="user-1",
+        account_id="acc-1",
+        amount=Decimal("-5.00"),
+        date=date(2026, 1, 2),
+        category="Food",
+    )
+    db.session.add(transaction)
+    db.session.commit()
+    before_edit = get_data_version("user-1")
+
+    # Counts, max id and the amount sum stay the same; only updated_at moves.
+    transaction.category = "Travel"
+    db.session.commit()
+    before_tag = get_data_version("user-1")
+    assert before_tag != before_edit
+
+    transaction.tags.append(Tag(user_id="user-1", name="trip"))
+    db.session.commit()
+    assert get_data_version("user-1") != before_tag
+
+
+def test_cached_data_version_rechecks_after_max_age_or_a_local_bump(app_context):
+    cached = get_cached_data_version("user-1")
+    db.session.add(Account(account_id="acc-2", user_id="user-1", name="Savings", balance=Decimal("1.00")))
+    db.session.commit()
+
+    # Another worker's write is only seen once the cached result expires.
+    assert get_cached_data_version("user-1") == cached
+    assert get_cached_data_version("user-1", max_age=0) == get_data_version("user-1") != cached
+
+    refreshed = get_cached_data_version("user-1")
+    bump_data_version("user-1")
+    assert get_cached_data_version("user-1") != refreshed
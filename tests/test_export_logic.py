@@ -0,0 +1,152 @@
+"""Tests for streaming exports in ``app.sql.export_logic`` and the export route."""
+
+import csv
+import io
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+os.environ.setdefault("PLAID_CLIENT_ID", "sandbox-client")
+os.environ.setdefault("PLAID_SECRET_KEY", "sandbox-secret")
+os.environ.setdefault("CLIENT_NAME", "pyNance Test Suite")
+os.environ.setdefault("BACKEND_PUBLIC_URL", "http://localhost")
+
+
+@pytest.fixture()
+def modules():
+    from app.extensions import db
+    from app.models import Account, Transaction
+    from app.routes.export import export
+    from app.sql import export_logic
+
+    return db, Account, Transaction, export, export_logic
+
+
+@pytest.fixture()
+def export_logic(modules):
+    return modules[-1]
+
+
+@pytest.fixture()
+def client(modules):
+    """Provide an export API client over an in-memory SQLite database."""
+
+    db, Account, Transaction, export_blueprint, _ = modules
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    app.register_blueprint(export_blueprint, url_prefix="/export")
+    with app.app_context():
+        db.create_all()
+        for user_id, account_id in (("user-1", "acc-1"), ("user-1", "acc-2"), ("user-2", "acc-3")):
+            db.session.add(Account(account_id=account_id, user_id=user_id, name=account_id, balance=Decimal("0")))
+        for index in range(12):
+            account_id = ("acc-1", "acc-2", "acc-3")[index % 3]
+            db.session.add(
+                Transaction(
+                    transaction_id=f"txn-{index:02d}",
+                    # txn-04 was ingested by a refresh, which leaves user_id empty.
+                    user_id=None if index == 4 else ("user-2" if account_id == "acc-3" else "user-1"),
+                    account_id=account_id,
+                    amount=Decimal(f"-{index}.25"),
+                    date=date(2026, 1, 1) + timedelta(days=index),
+                    description=f'Row {index}, "quoted"',
+                    updated_at=datetime(2026, 2, 1) + timedelta(hours=index),
+                )
+            )
+        db.session.commit()
+        with app.test_client() as test_client:
+            yield test_client
+        db.session.remove()
+        db.drop_all()
+
+
+def test_csv_export_streams_chunks_with_filters(client, export_logic, monkeypatch):
+    chunks = []
+    original = export_logic.iter_row_chunks
+
+    def _recording(stmt, chunk_size=export_logic.CHUNK_SIZE):
+        for rows in original(stmt, 2):
+            chunks.append(len(rows))
+            yield rows
+
+    monkeypatch.setattr(export_logic, "iter_row_chunks", _recording)
+    response = client.get(
+        "/export/transactions?user_id=user-1&account_ids=acc-1&start_date=2026-01-02&end_date=2026-01-11"
+    )
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "text/csv"
+    assert response.headers["Content-Disposition"] == "attachment; filename=transactions.csv"
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row["transaction_id"] for row in rows] == ["txn-03", "txn-06", "txn-09"]
+    assert rows[0]["description"] == 'Row 3, "quoted"'
+    assert rows[0]["amount"] == "-3.25"
+    assert chunks == [2, 1]
+
+
+def test_user_export_follows_account_ownership(client):
+    response = client.get("/export/transactions?format=ndjson&user_id=user-1")
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line["transaction_id"] for line in lines] == [
+        "txn-00",
+        "txn-01",
+        "txn-03",
+        "txn-04",
+        "txn-06",
+        "txn-07",
+        "txn-09",
+        "txn-10",
+    ]
+    assert lines[3]["user_id"] is None
+
+
+def test_ndjson_incremental_export_uses_watermark(client, modules):
+    response = client.get("/export/transactions?format=ndjson&since=2026-02-01T09:00:00Z")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert datetime.fromisoformat(response.headers["X-Export-Watermark"])
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line["transaction_id"] for line in lines] == ["txn-09", "txn-10", "txn-11"]
+    assert set(lines[0]) == {column.name for column in modules[2].__table__.columns}
+
+
+def test_export_rejects_bad_input(client, export_logic, monkeypatch):
+    assert client.get("/export/budgets").status_code == 404
+    assert client.get("/export/transactions?format=xml").status_code == 400
+    assert client.get("/export/transactions?start_date=01/02/2026").status_code == 400
+    assert client.get("/export/accounts?start_date=2026-01-01").status_code == 400
+
+    monkeypatch.setattr(export_logic, "pq", None)
+    assert client.get("/export/transactions?format=parquet").status_code == 501
+
+
+def test_parquet_export_writes_one_row_group_per_chunk(client, export_logic):
+    pq = pytest.importorskip("pyarrow.parquet")
+    with client.application.test_request_context():
+        stmt = export_logic.build_export_query("transactions")
+        body = b"".join(export_logic.iter_parquet_chunks(stmt, chunk_size=5))
+
+    parquet = pq.ParquetFile(io.BytesIO(body))
+    assert parquet.metadata.num_rows == 12
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("amount")[1].as_py() == Decimal("-1.25")
+    assert table.column("date")[0].as_py() == date(2026, 1, 1)
@@ -0,0 +1,66 @@
+"""Tests for the forecast result cache."""
+
+import os
+import sys
+
+BASE_BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend"))
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+from forecast.cache import ForecastResultCache, request_cache_key  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_request_cache_key_ignores_key_order_and_tracks_data_version():
+    first = request_cache_key({"horizon_days": 30, "graph_mode": "combined"}, "v1")
+    reordered = request_cache_key({"graph_mode": "combined", "horizon_days": 30}, "v1")
+
+    assert first == reordered
+    assert first != request_cache_key({"horizon_days": 30, "graph_mode": "combined"}, "v2")
+    assert first != request_cache_key({"horizon_days": 60, "graph_mode": "combined"}, "v1")
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = ForecastResultCache(max_entries=2)
+    cache.set("a", {"metadata": {"id": "a"}})
+    cache.set("b", {"metadata": {"id": "b"}})
+    assert cache.get("a") is not None
+
+    cache.set("c", {"metadata": {"id": "c"}})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"metadata": {"id": "a"}}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ForecastResultCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.set("a", {"metadata": {}})
+
+    clock.now = 9.9
+    assert cache.get("a") is not None
+    clock.now = 10.0
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"], stats["size"]) == (1, 1, 1, 0)
+
+
+def test_cached_payloads_are_isolated_from_caller_mutation():
+    cache = ForecastResultCache()
+    payload = {"metadata": {"tags": ["x"]}}
+    cache.set("a", payload)
+    payload["metadata"]["tags"].append("y")
+
+    cached = cache.get("a")
+    cached["metadata"]["cache"] = {"hit": True}
+
+    assert cache.get("a") == {"metadata": {"tags": ["x"]}}
@@ -55,6 +55,30 @@ sql_pkg.forecast_logic = forecast_logic_stub
 sys.modules["app.sql"] = sql_pkg
 sys.modules["app.sql.forecast_logic"] = forecast_logic_stub
 
+data_version_stub = types.ModuleType("app.sql.data_version")
+
+
+def _data_version_unavailable(user_id):
+    raise RuntimeError("no database in route tests")
+
+
+data_version_stub.get_data_version = _data_version_unavailable
+data_version_stub.bump_data_version = lambda user_id=None: None
+sql_pkg.data_version = data_version_stub
+sys.modules["app.sql.data_version"] = data_version_stub
+
+# ---- app.utils.read_replica ----
+utils_pkg = types.ModuleType("app.utils")
+utils_pkg.__path__ = []
+sys.modules.setdefault("app.utils", utils_pkg)
+# Stubbed only while the route module imports; later test modules need the real router.
+read_replica_stub = types.ModuleType("app.utils.read_replica")
+read_replica_stub.read_replica = lambda *a, **k: lambda view: view
+read_replica_stub.RoutingSession = type("RoutingSession", (), {})
+read_replica_stub.note_write = lambda user_id=None: None
+_real_read_replica = sys.modules.get("app.utils.read_replica")
+sys.modules["app.utils.read_replica"] = read_replica_stub
+
 # ---- app.services.forecast_engine etc ----
 services_pkg = types.ModuleType("app.services")
 services_pkg.__path__ = []
@@ -139,6 +163,11 @@ try:
     spec.loader.exec_module(forecast_module)
 except Exception:
     pytest.skip("forecast module import failed", allow_module_level=True)
+finally:
+    if _real_read_replica is None:
+        sys.modules.pop("app.utils.read_replica", None)
+    else:
+        sys.modules["app.utils.read_replica"] = _real_read_replica
 
 # ---- Load forecast orchestrator for monkeypatching ----
 SERVICES_PATH = os.path.join(BASE_BACKEND, "app", "services", "forecast_orchestrator.py")
@@ -554,6 +583,237 @@ def test_forecast_compute_accepts_new_compute_contract_fields(client, monkeypatc
     assert captured["graph_mode"] == "historical"
 
 
+def test_forecast_compute_engine_selection(client, monkeypatch):
+    calls = []
+
+    def fake_engine(name):
+        def compute(**kwargs):
+            calls.append((name, kwargs["horizon_days"]))
+            return {"timeline": [], "summary": None, "cashflows": [], "adjustments": [], "metadata": {}}
+
+        return compute
+
+    monkeypatch.setattr(forecast_module, "_load_latest_snapshots", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "_load_historical_aggregates", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "compute_forecast", fake_engine("reference"))
+    monkeypatch.setattr(forecast_module, "compute_forecast_vectorized", fake_engine("vectorized"))
+    monkeypatch.setattr(forecast_module, "_auto_wage_adjustments", lambda **_: [])
+    monkeypatch.setattr(forecast_module, "_auto_rent_adjustments", lambda **_: [])
+
+    long_horizon = forecast_module.VECTORIZED_ENGINE_MIN_HORIZON_DAYS
+    for body in (
+        {"horizon_days": 30},
+        {"horizon_days": long_horizon},
+        {"horizon_days": long_horizon, "engine": "reference"},
+        {"horizon_days": 30, "engine": "vectorized"},
+    ):
+        resp = client.post("/api/forecast/compute", json={"user_id": "user-1", **body})
+        assert resp.status_code == 200
+
+    assert calls == [
+        ("reference", 30),
+        ("vectorized", long_horizon),
+        ("reference", long_horizon),
+        ("vectorized", 30),
+    ]
+
+    resp = client.post("/api/forecast/compute", json={"user_id": "user-1", "engine": "gpu"})
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "engine must be one of auto, reference, or vectorized."}
+
+
+def test_forecast_compute_passes_output_mode_and_cashflow_range(client, monkeypatch):
+    captured = {}
+
+    def fake_compute_forecast(**kwargs):
+        captured.update(kwargs)
+        return {"summary": None, "adjustments": [], "metadata": {"output": kwargs["output"]}}
+
+    monkeypatch.setattr(forecast_module, "_load_latest_snapshots", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "_load_historical_aggregates", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "compute_forecast", fake_compute_forecast)
+    monkeypatch.setattr(forecast_module, "_auto_wage_adjustments", lambda **_: [])
+    monkeypatch.setattr(forecast_module, "_auto_rent_adjustments", lambda **_: [])
+
+    resp = client.post(
+        "/api/forecast/compute",
+        json={
+            "user_id": "user-1",
+            "output": "Columnar",
+            "cashflow_start": "2026-02-01",
+            "cashflow_end": "2026-02-07",
+        },
+    )
+
+    assert resp.status_code == 200
+    assert captured["output"] == "columnar"
+    assert [bound.isoformat() for bound in captured["cashflow_range"]] == ["2026-02-01", "2026-02-07"]
+
+    resp = client.post("/api/forecast/compute", json={"user_id": "user-1", "output": "csv"})
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "output must be one of full, summary, or columnar."}
+
+    resp = client.post(
+        "/api/forecast/compute",
+        json={"user_id": "user-1", "cashflow_start": "2026-02-07", "cashflow_end": "2026-02-01"},
+    )
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "cashflow_end must be on or after cashflow_start."}
+
+
+def test_forecast_compute_batch_loads_base_data_once(client, monkeypatch):
+    load_calls = []
+    compute_calls = []
+
+    def fake_snapshots(user_id, included_account_ids=None, excluded_account_ids=None):
+        load_calls.append(("snapshots", included_account_ids))
+        return [
+            {"account_id": "acct-1", "balance": 100.0, "account_type": "depository"},
+            {"account_id": "acct-2", "balance": 50.0, "account_type": "depository"},
+        ]
+
+    def fake_account_aggregates(user_id, start_date, included_account_ids=None):
+        load_calls.append(("aggregates", included_account_ids))
+        return [
+            {"account_id": "acct-1", "date": "2026-01-01", "inflow": 10.0, "outflow": 4.0},
+            {"account_id": "acct-2", "date": "2026-01-01", "inflow": 5.0, "outflow": 1.0},
+        ]
+
+    def fake_candidates(*, user_id, start_date, included_account_ids=None, excluded_account_ids=None):
+        load_calls.append(("candidates", included_account_ids))
+        return []
+
+    def fake_compute_forecast(**kwargs):
+        compute_calls.append(kwargs)
+        return {"timeline": [], "summary": None, "cashflows": [], "adjustments": [], "metadata": kwargs["metadata"]}
+
+    monkeypatch.setattr(forecast_module, "_load_latest_snapshots", fake_snapshots)
+    monkeypatch.setattr(forecast_module, "_load_account_historical_aggregates", fake_account_aggregates)
+    monkeypatch.setattr(forecast_module, "_load_auto_adjustment_candidates", fake_candidates)
+    monkeypatch.setattr(forecast_module, "compute_forecast", fake_compute_forecast)
+    monkeypatch.setattr(forecast_module, "compute_forecast_vectorized", fake_compute_forecast)
+
+    resp = client.post(
+        "/api/forecast/compute/batch",
+        json={
+            "user_id": "user-1",
+            "horizon_days": 30,
+            "scenarios": [
+                {"id": "base"},
+                {"id": "raise", "adjustments": [{"label": "Raise", "amount": 200, "date": "2026-02-01"}]},
+                {"id": "no-acct-2", "excluded_account_ids": ["acct-2"]},
+                {"id": "acct-2-only", "included_account_ids": ["acct-2"]},
+            ],
+        },
+    )
+
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["metadata"]["scenario_ids"] == ["base", "raise", "no-acct-2", "acct-2-only"]
+    assert sorted(body["scenarios"]) == sorted(body["metadata"]["scenario_ids"])
+    assert body["metadata"]["scenario_count"] == 4
+    assert body["metadata"]["distinct_account_filters"] == 3
+    assert load_calls == [
+        ("snapshots", None),
+        ("aggregates", None),
+        ("candidates", None),
+        ("snapshots", ["acct-2"]),
+        ("aggregates", ["acct-2"]),
+        ("candidates", ["acct-2"]),
+    ]
+
+    balances = [call["metadata"]["starting_balance"] for call in compute_calls]
+    inflows = [call["metadata"]["contribution_totals"]["historical_inflow"] for call in compute_calls]
+    assert balances == [150.0, 150.0, 100.0, 50.0]
+    assert inflows == [15.0, 15.0, 10.0, 5.0]
+    assert len(compute_calls[1]["adjustments"]) == 1
+
+
+def test_forecast_compute_batch_validates_scenarios(client):
+    resp = client.post("/api/forecast/compute/batch", json={"user_id": "user-1", "scenarios": []})
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "scenarios must be a non-empty list."}
+
+    resp = client.post(
+        "/api/forecast/compute/batch",
+        json={"user_id": "user-1", "scenarios": [{"id": "a"}, {"id": "a"}]},
+    )
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "scenario id a is duplicated."}
+
+    resp = client.post(
+        "/api/forecast/compute/batch",
+        json={"user_id": "user-1", "scenarios": [{"id": "bad", "adjustments": "nope"}]},
+    )
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "scenario bad: adjustments must be a list."}
+
+
+def test_forecast_compute_reuses_cached_result_until_data_version_changes(client, monkeypatch):
+    calls = []
+    versions = {"user-1": "v1"}
+
+    def fake_compute_forecast(**kwargs):
+        calls.append(kwargs["graph_mode"])
+        return {"timeline": [], "summary": None, "cashflows": [], "adjustments": [], "metadata": {"run": len(calls)}}
+
+    monkeypatch.setattr(forecast_module, "get_data_version", lambda user_id: versions[user_id])
+    monkeypatch.setattr(forecast_module, "FORECAST_RESULT_CACHE", forecast_module.ForecastResultCache(max_entries=2))
+    monkeypatch.setattr(forecast_module, "_load_latest_snapshots", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "_load_historical_aggregates", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "compute_forecast", fake_compute_forecast)
+    monkeypatch.setattr(forecast_module, "_auto_wage_adjustments", lambda **_: [])
+    monkeypatch.setattr(forecast_module, "_auto_rent_adjustments", lambda **_: [])
+
+    def post(**body):
+        resp = client.post(
+            "/api/forecast/compute",
+            json={"user_id": "user-1", "start_date": "2026-01-01", "horizon_days": 30, **body},
+        )
+        assert resp.status_code == 200
+        return resp.get_json()["metadata"]
+
+    first = post()
+    assert first["run"] == 1
+    assert first["cache"]["hit"] is False
+    assert first["cache"]["misses"] == 1
+
+    second = post()
+    assert second["run"] == 1
+    assert second["cache"]["hit"] is True
+    assert second["cache"]["hits"] == 1
+
+    assert post(graph_mode="forecast")["cache"]["hit"] is False
+    assert post(graph_mode="forecast")["cache"]["hit"] is True
+
+    versions["user-1"] = "v2"
+    refreshed = post()
+    assert refreshed["cache"]["hit"] is False
+    assert refreshed["cache"]["evictions"] == 1
+    assert calls == ["combined", "forecast", "combined"]
+
+
+def test_forecast_compute_bypasses_cache_without_data_version(client, monkeypatch):
+    calls = []
+
+    def fake_compute_forecast(**kwargs):
+        calls.append(kwargs)
+        return {"timeline": [], "summary": None, "cashflows": [], "adjustments": [], "metadata": {}}
+
+    monkeypatch.setattr(forecast_module, "_load_latest_snapshots", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "_load_historical_aggregates", lambda *a, **k: [])
+    monkeypatch.setattr(forecast_module, "compute_forecast", fake_compute_forecast)
+    monkeypatch.setattr(forecast_module, "_auto_wage_adjustments", lambda **_: [])
+    monkeypatch.setattr(forecast_module, "_auto_rent_adjustments", lambda **_: [])
+
+    for _ in range(2):
+        resp = client.post("/api/forecast/compute", json={"user_id": "user-1"})
+        assert resp.status_code == 200
+        assert "cache" not in resp.get_json()["metadata"]
+
+    assert len(calls) == 2
+
+
 def test_auto_wage_adjustments_include_bounded_source_transaction_references(monkeypatch):
     class FieldStub:
         def is_(self, other):
@@ -0,0 +1,107 @@
+"""Tests for the statistical forecast engine and fitted-model registry."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("statsmodels")
+pytest.importorskip("sklearn")
+
+BASE_BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend"))
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+MODULE_NAME = "app.services.forecast_stat_model"
+MODULE_PATH = os.path.join(BASE_BACKEND, "app", "services", "forecast_stat_model.py")
+
+if not hasattr(sys.modules.get("app.config"), "logger"):
+    config_stub = types.ModuleType("app.config")
+    config_stub.logger = types.SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None)
+    sys.modules["app.config"] = config_stub
+
+spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+stat_model = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(stat_model)
+
+
+@pytest.fixture(autouse=True)
+def registered_module(monkeypatch):
+    """Expose the module under its import name so fitted entries and pool tasks pickle."""
+    for package_name in ("app", "app.services"):
+        if package_name not in sys.modules:
+            package = types.ModuleType(package_name)
+            package.__path__ = []
+            monkeypatch.setitem(sys.modules, package_name, package)
+    monkeypatch.setitem(sys.modules, MODULE_NAME, stat_model)
+
+
+def _series(length, offset=0):
+    index = pd.date_range("2026-01-01", periods=length, freq="D")
+    values = [100 + offset + day * 0.5 + (day % 7) for day in range(length)]
+    return pd.Series(values, index=index, dtype=float)
+
+
+def test_module_import_defers_heavy_dependencies():
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); "
+        f"import {MODULE_NAME}; "
+        "heavy = [name for name in ('pandas', 'statsmodels', 'sklearn') if name in sys.modules]; "
+        "print('HEAVY=' + ','.join(heavy))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, BASE_BACKEND],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"},
+    )
+
+    assert "HEAVY=\n" in result.stdout
+
+
+def test_registry_reuses_warm_starts_and_cold_fits():
+    registry = stat_model.StatModelRegistry(order=(1, 0, 0))
+    series = _series(60)
+
+    first = registry.get_or_fit(user_id="u1", account_ids=["b", "a"], series=series)
+    assert registry.get_or_fit(user_id="u1", account_ids=["a", "b"], series=series) is first
+
+    appended = registry.get_or_fit(user_id="u1", account_ids=["a", "b"], series=_series(65))
+    assert appended is not first
+    assert len(appended.forecast(steps=3)) == 3
+
+    registry.get_or_fit(user_id="u1", account_ids=["a", "b"], series=_series(65, offset=5))
+
+    assert registry.stats == {"hits": 1, "warm_refits": 1, "cold_fits": 2, "evictions": 0, "disk_loads": 0}
+
+
+def test_registry_evicts_least_recently_used_and_reloads_from_disk(tmp_path):
+    registry = stat_model.StatModelRegistry(max_entries=1, persist_dir=str(tmp_path), order=(1, 0, 0))
+    series = _series(40)
+
+    registry.get_or_fit(user_id="u1", series=series)
+    registry.get_or_fit(user_id="u2", series=series)
+    assert registry.stats["evictions"] == 1
+
+    registry.get_or_fit(user_id="u1", series=series)
+    assert registry.stats["disk_loads"] == 1
+    assert registry.stats["hits"] == 1
+
+    restarted = stat_model.StatModelRegistry(persist_dir=str(tmp_path), order=(1, 0, 0))
+    restarted.get_or_fit(user_id="u2", series=series)
+    assert restarted.stats["hits"] == 1
+    assert restarted.stats["cold_fits"] == 0
+
+
+def test_evaluate_many_matches_sequential_backtests():
+    series_list = [_series(50), _series(50, offset=3)]
+
+    sequential = [stat_model.ForecastEngine(order=(1, 0, 0)).evaluate(series, steps=5) for series in series_list]
+    pooled = stat_model.evaluate_many(series_list, steps=5, order=(1, 0, 0), max_workers=2)
+
+    assert pooled == pytest.approx(sequential)
@@ -0,0 +1,205 @@
+"""Parity tests for the NumPy-backed forecast engine."""
+
+import math
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+BASE_BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend"))
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+from forecast.engine import compute_forecast  # noqa: E402
+from forecast.vectorized import (  # noqa: E402
+    ForecastCalendar,
+    adjustment_schedule_cents,
+    compute_forecast_vectorized,
+)
+
+
+def _assert_payload_close(reference, candidate, path="payload", abs_tol=0.011):
+    """Recursively compare payloads, allowing sub-cent float differences."""
+    if isinstance(reference, dict):
+        assert isinstance(candidate, dict), path
+        assert list(reference) == list(candidate), path
+        for key in reference:
+            _assert_payload_close(reference[key], candidate[key], f"{path}.{key}", abs_tol)
+    elif isinstance(reference, list):
+        assert isinstance(candidate, list), path
+        assert len(reference) == len(candidate), path
+        for index, (left, right) in enumerate(zip(reference, candidate)):
+            _assert_payload_close(left, right, f"{path}[{index}]", abs_tol)
+    elif isinstance(reference, float) or isinstance(candidate, float):
+        assert math.isclose(reference, candidate, rel_tol=1e-9, abs_tol=abs_tol), (path, reference, candidate)
+    else:
+        assert reference == candidate, (path, reference, candidate)
+
+
+def _scenario_inputs(**overrides):
+    start = date(2026, 1, 1)
+    inputs = dict(
+        user_id=1,
+        start_date=start,
+        horizon_days=400,
+        latest_snapshots=[
+            {"account_id": "chk", "balance": 1234.56, "date": "2026-01-01", "account_type": "depository"},
+            {"account_id": "cc", "balance": -300.0, "date": "2026-01-01", "account_type": "credit_card"},
+        ],
+        historical_aggregates=[
+            {
+                "date": (start - timedelta(days=offset)).isoformat(),
+                "inflow": float(40 + offset % 13),
+                "outflow": float(35 + offset % 7),
+            }
+            for offset in range(1, 91)
+        ],
+        adjustments=[
+            {"label": "Bonus", "amount": 500.0, "date": "2026-02-15", "adjustment_type": "manual"},
+            {"label": "Gym", "amount": -45.5, "date": "2025-12-20", "frequency": "monthly"},
+            {"label": "Coffee", "amount": -4.25, "date": "2025-12-29", "frequency": "weekly"},
+            {"label": "Savings", "amount": -3.1, "date": "2026-03-01", "frequency": "daily"},
+            {"label": "Auto wage income", "amount": 1800.0, "date": "2026-01-15", "adjustment_type": "auto_income"},
+            {
+                "label": "Trip",
+                "amount": -100.0,
+                "distribution": "spread",
+                "range_start": "2026-04-01",
+                "range_end": "2026-04-03",
+            },
+        ],
+    )
+    inputs.update(overrides)
+    return inputs
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"moving_average_window": 7, "normalize": True},
+        {
+            "recurring_sources": [
+                {"label": "Rent", "amount": -1500.0, "date": "2026-01-05", "frequency": "monthly", "recurring_id": 7},
+                {"label": "Payroll", "amount": 2100.0, "date": "2025-12-26", "frequency": "weekly"},
+            ],
+            "category_averages": [
+                {"category": "Groceries", "outflow": 30.0},
+                {"category": "Salary", "inflow": 55.0},
+            ],
+        },
+        {"horizon_days": 0},
+        {"adjustments": []},
+        {
+            "adjustments": [
+                {
+                    "label": f"Spread {index}",
+                    "amount": amount,
+                    "distribution": "spread",
+                    "range_start": (date(2026, 1, 3) + timedelta(days=2 * index)).isoformat(),
+                    "range_end": (date(2026, 1, 3) + timedelta(days=2 * index + length)).isoformat(),
+                }
+                for index, (amount, length) in enumerate(
+                    [(-177.47, 6), (233.33, 10), (-91.01, 12), (12.34, 2), (-58.19, 8), (401.11, 16)]
+                )
+            ],
+            "category_averages": [
+                {"category": "Dining", "outflow": 8.06},
+                {"category": "Transit", "outflow": 1.57},
+                {"category": "Groceries", "outflow": 46.22},
+                {"category": "Rent", "outflow": 68.0},
+            ],
+        },
+    ],
+)
+def test_vectorized_payload_matches_reference(overrides):
+    """The array engine should reproduce the reference payload within a cent."""
+    inputs = _scenario_inputs(**overrides)
+
+    _assert_payload_close(compute_forecast(**inputs), compute_forecast_vectorized(**inputs))
+
+
+def test_vectorized_matches_existing_engine_fixture():
+    """The vectorized engine mirrors the serialized payload contract of the reference engine."""
+    payload = compute_forecast_vectorized(
+        user_id=1,
+        start_date=date(2026, 1, 1),
+        horizon_days=2,
+        latest_snapshots=[{"account_id": "a1", "balance": 100.0, "date": "2026-01-01"}],
+        historical_aggregates=[{"date": "2025-12-31", "inflow": 20.0, "outflow": 10.0}],
+        adjustments=[{"label": "One-off", "amount": -50.0, "date": "2026-01-01", "adjustment_type": "manual"}],
+    )
+
+    assert [point["forecast_balance"] for point in payload["timeline"]] == [60.0, 70.0]
+    assert payload["summary"]["ending_balance"] == 70.0
+    assert payload["series"]["manual_adjustments"]["points"][0]["value"] == -50.0
+
+
+def test_calendar_occurrences_follow_reference_cadence_rules():
+    """Occurrence index sets should match the reference frequency matcher."""
+    calendar = ForecastCalendar(date(2026, 1, 30), 70)
+
+    assert calendar.occurrences(date(2026, 1, 31), None).tolist() == [1]
+    assert calendar.occurrences(date(2026, 1, 1), None).tolist() == []
+    assert calendar.occurrences(date(2026, 1, 28), "weekly").tolist() == [5, 12, 19, 26, 33, 40, 47, 54, 61, 68]
+    assert calendar.occurrences(date(2026, 2, 5), "daily").tolist() == list(range(6, 70))
+    # February has no 31st, so a month-end cadence skips it.
+    assert calendar.occurrences(date(2025, 12, 31), "monthly").tolist() == [1, 60]
+
+
+def test_spread_schedule_uses_reference_per_day_share():
+    """Spread adjustments should add ``amount / days`` per day, like the reference engine."""
+    calendar = ForecastCalendar(date(2026, 1, 1), 5)
+
+    schedule = adjustment_schedule_cents(
+        [{"amount": -10.0, "distribution": "spread", "range_start": "2026-01-02", "range_end": "2026-01-04"}],
+        calendar,
+    )
+
+    assert schedule[0] == 0 and schedule[4] == 0
+    assert schedule[1:4].tolist() == pytest.approx([-1000 / 3] * 3)
+    assert float(schedule.sum()) == pytest.approx(-1000)
+
+
+def test_vectorized_keeps_tiny_delta_remainder_cashflows():
+    """Sub-cent ``Decimal`` residuals left by category scaling are emitted as the reference does."""
+    inputs = _scenario_inputs(
+        adjustments=[],
+        category_averages=[{"category": "Groceries", "outflow": 18.14}, {"category": "Dining", "outflow": 62.54}],
+    )
+
+    reference = [item for item in compute_forecast(**inputs)["cashflows"] if item["source"] == "uncategorized"]
+    candidate = [
+        item for item in compute_forecast_vectorized(**inputs)["cashflows"] if item["source"] == "uncategorized"
+    ]
+
+    assert reference and all(abs(item["amount"]) < 1e-9 for item in reference)
+    assert [(item["date"], item["amount"]) for item in candidate] == [
+        (item["date"], item["amount"]) for item in reference
+    ]
+
+
+@pytest.mark.parametrize(
+    ("output", "cashflow_range"),
+    [
+        ("summary", None),
+        ("columnar", None),
+        ("columnar", ("2026-02-10", "2026-02-20")),
+        ("summary", (None, "2026-01-03")),
+        ("full", ("2026-04-01", "2026-04-03")),
+    ],
+)
+def test_vectorized_compact_outputs_match_reference(output, cashflow_range):
+    """Array-built compact payloads should match the reshaped reference payload."""
+    inputs = _scenario_inputs(
+        recurring_sources=[{"label": "Rent", "amount": -1500.0, "date": "2026-01-05", "frequency": "monthly"}],
+        category_averages=[{"category": "Groceries", "outflow": 30.0}, {"category": "Salary", "inflow": 55.0}],
+    )
+
+    reference = compute_forecast(**inputs, output=output, cashflow_range=cashflow_range)
+    candidate = compute_forecast_vectorized(**inputs, output=output, cashflow_range=cashflow_range)
+
+    _assert_payload_close(reference, candidate)
@@ -0,0 +1,85 @@
+"""Tests for compact forecast payload shapes."""
+
+import json
+import os
+import sys
+from datetime import date
+
+import pytest
+
+BASE_BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend"))
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+from forecast.engine import compute_forecast  # noqa: E402
+from forecast.views import normalize_output_mode, select_cashflows, shape_forecast_payload  # noqa: E402
+
+
+def _full_payload(horizon_days=365):
+    return compute_forecast(
+        user_id=1,
+        start_date=date(2026, 1, 1),
+        horizon_days=horizon_days,
+        latest_snapshots=[{"account_id": "a1", "balance": 1000.0, "date": "2026-01-01"}],
+        historical_aggregates=[
+            {"date": f"2025-12-{day:02d}", "inflow": 50.0 + day, "outflow": 40.0} for day in range(1, 31)
+        ],
+        adjustments=[
+            {"label": "Gym", "amount": -45.0, "date": "2026-01-10", "frequency": "monthly"},
+            {"label": "Bonus", "amount": 300.0, "date": "2026-03-01"},
+        ],
+    )
+
+
+def test_columnar_payload_uses_parallel_lists():
+    full = _full_payload(horizon_days=5)
+
+    columnar = shape_forecast_payload(full, output="columnar")
+    columns = columnar["columns"]
+
+    assert columns["dates"] == [point["date"] for point in full["timeline"]]
+    assert columns["forecast_balance"] == [point["forecast_balance"] for point in full["timeline"]]
+    assert len(columns["inflow"]) == len(columns["outflow"]) == 5
+    assert columnar["series"]["spending"]["values"] == [
+        point["value"] for point in full["series"]["spending"]["points"]
+    ]
+    assert "dates" not in columnar["series"]["spending"]
+    assert len(columnar["series"]["realized_income"]["dates"]) == 30
+    assert columnar["realized_history"]["dates"][-1] == "2026-01-01"
+    assert "realized_history" not in columnar["metadata"]
+    assert "realized_history" not in columnar["summary"]["metadata"]
+    assert columnar["metadata"]["output"] == "columnar"
+    assert "cashflows" not in columnar and "timeline" not in columnar
+
+
+def test_summary_payload_returns_requested_cashflow_range_only():
+    full = _full_payload()
+
+    summary = shape_forecast_payload(full, output="summary", cashflow_range=(date(2026, 3, 1), date(2026, 3, 1)))
+
+    assert summary["summary"]["ending_balance"] == full["summary"]["ending_balance"]
+    assert {item["date"] for item in summary["cashflows"]} == {"2026-03-01"}
+    assert any(item["label"] == "Bonus" for item in summary["cashflows"])
+    assert summary["metadata"]["cashflow_range"] == {"start": "2026-03-01", "end": "2026-03-01"}
+
+
+def test_compact_outputs_shrink_long_horizon_payloads():
+    full = _full_payload()
+
+    full_size = len(json.dumps(full))
+    assert len(json.dumps(shape_forecast_payload(full, output="columnar"))) * 5 < full_size
+    assert len(json.dumps(shape_forecast_payload(full, output="summary"))) * 50 < full_size
+
+
+def test_select_cashflows_supports_open_bounds():
+    cashflows = [{"date": "2026-01-01"}, {"date": "2026-01-02"}, {"date": "2026-01-03"}]
+
+    assert select_cashflows(cashflows, (None, "2026-01-02")) == cashflows[:2]
+    assert select_cashflows(cashflows, ("2026-01-02", None)) == cashflows[1:]
+
+
+def test_normalize_output_mode_rejects_unknown_values():
+    assert normalize_output_mode(None) == "full"
+    assert normalize_output_mode(" Columnar ") == "columnar"
+    with pytest.raises(ValueError):
+        normalize_output_mode("csv")
@@ -0,0 +1,126 @@
+"""Tests for ETag-based conditional GET handling."""
+
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from flask import Flask, jsonify, request
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+
+def _load_http_cache():
+    """Load the real module by path; route tests stub ``app.utils.http_cache``."""
+
+    path = Path(BASE_BACKEND) / "app" / "utils" / "http_cache.py"
+    spec = importlib.util.spec_from_file_location("http_cache_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def client(monkeypatch):
+    http_cache = _load_http_cache()
+
+    versions = {"user-1": "v1", None: "g1"}
+    version_stub = types.ModuleType("app.sql.data_version")
+    version_stub.get_data_version = lambda user_id: versions[user_id]
+    monkeypatch.setitem(sys.modules, "app.sql.data_version", version_stub)
+
+    calls = []
+    app = Flask(__name__)
+
+    @app.route("/totals")
+    @http_cache.conditional_get()
+    def totals():
+        calls.append(request.args.to_dict())
+        return jsonify({"total": 1}), 200
+
+    @app.route("/broken")
+    @http_cache.conditional_get()
+    def broken():
+        return jsonify({"status": "error"}), 500
+
+    test_client = app.test_client()
+    test_client.calls = calls
+    test_client.versions = versions
+    return test_client
+
+
+def test_matching_etag_returns_304_without_running_view(client):
+    first = client.get("/totals?user_id=user-1&start_date=2026-01-01")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    again = client.get("/totals?start_date=2026-01-01&user_id=user-1", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+    assert again.headers["ETag"] == etag
+    assert len(client.calls) == 1
+
+    other_args = client.get("/totals?user_id=user-1&start_date=2026-02-01", headers={"If-None-Match": etag})
+    assert other_args.status_code == 200
+    assert other_args.headers["ETag"] != etag
+
+
+def test_data_version_change_and_errors_skip_validation(client):
+    etag = client.get("/totals").headers["ETag"]
+    client.versions[None] = "g2"
+    changed = client.get("/totals", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+    broken = client.get("/broken")
+    assert broken.status_code == 500
+    assert "ETag" not in broken.headers
+
+    del client.versions["user-1"]
+    bypassed = client.get("/totals?user_id=user-1")
+    assert bypassed.status_code == 200
+    assert "ETag" not in bypassed.headers
+
+
+def test_etag_changes_when_a_refresh_ingested_transaction_is_edited():
+    """Rows without their own ``user_id`` still change their account owner's ETag."""
+    from datetime import date
+    from decimal import Decimal
+
+    from app.extensions import db
+    from app.models import Account, Transaction
+
+    http_cache = _load_http_cache()
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+
+    @app.route("/summary")
+    @http_cache.conditional_get()
+    def summary():
+        return jsonify({"ok": True})
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(Account(account_id="acc-1", user_id="user-1", name="Checking", balance=Decimal("10.00")))
+        transaction = Transaction(transaction_id="tx-1", account_id="acc-1", amount=Decimal("-5.00"), date=date.today())
+        db.session.add(transaction)
+        db.session.commit()
+        client = app.test_client()
+        etag = client.get("/summary?user_id=user-1").headers["ETag"]
+
+        # An edit made by another process: no local data version bump.
+        transaction.amount = Decimal("-9.00")
+        db.session.commit()
+
+        assert client.get("/summary?user_id=user-1", headers={"If-None-Match": etag}).status_code == 200
+        db.session.remove()
+        db.drop_all()
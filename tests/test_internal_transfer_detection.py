@@ -4,7 +4,7 @@ import importlib.util
 import os
 import sys
 import types
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
 
@@ -63,6 +63,10 @@ sys.modules["app.sql.dialect_utils"] = dialect_utils
 sequence_utils = types.ModuleType("app.sql.sequence_utils")
 sequence_utils.ensure_transactions_sequence = lambda *a, **k: None
 sys.modules["app.sql.sequence_utils"] = sequence_utils
+
+data_version = types.ModuleType("app.sql.data_version")
+data_version.bump_data_version = lambda user_id=None: None
+sys.modules["app.sql.data_version"] = data_version
 sql_pkg = types.ModuleType("app.sql")
 sql_pkg.__path__ = []
 sql_pkg.transaction_rules_logic = transaction_rules_logic
@@ -111,15 +115,52 @@ utils_pkg.category_display = category_display
 sys.modules["app.utils"] = utils_pkg
 app_pkg.utils = utils_pkg
 
-plaid_stub = types.ModuleType("plaid")
-
+# Installed only while the modules below import, so later test modules still get the real ones.
+metrics_stub = types.ModuleType("app.utils.metrics")
+for _name in ("record_transactions_ingested", "record_tx_cache", "record_tx_cache_eviction", "record_upsert_totals"):
+    setattr(metrics_stub, _name, lambda *a, **k: None)
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_attributes(self, *a, **k):
+        return None
+
+
+tracing_stub = types.ModuleType("app.utils.tracing")
+tracing_stub.current_span = lambda: _NullSpan()
+tracing_stub.span = lambda *a, **k: _NullSpan()
+tracing_stub.stage = lambda *a, **k: _NullSpan()
+tracing_stub.traced = lambda *a, **k: lambda func: func
+http_cache_stub = types.ModuleType("app.utils.http_cache")
+http_cache_stub.conditional_get = lambda *a, **k: lambda view: view
+read_replica_stub = types.ModuleType("app.utils.read_replica")
+read_replica_stub.read_replica = lambda *a, **k: lambda view: view
+_IMPORT_STUBS = {
+    "app.utils.metrics": metrics_stub,
+    "app.utils.tracing": tracing_stub,
+    "app.utils.http_cache": http_cache_stub,
+    "app.utils.read_replica": read_replica_stub,
+}
 
-class ApiException(Exception):
-    pass
 
+def _exec_with_stubs(spec, module):
+    previous = {name: sys.modules.get(name) for name in _IMPORT_STUBS}
+    sys.modules.update(_IMPORT_STUBS)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        for name, real in previous.items():
+            if real is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = real
 
-plaid_stub.ApiException = ApiException
-sys.modules["plaid"] = plaid_stub
 
 extensions = types.ModuleType("app.extensions")
 db = SQLAlchemy()
@@ -127,7 +168,10 @@ extensions.db = db
 sys.modules["app.extensions"] = extensions
 app_pkg.extensions = extensions
 
-# Load models and account_logic modules
+# Load models and account_logic modules. Drop model modules cached by earlier
+# test modules so every model binds to this module's ``db``.
+for _name in [name for name in sys.modules if name.startswith("app.models.")]:
+    del sys.modules[_name]
 spec_models = importlib.util.spec_from_file_location(
     "app.models",
     os.path.join(BASE_BACKEND, "app", "models", "__init__.py"),
@@ -143,15 +187,29 @@ spec_logic = importlib.util.spec_from_file_location(
     os.path.join(BASE_BACKEND, "app", "sql", "account_logic.py"),
 )
 account_logic = importlib.util.module_from_spec(spec_logic)
-spec_logic.loader.exec_module(account_logic)
+_exec_with_stubs(spec_logic, account_logic)
 sql_pkg.account_logic = account_logic
 
+services_pkg = types.ModuleType("app.services")
+services_pkg.__path__ = []
+sys.modules["app.services"] = services_pkg
+app_pkg.services = services_pkg
+
+spec_scan = importlib.util.spec_from_file_location(
+    "app.services.internal_transfer_scan",
+    os.path.join(BASE_BACKEND, "app", "services", "internal_transfer_scan.py"),
+)
+internal_transfer_scan = importlib.util.module_from_spec(spec_scan)
+sys.modules["app.services.internal_transfer_scan"] = internal_transfer_scan
+spec_scan.loader.exec_module(internal_transfer_scan)
+services_pkg.internal_transfer_scan = internal_transfer_scan
+
 spec_routes = importlib.util.spec_from_file_location(
     "app.routes.transactions",
     os.path.join(BASE_BACKEND, "app", "routes", "transactions.py"),
 )
 transactions_routes = importlib.util.module_from_spec(spec_routes)
-spec_routes.loader.exec_module(transactions_routes)
+_exec_with_stubs(spec_routes, transactions_routes)
 
 
 def test_detect_internal_transfer_marks_both_transactions():
@@ -266,6 +324,153 @@ def test_scan_internal_transfers_endpoint():
         assert models.Transaction.query.filter_by(is_internal=True).count() == 0
 
 
+def _add_transfer_pair(user_id, out_account, in_account, txn_prefix, amount, day):
+    return [
+        models.Transaction(
+            transaction_id=f"{txn_prefix}-out",
+            account_id=out_account,
+            user_id=user_id,
+            amount=-amount,
+            date=datetime(2024, 5, day, tzinfo=timezone.utc),
+            description="Transfer out",
+        ),
+        models.Transaction(
+            transaction_id=f"{txn_prefix}-in",
+            account_id=in_account,
+            user_id=user_id,
+            amount=amount,
+            date=datetime(2024, 5, day, tzinfo=timezone.utc),
+            description="Transfer in",
+        ),
+    ]
+
+
+def test_scan_internal_transfers_paginates_and_scopes_users(tmp_path, monkeypatch):
+    app = Flask(__name__)
+    # A file database, so scan worker processes see the same schema and rows.
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'transfers.db'}"
+    db.init_app(app)
+    app.register_blueprint(transactions_routes.transactions, url_prefix="/transactions")
+    with app.app_context():
+        models.Account.metadata.create_all(db.engine)
+        db.session.add_all(
+            [
+                models.Account(account_id="P1", user_id="pu1", name="Checking"),
+                models.Account(account_id="P2", user_id="pu1", name="Savings"),
+                models.Account(account_id="P3", user_id="pu2", name="Checking"),
+                models.Account(account_id="P4", user_id="pu2", name="Savings"),
+            ]
+        )
+        for index, day in enumerate((1, 8, 15)):
+            db.session.add_all(_add_transfer_pair("pu1", "P1", "P2", f"pu1-{index}", 40.0 + index, day))
+        # Refresh-ingested rows carry no user_id; their account says who owns them.
+        db.session.add_all(_add_transfer_pair(None, "P3", "P4", "pu2-0", 75.0, 3))
+        db.session.commit()
+
+        client = app.test_client()
+        res = client.post("/transactions/scan-internal?page_size=2")
+        data = res.get_json()
+        assert res.status_code == 200
+        assert data["has_more"] is True
+        assert [pair["transaction_id"] for pair in data["pairs"]] == ["pu1-0-out", "pu1-1-out"]
+
+        second = client.post(f"/transactions/scan-internal?page_size=2&cursor={data['next_cursor']}").get_json()
+        assert [pair["transaction_id"] for pair in second["pairs"]] == ["pu1-2-out", "pu2-0-out"]
+        assert second["has_more"] is False and second["next_cursor"] is None
+        assert client.post("/transactions/scan-internal?cursor=bogus").status_code == 400
+
+        scoped = client.post("/transactions/scan-internal?user_id=pu2").get_json()
+        assert [pair["counterpart_id"] for pair in scoped["pairs"]] == ["pu2-0-in"]
+
+        # The worker count is a setting; a request cannot raise it.
+        inline = client.post("/transactions/scan-internal?workers=8").get_json()
+        app.config["INTERNAL_SCAN_WORKERS"] = 2
+        # Worker tasks are pickled by module path; other test modules replace these in sys.modules.
+        for name, module in (
+            ("app", app_pkg),
+            ("app.services", services_pkg),
+            ("app.services.internal_transfer_scan", internal_transfer_scan),
+        ):
+            monkeypatch.setitem(sys.modules, name, module)
+        parallel = client.post("/transactions/scan-internal").get_json()
+        assert parallel["pairs"] == inline["pairs"]
+
+        # A page resumes at its keyset position instead of rescanning earlier users.
+        scanned = []
+        real_iter = internal_transfer_scan.iter_scan_records
+
+        def tracking_iter(user_id, batch_size=internal_transfer_scan.DEFAULT_BATCH_SIZE):
+            scanned.append(user_id)
+            return real_iter(user_id, batch_size)
+
+        internal_transfer_scan.iter_scan_records = tracking_iter
+        try:
+            resumed = internal_transfer_scan.scan_internal_transfers(after=("pu2", 0), limit=5)
+        finally:
+            internal_transfer_scan.iter_scan_records = real_iter
+        assert scanned == ["pu2"]
+        assert [pair["transaction_id"] for pair in resumed] == ["pu2-0-out"]
+
+
+def _full_scan_pairs(records, max_window_seconds, amount_epsilon, allow_same_account):
+    """Reference quadratic scan the indexed matcher must agree with."""
+    seen = set()
+    pairs = []
+    for index, anchor in enumerate(records):
+        if anchor["transaction_id"] in seen:
+            continue
+        best = None
+        for candidate in records[index + 1 :]:
+            if candidate["transaction_id"] in seen:
+                continue
+            if (candidate["date"] - anchor["date"]).total_seconds() > max_window_seconds:
+                break
+            score = internal_transfer_scan._internal_match_score(
+                anchor, candidate, max_window_seconds, amount_epsilon, allow_same_account
+            )
+            if score is not None and (best is None or score < best[0]):
+                best = (score, candidate)
+        if best is None:
+            continue
+        pairs.append((anchor["transaction_id"], best[1]["transaction_id"], round(best[0], 4)))
+        seen.update({anchor["transaction_id"], best[1]["transaction_id"]})
+    return pairs
+
+
+def test_match_internal_transfers_agrees_with_full_scan():
+    import random
+
+    rng = random.Random(7)
+    descriptions = ["Transfer to savings", "Transfer from checking", "Payment", "Starbucks", "Grocery run", ""]
+    for epsilon, allow_same_account in ((Decimal("0.01"), True), (Decimal("1.00"), False)):
+        records = []
+        for index in range(400):
+            description = rng.choice(descriptions)
+            records.append(
+                {
+                    "transaction_id": f"R{index}",
+                    "account_id": rng.choice(["A", "B", "C"]),
+                    "amount": rng.choice([-1, 1])
+                    * (Decimal(rng.choice([25, 40, 100, 250])) + Decimal(rng.randint(0, 2)) / 100),
+                    "date": datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=rng.randint(0, 60)),
+                    "description": description,
+                    "tokens": internal_transfer_scan._tokenize_transfer_text(description),
+                }
+            )
+        records.sort(key=lambda record: record["date"])
+
+        expected = _full_scan_pairs([dict(r) for r in records], 3 * 86400.0, epsilon, allow_same_account)
+        actual = internal_transfer_scan.match_internal_transfers(
+            [dict(r) for r in records],
+            user_id="u",
+            date_window_days=3,
+            amount_epsilon=epsilon,
+            allow_same_account=allow_same_account,
+        )
+        assert expected
+        assert [(p["transaction_id"], p["counterpart_id"], p["match_score"]) for p in actual] == expected
+
+
 def test_detect_internal_transfer_brokerage_funding_classification():
     app = Flask(__name__)
     app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
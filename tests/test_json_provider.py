@@ -0,0 +1,108 @@
+"""Tests for the fast JSON provider and negotiated response compression."""
+
+import gzip
+import importlib.util
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from flask import Flask, jsonify
+
+UTILS_DIR = Path(__file__).resolve().parent.parent / "backend" / "app" / "utils"
+
+
+def _load(name):
+    """Load a utils module by path; other test modules stub ``app.utils``."""
+
+    spec = importlib.util.spec_from_file_location(f"{name}_under_test", UTILS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+PAYLOAD = {
+    "amount": Decimal("-12.30"),
+    "date": date(2026, 3, 1),
+    "updated": datetime(2026, 3, 1, 8, 30, tzinfo=timezone.utc),
+    "name": "Café",
+    "counts": {7: 1},
+}
+EXPECTED = {
+    "amount": -12.3,
+    "date": "2026-03-01",
+    "updated": "2026-03-01T08:30:00+00:00",
+    "name": "Café",
+    "counts": {"7": 1},
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_provider_serializes_decimals_and_dates_natively(monkeypatch, use_orjson):
+    provider_module = _load("json_provider")
+    if use_orjson and provider_module.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(provider_module, "orjson", None)
+
+    app = Flask(__name__)
+    app.json = provider_module.FastJSONProvider(app)
+
+    @app.route("/payload")
+    def payload():
+        return jsonify(PAYLOAD)
+
+    response = app.test_client().get("/payload")
+    assert response.mimetype == "application/json"
+    assert json.loads(response.data) == EXPECTED
+    with app.app_context():
+        assert json.loads(app.json.dumps(PAYLOAD)) == EXPECTED
+        assert app.json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_compression_negotiates_encoding_and_skips_small_bodies():
+    compression = _load("compression")
+    app = Flask(__name__)
+    compression.init_compression(app)
+    big = {"rows": [{"description": "Coffee shop purchase", "amount": index} for index in range(200)]}
+
+    @app.route("/big")
+    def big_route():
+        return jsonify(big)
+
+    @app.route("/small")
+    def small_route():
+        return jsonify({"ok": True})
+
+    client = app.test_client()
+    gzipped = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in gzipped.headers["Vary"]
+    assert json.loads(gzip.decompress(gzipped.data)) == big
+    assert int(gzipped.headers["Content-Length"]) == len(gzipped.data)
+
+    assert "Content-Encoding" not in client.get("/big").headers
+    assert "Content-Encoding" not in client.get("/big", headers={"Accept-Encoding": "gzip;q=0"}).headers
+    assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+
+    if compression.brotli is not None:
+        preferred = client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+        assert preferred.headers["Content-Encoding"] == "br"
+        assert json.loads(compression.brotli.decompress(preferred.data)) == big
+
+
+def test_compressed_response_weakens_strong_etag():
+    compression = _load("compression")
+    app = Flask(__name__)
+    compression.init_compression(app)
+
+    @app.route("/tagged")
+    def tagged():
+        response = jsonify({"rows": ["x" * 40] * 100})
+        response.set_etag("abc")
+        return response
+
+    response = app.test_client().get("/tagged", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == 'W/"abc"'
@@ -0,0 +1,98 @@
+"""Tests for queued, rate-limited and JSON logging in ``app.config.log_setup``."""
+
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueListener
+
+import pytest
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+
+@pytest.fixture()
+def log_setup():
+    from app.config import log_setup
+
+    return log_setup
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        record.emitted_on = threading.current_thread().name
+        self.records.append(record)
+
+
+def _record(level=logging.INFO, msg="synced %s", args=("acct-1",), created=1000.0, lineno=10, **extra):
+    record = logging.makeLogRecord(
+        {"name": "app.sync", "levelno": level, "levelname": logging.getLevelName(level), "msg": msg, "args": args}
+    )
+    record.created, record.pathname, record.lineno = created, "sync.py", lineno
+    record.__dict__.update(extra)
+    return record
+
+
+def test_rate_limit_filter_caps_a_call_site_and_reports_suppressed(log_setup):
+    limiter = log_setup.RateLimitFilter(limit=3, window=60)
+
+    passed = [limiter.filter(_record(created=1000.0 + i)) for i in range(5)]
+    other_site = limiter.filter(_record(lineno=11))
+    warning = limiter.filter(_record(level=logging.WARNING))
+    next_window = _record(created=1061.0)
+
+    assert passed == [True, True, True, False, False]
+    assert other_site and warning
+    assert limiter.filter(next_window)
+    assert next_window.suppressed == 2
+    assert next_window.getMessage() == "synced acct-1 [2 similar messages suppressed]"
+
+
+def test_json_formatter_emits_extras_and_traceback(log_setup):
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(level=logging.ERROR, exc_info=sys.exc_info(), account_id="acct-9")
+
+    payload = json.loads(log_setup.JsonFormatter().format(record))
+
+    assert payload["level"] == "ERROR" and payload["logger"] == "app.sync"
+    assert payload["message"] == "synced acct-1" and payload["account_id"] == "acct-9"
+    assert payload["exc"].startswith("Traceback") and "ValueError: boom" in payload["exc"]
+
+
+def test_queue_handler_writes_on_listener_thread(log_setup):
+    collector = _Collect()
+    handler = log_setup.AppQueueHandler(queue.SimpleQueue())
+    listener = QueueListener(handler.queue, collector)
+    test_logger = logging.getLogger("tests.log_setup.queued")
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+    test_logger.addHandler(handler)
+    listener.start()
+    try:
+        payload = {"rows": [1, 2, 3]}
+        test_logger.info("payload %s", payload)
+        payload["rows"].append(4)  # formatted before enqueueing
+        try:
+            raise KeyError("missing")
+        except KeyError:
+            test_logger.exception("lookup failed")
+    finally:
+        listener.stop()
+        test_logger.removeHandler(handler)
+
+    first, second = collector.records
+    assert first.getMessage() == "payload {'rows': [1, 2, 3]}"
+    assert first.emitted_on != threading.current_thread().name
+    assert second.exc_info is None and "KeyError: 'missing'" in second.exc_text
@@ -0,0 +1,124 @@
+"""Tests for memoized merchant normalization and bulk re-normalization."""
+
+import importlib.util
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+from app.extensions import db  # noqa: E402
+from app.models import Account, MerchantUsage, Transaction  # noqa: E402
+from app.sql import transactions_logic  # noqa: E402
+
+
+def _load_normalization():
+    """Load the real module by path; other test modules stub ``app.utils``."""
+
+    name = "merchant_normalization_memo_test"
+    path = Path(BASE_BACKEND) / "app" / "utils" / "merchant_normalization.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def app_context():
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Account(account_id="acc-1", user_id="user-1", name="Checking", balance=Decimal("10.00")))
+        db.session.add(Account(account_id="acc-2", user_id="user-2", name="Savings", balance=Decimal("10.00")))
+        db.session.commit()
+        yield
+        db.session.remove()
+        db.drop_all()
+
+
+def test_resolve_merchant_memoizes_and_strips_prefix_runs_in_order():
+    normalization = _load_normalization()
+    normalization.clear_merchant_cache()
+
+    first = normalization.resolve_merchant(merchant_name=None, name="POS DEBIT SQ *JOES COFFEE", description=None)
+    second = normalization.resolve_merchant(merchant_name=None, name="POS DEBIT SQ *JOES COFFEE", description=None)
+
+    assert first is second
+    assert (first.display_name, first.merchant_slug) == ("Joes Coffee", "joes-coffee")
+    assert normalization._resolve_merchant_cached.cache_info().hits == 1
+    # Prefixes are stripped in declaration order only, so an out-of-order run keeps the tail.
+    assert normalization.resolve_merchant(None, "CARD 1234 SQ *JOE", None).merchant_slug == "sq-joe"
+
+    normalization.clear_merchant_cache()
+    assert normalization._resolve_merchant_cached.cache_info().currsize == 0
+
+
+def _txn(index, description, merchant_name, merchant_slug, user_modified=False, account_id="acc-1"):
+    return Transaction(
+        transaction_id=f"tx-{index}",
+        # Refresh-ingested rows carry no user_id; ownership comes from the account.
+        user_id=None,
+        account_id=account_id,
+        amount=Decimal("-4.50"),
+        date=date(2026, 1, index),
+        description=description,
+        merchant_name=merchant_name,
+        merchant_slug=merchant_slug,
+        user_modified=user_modified,
+    )
+
+
+def test_renormalize_updates_stale_groups_and_skips_user_edits(app_context):
+    db.session.add_all(
+        [
+            _txn(1, "POS SQ *JOES COFFEE", "Unknown", None),
+            _txn(2, "POS SQ *JOES COFFEE", "Unknown", None),
+            _txn(3, "Paypal *Netflix.com", "PAYPAL *NETFLIX.COM", "paypal-netflix-com"),
+            _txn(4, "Whole Foods", "Whole Foods", "whole-foods"),
+            _txn(5, "POS SQ *JOES COFFEE", "My Coffee", "mine", user_modified=True),
+            # Same merchant input as tx-3; descriptions do not split groups.
+            _txn(6, "PAYPAL *NETFLIX.COM 0426", "PAYPAL *NETFLIX.COM", "paypal-netflix-com"),
+            _txn(7, "Whole Foods", "Whole Foods", "whole-foods", account_id="acc-2"),
+        ]
+    )
+    for user_id in ("user-1", "user-2"):
+        db.session.add(MerchantUsage(user_id=user_id, merchant_slug="whole-foods", display_name="Whole Foods"))
+    db.session.commit()
+
+    preview = transactions_logic.renormalize_transaction_merchants(dry_run=True)
+    assert preview == {"groups": 3, "changed_groups": 2, "rows_updated": 0}
+    assert db.session.get(Transaction, 1).merchant_slug is None
+    assert MerchantUsage.query.count() == 2
+
+    stats = transactions_logic.renormalize_transaction_merchants(chunk_size=1)
+    assert stats == {"groups": 3, "changed_groups": 2, "rows_updated": 4}
+
+    db.session.expire_all()
+    rows = {txn.transaction_id: (txn.merchant_name, txn.merchant_slug) for txn in Transaction.query.all()}
+    assert rows == {
+        "tx-1": ("Joes Coffee", "joes-coffee"),
+        "tx-2": ("Joes Coffee", "joes-coffee"),
+        "tx-3": ("Netflix.com", "netflix-com"),
+        "tx-4": ("Whole Foods", "whole-foods"),
+        "tx-5": ("My Coffee", "mine"),
+        "tx-6": ("Netflix.com", "netflix-com"),
+        "tx-7": ("Whole Foods", "whole-foods"),
+    }
+    # Only user-1 had rewritten rows; user-2's usage survives.
+    assert [row.user_id for row in MerchantUsage.query.all()] == ["user-2"]
+    assert transactions_logic.renormalize_transaction_merchants()["changed_groups"] == 0
@@ -0,0 +1,109 @@
+"""Tests for the Prometheus metrics surface."""
+
+import os
+import sys
+
+import pytest
+from flask import Blueprint, Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+os.environ.setdefault("PLAID_CLIENT_ID", "sandbox-client")
+os.environ.setdefault("PLAID_SECRET_KEY", "sandbox-secret")
+os.environ.setdefault("CLIENT_NAME", "pyNance Test Suite")
+os.environ.setdefault("BACKEND_PUBLIC_URL", "http://localhost")
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+
+@pytest.fixture()
+def modules():
+    from app.routes.metrics import metrics as metrics_blueprint
+    from app.utils import metrics
+
+    return metrics, metrics_blueprint
+
+
+def _sample(name, **labels):
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture()
+def client(modules):
+    metrics, metrics_blueprint = modules
+    widgets = Blueprint("widgets", __name__)
+
+    @widgets.route("/ok")
+    def ok():
+        return {"ok": True}
+
+    @widgets.route("/boom")
+    def boom():
+        return {"error": "boom"}, 502
+
+    app = Flask(__name__)
+    metrics.init_metrics(app)
+    app.register_blueprint(widgets, url_prefix="/api/widgets")
+    app.register_blueprint(metrics_blueprint)
+    with app.test_client() as test_client:
+        yield test_client
+
+
+def test_requests_are_timed_per_blueprint_endpoint_and_errors_counted(client):
+    labels = {"blueprint": "widgets", "endpoint": "widgets.ok", "method": "GET"}
+    before = _sample("http_request_duration_seconds_count", **labels)
+    errors_before = _sample("http_request_errors_total", blueprint="widgets", endpoint="widgets.boom", status="502")
+
+    client.get("/api/widgets/ok")
+    client.get("/api/widgets/ok")
+    client.get("/api/widgets/boom")
+
+    assert _sample("http_request_duration_seconds_count", **labels) == before + 2
+    assert (
+        _sample("http_request_errors_total", blueprint="widgets", endpoint="widgets.boom", status="502")
+        == errors_before + 1
+    )
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    assert b'http_request_duration_seconds_bucket{blueprint="widgets",endpoint="widgets.ok"' in response.data
+
+
+def test_metrics_endpoint_without_prometheus_client(client, modules, monkeypatch):
+    metrics, _ = modules
+    monkeypatch.setattr(metrics, "Counter", None)
+
+    response = client.get("/metrics")
+    assert response.status_code == 501
+
+
+def test_plaid_ingest_and_cache_recorders(modules):
+    metrics, _ = modules
+    calls_before = _sample("plaid_api_request_duration_seconds_count", operation="accounts_get", outcome="error")
+
+    with pytest.raises(RuntimeError):
+        with metrics.observe_plaid_call("accounts_get"):
+            raise RuntimeError("plaid down")
+    metrics.record_plaid_retry("transactions_sync")
+    metrics.record_transactions_ingested("sync", 50, 0.5)
+    unchanged_before = _sample("transaction_upserts_total", outcome="unchanged")
+    metrics.record_upsert_totals({"processed": 9, "inserted": 2, "updated": 0, "unchanged": 7})
+    hits_before = _sample("tx_page_cache_requests_total", result="hit")
+    metrics.record_tx_cache("hit")
+    evictions_before = _sample("tx_page_cache_evictions_total", reason="invalidated")
+    metrics.record_tx_cache_eviction("invalidated", 3)
+
+    assert (
+        _sample("plaid_api_request_duration_seconds_count", operation="accounts_get", outcome="error")
+        == calls_before + 1
+    )
+    assert _sample("plaid_api_retries_total", operation="transactions_sync") >= 1
+    assert _sample("plaid_transactions_ingest_rate", source="sync") == 100.0
+    assert _sample("transaction_upserts_total", outcome="unchanged") == unchanged_before + 7
+    assert _sample("transaction_upserts_total", outcome="processed") == 0
+    assert _sample("tx_page_cache_requests_total", result="hit") == hits_before + 1
+    assert _sample("tx_page_cache_evictions_total", reason="invalidated") == evictions_before + 3
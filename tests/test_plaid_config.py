@@ -0,0 +1,101 @@
+"""Tests for side-effect-free configuration and the lazily built Plaid client."""
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+
+@pytest.fixture()
+def plaid_config():
+    from app.config import plaid_config
+
+    return plaid_config
+
+
+def test_importing_config_has_no_side_effects(tmp_path):
+    code = (
+        "import logging, sys\n"
+        "from app.config import logger\n"
+        "import app.config as config\n"
+        "assert logger is logging.getLogger() and not logger.handlers, logger.handlers\n"
+        "heavy = ('plaid', 'dotenv', 'app.config.environment', 'app.config.plaid_config')\n"
+        "loaded = [m for m in heavy if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+        "assert repr(config.plaid_client).endswith('(not built)>') and 'plaid' not in sys.modules\n"
+        "import os; os.environ['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'\n"
+        "config.configure_logging(); config.configure_logging()\n"
+        "assert [type(h).__name__ for h in logger.handlers] == ['AppQueueHandler'], logger.handlers\n"
+        "assert len(logging.getLogger('sqlalchemy.engine').handlers) >= 1\n"
+    )
+    env = {key: value for key, value in os.environ.items() if key != "SQLALCHEMY_DATABASE_URI"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [BASE_BACKEND, env.get("PYTHONPATH")]))
+    env["LOGS_DIR"] = str(tmp_path)
+    proc = subprocess.run([sys.executable, "-c", code], cwd=BASE_BACKEND, env=env, capture_output=True, text=True)
+
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_lazy_client_is_built_once_with_pool_and_default_timeouts(plaid_config):
+    from plaid.model.accounts_get_request import AccountsGetRequest
+
+    builds = []
+
+    def factory():
+        builds.append(threading.get_ident())
+        return plaid_config.build_plaid_client(pool_maxsize=7, timeout=(1.5, 7.0))
+
+    proxy = plaid_config.LazyPlaidClient(factory)
+    assert repr(proxy).endswith("(not built)>")
+    threads = [threading.Thread(target=proxy.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(builds) == 1 and proxy
+
+    rest_client = proxy.api_client.rest_client
+    pool_kw = rest_client.pool_manager.connection_pool_kw
+    assert pool_kw["maxsize"] == 7
+    assert any(option[1:] == (socket.SO_KEEPALIVE, 1) for option in pool_kw["socket_options"])
+
+    seen = []
+
+    def fake_request(method, url, **kwargs):
+        seen.append(kwargs["timeout"])
+        raise ConnectionAbortedError("offline")
+
+    rest_client.pool_manager.request = fake_request
+    with pytest.raises(ConnectionAbortedError):
+        proxy.accounts_get(AccountsGetRequest(access_token="access-offline"))
+    with pytest.raises(ConnectionAbortedError):
+        proxy.accounts_get(AccountsGetRequest(access_token="access-offline"), _request_timeout=3)
+    assert (seen[0].connect_timeout, seen[0].read_timeout) == (1.5, 7.0)
+    assert seen[1].total == 3
+
+    proxy.reset()
+    assert repr(proxy).endswith("(not built)>")
+
+
+def test_lazy_client_is_falsy_when_it_cannot_be_built(plaid_config):
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise ImportError("plaid-python is not installed")
+
+    proxy = plaid_config.LazyPlaidClient(broken)
+
+    assert not proxy and not proxy
+    with pytest.raises(RuntimeError):
+        proxy.accounts_get
+    assert len(calls) == 1
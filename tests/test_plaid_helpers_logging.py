@@ -121,9 +121,10 @@ class _FakePlaidTransactionsClient:
         return _FakeTransactionsResponse(transactions, total_transactions=1)
 
 
-def test_get_transactions_logs_lifecycle(monkeypatch, caplog):
+def test_get_transactions_logs_lifecycle(tmp_path: Path, monkeypatch, caplog):
     fake_client = _FakePlaidTransactionsClient()
     monkeypatch.setattr(plaid_helpers, "plaid_client", fake_client)
+    monkeypatch.setattr(plaid_helpers, "LAST_TRANSACTIONS", tmp_path / "last_refresh.json")
 
     with caplog.at_level(logging.INFO, logger=plaid_helpers.logger.name):
         result = plaid_helpers.get_transactions(
@@ -0,0 +1,125 @@
+"""Tests for the offline Plaid stand-in client."""
+
+import json
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+END = date(2026, 6, 30)
+
+
+@pytest.fixture()
+def standin_module():
+    from app.services import plaid_standin
+
+    return plaid_standin
+
+
+def _drain(client, access_token, cursor=None, count=None):
+    pages, added, modified, removed = 0, [], [], []
+    while True:
+        request = {"access_token": access_token, "cursor": cursor, "count": count}
+        response = client.transactions_sync(request)
+        pages += 1
+        added += [txn.transaction_id for txn in response.added]
+        modified += [txn.transaction_id for txn in response.modified]
+        removed += [txn.transaction_id for txn in response.removed]
+        cursor = response.next_cursor
+        if not response.has_more:
+            return pages, cursor, added, modified, removed
+
+
+def test_transactions_sync_follows_cursor_semantics(standin_module):
+    from plaid.exceptions import ApiException
+
+    client = standin_module.PlaidStandIn(end_date=END, page_size=100)
+    item = client.add_item(accounts=3, transactions=450)
+
+    pages, cursor, added, _, _ = _drain(client, item.access_token)
+    assert pages == 5 and sorted(added) == sorted(item.transactions)
+    assert _drain(client, item.access_token, cursor)[2:] == ([], [], [])
+    assert _drain(client, item.access_token, count=200)[0] == 3
+
+    counts = client.simulate_updates(item.item_id, added=7, modified=4, removed=3)
+    _, latest, added, modified, removed = _drain(client, item.access_token, cursor)
+    assert counts == {"added": 7, "modified": 4, "removed": 3}
+    assert (len(added), len(modified), len(removed)) == (7, 4, 3)
+    assert not set(removed) & set(item.transactions)
+    assert latest != cursor
+
+    with pytest.raises(ApiException) as excinfo:
+        client.transactions_sync({"access_token": item.access_token, "cursor": "not-a-cursor"})
+    assert json.loads(excinfo.value.body)["error_code"] == "INVALID_FIELD"
+
+
+def test_transactions_get_pages_and_faults(standin_module):
+    from plaid.exceptions import ApiException
+
+    slept = []
+    client = standin_module.PlaidStandIn(end_date=END, latency=0.05, sleep=slept.append)
+    item = client.add_item(accounts=2, transactions=300, days=90, investments=True)
+    window = {"access_token": item.access_token, "start_date": END - timedelta(days=29), "end_date": END}
+
+    first = client.transactions_get({**window, "options": {"count": 50, "offset": 0}})
+    rest = client.transactions_get({**window, "options": {"count": 500, "offset": 50}})
+    rows = [txn.to_dict() for txn in first.transactions + rest.transactions]
+    assert len(rows) == first.total_transactions < 300
+    assert all(window["start_date"] <= row["date"] <= END for row in rows)
+    assert first.accounts[0].balances.current is not None
+    assert slept == [0.05, 0.05]
+
+    holdings = client.investments_holdings_get({"access_token": item.access_token}).to_dict()
+    assert holdings["holdings"] and {acct["type"] for acct in holdings["accounts"]} == {"investment"}
+
+    client.inject_error("accounts_get", "RATE_LIMIT_EXCEEDED", times=2)
+    for _ in range(2):
+        with pytest.raises(ApiException) as excinfo:
+            client.accounts_get({"access_token": item.access_token})
+        assert excinfo.value.status == 429
+    assert len(client.accounts_get({"access_token": item.access_token}).accounts) == 3
+    with pytest.raises(ApiException):
+        client.accounts_get({"access_token": "access-unknown"})
+    assert client.errors == {"RATE_LIMIT_EXCEEDED": 2, "INVALID_ACCESS_TOKEN": 1}
+
+
+def test_sync_account_transactions_ingests_from_standin(standin_module, monkeypatch):
+    from app.extensions import db
+    from app.models import PlaidAccount, Transaction
+    from app.services import plaid_sync
+
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+    monkeypatch.setattr(plaid_sync.time, "sleep", lambda seconds: None)
+
+    client = standin_module.PlaidStandIn(end_date=END, page_size=60)
+    item = client.add_item(accounts=2, transactions=150, days=60)
+    with app.app_context():
+        db.create_all()
+        account_ids = standin_module.link_standin_item(client, item, "standin-user")
+        client.inject_error("transactions_sync", "INSTITUTION_DOWN")
+
+        with standin_module.use_plaid_standin(client):
+            first = plaid_sync.sync_account_transactions(account_ids[0])
+            assert plaid_sync.plaid_client is client
+        assert plaid_sync.plaid_client is not client
+
+        assert first["added"] == 150 and client.calls["transactions_sync"] == 4
+        assert Transaction.query.count() == 150
+        assert {pa.sync_cursor for pa in PlaidAccount.query.all()} == {first["next_cursor"]}
+
+        client.simulate_updates(item.item_id, added=5, removed=2)
+        with standin_module.use_plaid_standin(client):
+            second = plaid_sync.sync_account_transactions(account_ids[1])
+        assert (second["added"], second["removed"]) == (5, 2)
+        assert Transaction.query.count() == 153
+        db.session.remove()
@@ -0,0 +1,138 @@
+"""Tests for read-replica routing, with a second SQLite file standing in for the replica."""
+
+import os
+import sys
+
+import pytest
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+
+@pytest.fixture()
+def read_replica():
+    from app.utils import read_replica
+
+    return read_replica
+
+
+def _build_app(read_replica, tmp_path, with_replica=True, max_lag=30.0):
+    from flask import Flask, jsonify
+    from flask_sqlalchemy import SQLAlchemy
+
+    db = SQLAlchemy()
+
+    class Note(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        user_id = db.Column(db.String(32))
+        body = db.Column(db.String(64))
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'primary.db'}"
+    app.config["SQLALCHEMY_BINDS"] = {"replica": f"sqlite:///{tmp_path / 'replica.db'}"} if with_replica else {}
+    app.config["REPLICA_MAX_LAG_SECONDS"] = max_lag
+    db.init_app(app)
+    read_replica.init_read_replica(app, db)
+
+    with app.app_context():
+        # The replica lags: it has not seen the second primary row yet.
+        for engine, bodies in ((db.engine, ["primary-1", "primary-2"]), (db.engines.get("replica"), ["primary-1"])):
+            if engine is None:
+                continue
+            db.metadata.create_all(engine)
+            with engine.begin() as conn:
+                conn.execute(Note.__table__.insert(), [{"user_id": "u1", "body": body} for body in bodies])
+
+    def _bodies():
+        return [note.body for note in Note.query.order_by(Note.id)]
+
+    @app.route("/notes", methods=["GET", "POST"])
+    @read_replica.read_replica()
+    def notes():
+        return jsonify(_bodies())
+
+    @app.route("/notes/write-then-read")
+    @read_replica.read_replica()
+    def write_then_read():
+        before = _bodies()
+        db.session.add(Note(user_id="u1", body="new"))
+        db.session.flush()
+        after = _bodies()
+        db.session.rollback()
+        return jsonify({"before": before, "after": after})
+
+    @app.route("/notes/add", methods=["POST"])
+    def add_note():
+        db.session.add(Note(user_id="u1", body="added"))
+        db.session.commit()
+        return jsonify({"ok": True})
+
+    @app.route("/notes/unrouted")
+    def unrouted():
+        return jsonify(_bodies())
+
+    return app
+
+
+@pytest.fixture()
+def reset_writes(read_replica, monkeypatch):
+    monkeypatch.setattr(read_replica, "_LAST_WRITE_AT", {})
+    monkeypatch.setattr(read_replica, "_LAST_GLOBAL_WRITE_AT", 0.0)
+
+
+def test_decorated_get_reads_from_replica_and_other_requests_from_primary(read_replica, tmp_path, reset_writes):
+    client = _build_app(read_replica, tmp_path).test_client()
+
+    assert client.get("/notes").get_json() == ["primary-1"]
+    assert client.post("/notes").get_json() == ["primary-1", "primary-2"]
+    assert client.get("/notes/unrouted").get_json() == ["primary-1", "primary-2"]
+    assert "Set-Cookie" not in client.get("/notes").headers
+
+
+def test_session_stays_on_primary_after_it_writes(read_replica, tmp_path, reset_writes):
+    client = _build_app(read_replica, tmp_path).test_client()
+
+    payload = client.get("/notes/write-then-read").get_json()
+
+    assert payload["before"] == ["primary-1"]
+    assert payload["after"] == ["primary-1", "primary-2", "new"]
+    # The flush fenced this client onto the primary; a fresh client still reads the replica.
+    assert client.get("/notes").get_json() == ["primary-1", "primary-2"]
+    assert client.application.test_client().get("/notes").get_json() == ["primary-1"]
+
+
+def test_write_fence_cookie_keeps_the_writer_on_primary_across_workers(read_replica, tmp_path, reset_writes):
+    app = _build_app(read_replica, tmp_path)
+    writer = app.test_client()
+
+    response = writer.post("/notes/add")
+
+    assert response.headers["Set-Cookie"].startswith(f"{read_replica.WRITE_FENCE_COOKIE}=")
+    # Nothing was recorded in-process, as if another worker handled the write.
+    assert read_replica.seconds_since_write("u1") == float("inf")
+    assert writer.get("/notes").get_json() == ["primary-1", "primary-2", "added"]
+    assert app.test_client().get("/notes").get_json() == ["primary-1"]
+
+
+def test_recently_written_users_read_from_primary(read_replica, tmp_path, reset_writes):
+    client = _build_app(read_replica, tmp_path).test_client()
+
+    read_replica.note_write("u1")
+
+    assert client.get("/notes?user_id=u1").get_json() == ["primary-1", "primary-2"]
+    assert client.get("/notes?user_id=u2").get_json() == ["primary-1"]
+    assert client.get("/notes").get_json() == ["primary-1", "primary-2"]  # unscoped: any recent write counts
+
+
+def test_lag_guard_expires_and_missing_replica_uses_primary(read_replica, tmp_path, reset_writes):
+    (tmp_path / "lagless").mkdir()
+    (tmp_path / "single").mkdir()
+    lagless = _build_app(read_replica, tmp_path / "lagless", max_lag=0.0)
+    no_replica = _build_app(read_replica, tmp_path / "single", with_replica=False)
+
+    read_replica.note_write()
+
+    assert read_replica.seconds_since_write("anyone") < 30
+    assert lagless.test_client().get("/notes?user_id=u1").get_json() == ["primary-1"]
+    assert no_replica.test_client().get("/notes").get_json() == ["primary-1", "primary-2"]
@@ -0,0 +1,181 @@
+"""Tests for incrementally maintained recurring signatures."""
+
+import os
+import sys
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from flask import Flask, current_app
+from sqlalchemy import event
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+from app.extensions import db  # noqa: E402
+from app.models import Account, RecurringSignature, RecurringTransaction, Transaction  # noqa: E402
+from app.sql import recurring_logic  # noqa: E402
+
+
+@pytest.fixture()
+def app_context():
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Account(account_id="acc-1", user_id="user-1", name="Checking", balance=Decimal("10.00")))
+        db.session.commit()
+        yield
+        db.session.remove()
+        db.drop_all()
+
+
+def _txn(
+    index, txn_date, amount="-15.99", description="Netflix.com 1234", merchant_slug="netflix-com", user_id="user-1"
+):
+    return Transaction(
+        transaction_id=f"tx-{index}",
+        user_id=user_id,
+        account_id="acc-1",
+        amount=Decimal(amount),
+        date=txn_date,
+        description=description,
+        merchant_slug=merchant_slug,
+    )
+
+
+def test_incremental_observations_match_rebuild(app_context):
+    dates = [date(2026, 1, 5) + timedelta(days=30 * i) for i in range(5)]
+    first_batch = [_txn(i, day) for i, day in enumerate(dates[:3])]
+    db.session.add_all(first_batch)
+    assert recurring_logic.record_recurring_observations(first_batch) == 3
+    db.session.commit()
+
+    second_batch = [_txn(i, day) for i, day in enumerate(dates[3:], start=3)]
+    second_batch.append(_txn(99, date(2026, 2, 1), amount="-4.50", description="Corner Cafe", merchant_slug=None))
+    db.session.add_all(second_batch)
+    recurring_logic.record_recurring_observations(second_batch)
+    db.session.commit()
+
+    row = RecurringSignature.query.filter_by(signature="netflix-com").one()
+    assert row.amount_bucket == -1599
+    assert row.occurrence_count == 5
+    assert (row.first_date, row.last_date) == (dates[0], dates[-1])
+    assert row.gap_histogram == {"30": 4}
+    assert row.last_transaction_id == "tx-4"
+    assert RecurringSignature.query.filter_by(signature="cornercafe").one().occurrence_count == 1
+
+    incremental = recurring_logic.recurring_candidates("acc-1")
+    assert incremental == [
+        {
+            "amount": -15.99,
+            "description": "Netflix.com 1234",
+            "signature": "netflix-com",
+            "frequency": "monthly",
+            "gap_days": 30,
+            "last_seen": dates[-1].isoformat(),
+            "occurrences": 5,
+            "account_id": "acc-1",
+            "transaction_id": "tx-4",
+        }
+    ]
+
+    assert recurring_logic.rebuild_recurring_signatures("acc-1") == 6
+    assert recurring_logic.recurring_candidates("acc-1") == incremental
+    assert recurring_logic.recurring_candidates("acc-1", since=dates[-1] + timedelta(days=1)) == []
+
+
+def test_rebuild_takes_the_owner_from_the_account(app_context):
+    # Refresh-ingested rows carry no user_id; the first one must not decide the owner.
+    db.session.add_all(
+        [_txn(i, date(2026, 1, 5) + timedelta(days=30 * i), user_id=None if i == 0 else "user-1") for i in range(3)]
+    )
+    db.session.commit()
+
+    assert recurring_logic.rebuild_recurring_signatures("acc-1") == 3
+    assert RecurringSignature.query.one().user_id == "user-1"
+    assert len(recurring_logic.recurring_candidates(user_id="user-1")) == 1
+
+
+def test_observations_upsert_a_signature_created_concurrently(app_context):
+    competed = []
+
+    def competing_ingest(orm_state):
+        if competed or not orm_state.is_select or "recurring_signatures" not in str(orm_state.statement):
+            return None
+        competed.append(True)
+        lookup = orm_state.invoke_statement().freeze()
+        # Another ingest creates the same key between the lookup and the insert.
+        orm_state.session.execute(
+            RecurringSignature.__table__.insert().values(
+                account_id="acc-1",
+                signature="netflix-com",
+                amount_bucket=-1599,
+                occurrence_count=1,
+                gap_histogram={},
+                first_date=date(2026, 1, 5),
+                last_date=date(2026, 1, 5),
+            )
+        )
+        return lookup()
+
+    batch = [_txn(1, date(2026, 2, 4))]
+    db.session.add_all(batch)
+    event.listen(db.session, "do_orm_execute", competing_ingest)
+    try:
+        assert recurring_logic.record_recurring_observations(batch) == 1
+    finally:
+        event.remove(db.session, "do_orm_execute", competing_ingest)
+    db.session.commit()
+
+    row = RecurringSignature.query.one()
+    assert competed
+    assert row.occurrence_count == 2
+    assert row.gap_histogram == {"30": 1}
+
+
+def test_detected_route_reads_without_backfilling(app_context):
+    from app.routes import recurring as routes
+
+    app = current_app._get_current_object()
+    app.register_blueprint(routes.recurring, url_prefix="/recurring")
+    db.session.add_all([_txn(i, date(2026, 1, 5) + timedelta(days=30 * i)) for i in range(3)])
+    db.session.commit()
+
+    with app.test_client() as client:
+        res = client.get("/recurring/acc-1/detected?rebuild=true")
+
+    assert res.status_code == 200
+    assert res.get_json()["candidates"] == []
+    assert RecurringSignature.query.count() == 0
+
+
+def test_upsert_recurring_links_transaction_and_defers_commit(app_context):
+    db.session.add(_txn(1, date(2026, 3, 1), description="Gym Membership"))
+    db.session.commit()
+
+    recurring_logic.upsert_recurring(
+        "gym membership", Decimal("-15.99"), "monthly", date(2026, 4, 1), 0.3, "acc-1", commit=False
+    )
+    db.session.rollback()
+    assert RecurringTransaction.query.count() == 0
+
+    rec_id = recurring_logic.upsert_recurring(
+        "ignored", Decimal("-15.99"), "monthly", date(2026, 4, 1), 0.3, "acc-1", transaction_id="tx-1"
+    )
+    rec = db.session.get(RecurringTransaction, rec_id)
+    assert rec.transaction_id == "tx-1"
+    assert Transaction.query.count() == 1
+
+
+def test_dominant_gap_ignores_same_day_and_prefers_shorter_ties():
+    assert recurring_logic.dominant_gap({"0": 9, "31": 2, "30": 2}) == 30
+    assert recurring_logic.dominant_gap({"0": 3}) is None
+    assert recurring_logic.frequency_label(31) == "~31d"
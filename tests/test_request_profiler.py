@@ -0,0 +1,99 @@
+"""Tests for on-demand request profiling and the profile listing endpoint."""
+
+import os
+import pstats
+import sys
+import time
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+os.environ.setdefault("PLAID_CLIENT_ID", "sandbox-client")
+os.environ.setdefault("PLAID_SECRET_KEY", "sandbox-secret")
+os.environ.setdefault("CLIENT_NAME", "pyNance Test Suite")
+os.environ.setdefault("BACKEND_PUBLIC_URL", "http://localhost")
+
+ADMIN = {"X-Admin-Token": "secret-token"}
+
+
+@pytest.fixture()
+def modules():
+    from app.routes.profiles import profiles
+    from app.utils import profiler
+
+    return profiler, profiles
+
+
+@pytest.fixture()
+def app(modules, tmp_path):
+    profiler, profiles = modules
+    app = Flask(__name__)
+    app.config.update(PROFILER_ADMIN_TOKEN="secret-token", PROFILER_DIR=str(tmp_path), PROFILER_KEEP=3)
+    profiler.init_request_profiler(app)
+    app.register_blueprint(profiles, url_prefix="/api/profiles")
+
+    @app.route("/slow")
+    def slow_chart():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            sum(range(500))
+        return {"ok": True}
+
+    return app
+
+
+def test_flagged_requests_are_profiled_only_with_the_admin_token(app, tmp_path):
+    client = app.test_client()
+
+    assert "X-Profile-Id" not in client.get("/slow?_profile=1").headers
+    assert "X-Profile-Id" not in client.get("/slow", headers={"X-Profile": "1", "X-Admin-Token": "wrong"}).headers
+    assert list(tmp_path.iterdir()) == []
+
+    response = client.get("/slow", headers={"X-Profile": "1", **ADMIN})
+    profile_id = response.headers["X-Profile-Id"]
+    stats = pstats.Stats(str(tmp_path / f"{profile_id}.pstats"))
+    assert any(func[2] == "slow_chart" for func in stats.stats)
+
+    response = client.get("/slow?_profile=sample", headers=ADMIN)
+    folded = (tmp_path / f"{response.headers['X-Profile-Id']}.folded").read_text()
+    assert "slow_chart (test_request_profiler.py:" in folded
+    _, count = folded.splitlines()[0].rsplit(" ", 1)
+    assert int(count) > 0
+
+
+def test_sampling_and_retention(app, modules, tmp_path, monkeypatch):
+    profiler, _ = modules
+    monkeypatch.setattr(profiler, "_REQUEST_COUNTER", iter(range(1, 100)))
+    app.config["PROFILER_SAMPLE_EVERY"] = 2
+    client = app.test_client()
+
+    profiled = ["X-Profile-Id" in client.get("/slow").headers for _ in range(10)]
+
+    assert profiled == [False, True] * 5
+    listed = profiler.list_profiles(tmp_path)
+    assert len(listed) == 3
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [f"{entry['id']}.json" for entry in listed] + [entry["file"] for entry in listed]
+    )
+
+
+def test_listing_and_download_require_admin_token(app):
+    client = app.test_client()
+    profile_id = client.get("/slow", headers={"X-Profile": "1", **ADMIN}).headers["X-Profile-Id"]
+
+    assert client.get("/api/profiles/").status_code == 403
+    listed = client.get("/api/profiles/", headers=ADMIN).get_json()["data"]
+    assert listed[0]["id"] == profile_id
+    assert listed[0]["endpoint"] == "slow_chart"
+    assert listed[0]["status"] == 200 and listed[0]["mode"] == "cprofile"
+
+    download = client.get(f"/api/profiles/{profile_id}", headers=ADMIN)
+    assert download.status_code == 200
+    assert "attachment" in download.headers["Content-Disposition"]
+    assert client.get("/api/profiles/..%2Fsecrets", headers=ADMIN).status_code == 404
+    assert client.get("/api/profiles/20260101T000000000000-missing", headers=ADMIN).status_code == 404
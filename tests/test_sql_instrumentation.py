@@ -0,0 +1,172 @@
+"""Tests for per-request SQL instrumentation and query budgets."""
+
+import importlib.util
+import logging
+import os
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+os.environ.setdefault("PLAID_CLIENT_ID", "sandbox-client")
+os.environ.setdefault("PLAID_SECRET_KEY", "sandbox-secret")
+os.environ.setdefault("CLIENT_NAME", "pyNance Test Suite")
+os.environ.setdefault("BACKEND_PUBLIC_URL", "http://localhost")
+
+UTILS_DIR = Path(__file__).resolve().parent.parent / "backend" / "app" / "utils"
+
+
+def _load_instrumentation():
+    path = UTILS_DIR / "sql_instrumentation.py"
+    spec = importlib.util.spec_from_file_location("sql_instrumentation_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def modules():
+    from app.extensions import db
+    from app.models import Account, Institution, PlaidAccount
+    from app.routes.accounts import accounts
+    from app.routes.debug import debug
+    from app.routes.institutions import institutions
+    from app.utils import sql_instrumentation
+
+    return {
+        "db": db,
+        "Account": Account,
+        "Institution": Institution,
+        "PlaidAccount": PlaidAccount,
+        "blueprints": {"accounts": accounts, "debug": debug, "institutions": institutions},
+        "instrumentation": sql_instrumentation,
+    }
+
+
+@pytest.fixture()
+def client(modules):
+    """Instrumented app with three institutions of two Plaid-linked accounts each."""
+
+    db = modules["db"]
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        SQL_DEBUG_ENDPOINT=True,
+        SQL_N_PLUS_ONE_THRESHOLD=3,
+    )
+    db.init_app(app)
+    modules["instrumentation"].init_sql_instrumentation(app)
+    for name, blueprint in modules["blueprints"].items():
+        app.register_blueprint(blueprint, url_prefix=f"/api/{name}")
+
+    @app.route("/per-row")
+    def per_row():
+        for account in modules["Account"].query.all():
+            db.session.get(modules["PlaidAccount"], account.plaid_account.id)
+        return {"ok": True}
+
+    with app.app_context():
+        db.create_all()
+        for inst_index in range(3):
+            institution = modules["Institution"](name=f"Bank {inst_index}", provider="plaid")
+            db.session.add(institution)
+            db.session.flush()
+            for acc_index in range(2):
+                account_id = f"acc-{inst_index}-{acc_index}"
+                db.session.add(
+                    modules["Account"](
+                        account_id=account_id,
+                        user_id="user-1",
+                        name=account_id,
+                        balance=Decimal("10.00"),
+                        link_type="plaid",
+                        institution_db_id=institution.id,
+                    )
+                )
+                db.session.add(
+                    modules["PlaidAccount"](
+                        account_id=account_id,
+                        institution_db_id=institution.id,
+                        last_refreshed=datetime(2026, 10, 1, inst_index, acc_index),
+                    )
+                )
+        db.session.commit()
+        db.session.expire_all()
+        modules["instrumentation"].clear_query_stats()
+        with app.test_client() as test_client:
+            yield test_client
+        db.session.remove()
+        db.drop_all()
+
+
+def test_fingerprint_normalizes_literals_and_in_lists():
+    module = _load_instrumentation()
+
+    assert module.fingerprint("SELECT *\n  FROM t WHERE id = 42 AND name = 'O''Hara'") == (
+        "SELECT * FROM t WHERE id = ? AND name = ?"
+    )
+    assert module.fingerprint("SELECT a FROM t WHERE id IN (?, ?, ?)") == module.fingerprint(
+        "SELECT a FROM t WHERE id IN (%(id_1)s, %(id_2)s)"
+    )
+    assert module.fingerprint("SELECT col_1, t2.x FROM t2") == "SELECT col_1, t2.x FROM t2"
+
+
+def test_track_queries_nests_and_counts_repeated_statements():
+    module = _load_instrumentation()
+    engine = sqlalchemy.create_engine("sqlite://")
+
+    with module.track_queries("job", report=False) as outer:
+        with engine.connect() as conn:
+            with module.track_queries("inner", report=False) as inner:
+                for value in range(4):
+                    conn.execute(sqlalchemy.text("SELECT :value"), {"value": value})
+            conn.execute(sqlalchemy.text("SELECT 1"))
+
+    assert inner.count == 4
+    assert inner.repeated(3) == [("SELECT ?", 4)]
+    assert outer.count == 5
+    assert outer.summary(threshold=3)["n_plus_one"][0]["count"] == 5
+    assert module.current_query_stats() is None
+
+
+def test_request_headers_debug_endpoint_and_n_plus_one_log(client, caplog):
+    with caplog.at_level(logging.WARNING):
+        response = client.get("/per-row")
+
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Query-Count"]) == 7
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="7 queries"' in response.headers["Server-Timing"]
+    assert any("N+1 suspect in GET /per-row: 6 executions" in message for message in caplog.messages)
+
+    debug = client.get("/api/debug/sql").get_json()["data"]
+    assert debug["recent"][0]["label"] == "GET /per-row"
+    assert debug["suspects"][0]["executions"] == 6
+    assert debug["suspects"][0]["labels"] == ["GET /per-row"]
+
+    assert client.delete("/api/debug/sql").status_code == 200
+    client.application.config["SQL_DEBUG_ENDPOINT"] = False
+    assert client.get("/api/debug/sql").status_code == 404
+
+
+def test_account_listing_endpoints_stay_within_query_budget(client, assert_max_queries):
+    with assert_max_queries(3, "list_institutions"):
+        response = client.get("/api/institutions/")
+    institutions = response.get_json()["institutions"]
+    assert [len(inst["accounts"]) for inst in institutions] == [2, 2, 2]
+    assert institutions[0]["last_refreshed"]
+
+    with assert_max_queries(2, "refresh_status"):
+        response = client.get("/api/accounts/refresh_status")
+    assert len(response.get_json()["accounts"]) == 6
@@ -0,0 +1,54 @@
+"""Start-up budget: ``create_app`` must not import heavy optional dependencies.
+
+Wall time is machine-dependent, so it is only enforced by ``benchmarks.startup --check``.
+"""
+
+import os
+import sys
+
+import pytest
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+
+@pytest.fixture()
+def startup():
+    from benchmarks import startup
+
+    return startup
+
+
+def test_parse_importtime_reads_depth_and_skips_header(startup):
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     encodings.idna\n"
+        "import time:      1500 |       1620 |   app.config\n"
+        "import time:       300 |       1920 | app\n"
+    )
+
+    assert startup.parse_importtime(stderr) == [
+        ("encodings.idna", 120, 120, 2),
+        ("app.config", 1500, 1620, 1),
+        ("app", 300, 1920, 0),
+    ]
+
+
+@pytest.mark.parametrize("case", ["create_app", "create_app.no_routes"])
+def test_create_app_imports_no_heavy_modules(startup, case):
+    row = startup.run_case(case, repeat=1)
+
+    assert row["heavy_modules"] == []
+    assert row["median_ms"] > 0
+
+
+def test_run_case_ignores_log_lines_on_stdout(startup, monkeypatch):
+    # stop_logging() drains queued records to stdout at exit, after the timing is taken.
+    monkeypatch.setitem(
+        startup.CASES, "noisy", 'import atexit; atexit.register(print, "elapsed_ms=12:00:01 [INFO] app ready")'
+    )
+
+    row = startup.run_case("noisy", repeat=1)
+
+    assert row["median_ms"] > 0
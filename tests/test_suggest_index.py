@@ -0,0 +1,139 @@
+"""Tests for the in-process typeahead suggestion index."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+
+@pytest.fixture()
+def env():
+    from app import models
+    from app.extensions import db
+    from app.routes import suggest
+    from app.services import suggest_index
+    from app.sql import transactions_logic
+
+    return SimpleNamespace(db=db, models=models, service=suggest_index, logic=transactions_logic, routes=suggest)
+
+
+@pytest.fixture()
+def client(env):
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    env.db.init_app(app)
+    app.register_blueprint(env.routes.suggest, url_prefix="/api/suggest")
+    env.service.clear_suggest_indexes()
+    with app.app_context():
+        env.db.create_all()
+        env.db.session.add(
+            env.models.Account(account_id="acc-1", user_id="user-1", name="Checking", balance=Decimal("10.00"))
+        )
+        env.db.session.commit()
+        yield app.test_client()
+        env.service.clear_suggest_indexes()
+        env.db.session.remove()
+        env.db.drop_all()
+
+
+def test_search_ranks_prefix_then_word_prefix_then_fuzzy(env):
+    entry = env.service.SuggestEntry
+    index = env.service.SuggestIndex(
+        [
+            entry("merchant", "Joes Coffee", "joes-coffee", 3),
+            entry("merchant", "Coffee Bean", "coffee-bean", 1),
+            entry("merchant", "Coffeeshop Deluxe", "coffeeshop-deluxe", 9),
+            entry("tag", "coffee", "coffee", 2),
+            entry("merchant", "Netflix.com", "netflix-com", 20),
+        ]
+    )
+
+    labels = [item["label"] for item in index.search("coffee", limit=10)]
+    assert labels == ["Coffeeshop Deluxe", "coffee", "Coffee Bean", "Joes Coffee"]
+    assert [item["label"] for item in index.search("coffee", limit=2, kinds=["merchant"])] == [
+        "Coffeeshop Deluxe",
+        "Coffee Bean",
+    ]
+    fuzzy = index.search("netflx", limit=5)
+    assert fuzzy[0]["label"] == "Netflix.com"
+    assert 0 < fuzzy[0]["score"] < 1
+    assert index.search("", limit=1)[0]["label"] == "Netflix.com"
+
+
+def _txn(env, index, merchant_name, merchant_slug, category_id=None, user_id="user-1"):
+    return env.models.Transaction(
+        transaction_id=f"tx-{index}",
+        user_id=user_id,
+        account_id="acc-1",
+        amount=Decimal("-4.50"),
+        date=date(2026, 1, index),
+        description=merchant_name,
+        merchant_name=merchant_name,
+        merchant_slug=merchant_slug,
+        category_id=category_id,
+    )
+
+
+def test_suggest_endpoint_backfills_usage_and_reloads_on_data_version(env, client):
+    session = env.db.session
+    category = env.models.Category(primary_category="Food and Drink", detailed_category="Coffee Shop")
+    session.add(category)
+    session.flush()
+    session.add_all(
+        [_txn(env, 1, "Joes Coffee", "joes-coffee", category.id), _txn(env, 2, "Joes Coffee", "joes-coffee")]
+    )
+    session.add(env.models.Tag(user_id="user-1", name="coffee-runs"))
+    session.commit()
+
+    resp = client.get("/api/suggest?user_id=user-1&q=co")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert [(item["kind"], item["label"]) for item in data] == [
+        ("tag", "coffee-runs"),
+        ("merchant", "Joes Coffee"),
+        ("category", "Food and Drink - Coffee Shop"),
+    ]
+    assert env.models.MerchantUsage.query.filter_by(user_id="user-1").one().usage_count == 2
+
+    new_txn = _txn(env, 3, "Corner Bakery", "corner-bakery")
+    session.add(new_txn)
+    assert env.logic.record_merchant_usage([new_txn]) == 1
+    session.commit()
+    env.logic.bump_data_version("user-1")  # as the ingest paths do after committing
+
+    data = client.get("/api/suggest?user_id=user-1&q=cor&kinds=merchant").get_json()["data"]
+    assert [item["value"] for item in data] == ["corner-bakery"]
+
+    assert client.get("/api/suggest?q=co").status_code == 400
+    assert client.get("/api/suggest?user_id=user-1&kinds=bogus").status_code == 400
+
+
+def test_usage_counts_transactions_owned_through_their_account(env, client):
+    session = env.db.session
+    category = env.models.Category(primary_category="Food and Drink", detailed_category="Coffee Shop")
+    session.add(category)
+    session.flush()
+    # Refresh-ingested rows carry no user_id; they still belong to the account's owner.
+    session.add_all(
+        [
+            _txn(env, 1, "Joes Coffee", "joes-coffee", category.id),
+            _txn(env, 2, "Joes Coffee", "joes-coffee", category.id, user_id=None),
+        ]
+    )
+    session.commit()
+
+    data = client.get("/api/suggest?user_id=user-1&q=co").get_json()["data"]
+    assert {item["label"]: item["count"] for item in data} == {"Joes Coffee": 2, "Food and Drink - Coffee Shop": 2}
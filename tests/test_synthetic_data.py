@@ -0,0 +1,118 @@
+"""Tests for the synthetic dataset generator and benchmark result comparison."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+END = date(2026, 6, 30)
+
+
+@pytest.fixture()
+def modules():
+    from app.extensions import db
+    from app.services import synthetic_data
+
+    return db, synthetic_data
+
+
+@pytest.fixture()
+def app(modules):
+    db, _ = modules
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+
+
+def _rows(db):
+    from app.models import Transaction
+
+    return db.session.query(
+        Transaction.transaction_id, Transaction.account_id, Transaction.date, Transaction.amount
+    ).order_by(Transaction.transaction_id)
+
+
+def test_generator_builds_structured_deterministic_history(app, modules):
+    db, synthetic_data = modules
+    from app.models import Account, AccountHistory, Transaction
+
+    counts = synthetic_data.generate_synthetic_dataset(
+        users=2, accounts_per_user=3, months=6, transactions=3000, end_date=END, history_days=30
+    )
+
+    assert counts["accounts"] == 6
+    assert counts["transactions"] == Transaction.query.count()
+    assert 2700 <= counts["transactions"] <= 3300
+    assert counts["account_history"] == 6 * 30
+    assert {row.date for row in Transaction.query.all()} <= {
+        date.fromordinal(day) for day in range(END.toordinal() - 183, END.toordinal() + 1)
+    }
+
+    checking = "syn-acc-0001-01"
+    paychecks = Transaction.query.filter_by(account_id=checking, category_slug="INCOME_WAGES").all()
+    gaps = {(b.date - a.date).days for a, b in zip(paychecks, paychecks[1:])}
+    assert gaps == {14} and all(txn.amount > 0 for txn in paychecks)
+    rent = Transaction.query.filter_by(account_id=checking, category_slug="RENT_AND_UTILITIES_RENT").all()
+    assert len(rent) == 6 and {txn.date.day for txn in rent} == {1}
+
+    # Every savings sweep has an equal-and-opposite leg within a day.
+    outgoing = Transaction.query.filter_by(category_slug="TRANSFER_OUT_SAVINGS").all()
+    incoming = Transaction.query.filter_by(category_slug="TRANSFER_IN_ACCOUNT_TRANSFER").all()
+    assert outgoing and len(outgoing) == len(incoming)
+    for leg in outgoing:
+        assert any(
+            other.amount == -leg.amount and 0 <= (other.date - leg.date).days <= 1 and other.user_id == leg.user_id
+            for other in incoming
+        )
+
+    # The latest history row matches the account balance.
+    savings = db.session.get(Account, "syn-acc-0001-03")
+    latest = AccountHistory.query.filter_by(account_id=savings.account_id, date=END).one()
+    assert latest.balance == savings.balance > Decimal("0")
+
+    first_run = _rows(db).all()
+    with pytest.raises(ValueError):
+        synthetic_data.generate_synthetic_dataset(users=1, end_date=END)
+    assert synthetic_data.delete_synthetic_dataset() == 6
+    assert Transaction.query.count() == 0
+    synthetic_data.generate_synthetic_dataset(
+        users=2, accounts_per_user=3, months=6, transactions=3000, end_date=END, history_days=30
+    )
+    assert _rows(db).all() == first_run
+
+
+def test_compare_flags_regressions_beyond_threshold_and_noise_floor():
+    from benchmarks.compare import compare_results
+
+    baseline = {
+        "results": [
+            {"case": "a", "median_ms": 100.0},
+            {"case": "b", "median_ms": 1.0},
+            {"case": "gone", "median_ms": 5.0},
+        ]
+    }
+    current = {
+        "results": [
+            {"case": "a", "median_ms": 130.0},
+            {"case": "b", "median_ms": 2.5},
+            {"case": "new", "median_ms": 3.0},
+        ]
+    }
+
+    statuses = {row["case"]: row["status"] for row in compare_results(baseline, current, threshold=0.2)}
+
+    assert statuses == {"a": "regression", "b": "ok", "new": "new", "gone": "missing"}
+    assert compare_results(current, baseline, threshold=0.2)[0]["status"] == "improvement"
@@ -0,0 +1,94 @@
+"""Tests for OpenTelemetry-compatible pipeline spans."""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+UTILS_DIR = Path(__file__).resolve().parent.parent / "backend" / "app" / "utils"
+
+
+def _load_tracing():
+    path = UTILS_DIR / "tracing.py"
+    spec = importlib.util.spec_from_file_location("tracing_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(params=["builtin", "otel"])
+def tracing(request, tmp_path):
+    module = _load_tracing()
+    if request.param == "builtin":
+        module.otel_trace = None
+    elif module.otel_trace is None:
+        pytest.skip("opentelemetry-sdk is not installed")
+    trace_file = tmp_path / "traces.jsonl"
+    assert module.configure_tracing("file", trace_file)
+    yield module, trace_file
+    module.configure_tracing("none")
+
+
+def _spans(trace_file):
+    return {record["name"]: record for record in map(json.loads, trace_file.read_text().splitlines())}
+
+
+def test_traced_function_emits_aggregate_stage_spans(tracing):
+    module, trace_file = tracing
+
+    @module.traced("plaid.sync_account", stages=True)
+    def sync():
+        module.current_span().set_attributes({"account.id": "acc-1", "plaid.item_id": None})
+        with module.span("plaid.transactions_sync", **{"plaid.page": 1}) as page:
+            page.add_event("retry", {"attempt": 1})
+            page.set_attribute("plaid.retries", 1)
+        for _ in range(3):
+            with module.stage("category"):
+                pass
+            with module.stage("upsert"):
+                pass
+        with module.stage("commit"):
+            pass
+        return "done"
+
+    assert sync() == "done"
+
+    spans = _spans(trace_file)
+    root = spans["plaid.sync_account"]
+    assert root["parent_id"] is None
+    assert root["attributes"] == {"account.id": "acc-1"}
+    assert spans["plaid.transactions_sync"]["attributes"] == {"plaid.page": 1, "plaid.retries": 1}
+    assert spans["plaid.transactions_sync"]["events"][0]["name"] == "retry"
+    for name, calls in (("category", 3), ("upsert", 3), ("commit", 1)):
+        assert spans[name]["parent_id"] == root["context"]["span_id"]
+        assert spans[name]["context"]["trace_id"] == root["context"]["trace_id"]
+        assert spans[name]["attributes"]["stage.calls"] == calls
+
+
+def test_request_span_records_errors_and_disabled_tracing_is_inert(tracing, tmp_path):
+    module, trace_file = tracing
+    app = Flask(__name__)
+    module.init_tracing(app)
+
+    @app.route("/boom")
+    def boom():
+        with module.span("inner"):
+            raise RuntimeError("plaid down")
+
+    response = app.test_client().get("/boom")
+    assert response.status_code == 500
+    spans = _spans(trace_file)
+    assert spans["inner"]["status"]["status_code"] == "ERROR"
+    assert spans["inner"]["parent_id"] == spans["GET /boom"]["context"]["span_id"]
+    assert spans["GET /boom"]["attributes"]["http.status_code"] == 500
+
+    assert not module.configure_tracing("none")
+    with module.span("ignored") as ignored, module.stage("upsert"):
+        ignored.set_attribute("rows", 1)
+    assert "ignored" not in _spans(trace_file)
+    with pytest.raises(ValueError):
+        module.configure_tracing("jaeger")
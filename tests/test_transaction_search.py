@@ -0,0 +1,118 @@
+"""Tests for full-text transaction search."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+BASE_BACKEND = os.path.join(os.path.dirname(__file__), "..", "backend")
+if BASE_BACKEND not in sys.path:
+    sys.path.insert(0, BASE_BACKEND)
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+
+
+@pytest.fixture()
+def env():
+    from app import models
+    from app.extensions import db
+    from app.sql import search_logic as search
+
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    search.clear_search_indexes()
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            [
+                models.Account(account_id="acc-1", user_id="user-1", name="Checking", balance=Decimal("10.00")),
+                models.Account(
+                    account_id="acc-hidden", user_id="user-1", name="Old", balance=Decimal("0"), is_hidden=True
+                ),
+                models.Account(account_id="acc-2", user_id="user-2", name="Other", balance=Decimal("0")),
+            ]
+        )
+        db.session.commit()
+        yield SimpleNamespace(db=db, models=models, search=search)
+        search.clear_search_indexes()
+        db.session.remove()
+        db.drop_all()
+
+
+def _add(env, transaction_id, description, merchant_name, txn_date, account_id="acc-1", category_display=None):
+    txn = env.models.Transaction(
+        transaction_id=transaction_id,
+        user_id="user-1" if account_id != "acc-2" else "user-2",
+        account_id=account_id,
+        amount=Decimal("-9.99"),
+        date=txn_date,
+        description=description,
+        merchant_name=merchant_name,
+        category_display=category_display,
+    )
+    env.db.session.add(txn)
+    return txn
+
+
+def test_search_matches_all_terms_by_prefix_and_respects_scope(env):
+    txns = [
+        _add(env, "tx-1", "NETFLIX.COM 866-579", "Netflix", date(2026, 1, 3), category_display="Entertainment"),
+        _add(env, "tx-2", "Coffee shop downtown", "Joes Coffee", date(2026, 1, 4)),
+        _add(env, "tx-3", "Netflix gift card", "Target", date(2026, 1, 5)),
+        _add(env, "tx-4", "Netflix", "Netflix", date(2026, 1, 6), account_id="acc-hidden"),
+        _add(env, "tx-5", "Netflix", "Netflix", date(2026, 1, 7), account_id="acc-2"),
+    ]
+    assert env.search.refresh_search_documents(txns) == 5
+    env.db.session.commit()
+    doc = env.db.session.get(env.models.TransactionSearchDocument, "tx-1")
+    assert doc.document == "NETFLIX.COM 866-579 Netflix Entertainment"
+
+    result = env.search.search_transactions("user-1", "netf")
+    assert [item["transaction_id"] for item in result["transactions"]] == ["tx-1", "tx-3"]
+    assert result["transactions"][0]["rank"] >= result["transactions"][1]["rank"]
+    assert result["next_cursor"] is None
+
+    narrowed = env.search.search_transactions("user-1", "netflix gift")["transactions"]
+    assert [item["transaction_id"] for item in narrowed] == ["tx-3"]
+    assert env.search.search_transactions("user-1", "   ")["transactions"] == []
+
+
+def test_search_paginates_with_keyset_cursor_and_sees_tag_edits(env):
+    txns = [_add(env, f"tx-{i:02d}", "Corner Bakery", "Corner Bakery", date(2026, 2, i)) for i in range(1, 6)]
+    env.search.refresh_search_documents(txns)
+    env.db.session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        page = env.search.search_transactions("user-1", "bakery", page_size=2, cursor=cursor)
+        seen.extend(item["transaction_id"] for item in page["transactions"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    # Equal ranks fall back to the transaction list ordering: newest first.
+    assert seen == ["tx-05", "tx-04", "tx-03", "tx-02", "tx-01"]
+
+    tagged = txns[0]
+    tagged.tags = [env.models.Tag(user_id="user-1", name="breakfast")]
+    assert env.search.refresh_search_documents([tagged]) == 1
+    env.db.session.commit()
+    # Tag edits bump the data version through invalidate_tx_cache in the route.
+    from app.sql.data_version import bump_data_version
+
+    bump_data_version("user-1")
+    assert [item["transaction_id"] for item in env.search.search_transactions("user-1", "breakf")["transactions"]] == [
+        "tx-01"
+    ]
+
+    with pytest.raises(env.search.InvalidSearchCursor):
+        env.search.search_transactions("user-1", "bakery", cursor="not-a-cursor")
+    assert env.search.rebuild_search_documents("user-1") == 0